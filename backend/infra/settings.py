@@ -224,6 +224,58 @@ CACHES = {
     }
 }
 
+# Dashboard read-through cache (modules.base.services.VersionedCacheService)
+DASHBOARD_CACHE_ENDPOINTS = [
+    "transactions.stats",
+    "actors.list",
+    "actors.stats",
+    "loans.stats",
+    "ai_calls.stats",
+]
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', 300))
+# Comma separated endpoint names to bypass the cache for, or "*" for all of them
+DASHBOARD_CACHE_DISABLED = [
+    endpoint.strip()
+    for endpoint in os.environ.get('DASHBOARD_CACHE_DISABLED', '').split(',')
+    if endpoint.strip()
+]
+
+# Authenticated principals cache (modules.userdata.services.PrincipalCacheService)
+PRINCIPAL_CACHE_TIMEOUT = int(os.environ.get('PRINCIPAL_CACHE_TIMEOUT', 300))
+# Upper bound for other workers to notice a deactivation or profile change
+PRINCIPAL_CACHE_LOCAL_TIMEOUT = int(os.environ.get('PRINCIPAL_CACHE_LOCAL_TIMEOUT', 10))
+PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES = int(os.environ.get('PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES', 1024))
+
+# MCP access-token verification cache (modules.ai.mcp.oauth.services.token_cache)
+MCP_TOKEN_CACHE_TIMEOUT = int(os.environ.get('MCP_TOKEN_CACHE_TIMEOUT', 300))
+
+# Read-only connection pool of the MCP SQL tool (modules.ai.mcp.gateways.connection_pool)
+MCP_DB_POOL_MIN_SIZE = int(os.environ.get('MCP_DB_POOL_MIN_SIZE', 1))
+MCP_DB_POOL_MAX_SIZE = int(os.environ.get('MCP_DB_POOL_MAX_SIZE', 4))
+# Seconds a query waits for a free connection before failing with SQL_POOL_EXHAUSTED
+MCP_DB_POOL_TIMEOUT = float(os.environ.get('MCP_DB_POOL_TIMEOUT', 3))
+# Idle connections older than this are pinged before being reused
+MCP_DB_POOL_HEALTHCHECK_INTERVAL = float(os.environ.get('MCP_DB_POOL_HEALTHCHECK_INTERVAL', 30))
+
+# How execute_sql confines queries to the user's rows: "cte" shadows the scoped
+# tables with filtered CTEs; "rls" runs the query as-is under the row-level
+# security policies installed by `mcp_setup_db --scoping rls`. Both must agree:
+# once the policies are installed, queries in "cte" mode see no rows.
+MCP_SCOPING_MODE = os.environ.get('MCP_SCOPING_MODE', 'cte')
+
+# Paging of execute_sql results (modules.ai.mcp.services.result_pages)
+MCP_SQL_PAGE_SIZE = int(os.environ.get('MCP_SQL_PAGE_SIZE', 200))
+MCP_SQL_MAX_PAGE_SIZE = int(os.environ.get('MCP_SQL_MAX_PAGE_SIZE', 1000))
+# Rows read per query; later pages are served from the shared cache
+MCP_SQL_MAX_ROWS = int(os.environ.get('MCP_SQL_MAX_ROWS', 5000))
+MCP_SQL_FETCH_BATCH_SIZE = int(os.environ.get('MCP_SQL_FETCH_BATCH_SIZE', 500))
+# Seconds a next_cursor stays valid
+MCP_SQL_RESULT_TIMEOUT = int(os.environ.get('MCP_SQL_RESULT_TIMEOUT', 300))
+
+# execute_sql result cache, keyed on the user's data version (modules.ai.mcp.services.result_cache); 0 disables it
+MCP_SQL_CACHE_TIMEOUT = int(os.environ.get('MCP_SQL_CACHE_TIMEOUT', 600))
+MCP_SQL_CACHE_MAX_BYTES_PER_USER = int(os.environ.get('MCP_SQL_CACHE_MAX_BYTES_PER_USER', 2 * 1024 * 1024))
+
 # Celery Configuration
 CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
@@ -278,3 +330,14 @@ LOGGING = {
         },
     },
 }
+
+# Keyset pagination for list endpoints (modules.base.pagination)
+PAGINATION_DEFAULT_PAGE_SIZE = int(os.environ.get('PAGINATION_DEFAULT_PAGE_SIZE', 50))
+PAGINATION_MAX_PAGE_SIZE = int(os.environ.get('PAGINATION_MAX_PAGE_SIZE', 200))
+
+# Shared keep-alive HTTP pools for LLM and embedding providers (modules.ai.gateways.http_clients)
+LLM_HTTP_MAX_CONNECTIONS = int(os.environ.get('LLM_HTTP_MAX_CONNECTIONS', 20))
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get('LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS', 10))
+LLM_HTTP_KEEPALIVE_EXPIRY = float(os.environ.get('LLM_HTTP_KEEPALIVE_EXPIRY', 90))
+LLM_HTTP_CONNECT_TIMEOUT = float(os.environ.get('LLM_HTTP_CONNECT_TIMEOUT', 5))
+LLM_HTTP_TIMEOUT = float(os.environ.get('LLM_HTTP_TIMEOUT', 120))
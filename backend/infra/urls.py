@@ -29,6 +29,7 @@ urlpatterns = [
     path("transactions/", include("modules.transactions.urls")),
     path("loans/", include("modules.loans.urls")),
     path("ai/", include("modules.ai.urls")),
+    path("base/", include("modules.base.urls")),
 ]
 
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
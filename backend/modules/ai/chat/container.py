@@ -16,21 +16,21 @@ class AIChatContainer(containers.DeclarativeContainer):
     tools = providers.Dependency()
 
     # FACTORIES
-    ai_call_factory = providers.Factory(AICallFactory)
-    conversation_factory = providers.Factory(ConversationFactory)
-    message_factory = providers.Factory(MessageFactory, ai_call_factory=ai_call_factory)
-    embedding_call_factory = providers.Factory(EmbeddingCallFactory)
+    ai_call_factory = providers.Singleton(AICallFactory)
+    conversation_factory = providers.Singleton(ConversationFactory)
+    message_factory = providers.Singleton(MessageFactory, ai_call_factory=ai_call_factory)
+    embedding_call_factory = providers.Singleton(EmbeddingCallFactory)
 
     # REPOSITORIES
-    ai_call_repository = providers.Factory(AICallRepository, model=AICall, ai_call_factory=ai_call_factory)
-    conversation_repository = providers.Factory(ConversationRepository, model=Conversation, conversation_factory=conversation_factory)
-    message_repository = providers.Factory(MessageRepository, model=Message, message_factory=message_factory)
-    embedding_call_repository = providers.Factory(EmbeddingCallRepository, model=EmbeddingCall, embedding_call_factory=embedding_call_factory)
+    ai_call_repository = providers.Singleton(AICallRepository, model=AICall, ai_call_factory=ai_call_factory)
+    conversation_repository = providers.Singleton(ConversationRepository, model=Conversation, conversation_factory=conversation_factory)
+    message_repository = providers.Singleton(MessageRepository, model=Message, message_factory=message_factory)
+    embedding_call_repository = providers.Singleton(EmbeddingCallRepository, model=EmbeddingCall, embedding_call_factory=embedding_call_factory)
 
     # SERIALIZERS
-    ai_call_serializer = providers.Factory(AICallSerializer)
-    message_serializer = providers.Factory(MessageSerializer, ai_call_serializer=ai_call_serializer)
-    conversation_serializer = providers.Factory(ConversationSerializer, message_serializer=message_serializer)
+    ai_call_serializer = providers.Singleton(AICallSerializer)
+    message_serializer = providers.Singleton(MessageSerializer, ai_call_serializer=ai_call_serializer)
+    conversation_serializer = providers.Singleton(ConversationSerializer, message_serializer=message_serializer)
 
     # USE CASES
     list_conversations_use_case = providers.Factory(
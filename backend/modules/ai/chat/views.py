@@ -7,30 +7,32 @@ from modules.ai.container import AIContainer
 from modules.userdata.authentication import JWTAuthentication
 from modules.transactions.container import TransactionsContainer
 
+# The AI tools are bound to the requesting user, so they are passed when a use
+# case is built.
+ai_container = AIContainer()
+transactions_container = TransactionsContainer()
+container = AIChatContainer(
+    ask_use_case=ai_container.ask_use_case,
+    create_embedding_use_case=ai_container.create_embedding_use_case,
+)
+
 
 class StartConversionView(views.APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def get_container(self):
-        ai_container = AIContainer()
-        ask_use_case = ai_container.ask_use_case()
-        create_embedding_use_case = ai_container.create_embedding_use_case()
-        tools = TransactionsContainer(user_id=self.request.user.id).get_tools_for_ai_use_case().execute()
+    container = container
 
-        return AIChatContainer(
-            ask_use_case=ask_use_case, 
-            create_embedding_use_case=create_embedding_use_case,
-            tools=tools
-        )
+    def get_tools(self, user_id: int) -> list:
+        return transactions_container.get_tools_for_ai_use_case().execute(user_id)
 
     def post(self, request):
         data = request.data
         data["user"] = request.user.id
         model = data.get("model")
 
-        container = self.get_container()
-        result = container.start_conversion_use_case().execute(data, model=model)
+        start_conversion_use_case = self.container.start_conversion_use_case(tools=self.get_tools(request.user.id))
+        result = start_conversion_use_case.execute(data, model=model)
         return Response(result, status=status.HTTP_200_OK)
 
 
@@ -38,9 +40,7 @@ class ListConversationsView(views.APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = AIChatContainer()
+    container = container
 
     def get(self, request):
         user_id = request.user.id
@@ -52,9 +52,7 @@ class ListMessagesView(views.APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = AIChatContainer()
+    container = container
 
     def get(self, request, conversation_id):
         user_id = request.user.id
@@ -66,22 +64,15 @@ class SendConversionMessageView(views.APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def get_container(self):
-        ai_container = AIContainer()
-        ask_use_case = ai_container.ask_use_case()
-        create_embedding_use_case = ai_container.create_embedding_use_case()
-        tools = TransactionsContainer(user_id=self.request.user.id).get_tools_for_ai_use_case().execute()
+    container = container
 
-        return AIChatContainer(
-            ask_use_case=ask_use_case, 
-            create_embedding_use_case=create_embedding_use_case,
-            tools=tools
-        )
+    def get_tools(self, user_id: int) -> list:
+        return transactions_container.get_tools_for_ai_use_case().execute(user_id)
 
     def post(self, request, conversation_id):
         user_id = request.user.id
         content = request.data["content"]
         model = request.data.get("model")
-        container = self.get_container()
-        result = container.send_conversion_message_use_case().execute(conversation_id, content, user_id, model=model)
+        send_conversion_message_use_case = self.container.send_conversion_message_use_case(tools=self.get_tools(user_id))
+        result = send_conversion_message_use_case.execute(conversation_id, content, user_id, model=model)
         return Response(result, status=status.HTTP_200_OK)
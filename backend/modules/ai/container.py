@@ -9,56 +9,66 @@ from modules.ai.gateways import OpenAIEmbeddingGateway, LLMGateway
 from modules.ai.models import AICall, EmbeddingCall
 from modules.ai.repositories import AICallRepository, EmbeddingRepository
 from modules.ai.services.llm import LLMService
+from modules.ai.types import LlmProviders
 from modules.ai.serializers import EmbeddingSerializer, AICallSerializer
 from modules.ai.use_cases.ask import AskUseCase
 from modules.ai.use_cases.create_embedding import CreateEmbeddingUseCase
 from modules.ai.use_cases.embedding import ListEmbeddingsUseCase, StatsEmbeddingsUseCase
 from modules.ai.use_cases.ai_call import ListAICallsUseCase, StatsAICallUseCase
+from modules.base.services import VersionedCacheService
 
 
 class AIContainer(containers.DeclarativeContainer):
     # FACTORIES
-    ai_request_factory = providers.Factory(AIRequestFactory)
-    ai_response_factory = providers.Factory(AIResponseFactory)
-    ai_call_factory = providers.Factory(AICallFactory)
-    embedding_factory = providers.Factory(EmbeddingFactory)
+    ai_request_factory = providers.Singleton(AIRequestFactory)
+    ai_response_factory = providers.Singleton(AIResponseFactory)
+    ai_call_factory = providers.Singleton(AICallFactory)
+    embedding_factory = providers.Singleton(EmbeddingFactory)
 
     # GATEWAYS
-    deepseek_llm_gateway = providers.Factory(
+    deepseek_llm_gateway = providers.Singleton(
         LLMGateway,
+        provider=LlmProviders.DEEPSEEK.name,
         api_key=settings.DEEPSEEK_API_KEY,
         base_url=settings.DEEPSEEK_BASE_URL,
         ai_request_factory=ai_request_factory,
     )
-    google_llm_gateway = providers.Factory(
+    google_llm_gateway = providers.Singleton(
         LLMGateway,
+        provider=LlmProviders.GOOGLE.name,
         api_key=settings.GOOGLE_AI_API_KEY,
         base_url=settings.GOOGLE_AI_BASE_URL,
         ai_request_factory=ai_request_factory,
     )
-    openai_llm_gateway = providers.Factory(
+    openai_llm_gateway = providers.Singleton(
         LLMGateway,
+        provider=LlmProviders.OPENAI.name,
         api_key=settings.OPENAI_API_KEY,
         base_url=settings.OPENAI_BASE_URL,
         ai_request_factory=ai_request_factory,
     )
-    openai_embedding_gateway = providers.Factory(OpenAIEmbeddingGateway, api_key=settings.OPENAI_API_KEY)
+    openai_embedding_gateway = providers.Singleton(
+        OpenAIEmbeddingGateway,
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL,
+    )
 
     # SERVICES
-    llm_service = providers.Factory(
+    llm_service = providers.Singleton(
         LLMService,
         deepseek_llm_gateway=deepseek_llm_gateway,
         google_llm_gateway=google_llm_gateway,
         openai_llm_gateway=openai_llm_gateway,
     )
+    versioned_cache_service = providers.Singleton(VersionedCacheService)
 
     # REPOSITORIES
-    ai_call_repository = providers.Factory(AICallRepository, model=AICall, ai_response_factory=ai_response_factory, ai_call_factory=ai_call_factory)
-    embedding_repository = providers.Factory(EmbeddingRepository, model=EmbeddingCall, embedding_factory=embedding_factory)
+    ai_call_repository = providers.Singleton(AICallRepository, model=AICall, ai_response_factory=ai_response_factory, ai_call_factory=ai_call_factory)
+    embedding_repository = providers.Singleton(EmbeddingRepository, model=EmbeddingCall, embedding_factory=embedding_factory)
 
     # SERIALIZERS
-    embedding_serializer = providers.Factory(EmbeddingSerializer)
-    ai_call_serializer = providers.Factory(AICallSerializer)
+    embedding_serializer = providers.Singleton(EmbeddingSerializer)
+    ai_call_serializer = providers.Singleton(AICallSerializer)
 
     # USE CASES
     ask_use_case = providers.Factory(
@@ -67,6 +77,7 @@ class AIContainer(containers.DeclarativeContainer):
         ai_response_factory=ai_response_factory,
         llm_service=llm_service,
         ai_call_repository=ai_call_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     create_embedding_use_case = providers.Factory(
@@ -1,7 +1,10 @@
+from modules.ai.gateways.http_clients import OpenAIClientRegistry, client_registry
 from modules.ai.gateways.openai_embedding import OpenAIEmbeddingGateway
 from modules.ai.gateways.llm import LLMGateway
 
 __all__ = [
+    "OpenAIClientRegistry",
+    "client_registry",
     "OpenAIEmbeddingGateway",
     "LLMGateway",
 ]
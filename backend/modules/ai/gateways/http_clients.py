@@ -0,0 +1,140 @@
+import logging
+import os
+import threading
+
+import httpx
+from django.conf import settings
+from openai import DefaultHttpxClient, OpenAI
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.errors = 0
+        self.connections_opened = 0
+
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+
+class MeteredTransport(httpx.HTTPTransport):
+    """HTTPTransport counting requests and new connections (TCP+TLS handshakes).
+
+    Connections are counted through httpx's private ``_pool`` (an httpcore
+    ``ConnectionPool``). If a later release renames it, only requests are metered
+    and the connection figures are reported as ``None``.
+    """
+
+    def __init__(self, metrics: PoolMetrics, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics = metrics
+
+        pool = getattr(self, "_pool", None)
+        self.pool_metered = hasattr(pool, "create_connection") and hasattr(pool, "connections")
+        if not self.pool_metered:
+            logger.warning("[MeteredTransport] httpx connection pool not found, connections are not metered")
+            return
+
+        create_connection = pool.create_connection
+
+        def create_counted_connection(origin):
+            metrics.increment("connections_opened")
+            return create_connection(origin)
+
+        pool.create_connection = create_counted_connection
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.metrics.increment("requests")
+        self.metrics.increment("in_flight")
+        try:
+            return super().handle_request(request)
+        except Exception:
+            self.metrics.increment("errors")
+            raise
+        finally:
+            self.metrics.increment("in_flight", -1)
+
+    def connection_counts(self) -> dict:
+        if not self.pool_metered:
+            return {"open": None, "idle": None}
+        connections = list(self._pool.connections)
+        return {
+            "open": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+        }
+
+
+class OpenAIClientRegistry:
+    """One OpenAI client, with its own keep-alive connection pool, per provider account.
+
+    Clients are keyed by ``(provider, base_url, api_key)`` and shared by every
+    gateway of the worker process, so consecutive calls of a chat turn reuse the
+    open connection instead of paying a new handshake. After a fork the registry
+    starts over: sockets must not be shared between worker processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._clients: dict[tuple, tuple[OpenAI, MeteredTransport, PoolMetrics]] = {}
+
+    def get(self, provider: str, api_key: str, base_url: str = None) -> OpenAI:
+        key = (provider, base_url, api_key)
+        entry = self._clients.get(key) if self._pid == os.getpid() else None
+        if entry is None:
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._pid = os.getpid()
+                    self._clients = {}
+                entry = self._clients.get(key)
+                if entry is None:
+                    entry = self._clients[key] = self._build(api_key, base_url)
+        return entry[0]
+
+    def stats(self) -> list[dict]:
+        return [
+            {
+                "provider": provider,
+                "base_url": base_url,
+                "requests": metrics.requests,
+                "in_flight": metrics.in_flight,
+                "errors": metrics.errors,
+                "connections_opened": metrics.connections_opened,
+                "connections": transport.connection_counts(),
+                "max_connections": settings.LLM_HTTP_MAX_CONNECTIONS,
+            }
+            for (provider, base_url, _), (_, transport, metrics) in list(self._clients.items())
+        ]
+
+    def close(self):
+        with self._lock:
+            for client, _, _ in self._clients.values():
+                client.close()
+            self._clients = {}
+
+    def _build(self, api_key: str, base_url: str = None) -> tuple[OpenAI, MeteredTransport, PoolMetrics]:
+        metrics = PoolMetrics()
+        timeout = httpx.Timeout(settings.LLM_HTTP_TIMEOUT, connect=settings.LLM_HTTP_CONNECT_TIMEOUT)
+        transport = MeteredTransport(
+            metrics,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            http_client=DefaultHttpxClient(transport=transport, timeout=timeout),
+        )
+        return client, transport, metrics
+
+
+client_registry = OpenAIClientRegistry()
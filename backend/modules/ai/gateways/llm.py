@@ -6,25 +6,20 @@ from openai.types.chat import ChatCompletion
 
 from modules.ai.domains.ai_request import AIRequestDomain
 from modules.ai.factories.ai_request import AIRequestFactory
+from modules.ai.gateways.http_clients import client_registry
 
 logger = logging.getLogger(__name__)
 
 
 class LLMGateway:
-    _client: OpenAI = None
-
-    def __init__(self, api_key: str, base_url: str, ai_request_factory: AIRequestFactory):
+    def __init__(self, provider: str, api_key: str, base_url: str, ai_request_factory: AIRequestFactory):
+        self.provider = provider
         self.api_key = api_key
         self.base_url = base_url
         self.ai_request_factory = ai_request_factory
 
     def get_client(self) -> OpenAI:
-        if self._client is None:
-            self._client = OpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url,
-            )
-        return self._client
+        return client_registry.get(self.provider, self.api_key, self.base_url)
 
     @property
     def client(self) -> OpenAI:
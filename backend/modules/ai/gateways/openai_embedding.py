@@ -1,21 +1,21 @@
 from openai import OpenAI
 from openai.types import CreateEmbeddingResponse
 
+from modules.ai.gateways.http_clients import client_registry
+from modules.ai.types import LlmProviders
+
 
 class EmbeddingModels:
     TEXT_EMBEDDING_3_SMALL = "text-embedding-3-small"
 
 
 class OpenAIEmbeddingGateway:
-    _client: OpenAI = None
-
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = None):
         self.api_key = api_key
+        self.base_url = base_url
 
-    def get_client(self):
-        if self._client is None:
-            self._client = OpenAI(api_key=self.api_key)
-        return self._client
+    def get_client(self) -> OpenAI:
+        return client_registry.get(LlmProviders.OPENAI.name, self.api_key, self.base_url)
     
     @property
     def client(self):
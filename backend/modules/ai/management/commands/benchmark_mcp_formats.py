@@ -0,0 +1,93 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from modules.ai.mcp.factories.query_result import OUTPUT_FORMATS, QueryResultFactory
+from modules.ai.mcp.services.query_scoper import QueryScoperService
+from modules.transactions.models import Actor, SubTransaction, Transaction
+from modules.transactions.types import TransactionCategory
+
+# Queries the agent typically sends through execute_sql.
+QUERIES = [
+    ("bills", "SELECT id, due_date, total_amount, transaction_type, category, is_recurrent, paid_at FROM transactions_transaction ORDER BY due_date DESC"),
+    ("items", "SELECT s.date, s.description, s.amount, s.category, a.name AS actor FROM transactions_subtransaction s LEFT JOIN transactions_actor a ON a.id = s.actor_id ORDER BY s.date DESC"),
+    ("spend by month", "SELECT date_trunc('month', date)::date AS month, category, SUM(amount) AS total FROM transactions_subtransaction GROUP BY 1, 2 ORDER BY 1, 2"),
+    ("top actors", "SELECT a.name, COUNT(*) AS items, SUM(s.amount) AS total FROM transactions_subtransaction s JOIN transactions_actor a ON a.id = s.actor_id GROUP BY a.name ORDER BY total DESC LIMIT 20"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the size in bytes and estimated tokens of execute_sql results in each "
+        "output format on a synthetic dataset. Everything is created inside a transaction "
+        "that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=200)
+        parser.add_argument("--sub-transactions-per-transaction", type=int, default=5)
+        parser.add_argument("--row-limit", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user_id = self._seed(options)
+            self._measure(user_id, options["row_limit"])
+            transaction.set_rollback(True)
+
+    def _seed(self, options) -> int:
+        random.seed(0)
+        user = get_user_model().objects.create_user(email="benchmark-formats@example.com", password=None)
+        categories = [name for name, _ in TransactionCategory.get_all_as_options()]
+        actors = Actor.objects.bulk_create([
+            Actor(user=user, name=name)
+            for name in ("Supermercado Pão de Açúcar", "Posto Ipiranga", "Farmácia São João", "iFood", "Uber", "Netflix", "Enel", "Sabesp")
+        ])
+        bills = Transaction.objects.bulk_create([
+            Transaction(
+                user=user,
+                due_date=date(2025, 1, 1) + timedelta(days=index % 365),
+                total_amount=Decimal(random.randint(1000, 500000)) / 100,
+                transaction_identifier=f"Fatura {index}",
+                transaction_type=random.choice(["outgoing"] * 9 + ["incoming"]),
+                category=random.choice(categories),
+                is_recurrent=index % 7 == 0,
+            )
+            for index in range(options["transactions"])
+        ])
+        SubTransaction.objects.bulk_create([
+            SubTransaction(
+                transaction=bill,
+                date=bill.due_date,
+                description=f"Compra {index} parcela 1/3",
+                amount=Decimal(random.randint(100, 50000)) / 100,
+                actor=random.choice(actors),
+                category=random.choice(categories),
+            )
+            for bill in bills
+            for index in range(options["sub_transactions_per_transaction"])
+        ])
+        return user.id
+
+    def _measure(self, user_id: int, row_limit: int):
+        scoper = QueryScoperService()
+        factory = QueryResultFactory()
+        header = f"{'query':<16}{'rows':>6}" + "".join(f"{name:>22}" for name in OUTPUT_FORMATS)
+        self.stdout.write("bytes / estimated tokens (vs json)")
+        self.stdout.write(header)
+        for name, query in QUERIES:
+            wrapped, params = scoper.scope(query, user_id=user_id, row_limit=row_limit)
+            with connection.cursor() as cursor:
+                cursor.execute(wrapped, params)
+                result = factory.from_cursor(cursor, started_at_ms=0, row_limit=row_limit, now_ms=0)
+
+            sizes = {output_format: factory.to_payload(result, output_format)["size"] for output_format in OUTPUT_FORMATS}
+            json_tokens = sizes["json"]["estimated_tokens"]
+            cells = "".join(
+                f"{size['bytes']:>8} / {size['estimated_tokens']:>5} {size['estimated_tokens'] / json_tokens:>4.0%}"
+                for size in sizes.values()
+            )
+            self.stdout.write(f"{name:<16}{result.row_count:>6}{cells}")
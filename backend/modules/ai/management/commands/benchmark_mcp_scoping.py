@@ -0,0 +1,137 @@
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from modules.ai.mcp import row_level_security
+from modules.ai.mcp.services.query_scoper import SCOPED_TABLES_CTE, QueryScoperService
+from modules.loans.models import Loan, LoanPayment
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+# Queries the agent typically sends through execute_sql. ``{transaction_id}``
+# is replaced by one of the measured user's transactions.
+QUERIES = [
+    ("lookup by id", "SELECT id, transaction_identifier, total_amount FROM transactions_transaction WHERE id = {transaction_id}"),
+    ("latest bills", "SELECT due_date, total_amount FROM transactions_transaction ORDER BY due_date DESC LIMIT 10"),
+    ("spend by category", "SELECT category, SUM(amount) FROM transactions_subtransaction WHERE date >= '2025-01-01' GROUP BY category"),
+    ("top actors", "SELECT a.name, SUM(s.amount) AS total FROM transactions_subtransaction s JOIN transactions_actor a ON a.id = s.actor_id GROUP BY a.name ORDER BY total DESC LIMIT 5"),
+    ("active loans", "SELECT COUNT(*) FROM loans_loan WHERE status = 'active'"),
+    ("loan payments", "SELECT l.description, SUM(p.amount) FROM loans_loanpayment p JOIN loans_loan l ON l.id = p.loan_id GROUP BY l.description"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare execute_sql scoping with every CTE, table-aware CTEs and row-level "
+        "security on a synthetic dataset. Queries run as the MCP read-only role; "
+        "everything is created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=20)
+        parser.add_argument("--transactions-per-user", type=int, default=2000)
+        parser.add_argument("--sub-transactions-per-transaction", type=int, default=5)
+        parser.add_argument("--iterations", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user_id, transaction_id = self._seed(options)
+            self._measure(user_id, transaction_id, options["iterations"])
+            transaction.set_rollback(True)
+
+    def _seed(self, options) -> tuple[int, int]:
+        started = time.perf_counter()
+        random.seed(0)
+        User = get_user_model()
+        users = [
+            User.objects.create_user(email=f"benchmark-scoping-{index}@example.com", password=None)
+            for index in range(options["users"])
+        ]
+        measured_bill = None
+        for user in users:
+            actors = Actor.objects.bulk_create([Actor(user=user, name=f"Actor {index}") for index in range(30)])
+            bills = Transaction.objects.bulk_create([
+                Transaction(
+                    user=user,
+                    due_date=date(2023, 1, 1) + timedelta(days=index % 1000),
+                    total_amount=Decimal(random.randint(100, 100000)) / 100,
+                    transaction_identifier=f"Bill {index}",
+                )
+                for index in range(options["transactions_per_user"])
+            ], batch_size=5000)
+            measured_bill = measured_bill or bills[0]
+            SubTransaction.objects.bulk_create([
+                SubTransaction(
+                    transaction=bill,
+                    date=bill.due_date,
+                    description=f"Item {index}",
+                    amount=Decimal(random.randint(100, 10000)) / 100,
+                    actor=random.choice(actors),
+                )
+                for bill in bills
+                for index in range(options["sub_transactions_per_transaction"])
+            ], batch_size=5000)
+            loans = Loan.objects.bulk_create([
+                Loan(user=user, actor=random.choice(actors), principal_amount=Decimal(1000), lent_at=date(2025, 1, 1), description=f"Loan {index}")
+                for index in range(20)
+            ])
+            LoanPayment.objects.bulk_create([
+                LoanPayment(loan=loan, amount=Decimal(100), paid_at=date(2025, 2, 1))
+                for loan in loans
+                for _ in range(5)
+            ])
+
+        with connection.cursor() as cursor:
+            for table in SubTransaction, Transaction, Actor, Loan, LoanPayment:
+                cursor.execute(f"ANALYZE {table._meta.db_table}")
+
+        self.stdout.write(f"Seeded {len(users)} users in {time.perf_counter() - started:.1f}s")
+        return users[0].id, measured_bill.id
+
+    def _measure(self, user_id: int, transaction_id: int, iterations: int):
+        scoper = QueryScoperService()
+        role = row_level_security.quote_ident(settings.MCP_DATABASE_USER)
+        timings = []
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL ROLE {role}")
+        for name, query in QUERIES:
+            query = query.format(transaction_id=transaction_id)
+            lazy, params = scoper.scope(query, user_id=user_id)
+            full = lazy.replace(scoper.ctes_for(query), SCOPED_TABLES_CTE, 1)
+            timings.append((name, query, self._median_ms(full, params, iterations), self._median_ms(lazy, params, iterations)))
+
+        # The policies hide every row from the CTE runs, so they come last.
+        with connection.cursor() as cursor:
+            cursor.execute("RESET ROLE")
+            # ALTER TABLE refuses to run while deferred FK checks are pending.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            for statement in row_level_security.enable_statements(
+                settings.MCP_DATABASE_USER, connection.settings_dict["USER"]
+            ):
+                cursor.execute(statement)
+            cursor.execute(f"SET LOCAL ROLE {role}")
+            cursor.execute("SET LOCAL app.user_id = %s", [str(user_id)])
+
+        self.stdout.write(f"{'query':<20}{'every CTE (ms)':>16}{'lazy (ms)':>12}{'rls (ms)':>12}{'lazy speedup':>14}")
+        for name, query, full_ms, lazy_ms in timings:
+            rls_ms = self._median_ms(query, None, iterations)
+            self.stdout.write(
+                f"{name:<20}{full_ms:>16.2f}{lazy_ms:>12.2f}{rls_ms:>12.2f}{full_ms / lazy_ms:>13.1f}x"
+            )
+
+    def _median_ms(self, sql: str, params: dict | None, iterations: int) -> float:
+        timings = []
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for _ in range(iterations):
+                started = time.perf_counter()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
@@ -3,11 +3,15 @@ from psycopg2 import sql
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
+from modules.ai.mcp import row_level_security
+
 
 class Command(BaseCommand):
     help = (
         "Create the read-only Postgres role for the MCP server and grant "
-        "SELECT-only privileges. Requires superuser DB credentials."
+        "SELECT-only privileges. With --scoping rls, also install the "
+        "row-level security policies of the scoped tables (and drop them "
+        "with --scoping cte). Requires superuser DB credentials."
     )
 
     def add_arguments(self, parser):
@@ -21,6 +25,12 @@ class Command(BaseCommand):
             required=True,
             help="Password for the admin user",
         )
+        parser.add_argument(
+            "--scoping",
+            choices=["cte", "rls"],
+            default=settings.MCP_SCOPING_MODE,
+            help="Scoping mode the MCP server runs with (default: MCP_SCOPING_MODE)",
+        )
 
     def handle(self, *args, **opts):
         role = settings.MCP_DATABASE_USER
@@ -41,6 +51,9 @@ class Command(BaseCommand):
         try:
             with conn.cursor() as cur:
                 role_ident = sql.Identifier(role)
+                # Policies depend on the role: drop them before the role.
+                for stmt in row_level_security.disable_statements():
+                    self._run(cur, sql.SQL(stmt))
                 self._run(cur, sql.SQL(
                     "DROP ROLE IF EXISTS {role}"
                 ).format(role=role_ident))
@@ -61,11 +74,17 @@ class Command(BaseCommand):
                     "GRANT SELECT ON TABLES TO {role}",
                 ]:
                     self._run(cur, sql.SQL(stmt).format(role=role_ident))
+                if opts["scoping"] == "rls":
+                    for stmt in row_level_security.enable_statements(
+                        role, settings.DATABASES["default"]["USER"]
+                    ):
+                        self._run(cur, sql.SQL(stmt))
         finally:
             conn.close()
 
         self.stdout.write(self.style.SUCCESS(
-            f"Role {role} created/reset with SELECT-only privileges."
+            f"Role {role} created/reset with SELECT-only privileges "
+            f"({opts['scoping']} scoping)."
         ))
 
     def _run(self, cur, statement, params=None):
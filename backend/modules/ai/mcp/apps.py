@@ -5,3 +5,6 @@ class MCPConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "modules.ai.mcp"
     label = "ai_mcp"
+
+    def ready(self):
+        from modules.ai.mcp import signals  # noqa: F401
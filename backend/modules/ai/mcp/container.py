@@ -1,18 +1,23 @@
 from dependency_injector import containers, providers
+from django.conf import settings
 
 from modules.ai.mcp.factories.enum_listing import EnumListingFactory
 from modules.ai.mcp.factories.query_result import QueryResultFactory
 from modules.ai.mcp.factories.sql_query import SqlQueryFactory
 from modules.ai.mcp.factories.table_schema import TableSchemaFactory
+from modules.ai.mcp.gateways.connection_pool import ReadOnlyConnectionPool
 from modules.ai.mcp.gateways.readonly_postgres import ReadOnlyPostgresGateway
 from modules.ai.mcp.repositories.schema_introspection import (
     SchemaIntrospectionRepository,
 )
 from modules.ai.mcp.services.query_scoper import QueryScoperService
+from modules.ai.mcp.services.result_cache import QueryResultCacheService
+from modules.ai.mcp.services.result_pages import ResultPageCacheService
 from modules.ai.mcp.services.sql_validator import SqlValidatorService
 from modules.ai.mcp.use_cases.describe_schema import DescribeSchemaUseCase
 from modules.ai.mcp.use_cases.execute_sql import ExecuteSqlUseCase
 from modules.ai.mcp.use_cases.list_enums import ListEnumsUseCase
+from modules.base.services import VersionedCacheService
 
 
 class MCPContainer(containers.DeclarativeContainer):
@@ -24,17 +29,27 @@ class MCPContainer(containers.DeclarativeContainer):
     # SERVICES
     sql_validator = providers.Singleton(SqlValidatorService)
     query_scoper = providers.Singleton(QueryScoperService)
+    versioned_cache_service = providers.Singleton(VersionedCacheService)
+    result_page_cache = providers.Singleton(ResultPageCacheService)
+    query_result_cache = providers.Singleton(
+        QueryResultCacheService,
+        versioned_cache_service=versioned_cache_service,
+    )
 
     sql_query_factory = providers.Singleton(
         SqlQueryFactory,
         sql_validator=sql_validator,
         query_scoper=query_scoper,
+        scoping_mode=settings.MCP_SCOPING_MODE,
     )
 
     # GATEWAYS
+    readonly_connection_pool = providers.Singleton(ReadOnlyConnectionPool.from_settings)
     readonly_postgres_gateway = providers.Singleton(
         ReadOnlyPostgresGateway,
         query_result_factory=query_result_factory,
+        connection_pool=readonly_connection_pool,
+        fetch_batch_size=settings.MCP_SQL_FETCH_BATCH_SIZE,
     )
 
     # REPOSITORIES
@@ -48,6 +63,8 @@ class MCPContainer(containers.DeclarativeContainer):
         ExecuteSqlUseCase,
         sql_query_factory=sql_query_factory,
         readonly_postgres_gateway=readonly_postgres_gateway,
+        result_page_cache=result_page_cache,
+        query_result_cache=query_result_cache,
     )
     describe_schema_use_case = providers.Singleton(
         DescribeSchemaUseCase,
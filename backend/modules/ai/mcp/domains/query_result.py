@@ -1,16 +1,24 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 
 @dataclass(frozen=True)
 class QueryResult:
-    """Result of an `execute_sql` call, ready to be serialized to MCP."""
+    """Result of an `execute_sql` call, ready to be serialized to MCP.
+
+    `truncated` means the query has more rows than `rows`; `next_cursor`, when
+    set, fetches the next page of them without running the query again.
+    `cache` says whether the rows came from the result cache, with the user's
+    hit rate.
+    """
 
     columns: list[str]
     rows: list[list[Any]]
     row_count: int
     truncated: bool
     execution_ms: int
+    next_cursor: Optional[str] = None
+    cache: Optional[dict] = None
 
     def to_dict(self) -> dict:
         return {
@@ -19,4 +27,6 @@ class QueryResult:
             "row_count": self.row_count,
             "truncated": self.truncated,
             "execution_ms": self.execution_ms,
+            "next_cursor": self.next_cursor,
+            "cache": self.cache,
         }
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -8,8 +9,12 @@ class SqlQuery:
     `raw` is what the agent sent; `wrapped` is the version we execute (with
     CTEs that shadow real table names to enforce user_id and soft-delete
     filtering). `params` holds psycopg bind values.
+
+    In row-level security mode `wrapped` is the agent's query unchanged and
+    `rls_user_id` is the user the gateway binds to `app.user_id` around it.
     """
 
     raw: str
     wrapped: str
     params: dict = field(default_factory=dict)
+    rls_user_id: Optional[int] = None
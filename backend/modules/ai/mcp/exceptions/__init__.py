@@ -5,6 +5,8 @@ from modules.ai.mcp.exceptions.mcp import (
     SqlTimeoutError,
     SqlPermissionDeniedError,
     SqlInvalidError,
+    SqlPoolExhaustedError,
+    SqlCursorExpiredError,
     SchemaIntrospectionError,
 )
 
@@ -15,5 +17,7 @@ __all__ = [
     "SqlTimeoutError",
     "SqlPermissionDeniedError",
     "SqlInvalidError",
+    "SqlPoolExhaustedError",
+    "SqlCursorExpiredError",
     "SchemaIntrospectionError",
 ]
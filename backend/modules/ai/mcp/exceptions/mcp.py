@@ -30,5 +30,13 @@ class SqlInvalidError(MCPError):
     code = "SQL_INVALID"
 
 
+class SqlPoolExhaustedError(MCPError):
+    code = "SQL_POOL_EXHAUSTED"
+
+
+class SqlCursorExpiredError(MCPError):
+    code = "SQL_CURSOR_EXPIRED"
+
+
 class SchemaIntrospectionError(MCPError):
     code = "SCHEMA_INTROSPECTION_ERROR"
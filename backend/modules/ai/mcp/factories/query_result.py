@@ -1,8 +1,18 @@
+import csv
+import io
+import json
+import math
+import time
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Optional
 
 from modules.ai.mcp.domains.query_result import QueryResult
+from modules.ai.mcp.exceptions import SqlInvalidError
+
+OUTPUT_FORMATS = ("json", "csv", "markdown_table", "columnar")
+# Rough ratio for estimated_tokens; close enough to compare formats.
+CHARS_PER_TOKEN = 4
 
 
 class QueryResultFactory:
@@ -12,10 +22,22 @@ class QueryResultFactory:
         *,
         started_at_ms: int,
         row_limit: int,
-        now_ms: int,
+        now_ms: Optional[int] = None,
+        batch_size: int = 500,
     ) -> QueryResult:
+        """Read up to `row_limit` rows, `batch_size` at a time.
+
+        One extra row tells whether the result was truncated. The description
+        is read after the first fetch: a named cursor only has it from then on.
+        `now_ms` defaults to the time the last row was read.
+        """
+        raw_rows = []
+        while len(raw_rows) <= row_limit:
+            batch = cursor.fetchmany(min(batch_size, row_limit + 1 - len(raw_rows)))
+            if not batch:
+                break
+            raw_rows.extend(batch)
         columns = [d[0] for d in cursor.description]
-        raw_rows = cursor.fetchall()
 
         truncated = len(raw_rows) > row_limit
         if truncated:
@@ -25,6 +47,8 @@ class QueryResultFactory:
             [self._serialize(cell) for cell in row]
             for row in raw_rows
         ]
+        if now_ms is None:
+            now_ms = int(time.monotonic() * 1000)
         execution_ms = max(0, now_ms - started_at_ms)
         return QueryResult(
             columns=columns,
@@ -34,6 +58,80 @@ class QueryResultFactory:
             execution_ms=execution_ms,
         )
 
+    def to_payload(self, result: QueryResult, output_format: Optional[str] = None) -> dict:
+        """Render `result` in one of ``OUTPUT_FORMATS`` (``json`` by default).
+
+        ``size`` reports the JSON text of the payload as it is before ``size``
+        itself is added, in bytes and in estimated tokens.
+        """
+        output_format = self.check_format(output_format)
+        if output_format == "json":
+            payload = result.to_dict()
+        else:
+            payload = {
+                "format": output_format,
+                **self._render(result, output_format),
+                "row_count": result.row_count,
+                "truncated": result.truncated,
+                "execution_ms": result.execution_ms,
+                "next_cursor": result.next_cursor,
+                "cache": result.cache,
+            }
+
+        text = json.dumps(payload, ensure_ascii=False)
+        payload["size"] = {
+            "bytes": len(text.encode("utf-8")),
+            "estimated_tokens": math.ceil(len(text) / CHARS_PER_TOKEN),
+        }
+        return payload
+
+    def check_format(self, output_format: Optional[str]) -> str:
+        output_format = output_format or "json"
+        if output_format not in OUTPUT_FORMATS:
+            raise SqlInvalidError(
+                f"format must be one of {', '.join(OUTPUT_FORMATS)}, got {output_format!r}"
+            )
+        return output_format
+
+    def _render(self, result: QueryResult, output_format: str) -> dict:
+        if output_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(result.columns)
+            writer.writerows(result.rows)
+            return {"data": buffer.getvalue()}
+        if output_format == "markdown_table":
+            lines = [
+                self._markdown_row(result.columns),
+                "|" + "---|" * len(result.columns),
+                *(self._markdown_row(row) for row in result.rows),
+            ]
+            return {"data": "\n".join(lines)}
+        return {"columns": [
+            self._column(name, [row[index] for row in result.rows])
+            for index, name in enumerate(result.columns)
+        ]}
+
+    def _column(self, name: str, values: list[Any]) -> dict:
+        """Dictionary-encode a column whose values repeat (category,
+        transaction_type...): each distinct value is sent once, and rows refer
+        to it by position.
+        """
+        try:
+            dictionary = list(dict.fromkeys(values))
+        except TypeError:  # json/array columns are not hashable
+            return {"name": name, "values": values}
+        if len(dictionary) * 2 > len(values):
+            return {"name": name, "values": values}
+        codes = {value: code for code, value in enumerate(dictionary)}
+        return {"name": name, "dictionary": dictionary, "codes": [codes[value] for value in values]}
+
+    def _markdown_row(self, cells: list[Any]) -> str:
+        return "| " + " | ".join(
+            "" if cell is None else str(cell).replace("|", "\\|").replace("\n", " ")
+            for cell in cells
+        ) + " |"
+
     def _serialize(self, value: Any) -> Any:
         if isinstance(value, Decimal):
             return str(value)
@@ -3,16 +3,25 @@ from modules.ai.mcp.services.sql_validator import SqlValidatorService
 from modules.ai.mcp.services.query_scoper import QueryScoperService
 
 
+SCOPING_MODES = ("cte", "rls")
+
+
 class SqlQueryFactory:
     def __init__(
         self,
         sql_validator: SqlValidatorService,
         query_scoper: QueryScoperService,
+        scoping_mode: str = "cte",
     ):
+        if scoping_mode not in SCOPING_MODES:
+            raise ValueError(f"scoping_mode must be one of {SCOPING_MODES}, got {scoping_mode!r}")
         self.sql_validator = sql_validator
         self.query_scoper = query_scoper
+        self.scoping_mode = scoping_mode
 
-    def from_raw(self, raw: str, *, user_id: int) -> SqlQuery:
+    def from_raw(self, raw: str, *, user_id: int, row_limit: int = 1000) -> SqlQuery:
         cleaned = self.sql_validator.validate(raw)
-        wrapped, params = self.query_scoper.scope(cleaned, user_id=user_id)
+        if self.scoping_mode == "rls":
+            return SqlQuery(raw=cleaned, wrapped=cleaned, rls_user_id=user_id)
+        wrapped, params = self.query_scoper.scope(cleaned, user_id=user_id, row_limit=row_limit)
         return SqlQuery(raw=cleaned, wrapped=wrapped, params=params)
@@ -0,0 +1,203 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from modules.ai.mcp.exceptions import SqlPoolExhaustedError
+
+logger = logging.getLogger("modules.ai.mcp")
+
+
+class ReadOnlyConnectionPool:
+    """Thread-safe pool of psycopg2 connections authenticated as the read-only role.
+
+    Session settings (read-only, autocommit, timeouts) are applied once, when a
+    connection is opened. A connection is lent to one caller at a time; when all
+    ``max_size`` are busy, callers wait up to ``timeout`` seconds and then get
+    ``SqlPoolExhaustedError``. Connections idle for longer than
+    ``healthcheck_interval`` are pinged before being lent, and a connection that
+    failed at the protocol level is closed instead of returned to the pool.
+
+    psycopg2 is imported lazily so the module can be imported without it.
+    """
+
+    def __init__(self, min_size: int, max_size: int, timeout: float, healthcheck_interval: float):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.healthcheck_interval = healthcheck_interval
+
+        self._condition = threading.Condition()
+        self._idle: list[tuple[object, float]] = []
+        self._size = 0
+        self._filled = False
+        self._counters = {"checkouts": 0, "waits": 0, "timeouts": 0, "discarded": 0}
+
+    @classmethod
+    def from_settings(cls) -> "ReadOnlyConnectionPool":
+        return cls(
+            min_size=settings.MCP_DB_POOL_MIN_SIZE,
+            max_size=settings.MCP_DB_POOL_MAX_SIZE,
+            timeout=settings.MCP_DB_POOL_TIMEOUT,
+            healthcheck_interval=settings.MCP_DB_POOL_HEALTHCHECK_INTERVAL,
+        )
+
+    @contextmanager
+    def connection(self):
+        """Lend a connection for the duration of the block."""
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception as exc:
+            self.release(conn, discard=self._is_broken(conn, exc))
+            raise
+        else:
+            self.release(conn)
+
+    def acquire(self):
+        self._fill()
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            self._counters["checkouts"] += 1
+            waited = False
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["timeouts"] += 1
+                    raise SqlPoolExhaustedError(
+                        f"all {self.max_size} read-only connections are busy, retry shortly"
+                    )
+                if not waited:
+                    self._counters["waits"] += 1
+                    waited = True
+                self._condition.wait(remaining)
+
+            if self._idle:
+                conn, idle_since = self._idle.pop()
+            else:
+                conn, idle_since = None, None
+                self._size += 1
+
+        if conn is not None and self._is_healthy(conn, idle_since):
+            return conn
+        if conn is not None:
+            self._close(conn)
+            with self._condition:
+                self._counters["discarded"] += 1
+
+        try:
+            return self._connect()
+        except Exception:
+            self._forget()
+            raise
+
+    def release(self, conn, discard: bool = False):
+        if discard or conn.closed:
+            self._close(conn)
+            with self._condition:
+                self._counters["discarded"] += 1
+            self._forget()
+            return
+
+        with self._condition:
+            self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+                **self._counters,
+            }
+
+    def close(self):
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._filled = False
+        for conn, _ in idle:
+            self._close(conn)
+
+    def _fill(self):
+        if self._filled:
+            return
+        with self._condition:
+            if self._filled:
+                return
+            self._filled = True
+            missing = max(self.min_size - self._size, 0)
+            self._size += missing
+        for _ in range(missing):
+            try:
+                conn = self._connect()
+            except Exception:
+                logger.warning("mcp.pool could not open a read-only connection", exc_info=True)
+                self._forget()
+                continue
+            with self._condition:
+                self._idle.append((conn, time.monotonic()))
+                self._condition.notify()
+
+    def _forget(self):
+        """Give back the slot of a connection that was closed or never opened."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _connect(self):
+        import psycopg2  # noqa: PLC0415
+        from psycopg2.extensions import ISOLATION_LEVEL_READ_COMMITTED  # noqa: PLC0415
+
+        db = settings.DATABASES["default"]
+        conn = psycopg2.connect(
+            host=db["HOST"],
+            port=db["PORT"],
+            dbname=db["NAME"],
+            user=settings.MCP_DATABASE_USER,
+            password=settings.MCP_DATABASE_PASSWORD,
+            connect_timeout=5,
+        )
+        conn.set_isolation_level(ISOLATION_LEVEL_READ_COMMITTED)
+        conn.set_session(readonly=True, autocommit=True)
+        with conn.cursor() as cur:
+            cur.execute("SET statement_timeout = '5s'")
+            cur.execute("SET idle_in_transaction_session_timeout = '5s'")
+            cur.execute("SET lock_timeout = '2s'")
+        return conn
+
+    def _is_healthy(self, conn, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.healthcheck_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            return True
+        except Exception:
+            logger.info("mcp.pool dropping a read-only connection that failed its health check")
+            return False
+
+    def _is_broken(self, conn, exc: Exception) -> bool:
+        """Whether the connection itself failed, as opposed to the statement it ran."""
+        import psycopg2  # noqa: PLC0415
+        from psycopg2 import errors as pg_errors  # noqa: PLC0415
+
+        if conn.closed:
+            return True
+        if isinstance(exc, pg_errors.QueryCanceled):
+            return False
+        return isinstance(exc, psycopg2.InterfaceError | psycopg2.OperationalError)
+
+    def _close(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
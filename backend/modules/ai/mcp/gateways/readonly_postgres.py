@@ -1,7 +1,6 @@
 import logging
 import time
-
-from django.conf import settings
+from typing import Optional
 
 from modules.ai.mcp.domains.query_result import QueryResult
 from modules.ai.mcp.domains.sql_query import SqlQuery
@@ -11,89 +10,93 @@ from modules.ai.mcp.exceptions import (
     SqlTimeoutError,
 )
 from modules.ai.mcp.factories.query_result import QueryResultFactory
+from modules.ai.mcp.gateways.connection_pool import ReadOnlyConnectionPool
 
 
 logger = logging.getLogger("modules.ai.mcp")
 
+CURSOR_NAME = "mcp_execute_sql"
+
 
 class ReadOnlyPostgresGateway:
-    """Holds a single psycopg2 connection authenticated as the read-only role.
+    """Runs scoped queries on connections authenticated as the read-only role.
 
-    A new connection is opened lazily on first use and reused for the life of
-    the MCP process. On any failure we close and re-open on the next call.
+    Connections come from a ``ReadOnlyConnectionPool`` so concurrent requests
+    (gunicorn threads) never share one, and a failing query only costs the
+    connection it ran on, if anything. Results are streamed through a
+    server-side cursor, ``fetch_batch_size`` rows at a time.
 
     psycopg2 is imported lazily inside methods so that the module can be
     imported (e.g. by the DI container) even when psycopg2 is not installed.
     """
 
-    def __init__(self, query_result_factory: QueryResultFactory):
+    def __init__(
+        self,
+        query_result_factory: QueryResultFactory,
+        connection_pool: Optional[ReadOnlyConnectionPool] = None,
+        fetch_batch_size: int = 500,
+    ):
         self.query_result_factory = query_result_factory
-        self._conn = None
+        self.connection_pool = connection_pool or ReadOnlyConnectionPool.from_settings()
+        self.fetch_batch_size = fetch_batch_size
 
-    def _connect(self):
-        import psycopg2  # noqa: PLC0415
-        from psycopg2.extensions import ISOLATION_LEVEL_READ_COMMITTED  # noqa: PLC0415
-
-        db = settings.DATABASES["default"]
-        conn = psycopg2.connect(
-            host=db["HOST"],
-            port=db["PORT"],
-            dbname=db["NAME"],
-            user=settings.MCP_DATABASE_USER,
-            password=settings.MCP_DATABASE_PASSWORD,
-            connect_timeout=5,
-        )
-        conn.set_isolation_level(ISOLATION_LEVEL_READ_COMMITTED)
-        conn.set_session(readonly=True, autocommit=True)
-        with conn.cursor() as cur:
-            cur.execute("SET statement_timeout = '5s'")
-            cur.execute("SET idle_in_transaction_session_timeout = '5s'")
-            cur.execute("SET lock_timeout = '2s'")
-        return conn
-
-    def _get_conn(self):
-        if self._conn is None or self._conn.closed:
-            self._conn = self._connect()
-        return self._conn
-
-    def execute(self, query: SqlQuery) -> QueryResult:
+    def execute(self, query: SqlQuery, *, row_limit: int = 1000) -> QueryResult:
         import psycopg2  # noqa: PLC0415
         from psycopg2 import errors as pg_errors  # noqa: PLC0415
 
-        conn = self._get_conn()
-        started = time.monotonic()
         try:
-            with conn.cursor() as cur:
-                cur.execute(query.wrapped, query.params)
-                return self.query_result_factory.from_cursor(
-                    cur,
-                    started_at_ms=int(started * 1000),
-                    row_limit=1000,
-                    now_ms=int(time.monotonic() * 1000),
-                )
+            with self.connection_pool.connection() as conn:
+                return self._stream(conn, query, row_limit)
         except pg_errors.QueryCanceled as exc:
-            self._reset()
             raise SqlTimeoutError("query exceeded 5s, add filters or aggregate") from exc
         except pg_errors.InsufficientPrivilege as exc:
-            self._reset()
             raise SqlPermissionDeniedError(str(exc)) from exc
         except pg_errors.ReadOnlySqlTransaction as exc:
-            self._reset()
             raise SqlPermissionDeniedError(
                 "MCP connection is read-only"
             ) from exc
         except psycopg2.Error as exc:
-            self._reset()
             raise SqlInvalidError(str(exc).strip()) from exc
 
+    def _stream(self, conn, query: SqlQuery, row_limit: int) -> QueryResult:
+        """Read the result through a named (server-side) cursor, so rows reach
+        Python one batch at a time and at most `row_limit` + 1 are ever read.
+
+        Named cursors need a transaction: the connection leaves autocommit for
+        the duration of the query and the transaction is always rolled back.
+        In row-level security mode `app.user_id` is set in that transaction, so
+        a pooled connection never carries one user's id into the next query.
+        """
+        conn.autocommit = False
+        try:
+            if query.rls_user_id is not None:
+                with conn.cursor() as cur:
+                    cur.execute("SET LOCAL app.user_id = %s", [str(query.rls_user_id)])
+            with conn.cursor(name=CURSOR_NAME) as cur:
+                cur.itersize = self.fetch_batch_size
+                started = time.monotonic()
+                # Without bind values (rls mode) a `%` in the agent's SQL reaches Postgres as is.
+                cur.execute(query.wrapped, query.params or None)
+                return self.query_result_factory.from_cursor(
+                    cur,
+                    started_at_ms=int(started * 1000),
+                    row_limit=row_limit,
+                    batch_size=self.fetch_batch_size,
+                )
+        finally:
+            try:
+                conn.rollback()
+                conn.autocommit = True
+            except Exception:
+                logger.info("mcp.sql could not end the read-only transaction")
+
     def execute_raw_for_test(self, sql: str) -> QueryResult:
         """Test-only escape hatch: run a raw SQL string with no wrapping."""
         import psycopg2  # noqa: PLC0415
         from psycopg2 import errors as pg_errors  # noqa: PLC0415
 
-        conn = self._get_conn()
         try:
-            with conn.cursor() as cur:
+            with self.connection_pool.connection() as conn, conn.cursor() as cur:
                 cur.execute(sql)
                 if cur.description:
                     return self.query_result_factory.from_cursor(
@@ -102,22 +105,11 @@ class ReadOnlyPostgresGateway:
                 return QueryResult(columns=[], rows=[], row_count=0,
                                    truncated=False, execution_ms=0)
         except pg_errors.InsufficientPrivilege as exc:
-            self._reset()
             raise SqlPermissionDeniedError(str(exc)) from exc
         except pg_errors.ReadOnlySqlTransaction as exc:
-            self._reset()
             raise SqlPermissionDeniedError("read-only transaction") from exc
         except psycopg2.Error as exc:
-            self._reset()
             raise SqlInvalidError(str(exc).strip()) from exc
 
-    def _reset(self):
-        if self._conn is not None:
-            try:
-                self._conn.close()
-            except Exception:
-                pass
-            self._conn = None
-
     def close(self):
-        self._reset()
+        self.connection_pool.close()
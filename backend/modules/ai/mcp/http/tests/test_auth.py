@@ -12,10 +12,12 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from modules.ai.mcp.http.auth import user_id_from_bearer_token
 from modules.ai.mcp.models import MCPOAuthClient, MCPAccessToken
+from modules.ai.mcp.oauth.container import OAuthContainer
+from modules.ai.mcp.oauth.services.token_cache import token_cache
 from modules.ai.mcp.oauth.services.token_generator import TokenGeneratorService
 
 
@@ -50,3 +52,38 @@ class TestBearerAuth(TestCase):
 
     def test_unknown_token(self):
         self.assertIsNone(user_id_from_bearer_token("Bearer not-a-real-token"))
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TestBearerAuthTokenCache(TestCase):
+    def setUp(self):
+        token_cache.cache.clear()
+        self.user = User.objects.create_user(email="cache@u.com", password="x")
+        client = MCPOAuthClient.objects.create(
+            client_id="mcp_cache", name="X", redirect_uris=[], user_id=self.user.id,
+        )
+        self.plaintext, self.token_hash = TokenGeneratorService().generate_access_token()
+        MCPAccessToken.objects.create(
+            token_hash=self.token_hash, client=client, user_id=self.user.id,
+            scope="mcp:read",
+            expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        )
+        self.header = f"Bearer {self.plaintext}"
+
+    def test_repeated_calls_skip_the_database(self):
+        with self.assertNumQueries(1):
+            user_id_from_bearer_token(self.header)
+        with self.assertNumQueries(0):
+            self.assertEqual(user_id_from_bearer_token(self.header), self.user.id)
+
+    def test_revoke_by_hash_takes_effect_immediately(self):
+        user_id_from_bearer_token(self.header)
+        OAuthContainer().access_token_repository().revoke_by_hash(self.token_hash)
+        self.assertIsNone(user_id_from_bearer_token(self.header))
+
+    def test_revoke_all_takes_effect_immediately(self):
+        user_id_from_bearer_token(self.header)
+        OAuthContainer().access_token_repository().revoke_all(
+            client_id="mcp_cache", user_id=self.user.id,
+        )
+        self.assertIsNone(user_id_from_bearer_token(self.header))
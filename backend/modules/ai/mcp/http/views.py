@@ -8,7 +8,7 @@ from django.views.decorators.http import require_POST
 from modules.ai.mcp.container import MCPContainer
 from modules.ai.mcp.http.auth import user_id_from_bearer_token
 from modules.ai.mcp.tools.execute_sql import (
-    EXECUTE_SQL_DESCRIPTION, call_execute_sql,
+    call_execute_sql, execute_sql_description, execute_sql_input_schema,
 )
 from modules.ai.mcp.tools.describe_schema import (
     DESCRIBE_SCHEMA_DESCRIPTION, call_describe_schema,
@@ -32,12 +32,8 @@ def _tools_list() -> list[dict]:
     return [
         {
             "name": "execute_sql",
-            "description": EXECUTE_SQL_DESCRIPTION,
-            "inputSchema": {
-                "type": "object",
-                "properties": {"query": {"type": "string"}},
-                "required": ["query"],
-            },
+            "description": execute_sql_description(),
+            "inputSchema": execute_sql_input_schema(),
         },
         {
             "name": "describe_schema",
@@ -58,9 +54,13 @@ def _tools_list() -> list[dict]:
 def _call_tool(name: str, arguments: dict, user_id: int) -> dict:
     if name == "execute_sql":
         return call_execute_sql(
-            query=arguments["query"],
+            query=arguments.get("query"),
             use_case=_mcp_container.execute_sql_use_case(),
+            query_result_factory=_mcp_container.query_result_factory(),
             user_id=user_id,
+            row_limit=arguments.get("row_limit"),
+            cursor=arguments.get("cursor"),
+            output_format=arguments.get("format"),
         )
     if name == "describe_schema":
         return call_describe_schema(
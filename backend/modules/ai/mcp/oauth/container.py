@@ -8,6 +8,7 @@ from modules.ai.mcp.oauth.repositories.auth_code import AuthorizationCodeReposit
 from modules.ai.mcp.oauth.repositories.access_token import AccessTokenRepository
 from modules.ai.mcp.oauth.services.pkce import PKCEService
 from modules.ai.mcp.oauth.services.token_generator import TokenGeneratorService
+from modules.ai.mcp.oauth.services.token_cache import token_cache as process_token_cache
 from modules.ai.mcp.oauth.use_cases.register_client import RegisterClientUseCase
 from modules.ai.mcp.oauth.use_cases.authorize import AuthorizeUseCase
 from modules.ai.mcp.oauth.use_cases.exchange_code import ExchangeCodeUseCase
@@ -25,6 +26,8 @@ class OAuthContainer(containers.DeclarativeContainer):
     # SERVICES
     pkce_service = providers.Singleton(PKCEService)
     token_generator = providers.Singleton(TokenGeneratorService)
+    # One per process, shared by every container, so the hit counters add up.
+    token_cache = providers.Object(process_token_cache)
 
     # REPOSITORIES
     client_repository = providers.Singleton(
@@ -34,7 +37,7 @@ class OAuthContainer(containers.DeclarativeContainer):
         AuthorizationCodeRepository, factory=auth_code_factory,
     )
     access_token_repository = providers.Singleton(
-        AccessTokenRepository, factory=access_token_factory,
+        AccessTokenRepository, factory=access_token_factory, token_cache=token_cache,
     )
 
     # USE CASES
@@ -60,6 +63,7 @@ class OAuthContainer(containers.DeclarativeContainer):
         VerifyTokenUseCase,
         access_token_repository=access_token_repository,
         token_generator=token_generator,
+        token_cache=token_cache,
     )
     revoke_use_case = providers.Singleton(
         RevokeUseCase,
@@ -4,11 +4,13 @@ from typing import Optional
 from modules.ai.mcp.models import MCPAccessToken, MCPOAuthClient
 from modules.ai.mcp.oauth.domains.access_token import AccessToken
 from modules.ai.mcp.oauth.factories.access_token import AccessTokenFactory
+from modules.ai.mcp.oauth.services.token_cache import TokenCacheService
 
 
 class AccessTokenRepository:
-    def __init__(self, factory: AccessTokenFactory):
+    def __init__(self, factory: AccessTokenFactory, token_cache: TokenCacheService):
         self.factory = factory
+        self.token_cache = token_cache
 
     def create(self, *, token_hash: str, client_id: str, user_id: int,
                scope: str, expires_at: datetime) -> AccessToken:
@@ -21,17 +23,25 @@ class AccessTokenRepository:
 
     def get_by_hash(self, token_hash: str) -> Optional[AccessToken]:
         try:
-            m = MCPAccessToken.objects.get(token_hash=token_hash)
+            m = MCPAccessToken.objects.select_related("client").get(token_hash=token_hash)
         except MCPAccessToken.DoesNotExist:
             return None
         return self.factory.from_model(m)
 
     def revoke_by_hash(self, token_hash: str) -> int:
-        return MCPAccessToken.objects.filter(
+        revoked = MCPAccessToken.objects.filter(
             token_hash=token_hash, revoked_at__isnull=True
         ).update(revoked_at=datetime.now(timezone.utc))
+        self.token_cache.invalidate([token_hash])
+        return revoked
 
     def revoke_all(self, *, client_id: str, user_id: int) -> int:
-        return MCPAccessToken.objects.filter(
+        tokens = MCPAccessToken.objects.filter(
             client__client_id=client_id, user_id=user_id, revoked_at__isnull=True
+        )
+        token_hashes = list(tokens.values_list("token_hash", flat=True))
+        revoked = MCPAccessToken.objects.filter(
+            token_hash__in=token_hashes, revoked_at__isnull=True
         ).update(revoked_at=datetime.now(timezone.utc))
+        self.token_cache.invalidate(token_hashes)
+        return revoked
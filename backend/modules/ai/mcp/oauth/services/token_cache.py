@@ -0,0 +1,91 @@
+import logging
+import math
+import threading
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.transaction import on_commit
+
+from modules.ai.mcp.oauth.domains.access_token import AccessToken
+
+logger = logging.getLogger(__name__)
+
+TOKEN_KEY = "mcp_access_token:{token_hash}"
+COUNTERS = ("hits", "misses", "errors")
+
+
+class TokenCacheService:
+    """Shared cache of access tokens by hash, in front of ``MCPAccessToken``.
+
+    Lives in the shared cache only, never in process memory, so a revocation
+    evicts the token for every worker at once. A valid token is kept at most
+    until it expires; revoked and expired tokens are cached too, since they can
+    never become valid again.
+
+    Hit/miss counters are kept per process. Cache failures fall back to the
+    database.
+    """
+
+    def __init__(self, cache_alias: str = "default"):
+        self.cache_alias = cache_alias
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(COUNTERS, 0)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get(self, token_hash: str) -> AccessToken | None:
+        try:
+            access_token = self.cache.get(TOKEN_KEY.format(token_hash=token_hash))
+        except Exception:
+            logger.warning("[TokenCache] Read failed", exc_info=True)
+            self._count("errors")
+            return None
+
+        self._count("hits" if access_token is not None else "misses")
+        return access_token
+
+    def set(self, access_token: AccessToken):
+        timeout = settings.MCP_TOKEN_CACHE_TIMEOUT
+        if access_token.revoked_at is None:
+            seconds_left = (access_token.expires_at - datetime.now(UTC)).total_seconds()
+            if seconds_left > 0:
+                timeout = min(timeout, math.ceil(seconds_left))
+
+        try:
+            self.cache.set(TOKEN_KEY.format(token_hash=access_token.token_hash), access_token, timeout=timeout)
+        except Exception:
+            logger.warning("[TokenCache] Write failed", exc_info=True)
+
+    def invalidate(self, token_hashes: list[str]):
+        """Evict tokens now and again once the revoking transaction commits.
+
+        The second pass drops any entry a concurrent verification cached from
+        the row as it was before the commit.
+        """
+        if not token_hashes:
+            return
+        self._delete(token_hashes)
+        on_commit(lambda: self._delete(token_hashes))
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else None
+        return counters
+
+    def _delete(self, token_hashes: list[str]):
+        try:
+            self.cache.delete_many([TOKEN_KEY.format(token_hash=token_hash) for token_hash in token_hashes])
+        except Exception:
+            logger.warning("[TokenCache] Could not invalidate %s token(s)", len(token_hashes), exc_info=True)
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+
+token_cache = TokenCacheService()
@@ -29,6 +29,7 @@ from modules.ai.mcp.oauth.factories.access_token import AccessTokenFactory
 from modules.ai.mcp.oauth.repositories.client import OAuthClientRepository
 from modules.ai.mcp.oauth.repositories.auth_code import AuthorizationCodeRepository
 from modules.ai.mcp.oauth.repositories.access_token import AccessTokenRepository
+from modules.ai.mcp.oauth.services.token_cache import TokenCacheService
 
 
 User = get_user_model()
@@ -92,7 +93,7 @@ class TestAuthorizationCodeRepository(TestCase):
 
 class TestAccessTokenRepository(TestCase):
     def setUp(self):
-        self.token_repo = AccessTokenRepository(factory=AccessTokenFactory())
+        self.token_repo = AccessTokenRepository(factory=AccessTokenFactory(), token_cache=TokenCacheService())
         self.user = User.objects.create_user(email="u@u.com", password="x")
         MCPOAuthClient.objects.create(client_id="mcp_x", name="C", redirect_uris=[])
 
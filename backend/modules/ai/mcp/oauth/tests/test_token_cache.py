@@ -0,0 +1,99 @@
+from datetime import UTC, datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from modules.ai.mcp.models import MCPAccessToken, MCPOAuthClient
+from modules.ai.mcp.oauth.domains.access_token import AccessToken
+from modules.ai.mcp.oauth.factories.access_token import AccessTokenFactory
+from modules.ai.mcp.oauth.repositories.access_token import AccessTokenRepository
+from modules.ai.mcp.oauth.services.token_cache import TokenCacheService, token_cache
+from modules.ai.mcp.oauth.services.token_generator import TokenGeneratorService
+from modules.ai.mcp.oauth.use_cases.verify_token import VerifyTokenUseCase
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def make_token(token_hash: str = "h", expires_in: timedelta = timedelta(days=1), revoked: bool = False) -> AccessToken:
+    now = datetime.now(UTC)
+    return AccessToken(
+        token_hash=token_hash, client_id="mcp_x", user_id=42, scope="mcp:read",
+        expires_at=now + expires_in, revoked_at=now if revoked else None,
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MCP_TOKEN_CACHE_TIMEOUT=300)
+class TestTokenCacheService(TestCase):
+    def setUp(self):
+        self.service = TokenCacheService()
+        self.service.cache.clear()
+
+    def test_set_then_get(self):
+        token = make_token()
+        self.service.set(token)
+        self.assertEqual(self.service.get("h"), token)
+
+    def test_valid_token_is_kept_until_it_expires_at_most(self):
+        self.service.set(make_token(expires_in=timedelta(seconds=30)))
+        expires_at = self.service.cache._expire_info[self.service.cache.make_and_validate_key("mcp_access_token:h")]
+        self.assertLessEqual(expires_at - datetime.now().timestamp(), 31)
+
+    def test_revoked_token_uses_default_timeout(self):
+        self.service.set(make_token(expires_in=timedelta(seconds=30), revoked=True))
+        expires_at = self.service.cache._expire_info[self.service.cache.make_and_validate_key("mcp_access_token:h")]
+        self.assertGreater(expires_at - datetime.now().timestamp(), 290)
+
+    def test_invalidate_evicts_immediately_and_after_commit(self):
+        self.service.set(make_token("a"))
+        self.service.set(make_token("b"))
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.service.invalidate(["a", "b"])
+            self.assertIsNone(self.service.get("a"))
+            self.service.set(make_token("a"))
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsNone(self.service.get("a"))
+        self.assertIsNone(self.service.get("b"))
+
+    def test_stats_report_hit_ratio(self):
+        self.assertIsNone(self.service.stats()["hit_ratio"])
+        self.service.set(make_token())
+        self.service.get("h")
+        self.service.get("h")
+        self.service.get("h")
+        self.service.get("unknown")
+        self.assertEqual(
+            self.service.stats(),
+            {"hits": 3, "misses": 1, "errors": 0, "hit_ratio": 0.75},
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MCP_TOKEN_CACHE_TIMEOUT=300)
+class TestTokenCacheInvalidationOnDelete(TestCase):
+    def setUp(self):
+        token_cache.cache.clear()
+        token_generator = TokenGeneratorService()
+        self.use_case = VerifyTokenUseCase(
+            access_token_repository=AccessTokenRepository(factory=AccessTokenFactory(), token_cache=token_cache),
+            token_generator=token_generator,
+            token_cache=token_cache,
+        )
+        self.user = get_user_model().objects.create_user(email="u@u.com", password="x")
+        self.client_model = MCPOAuthClient.objects.create(client_id="mcp_x", name="C", redirect_uris=[])
+        self.plaintext = "plain-token"
+        MCPAccessToken.objects.create(
+            token_hash=token_generator.hash_token(self.plaintext), client=self.client_model, user=self.user,
+            expires_at=datetime.now(UTC) + timedelta(days=1),
+        )
+        self.assertEqual(self.use_case.execute(plaintext_token=self.plaintext), self.user.id)
+
+    def test_deleting_the_user_invalidates_cached_tokens(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertIsNone(self.use_case.execute(plaintext_token=self.plaintext))
+
+    def test_deleting_the_client_invalidates_cached_tokens(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client_model.delete()
+        self.assertIsNone(self.use_case.execute(plaintext_token=self.plaintext))
@@ -11,9 +11,12 @@ class TestVerifyTokenUseCase(SimpleTestCase):
     def setUp(self):
         self.mock_token_repo = Mock()
         self.mock_token_gen = Mock()
+        self.mock_token_cache = Mock()
+        self.mock_token_cache.get.return_value = None
         self.use_case = VerifyTokenUseCase(
             access_token_repository=self.mock_token_repo,
             token_generator=self.mock_token_gen,
+            token_cache=self.mock_token_cache,
         )
 
     def test_returns_user_id_for_valid_token(self):
@@ -47,3 +50,39 @@ class TestVerifyTokenUseCase(SimpleTestCase):
             revoked_at=None,
         )
         self.assertIsNone(self.use_case.execute(plaintext_token="t"))
+
+    def test_cached_token_skips_repository(self):
+        self.mock_token_gen.hash_token.return_value = "h"
+        self.mock_token_cache.get.return_value = AccessToken(
+            token_hash="h", client_id="mcp_x", user_id=42, scope="mcp:read",
+            expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+            revoked_at=None,
+        )
+        self.assertEqual(self.use_case.execute(plaintext_token="t"), 42)
+        self.mock_token_repo.get_by_hash.assert_not_called()
+
+    def test_cached_token_is_still_checked_for_expiry(self):
+        self.mock_token_gen.hash_token.return_value = "h"
+        self.mock_token_cache.get.return_value = AccessToken(
+            token_hash="h", client_id="mcp_x", user_id=42, scope="mcp:read",
+            expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+            revoked_at=None,
+        )
+        self.assertIsNone(self.use_case.execute(plaintext_token="t"))
+
+    def test_cache_miss_stores_token(self):
+        self.mock_token_gen.hash_token.return_value = "h"
+        access_token = AccessToken(
+            token_hash="h", client_id="mcp_x", user_id=42, scope="mcp:read",
+            expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+            revoked_at=None,
+        )
+        self.mock_token_repo.get_by_hash.return_value = access_token
+        self.use_case.execute(plaintext_token="t")
+        self.mock_token_cache.set.assert_called_once_with(access_token)
+
+    def test_unknown_token_is_not_cached(self):
+        self.mock_token_gen.hash_token.return_value = "h"
+        self.mock_token_repo.get_by_hash.return_value = None
+        self.use_case.execute(plaintext_token="t")
+        self.mock_token_cache.set.assert_not_called()
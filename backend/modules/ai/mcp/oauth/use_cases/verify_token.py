@@ -3,15 +3,19 @@ from typing import Optional
 
 
 class VerifyTokenUseCase:
-    def __init__(self, access_token_repository, token_generator):
+    def __init__(self, access_token_repository, token_generator, token_cache):
         self.access_token_repository = access_token_repository
         self.token_generator = token_generator
+        self.token_cache = token_cache
 
     def execute(self, *, plaintext_token: str) -> Optional[int]:
         token_hash = self.token_generator.hash_token(plaintext_token)
-        access_token = self.access_token_repository.get_by_hash(token_hash)
+        access_token = self.token_cache.get(token_hash)
         if access_token is None:
-            return None
+            access_token = self.access_token_repository.get_by_hash(token_hash)
+            if access_token is None:
+                return None
+            self.token_cache.set(access_token)
         if not access_token.is_valid(datetime.now(timezone.utc)):
             return None
         return access_token.user_id
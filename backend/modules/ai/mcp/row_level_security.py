@@ -0,0 +1,96 @@
+"""Row-level security policies for the ``rls`` scoping mode.
+
+Each scoped table gets one SELECT policy for the read-only role, keyed on the
+``app.user_id`` setting that ``ReadOnlyPostgresGateway`` issues with
+``SET LOCAL`` for every query. When the setting is missing the policies match
+no row, so a connection that forgot to set it sees nothing.
+
+The policies mirror the CTEs of ``QueryScoperService``, with one difference:
+sub-transactions and loan payments are matched through their parent table,
+whose own policy applies, so rows of a soft-deleted bill or loan are hidden
+as well.
+
+Installed by ``mcp_setup_db --scoping rls``. Enabling row-level security does
+not affect the application role, which owns the tables.
+
+The policies are only as strong as ``app.user_id``. ``set_config()`` could
+rewrite it, and the functions that run a query passed as text (the
+``*_to_xml*`` family, ``ts_stat``) run it over SPI in the caller's
+transaction, so a string built at run time could call ``set_config()`` past
+any text check. Postgres grants these functions to PUBLIC, so the mode
+revokes them from PUBLIC and grants them back to the application role only.
+"""
+
+
+POLICY_NAME = "mcp_user_scope"
+APP_USER_ID = "NULLIF(current_setting('app.user_id', true), '')::bigint"
+
+POLICIES = {
+    "transactions_transaction": f"user_id = {APP_USER_ID} AND deleted_at IS NULL",
+    "transactions_actor": f"user_id = {APP_USER_ID} AND deleted_at IS NULL",
+    "transactions_subtransaction": (
+        "deleted_at IS NULL AND EXISTS ("
+        "SELECT 1 FROM public.transactions_transaction t "
+        f"WHERE t.id = transaction_id AND t.user_id = {APP_USER_ID})"
+    ),
+    "file_reader_file": f"user_id = {APP_USER_ID}",
+    "loans_loan": f"user_id = {APP_USER_ID} AND deleted_at IS NULL",
+    "loans_loanpayment": (
+        "deleted_at IS NULL AND EXISTS ("
+        "SELECT 1 FROM public.loans_loan l "
+        f"WHERE l.id = loan_id AND l.user_id = {APP_USER_ID})"
+    ),
+}
+
+# Functions the read-only role must not run, matched in pg_catalog.
+RESTRICTED_FUNCTIONS = (
+    "proname ~ '^(query|cursor|table|schema|database)_to_xml' "
+    "OR proname IN ('set_config', 'ts_stat')"
+)
+
+
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def enable_statements(role: str, app_role: str) -> list[str]:
+    statements = disable_statements() + [_restricted_functions_statement(
+        "'REVOKE EXECUTE ON FUNCTION ' || f || ' FROM PUBLIC'",
+        f"'GRANT EXECUTE ON FUNCTION ' || f || ' TO ' || quote_ident({quote_literal(app_role)})",
+    )]
+    for table, condition in POLICIES.items():
+        statements += [
+            f"CREATE POLICY {POLICY_NAME} ON public.{table} FOR SELECT TO {quote_ident(role)} USING ({condition})",
+            f"ALTER TABLE public.{table} ENABLE ROW LEVEL SECURITY",
+        ]
+    return statements
+
+
+def disable_statements() -> list[str]:
+    statements = []
+    for table in POLICIES:
+        statements += [
+            f"DROP POLICY IF EXISTS {POLICY_NAME} ON public.{table}",
+            f"ALTER TABLE public.{table} DISABLE ROW LEVEL SECURITY",
+        ]
+    statements.append(_restricted_functions_statement("'GRANT EXECUTE ON FUNCTION ' || f || ' TO PUBLIC'"))
+    return statements
+
+
+def _restricted_functions_statement(*commands: str) -> str:
+    """Execute each command, a PL/pgSQL text expression, for every restricted
+    function, whose signature is bound to ``f``. Signatures vary across
+    Postgres versions, hence the loop.
+    """
+    body = "\n".join(f"    EXECUTE {command};" for command in commands)
+    return (
+        "DO $$\nDECLARE f text;\nBEGIN\n"
+        "  FOR f IN SELECT p.oid::regprocedure::text FROM pg_proc p\n"
+        f"    WHERE p.pronamespace = 'pg_catalog'::regnamespace AND ({RESTRICTED_FUNCTIONS}) LOOP\n"
+        f"{body}\n"
+        "  END LOOP;\nEND $$"
+    )
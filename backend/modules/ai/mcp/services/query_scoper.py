@@ -1,50 +1,106 @@
-SCOPED_TABLES_CTE = """\
-WITH
-  me AS (SELECT %(user_id)s::bigint AS id),
+import re
+
+import sqlparse
+
+from modules.ai.mcp.exceptions import SqlNotAllowedError
+
+ME_CTE = "  me AS (SELECT %(user_id)s::bigint AS id)"
+
+# One CTE per user-owned table, keyed by the table name it shadows. Each body
+# reads the real table through its ``public.`` name, so none depends on another.
+SCOPED_TABLE_CTES = {
+    "transactions_transaction": """\
   transactions_transaction AS (
     SELECT * FROM public.transactions_transaction
     WHERE user_id = (SELECT id FROM me) AND deleted_at IS NULL
-  ),
+  )""",
+    "transactions_actor": """\
   transactions_actor AS (
     SELECT * FROM public.transactions_actor
     WHERE user_id = (SELECT id FROM me) AND deleted_at IS NULL
-  ),
+  )""",
+    "transactions_subtransaction": """\
   transactions_subtransaction AS (
     SELECT s.* FROM public.transactions_subtransaction s
     JOIN public.transactions_transaction t ON s.transaction_id = t.id
     WHERE t.user_id = (SELECT id FROM me) AND s.deleted_at IS NULL
-  ),
+  )""",
+    "file_reader_file": """\
   file_reader_file AS (
     SELECT * FROM public.file_reader_file
     WHERE user_id = (SELECT id FROM me)
-  ),
+  )""",
+    "loans_loan": """\
   loans_loan AS (
     SELECT * FROM public.loans_loan
     WHERE user_id = (SELECT id FROM me) AND deleted_at IS NULL
-  ),
+  )""",
+    "loans_loanpayment": """\
   loans_loanpayment AS (
     SELECT p.* FROM public.loans_loanpayment p
     JOIN public.loans_loan l ON p.loan_id = l.id
     WHERE l.user_id = (SELECT id FROM me) AND p.deleted_at IS NULL
-  )
-"""
+  )""",
+}
+
+SCOPED_TABLES_CTE = "WITH\n" + ",\n".join([ME_CTE, *SCOPED_TABLE_CTES.values()]) + "\n"
+
+_WORD = re.compile(r"[a-z_][a-z0-9_$]*")
+# U&"..." identifiers can spell a table name with escapes we do not decode.
+_UNICODE_ESCAPE = re.compile(r"u&\s*['\"]", re.IGNORECASE)
+# ``public.transactions_transaction`` names the real table, not the CTE.
+_QUALIFIED_SCOPED_TABLE = re.compile(
+    r"\.\s*\"?(" + "|".join(SCOPED_TABLE_CTES) + r")\b", re.IGNORECASE
+)
 
 
 class QueryScoperService:
     """Wraps a user-supplied SELECT in CTEs that shadow real table names with
     user-scoped, soft-delete-filtered versions, then caps the result with a
     LIMIT.
+
+    Only the CTEs of tables the query mentions are emitted: an unused CTE that
+    Postgres cannot inline (``transactions_transaction`` is read by two of them)
+    costs a scan of the user's rows for nothing. Detection errs on the side of
+    scoping: any word of any token counts, quoted names and string literals
+    included, and unicode-escaped identifiers bring back every CTE.
+
+    Schema-qualified names of scoped tables would read past the CTEs and are
+    rejected.
     """
 
     def scope(
         self, query: str, *, user_id: int, row_limit: int = 1000
     ) -> tuple[str, dict]:
+        qualified = _QUALIFIED_SCOPED_TABLE.search(query)
+        if qualified:
+            raise SqlNotAllowedError(
+                f"refer to {qualified.group(1).lower()} without a schema name"
+            )
         outer_limit = row_limit + 1  # +1 so the gateway can detect truncation
+        # The wrapped query is run with bind values, so a literal % must be doubled.
+        escaped = query.replace("%", "%%")
         wrapped = (
-            f"{SCOPED_TABLES_CTE}"
+            f"{self.ctes_for(query)}"
             f"SELECT * FROM (\n"
-            f"{query}\n"
+            f"{escaped}\n"
             f") AS _user_query LIMIT {outer_limit}\n"
-            f"-- end-of-wrap: {query}"
+            f"-- end-of-wrap: {escaped}"
         )
         return wrapped, {"user_id": user_id}
+
+    def ctes_for(self, query: str) -> str:
+        tables = self.referenced_tables(query)
+        return "WITH\n" + ",\n".join([ME_CTE, *(
+            cte for table, cte in SCOPED_TABLE_CTES.items() if table in tables
+        )]) + "\n"
+
+    def referenced_tables(self, query: str) -> set[str]:
+        if _UNICODE_ESCAPE.search(query):
+            return set(SCOPED_TABLE_CTES)
+
+        words = set()
+        for statement in sqlparse.parse(query):
+            for token in statement.flatten():
+                words.update(_WORD.findall(token.value.lower()))
+        return words & SCOPED_TABLE_CTES.keys()
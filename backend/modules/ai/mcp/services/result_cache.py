@@ -0,0 +1,127 @@
+import hashlib
+import logging
+import pickle
+import re
+from collections.abc import Callable
+from dataclasses import replace
+
+import sqlparse
+from django.conf import settings
+from django.core.cache import caches
+
+from modules.ai.mcp.domains.query_result import QueryResult
+from modules.base.services import VersionedCacheService
+
+logger = logging.getLogger("modules.ai.mcp")
+
+RESULT_KEY = "mcp_sql_cache:{user_id}:v{version}:{digest}"
+INDEX_KEY = "mcp_sql_cache_index:{user_id}"
+COUNTER_KEY = "mcp_sql_cache_stats:{user_id}:{counter}"
+COUNTER_TIMEOUT = 60 * 60 * 24
+
+# Results that depend on the clock or on randomness, not only on the data.
+_VOLATILE = re.compile(
+    r"\b(now|random|setseed|clock_timestamp|timeofday|statement_timestamp|transaction_timestamp"
+    r"|current_date|current_time|current_timestamp|localtime|localtimestamp"
+    r"|gen_random_uuid|pg_sleep\w*|nextval|txid_current\w*)\b",
+    re.IGNORECASE,
+)
+
+
+class QueryResultCacheService:
+    """Per-user cache of `execute_sql` results in the shared cache.
+
+    Keys combine the user, the user's data version (``VersionedCacheService``,
+    bumped by every write use case) and the normalized SQL. A write therefore
+    makes every earlier result unreachable, and nothing has to be deleted for
+    the cache to stay correct. Queries that call clock or random functions are
+    never cached.
+
+    Each user gets at most ``MCP_SQL_CACHE_MAX_BYTES_PER_USER`` bytes of
+    results, tracked in an index of keys and pickled sizes, oldest first.
+    Storing a result first drops entries from older data versions, then the
+    oldest ones until the new result fits. Concurrent writes by the same user
+    can lose an index entry. That entry still expires with its timeout, so the
+    cap is best effort.
+
+    Cache failures never break a query: it runs against the database.
+    """
+
+    def __init__(self, versioned_cache_service: VersionedCacheService, cache_alias: str = "default"):
+        self.versioned_cache_service = versioned_cache_service
+        self.cache_alias = cache_alias
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_or_execute(self, sql: str, *, user_id: int, execute: Callable[[], QueryResult]) -> QueryResult:
+        if settings.MCP_SQL_CACHE_TIMEOUT <= 0 or _VOLATILE.search(sql):
+            return execute()
+
+        try:
+            version = self.versioned_cache_service.version(user_id)
+            key = RESULT_KEY.format(user_id=user_id, version=version, digest=self._digest(sql))
+            result = self.cache.get(key)
+        except Exception:
+            logger.warning("mcp.sql_cache read failed", exc_info=True)
+            return execute()
+
+        if result is not None:
+            return replace(result, cache=self._record(user_id, hit=True))
+
+        result = execute()
+        self._store(user_id, version, key, result)
+        return replace(result, cache=self._record(user_id, hit=False))
+
+    def stats(self, user_id: int) -> dict:
+        keys = {counter: COUNTER_KEY.format(user_id=user_id, counter=counter) for counter in ("hits", "misses")}
+        values = self.cache.get_many(list(keys.values()))
+        hits, misses = (values.get(keys[counter], 0) for counter in ("hits", "misses"))
+        lookups = hits + misses
+        return {"hits": hits, "misses": misses, "hit_ratio": round(hits / lookups, 4) if lookups else None}
+
+    def _store(self, user_id: int, version: int, key: str, result: QueryResult):
+        size = len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        cap = settings.MCP_SQL_CACHE_MAX_BYTES_PER_USER
+        if size > cap:
+            return
+
+        index_key = INDEX_KEY.format(user_id=user_id)
+        current = RESULT_KEY.format(user_id=user_id, version=version, digest="")
+        try:
+            entries = self.cache.get(index_key) or []
+            evicted = [entry_key for entry_key, _ in entries if not entry_key.startswith(current)]
+            entries = [entry for entry in entries if entry[0].startswith(current) and entry[0] != key]
+            entries.append((key, size))
+            while sum(entry_size for _, entry_size in entries) > cap:
+                evicted.append(entries.pop(0)[0])
+
+            timeout = settings.MCP_SQL_CACHE_TIMEOUT
+            self.cache.set_many({key: result, index_key: entries}, timeout=timeout)
+            if evicted:
+                self.cache.delete_many(evicted)
+        except Exception:
+            logger.warning("mcp.sql_cache write failed", exc_info=True)
+
+    def _record(self, user_id: int, *, hit: bool) -> dict:
+        """Count the lookup and return the cache metadata of the response."""
+        try:
+            self._increment(COUNTER_KEY.format(user_id=user_id, counter="hits" if hit else "misses"))
+            return {"hit": hit, **self.stats(user_id)}
+        except Exception:
+            logger.warning("mcp.sql_cache could not update hit counters", exc_info=True)
+            return {"hit": hit}
+
+    def _increment(self, key: str):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Missing key: create it, unless a concurrent lookup just did.
+            if not self.cache.add(key, 1, timeout=COUNTER_TIMEOUT):
+                self.cache.incr(key)
+
+    def _digest(self, sql: str) -> str:
+        normalized = sqlparse.format(sql, keyword_case="upper", strip_whitespace=True)
+        payload = f"{settings.MCP_SQL_MAX_ROWS}:{normalized}"
+        return hashlib.sha256(payload.encode()).hexdigest()
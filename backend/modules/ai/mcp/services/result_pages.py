@@ -0,0 +1,113 @@
+import logging
+import math
+import secrets
+import time
+from dataclasses import replace
+
+from django.conf import settings
+from django.core.cache import caches
+
+from modules.ai.mcp.domains.query_result import QueryResult
+from modules.ai.mcp.exceptions import SqlCursorExpiredError
+
+logger = logging.getLogger("modules.ai.mcp")
+
+RESULT_KEY = "mcp_sql_result:{user_id}:{result_id}"
+CHUNK_KEY = "mcp_sql_result:{user_id}:{result_id}:{chunk}"
+CHUNK_ROWS = 500
+
+
+class ResultPageCacheService:
+    """Keeps the rows of a large `execute_sql` result in the shared cache so
+    the agent can page through them without running the query again.
+
+    Rows are stored in chunks of ``CHUNK_ROWS``, so a page only loads the
+    chunks it overlaps. Keys include the user id: a cursor is useless to any
+    other user. A cursor is ``<result id>.<offset>`` and expires
+    ``MCP_SQL_RESULT_TIMEOUT`` seconds after the query ran.
+    """
+
+    def __init__(self, cache_alias: str = "default"):
+        self.cache_alias = cache_alias
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def first_page(self, result: QueryResult, *, user_id: int, page_size: int) -> QueryResult:
+        """Return the first `page_size` rows of `result`, with a cursor to the
+        rest. If the rows cannot be stored, the page comes back truncated with
+        no cursor.
+        """
+        if result.row_count <= page_size:
+            return result
+
+        result_id = secrets.token_urlsafe(12)
+        entries = {
+            RESULT_KEY.format(user_id=user_id, result_id=result_id): {
+                "columns": result.columns,
+                "row_count": result.row_count,
+                "truncated": result.truncated,
+            },
+        }
+        for chunk in range(math.ceil(result.row_count / CHUNK_ROWS)):
+            key = CHUNK_KEY.format(user_id=user_id, result_id=result_id, chunk=chunk)
+            entries[key] = result.rows[chunk * CHUNK_ROWS:(chunk + 1) * CHUNK_ROWS]
+
+        try:
+            self.cache.set_many(entries, timeout=settings.MCP_SQL_RESULT_TIMEOUT)
+            next_cursor = f"{result_id}.{page_size}"
+        except Exception:
+            logger.warning("mcp.execute_sql could not store result pages", exc_info=True)
+            next_cursor = None
+
+        rows = result.rows[:page_size]
+        return replace(result, rows=rows, row_count=len(rows), truncated=True, next_cursor=next_cursor)
+
+    def page(self, cursor: str, *, user_id: int, page_size: int) -> QueryResult:
+        started = time.monotonic()
+        result_id, offset = self._parse(cursor)
+        meta = self._get(RESULT_KEY.format(user_id=user_id, result_id=result_id))
+        if meta is None or offset >= meta["row_count"]:
+            raise SqlCursorExpiredError("unknown or expired cursor, run the query again")
+
+        end = min(offset + page_size, meta["row_count"])
+        keys = [
+            CHUNK_KEY.format(user_id=user_id, result_id=result_id, chunk=chunk)
+            for chunk in range(offset // CHUNK_ROWS, math.ceil(end / CHUNK_ROWS))
+        ]
+        chunks = self._get_many(keys)
+        if len(chunks) != len(keys):
+            raise SqlCursorExpiredError("unknown or expired cursor, run the query again")
+
+        first_row = (offset // CHUNK_ROWS) * CHUNK_ROWS
+        rows = [row for key in keys for row in chunks[key]][offset - first_row:end - first_row]
+        has_more = end < meta["row_count"]
+        return QueryResult(
+            columns=meta["columns"],
+            rows=rows,
+            row_count=len(rows),
+            truncated=has_more or meta["truncated"],
+            execution_ms=int((time.monotonic() - started) * 1000),
+            next_cursor=f"{result_id}.{end}" if has_more else None,
+        )
+
+    def _parse(self, cursor: str) -> tuple[str, int]:
+        result_id, _, offset = str(cursor).rpartition(".")
+        if not result_id or not offset.isdigit():
+            raise SqlCursorExpiredError("malformed cursor, pass next_cursor as returned")
+        return result_id, int(offset)
+
+    def _get(self, key: str):
+        try:
+            return self.cache.get(key)
+        except Exception:
+            logger.warning("mcp.execute_sql could not read result pages", exc_info=True)
+            return None
+
+    def _get_many(self, keys: list[str]) -> dict:
+        try:
+            return self.cache.get_many(keys)
+        except Exception:
+            logger.warning("mcp.execute_sql could not read result pages", exc_info=True)
+            return {}
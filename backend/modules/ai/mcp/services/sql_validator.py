@@ -1,3 +1,5 @@
+import re
+
 import sqlparse
 from sqlparse.sql import Statement
 from sqlparse.tokens import DDL, DML, Keyword
@@ -11,6 +13,16 @@ from modules.ai.mcp.exceptions import (
 ALLOWED_FIRST_TOKENS = {"SELECT", "WITH"}
 # Token types that can appear as the leading keyword of a statement.
 _LEADING_KEYWORD_TTYPES = (DML, DDL, Keyword, Keyword.CTE)
+# set_config() could overwrite app.user_id, which the row-level security
+# policies read. The *_to_xml* family and ts_stat() run a query passed as text,
+# which escapes both this check (the text can be built at run time) and the
+# scoping CTEs (the query resolves table names on its own). U&"..." identifiers
+# could spell any of them without matching.
+_FORBIDDEN_FUNCTIONS = re.compile(
+    r"\b(set_config|(query|cursor|table|schema|database)_to_xml\w*|ts_stat)\b",
+    re.IGNORECASE,
+)
+_UNICODE_ESCAPE = re.compile(r"u&\s*['\"]", re.IGNORECASE)
 
 
 class SqlValidatorService:
@@ -50,6 +62,7 @@ class SqlValidatorService:
             )
 
         self._reject_inner_dml_ddl(statement)
+        self._reject_session_overrides(cleaned)
         return cleaned
 
     def _first_keyword(self, statement: Statement) -> str | None:
@@ -77,3 +90,10 @@ class SqlValidatorService:
                     raise SqlNotAllowedError(
                         f"forbidden keyword inside query: {token.value!r}"
                     )
+
+    def _reject_session_overrides(self, query: str) -> None:
+        forbidden = _FORBIDDEN_FUNCTIONS.search(query)
+        if forbidden:
+            raise SqlNotAllowedError(f"{forbidden.group(1).lower()}() is not allowed")
+        if _UNICODE_ESCAPE.search(query):
+            raise SqlNotAllowedError("unicode-escaped identifiers and strings are not allowed")
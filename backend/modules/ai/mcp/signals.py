@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from modules.ai.mcp.models import MCPAccessToken
+from modules.ai.mcp.oauth.services.token_cache import token_cache
+
+
+@receiver(post_delete, sender=MCPAccessToken, dispatch_uid="invalidate_token_on_delete")
+def invalidate_token_on_delete(sender, instance: MCPAccessToken, **kwargs):
+    # Tokens also go away by cascade when their user or client is deleted, which
+    # never passes through AccessTokenRepository's revoke methods.
+    token_cache.invalidate([instance.token_hash])
@@ -0,0 +1,18 @@
+from django.test import SimpleTestCase, override_settings
+
+from modules.ai.mcp.tools.execute_sql import execute_sql_description, execute_sql_input_schema
+
+
+@override_settings(MCP_SQL_PAGE_SIZE=50, MCP_SQL_MAX_PAGE_SIZE=250, MCP_SQL_MAX_ROWS=2000, MCP_SQL_RESULT_TIMEOUT=120)
+class TestExecuteSqlToolDefinition(SimpleTestCase):
+    def test_description_reports_the_configured_limits(self):
+        description = execute_sql_description()
+        self.assertIn("padrão 50", description)
+        self.assertIn("máximo 250", description)
+        self.assertIn("até 2000 linhas", description)
+        self.assertIn("vale por 120 segundos", description)
+
+    def test_row_limit_bounds_follow_settings(self):
+        row_limit = execute_sql_input_schema()["properties"]["row_limit"]
+        self.assertEqual(row_limit["maximum"], 250)
+        self.assertEqual(row_limit["description"], "Rows per page (default 50).")
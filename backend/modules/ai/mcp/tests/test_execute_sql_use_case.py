@@ -1,20 +1,40 @@
 from unittest.mock import Mock
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 
 from modules.ai.mcp.domains.query_result import QueryResult
 from modules.ai.mcp.domains.sql_query import SqlQuery
-from modules.ai.mcp.exceptions import SqlNotAllowedError
+from modules.ai.mcp.exceptions import SqlCursorExpiredError, SqlInvalidError, SqlNotAllowedError
+from modules.ai.mcp.services.result_cache import QueryResultCacheService
+from modules.ai.mcp.services.result_pages import ResultPageCacheService
 from modules.ai.mcp.use_cases.execute_sql import ExecuteSqlUseCase
+from modules.base.services import VersionedCacheService
 
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
+
+def make_result(row_count: int, truncated: bool = False) -> QueryResult:
+    return QueryResult(
+        columns=["id"], rows=[[i] for i in range(row_count)], row_count=row_count,
+        truncated=truncated, execution_ms=5,
+    )
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES, MCP_SQL_PAGE_SIZE=10, MCP_SQL_MAX_PAGE_SIZE=50, MCP_SQL_MAX_ROWS=100,
+    MCP_SQL_CACHE_TIMEOUT=0,
+)
 class TestExecuteSqlUseCase(SimpleTestCase):
     def setUp(self):
         self.mock_factory = Mock()
         self.mock_gateway = Mock()
+        self.page_cache = ResultPageCacheService()
+        self.page_cache.cache.clear()
         self.use_case = ExecuteSqlUseCase(
             sql_query_factory=self.mock_factory,
             readonly_postgres_gateway=self.mock_gateway,
+            result_page_cache=self.page_cache,
+            query_result_cache=QueryResultCacheService(VersionedCacheService()),
         )
 
     def test_passes_query_through_factory_then_gateway(self):
@@ -28,8 +48,8 @@ class TestExecuteSqlUseCase(SimpleTestCase):
 
         result = self.use_case.execute("SELECT 1", user_id=7)
 
-        self.mock_factory.from_raw.assert_called_once_with("SELECT 1", user_id=7)
-        self.mock_gateway.execute.assert_called_once_with(sql_query)
+        self.mock_factory.from_raw.assert_called_once_with("SELECT 1", user_id=7, row_limit=100)
+        self.mock_gateway.execute.assert_called_once_with(sql_query, row_limit=100)
         self.assertEqual(result, expected)
 
     def test_propagates_validator_errors(self):
@@ -37,3 +57,60 @@ class TestExecuteSqlUseCase(SimpleTestCase):
         with self.assertRaises(SqlNotAllowedError):
             self.use_case.execute("DROP TABLE x", user_id=1)
         self.mock_gateway.execute.assert_not_called()
+
+    def test_pages_through_a_large_result_without_running_it_again(self):
+        self.mock_gateway.execute.return_value = make_result(25)
+
+        first = self.use_case.execute("SELECT id FROM x", user_id=7)
+        second = self.use_case.next_page(first.next_cursor, user_id=7)
+        third = self.use_case.next_page(second.next_cursor, user_id=7)
+
+        self.assertEqual(self.mock_gateway.execute.call_count, 1)
+        self.assertEqual([first.row_count, second.row_count, third.row_count], [10, 10, 5])
+        self.assertEqual(first.rows + second.rows + third.rows, [[i] for i in range(25)])
+        self.assertTrue(first.truncated and second.truncated)
+        self.assertFalse(third.truncated)
+        self.assertIsNone(third.next_cursor)
+
+    def test_row_limit_is_per_call_and_capped(self):
+        self.mock_gateway.execute.return_value = make_result(100, truncated=True)
+
+        first = self.use_case.execute("SELECT id FROM x", user_id=7, row_limit=3)
+        second = self.use_case.next_page(first.next_cursor, user_id=7, row_limit=500)
+
+        self.assertEqual(first.row_count, 3)
+        self.assertEqual(second.row_count, 50)
+        self.assertEqual(second.rows[0], [3])
+
+    def test_last_page_of_a_capped_result_stays_truncated(self):
+        self.mock_gateway.execute.return_value = make_result(100, truncated=True)
+
+        first = self.use_case.execute("SELECT id FROM x", user_id=7, row_limit=50)
+        last = self.use_case.next_page(first.next_cursor, user_id=7, row_limit=50)
+
+        self.assertIsNone(last.next_cursor)
+        self.assertTrue(last.truncated)
+
+    def test_invalid_row_limit_is_rejected(self):
+        with self.assertRaises(SqlInvalidError):
+            self.use_case.execute("SELECT 1", user_id=7, row_limit="many")
+
+    def test_cursor_of_another_user_is_rejected(self):
+        self.mock_gateway.execute.return_value = make_result(25)
+        first = self.use_case.execute("SELECT id FROM x", user_id=7)
+
+        with self.assertRaises(SqlCursorExpiredError):
+            self.use_case.next_page(first.next_cursor, user_id=8)
+
+    @override_settings(MCP_SQL_CACHE_TIMEOUT=60, MCP_SQL_CACHE_MAX_BYTES_PER_USER=100_000)
+    def test_repeated_query_is_served_from_the_result_cache(self):
+        self.mock_factory.from_raw.return_value = SqlQuery(raw="SELECT id FROM x", wrapped="...")
+        self.mock_gateway.execute.return_value = make_result(3)
+
+        first = self.use_case.execute("SELECT id FROM x", user_id=7)
+        second = self.use_case.execute("SELECT id FROM x", user_id=7)
+
+        self.assertEqual(self.mock_gateway.execute.call_count, 1)
+        self.assertEqual(second.rows, first.rows)
+        self.assertEqual((first.cache["hit"], second.cache["hit"]), (False, True))
+        self.assertEqual(second.cache["hit_ratio"], 0.5)
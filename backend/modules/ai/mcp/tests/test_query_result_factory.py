@@ -2,11 +2,22 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 from unittest.mock import Mock
 
+import json
+
 from django.test import SimpleTestCase
 
+from modules.ai.mcp.domains.query_result import QueryResult
+from modules.ai.mcp.exceptions import SqlInvalidError
 from modules.ai.mcp.factories.query_result import QueryResultFactory
 
 
+def make_result(columns, rows, next_cursor=None):
+    return QueryResult(
+        columns=columns, rows=rows, row_count=len(rows),
+        truncated=next_cursor is not None, execution_ms=3, next_cursor=next_cursor,
+    )
+
+
 class TestQueryResultFactory(SimpleTestCase):
     def setUp(self):
         self.factory = QueryResultFactory()
@@ -14,7 +25,14 @@ class TestQueryResultFactory(SimpleTestCase):
     def _mock_cursor(self, description, rows):
         cursor = Mock()
         cursor.description = [(name,) for name in description]
-        cursor.fetchall.return_value = rows
+        remaining = list(rows)
+
+        def fetchmany(size):
+            batch = remaining[:size]
+            del remaining[:size]
+            return batch
+
+        cursor.fetchmany.side_effect = fetchmany
         return cursor
 
     def test_builds_result_from_cursor(self):
@@ -59,3 +77,77 @@ class TestQueryResultFactory(SimpleTestCase):
             cursor, started_at_ms=0, row_limit=1000, now_ms=0
         )
         self.assertTrue(result.rows[0][0].startswith("2024-03-15T12:30:00"))
+
+    def test_reads_in_batches_and_stops_after_the_extra_row(self):
+        cursor = self._mock_cursor(["id"], [(i,) for i in range(50)])
+        result = self.factory.from_cursor(
+            cursor, started_at_ms=0, row_limit=20, now_ms=0, batch_size=8
+        )
+        self.assertEqual(result.rows, [[i] for i in range(20)])
+        self.assertTrue(result.truncated)
+        self.assertEqual(
+            [call.args[0] for call in cursor.fetchmany.call_args_list], [8, 8, 5]
+        )
+
+    def test_empty_result(self):
+        cursor = self._mock_cursor(["id"], [])
+        result = self.factory.from_cursor(
+            cursor, started_at_ms=0, row_limit=1000, now_ms=0
+        )
+        self.assertEqual((result.columns, result.rows, result.truncated), (["id"], [], False))
+
+
+class TestQueryResultPayload(SimpleTestCase):
+    def setUp(self):
+        self.factory = QueryResultFactory()
+        self.result = make_result(
+            ["id", "category", "amount"],
+            [[1, "FOOD", "10.50"], [2, "FOOD", "3.00"], [3, "HOME", None], [4, "FOOD", "1.00"]],
+            next_cursor="abc.4",
+        )
+
+    def test_json_is_the_default(self):
+        payload = self.factory.to_payload(self.result)
+        self.assertEqual(payload["rows"], self.result.rows)
+        self.assertEqual(payload["next_cursor"], "abc.4")
+        self.assertNotIn("format", payload)
+
+    def test_csv(self):
+        payload = self.factory.to_payload(self.result, "csv")
+        self.assertEqual(
+            payload["data"],
+            "id,category,amount\n1,FOOD,10.50\n2,FOOD,3.00\n3,HOME,\n4,FOOD,1.00\n",
+        )
+        self.assertEqual((payload["format"], payload["row_count"], payload["truncated"]), ("csv", 4, True))
+
+    def test_markdown_table_escapes_pipes_and_newlines(self):
+        result = make_result(["description"], [["a|b"], ["line\nbreak"]])
+        payload = self.factory.to_payload(result, "markdown_table")
+        self.assertEqual(
+            payload["data"],
+            "| description |\n|---|\n| a\\|b |\n| line break |",
+        )
+
+    def test_columnar_dictionary_encodes_repeated_values(self):
+        payload = self.factory.to_payload(self.result, "columnar")
+        self.assertEqual(payload["columns"], [
+            {"name": "id", "values": [1, 2, 3, 4]},
+            {"name": "category", "dictionary": ["FOOD", "HOME"], "codes": [0, 0, 1, 0]},
+            {"name": "amount", "values": ["10.50", "3.00", None, "1.00"]},
+        ])
+
+    def test_columnar_keeps_unhashable_values(self):
+        result = make_result(["tags"], [[["a"]], [["a"]], [["a"]]])
+        payload = self.factory.to_payload(result, "columnar")
+        self.assertEqual(payload["columns"], [{"name": "tags", "values": [["a"], ["a"], ["a"]]}])
+
+    def test_size_reports_the_rendered_payload(self):
+        payload = self.factory.to_payload(self.result, "csv")
+        size = payload.pop("size")
+        text = json.dumps(payload, ensure_ascii=False)
+        self.assertEqual(size["bytes"], len(text.encode("utf-8")))
+        self.assertEqual(size["estimated_tokens"], -(-len(text) // 4))
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(SqlInvalidError):
+            self.factory.to_payload(self.result, "xml")
@@ -1,16 +1,20 @@
 from django.test import SimpleTestCase
 
+from modules.ai.mcp.exceptions import SqlNotAllowedError
 from modules.ai.mcp.services.query_scoper import QueryScoperService
 
+ALL_TABLES_QUERY = (
+    "SELECT * FROM transactions_transaction, transactions_actor, "
+    "transactions_subtransaction, file_reader_file, loans_loan, loans_loanpayment"
+)
+
 
 class TestQueryScoperService(SimpleTestCase):
     def setUp(self):
         self.service = QueryScoperService()
 
     def test_wraps_query_with_cte_block(self):
-        wrapped, params = self.service.scope(
-            "SELECT id FROM transactions_transaction", user_id=42
-        )
+        wrapped, params = self.service.scope(ALL_TABLES_QUERY, user_id=42)
         self.assertIn("WITH", wrapped.upper())
         self.assertIn("transactions_transaction AS", wrapped)
         self.assertIn("transactions_actor AS", wrapped)
@@ -37,18 +41,83 @@ class TestQueryScoperService(SimpleTestCase):
         self.assertIn("LIMIT 1001", wrapped)
 
     def test_filters_soft_deleted_rows(self):
-        wrapped, _ = self.service.scope("SELECT 1", user_id=1)
+        wrapped, _ = self.service.scope(ALL_TABLES_QUERY, user_id=1)
         # Five tables have deleted_at; file_reader_file does not.
         self.assertEqual(wrapped.count("deleted_at IS NULL"), 5)
 
     def test_subtransaction_scoped_via_parent_transaction(self):
-        wrapped, _ = self.service.scope("SELECT 1", user_id=1)
+        wrapped, _ = self.service.scope("SELECT * FROM transactions_subtransaction", user_id=1)
         self.assertIn("transactions_subtransaction s", wrapped)
         self.assertIn(
             "JOIN public.transactions_transaction t", wrapped
         )
 
     def test_loan_payment_scoped_via_parent_loan(self):
-        wrapped, _ = self.service.scope("SELECT 1", user_id=1)
+        wrapped, _ = self.service.scope("SELECT * FROM loans_loanpayment", user_id=1)
         self.assertIn("loans_loanpayment p", wrapped)
         self.assertIn("JOIN public.loans_loan l", wrapped)
+
+    def test_only_referenced_tables_are_scoped(self):
+        wrapped, _ = self.service.scope(
+            "SELECT a.name, SUM(s.amount) FROM transactions_subtransaction s "
+            "JOIN transactions_actor a ON a.id = s.actor_id GROUP BY a.name",
+            user_id=1,
+        )
+        self.assertIn("transactions_subtransaction AS", wrapped)
+        self.assertIn("transactions_actor AS", wrapped)
+        self.assertNotIn("transactions_transaction AS", wrapped)
+        self.assertNotIn("loans_loan AS", wrapped)
+        self.assertNotIn("file_reader_file AS", wrapped)
+
+    def test_query_without_tables_keeps_only_me(self):
+        wrapped, params = self.service.scope("SELECT 1", user_id=7)
+        self.assertTrue(wrapped.startswith("WITH\n  me AS"))
+        self.assertNotIn("public.", wrapped)
+        self.assertEqual(params, {"user_id": 7})
+
+    def test_detection_is_case_insensitive_and_sees_quoted_names(self):
+        tables = self.service.referenced_tables(
+            'SELECT * FROM LOANS_LOAN JOIN "file_reader_file" f ON true'
+        )
+        self.assertEqual(tables, {"loans_loan", "file_reader_file"})
+
+    def test_names_in_subqueries_and_ctes_are_seen(self):
+        tables = self.service.referenced_tables(
+            "WITH x AS (SELECT id FROM loans_loanpayment) "
+            "SELECT * FROM x WHERE EXISTS (SELECT 1 FROM transactions_transaction)"
+        )
+        self.assertEqual(tables, {"loans_loanpayment", "transactions_transaction"})
+
+    def test_names_in_string_literals_are_scoped_anyway(self):
+        tables = self.service.referenced_tables(
+            "SELECT * FROM query_to_xml('select * from transactions_actor', true, true, '')"
+        )
+        self.assertEqual(tables, {"transactions_actor"})
+
+    def test_unicode_escaped_identifiers_scope_every_table(self):
+        wrapped, _ = self.service.scope(
+            'SELECT * FROM U&"loans\\005floan"', user_id=1
+        )
+        self.assertEqual(wrapped.count(" AS (\n"), 6)
+
+    def test_schema_qualified_scoped_tables_are_rejected(self):
+        for query in (
+            "SELECT * FROM public.transactions_transaction",
+            'SELECT * FROM "public"."loans_loan"',
+            "SELECT * FROM x JOIN PUBLIC . transactions_actor a ON true",
+        ):
+            with self.subTest(query=query), self.assertRaises(SqlNotAllowedError):
+                self.service.scope(query, user_id=1)
+
+    def test_column_names_with_a_table_prefix_are_allowed(self):
+        wrapped, _ = self.service.scope(
+            "SELECT p.loans_loan_id FROM loans_loanpayment p", user_id=1
+        )
+        self.assertIn("loans_loanpayment AS", wrapped)
+
+    def test_percent_signs_are_escaped_for_binding(self):
+        wrapped, params = self.service.scope(
+            "SELECT * FROM transactions_actor WHERE name LIKE 'A%'", user_id=1
+        )
+        self.assertIn("LIKE 'A%%'", wrapped)
+        self.assertIn("LIKE 'A%'", wrapped % params)
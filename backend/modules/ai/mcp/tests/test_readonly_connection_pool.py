@@ -0,0 +1,166 @@
+import threading
+import time
+from unittest.mock import patch
+
+import psycopg2
+from django.test import SimpleTestCase
+
+from modules.ai.mcp.exceptions import SqlPoolExhaustedError
+from modules.ai.mcp.gateways.connection_pool import ReadOnlyConnectionPool
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.pings = 0
+        self.fail_ping = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.conn.pings += 1
+        if self.conn.fail_ping:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+
+class TestReadOnlyConnectionPool(SimpleTestCase):
+    def setUp(self):
+        self.opened = []
+
+        def connect(pool):
+            conn = FakeConnection()
+            self.opened.append(conn)
+            return conn
+
+        patcher = patch.object(ReadOnlyConnectionPool, "_connect", connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _pool(self, **kwargs):
+        options = {"min_size": 1, "max_size": 2, "timeout": 0.2, "healthcheck_interval": 30}
+        options.update(kwargs)
+        return ReadOnlyConnectionPool(**options)
+
+    def test_invalid_sizes_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self._pool(min_size=3, max_size=2)
+        with self.assertRaises(ValueError):
+            self._pool(min_size=0, max_size=0)
+
+    def test_min_size_is_opened_on_first_use_and_reused(self):
+        pool = self._pool(min_size=2, max_size=3)
+        self.assertEqual(self.opened, [])
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        self.assertEqual(len(self.opened), 2)
+        self.assertIs(first, second)
+        self.assertEqual(pool.stats()["size"], 2)
+
+    def test_exhausted_pool_times_out(self):
+        pool = self._pool(max_size=1, timeout=0.05)
+
+        with pool.connection():
+            started = time.monotonic()
+            with self.assertRaises(SqlPoolExhaustedError) as ctx:
+                pool.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertEqual(ctx.exception.code, "SQL_POOL_EXHAUSTED")
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_waiter_gets_released_connection(self):
+        pool = self._pool(max_size=1, timeout=2)
+        conn = pool.acquire()
+        received = []
+
+        waiter = threading.Thread(target=lambda: received.append(pool.acquire()))
+        waiter.start()
+        time.sleep(0.05)
+        pool.release(conn)
+        waiter.join(timeout=2)
+
+        self.assertEqual(received, [conn])
+        self.assertEqual(pool.stats()["waits"], 1)
+
+    def test_statement_errors_keep_the_connection(self):
+        pool = self._pool()
+
+        with self.assertRaises(psycopg2.errors.QueryCanceled):
+            with pool.connection():
+                raise psycopg2.errors.QueryCanceled("canceling statement due to statement timeout")
+
+        stats = pool.stats()
+        self.assertEqual((stats["size"], stats["idle"], stats["discarded"]), (1, 1, 0))
+
+    def test_broken_connection_is_discarded(self):
+        pool = self._pool()
+
+        with self.assertRaises(psycopg2.OperationalError):
+            with pool.connection() as conn:
+                raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+        self.assertEqual(conn.closed, 1)
+        self.assertEqual(pool.stats()["size"], 0)
+        with pool.connection() as replacement:
+            self.assertIsNot(replacement, conn)
+
+    def test_stale_idle_connection_is_pinged_and_replaced_when_dead(self):
+        pool = self._pool(healthcheck_interval=0)
+        with pool.connection() as conn:
+            pass
+        conn.pings = 0
+        conn.fail_ping = True
+
+        with pool.connection() as replacement:
+            pass
+
+        self.assertEqual(conn.pings, 1)
+        self.assertIsNot(replacement, conn)
+        self.assertEqual(pool.stats()["size"], 1)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+    def test_concurrent_callers_never_share_a_connection(self):
+        pool = self._pool(max_size=3, timeout=5)
+        in_use = set()
+        lock = threading.Lock()
+        overlaps = []
+
+        def work():
+            for _ in range(20):
+                with pool.connection() as conn:
+                    with lock:
+                        if id(conn) in in_use:
+                            overlaps.append(conn)
+                        in_use.add(id(conn))
+                    time.sleep(0.001)
+                    with lock:
+                        in_use.discard(id(conn))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(overlaps, [])
+        self.assertLessEqual(len(self.opened), 3)
+        self.assertEqual(pool.stats()["in_use"], 0)
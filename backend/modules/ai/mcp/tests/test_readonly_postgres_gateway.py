@@ -20,20 +20,30 @@ if os.environ.get("MCP_PG_INTEGRATION") != "1":
     )
 
 # Heavy imports only after the skip gate
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
 
+from modules.ai.mcp import row_level_security
 from modules.ai.mcp.factories.query_result import QueryResultFactory
+from modules.ai.mcp.gateways.connection_pool import ReadOnlyConnectionPool
 from modules.ai.mcp.gateways.readonly_postgres import ReadOnlyPostgresGateway
 from modules.ai.mcp.domains.sql_query import SqlQuery
 from modules.ai.mcp.exceptions import (
+    SqlNotAllowedError,
     SqlPermissionDeniedError,
     SqlTimeoutError,
     SqlInvalidError,
 )
+from modules.ai.mcp.factories.sql_query import SqlQueryFactory
 from modules.ai.mcp.services.query_scoper import QueryScoperService
-from modules.transactions.models import Transaction
+from modules.ai.mcp.services.sql_validator import SqlValidatorService
+from modules.loans.models import Loan, LoanPayment
+from modules.transactions.models import Actor, SubTransaction, Transaction
 
 
 User = get_user_model()
@@ -105,3 +115,261 @@ class TestReadOnlyPostgresGateway(TestCase):
             self.gateway.execute(
                 self._query("SELECT pg_sleep(6)", self.user_a.id)
             )
+
+
+class TestReadOnlyPostgresGatewayConcurrency(TransactionTestCase):
+    """N users query through one gateway at once, as gunicorn threads do.
+
+    TransactionTestCase: the read-only connections only see committed rows.
+    """
+
+    USERS = 12
+    QUERIES_PER_USER = 10
+
+    def setUp(self):
+        self.users = []
+        for index in range(self.USERS):
+            user = User.objects.create_user(email=f"stress{index}@a.com", password="x")
+            Transaction.objects.create(
+                user=user,
+                due_date="2024-01-15",
+                total_amount=Decimal(index + 1),
+                transaction_identifier=f"S{index}",
+            )
+            self.users.append(user)
+        self.pool = ReadOnlyConnectionPool(min_size=1, max_size=4, timeout=10, healthcheck_interval=30)
+        self.gateway = ReadOnlyPostgresGateway(
+            query_result_factory=QueryResultFactory(),
+            connection_pool=self.pool,
+        )
+
+    def tearDown(self):
+        self.gateway.close()
+
+    def _run_as(self, index):
+        user = self.users[index]
+        results = []
+        for query_index in range(self.QUERIES_PER_USER):
+            raw_sql = "SELECT total_amount FROM transactions_transaction"
+            if query_index % 3 == 2:
+                raw_sql = "SELECT no_such_column FROM transactions_transaction"
+            wrapped, params = QueryScoperService().scope(raw_sql, user_id=user.id)
+            try:
+                result = self.gateway.execute(SqlQuery(raw=raw_sql, wrapped=wrapped, params=params))
+                results.append([row[0] for row in result.rows])
+            except SqlInvalidError:
+                results.append("invalid")
+        return results
+
+    def test_concurrent_users_only_see_their_rows(self):
+        with ThreadPoolExecutor(max_workers=self.USERS) as executor:
+            outcomes = list(executor.map(self._run_as, range(self.USERS)))
+
+        for index, results in enumerate(outcomes):
+            expected = [
+                "invalid" if query_index % 3 == 2 else [f"{index + 1}.00"]
+                for query_index in range(self.QUERIES_PER_USER)
+            ]
+            self.assertEqual(results, expected)
+
+        stats = self.pool.stats()
+        self.assertLessEqual(stats["size"], 4)
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["timeouts"], 0)
+        # Invalid queries leave their connection usable.
+        self.assertEqual(stats["discarded"], 0)
+
+
+class TestReadOnlyPostgresGatewayStreaming(TransactionTestCase):
+    """Large results are read through a server-side cursor, in batches."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="stream@a.com", password="x")
+        Transaction.objects.bulk_create([
+            Transaction(
+                user=self.user, due_date="2024-01-15", total_amount=Decimal(index),
+                transaction_identifier=f"T{index:04d}",
+            )
+            for index in range(1200)
+        ])
+        self.pool = ReadOnlyConnectionPool(min_size=1, max_size=1, timeout=5, healthcheck_interval=30)
+        self.gateway = ReadOnlyPostgresGateway(
+            query_result_factory=QueryResultFactory(),
+            connection_pool=self.pool,
+            fetch_batch_size=100,
+        )
+
+    def tearDown(self):
+        self.gateway.close()
+
+    def _query(self, raw_sql, row_limit):
+        wrapped, params = QueryScoperService().scope(raw_sql, user_id=self.user.id, row_limit=row_limit)
+        return SqlQuery(raw=raw_sql, wrapped=wrapped, params=params)
+
+    def test_row_limit_bounds_the_result(self):
+        raw_sql = "SELECT transaction_identifier FROM transactions_transaction ORDER BY 1"
+        result = self.gateway.execute(self._query(raw_sql, 1100), row_limit=1100)
+
+        self.assertEqual(result.row_count, 1100)
+        self.assertTrue(result.truncated)
+        self.assertEqual(result.rows[-1], ["T1099"])
+
+    def test_connection_is_back_in_autocommit_after_each_query(self):
+        self.gateway.execute(self._query("SELECT 1", 10), row_limit=10)
+        with self.assertRaises(SqlInvalidError):
+            self.gateway.execute(self._query("SELECT no_such_column FROM transactions_transaction", 10), row_limit=10)
+
+        with self.pool.connection() as conn:
+            self.assertTrue(conn.autocommit)
+        self.assertEqual(self.pool.stats()["discarded"], 0)
+
+
+# Builds the set_config() call at run time and runs it over SPI, in the same
+# transaction as the query that follows.
+QUERY_TO_XML_ATTACK = (
+    "WITH s AS MATERIALIZED (SELECT query_to_xml('select set_' || 'config(''app.user_id'', ''{other}'', true)', "
+    "false, false, '') x) SELECT t.transaction_identifier FROM s CROSS JOIN LATERAL "
+    "(SELECT * FROM transactions_transaction WHERE s.x IS NOT NULL) t"
+)
+
+
+class TestScopingModeParity(TransactionTestCase):
+    """The CTE and row-level security modes return the same rows for the same
+    query, and neither leaks another user's rows, however the query is written.
+
+    The policies are only installed for the row-level security runs: with them
+    in place the CTE mode sees no rows at all.
+    """
+
+    QUERIES = [
+        "SELECT transaction_identifier FROM transactions_transaction",
+        "SELECT s.description FROM transactions_subtransaction s "
+        "JOIN transactions_transaction t ON t.id = s.transaction_id",
+        "SELECT name FROM transactions_actor WHERE id IN (SELECT actor_id FROM transactions_subtransaction)",
+        "SELECT l.description, p.amount FROM loans_loanpayment p JOIN loans_loan l ON l.id = p.loan_id",
+        "WITH t AS (SELECT * FROM transactions_transaction) SELECT transaction_identifier FROM t",
+        "SELECT transaction_identifier FROM transactions_transaction WHERE transaction_identifier LIKE '%1'",
+    ]
+    ATTACKS = [
+        "SELECT set_config('app.user_id', '{other}', false)",
+        "SELECT transaction_identifier FROM transactions_transaction "
+        "WHERE set_config('app.user_id', '{other}', true) IS NOT NULL",
+        'SELECT * FROM U&"transactions\\005ftransaction"',
+        QUERY_TO_XML_ATTACK,
+        "SELECT query_to_xml('select * from transactions_transaction', true, false, '')",
+    ]
+
+    def setUp(self):
+        self.user_a = self._seed("a")
+        self.user_b = self._seed("b")
+        self.pool = ReadOnlyConnectionPool(min_size=1, max_size=1, timeout=5, healthcheck_interval=30)
+        self.gateway = ReadOnlyPostgresGateway(
+            query_result_factory=QueryResultFactory(),
+            connection_pool=self.pool,
+        )
+
+    def tearDown(self):
+        self.gateway.close()
+        self._apply(row_level_security.disable_statements())
+
+    def _apply(self, statements):
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def _install_policies(self):
+        self._apply(row_level_security.enable_statements(
+            settings.MCP_DATABASE_USER, connection.settings_dict["USER"]
+        ))
+
+    def _seed(self, prefix):
+        user = User.objects.create_user(email=f"{prefix}@parity.com", password="x")
+        actor = Actor.objects.create(user=user, name=f"{prefix} actor")
+        for index in (1, 2):
+            bill = Transaction.objects.create(
+                user=user, due_date="2024-01-15", total_amount=Decimal(index),
+                transaction_identifier=f"{prefix}{index}",
+            )
+            SubTransaction.objects.create(
+                transaction=bill, date="2024-01-15", description=f"{prefix} item {index}",
+                amount=Decimal(index), actor=actor,
+            )
+        Transaction.objects.create(
+            user=user, due_date="2024-01-15", total_amount=Decimal(9),
+            transaction_identifier=f"{prefix} deleted", deleted_at=timezone.now(),
+        )
+        loan = Loan.objects.create(
+            user=user, actor=actor, principal_amount=Decimal(100),
+            lent_at="2024-01-01", description=f"{prefix} loan",
+        )
+        LoanPayment.objects.create(loan=loan, amount=Decimal(10), paid_at="2024-02-01")
+        return user
+
+    def _run(self, mode, raw_sql, user):
+        factory = SqlQueryFactory(
+            sql_validator=SqlValidatorService(),
+            query_scoper=QueryScoperService(),
+            scoping_mode=mode,
+        )
+        result = self.gateway.execute(factory.from_raw(raw_sql, user_id=user.id))
+        return sorted(str(value) for row in result.rows for value in row)
+
+    def _run_all(self, mode):
+        return {
+            (raw_sql, user.email): self._run(mode, raw_sql, user)
+            for raw_sql in self.QUERIES
+            for user in (self.user_a, self.user_b)
+        }
+
+    def test_modes_return_the_same_rows(self):
+        cte_rows = self._run_all("cte")
+        self._install_policies()
+        rls_rows = self._run_all("rls")
+
+        self.assertEqual(cte_rows, rls_rows)
+        for (raw_sql, email), values in cte_rows.items():
+            other = "b" if email.startswith("a") else "a"
+            with self.subTest(query=raw_sql, user=email):
+                self.assertTrue(values)
+                self.assertFalse([value for value in values if value.startswith(other)])
+                self.assertFalse([value for value in values if "deleted" in value])
+
+    def test_attacks_are_rejected_in_both_modes(self):
+        self._install_policies()
+        for template in self.ATTACKS:
+            raw_sql = template.format(other=self.user_b.id)
+            for mode in ("cte", "rls"):
+                with self.subTest(query=raw_sql, mode=mode), self.assertRaises(SqlNotAllowedError):
+                    self._run(mode, raw_sql, self.user_a)
+
+    def test_schema_qualified_tables_are_rejected_or_still_scoped(self):
+        raw_sql = "SELECT transaction_identifier FROM public.transactions_transaction"
+        with self.assertRaises(SqlNotAllowedError):
+            self._run("cte", raw_sql, self.user_a)
+
+        self._install_policies()
+        self.assertEqual(self._run("rls", raw_sql, self.user_a), ["a1", "a2"])
+
+    def test_rls_without_user_sees_nothing(self):
+        self._install_policies()
+        result = self.gateway.execute_raw_for_test(
+            "SELECT count(*) FROM transactions_transaction"
+        )
+        self.assertEqual(result.rows, [[0]])
+
+    def test_user_id_does_not_outlive_the_query(self):
+        self._install_policies()
+        self._run("rls", "SELECT 1", self.user_a)
+
+        result = self.gateway.execute_raw_for_test("SELECT current_setting('app.user_id', true)")
+        self.assertIn(result.rows[0][0], (None, ""))
+
+    def test_read_only_role_cannot_run_query_from_text_functions(self):
+        """The role-level guard holds even for a query the validator let through."""
+        self._install_policies()
+        for raw_sql in (
+            QUERY_TO_XML_ATTACK.format(other=self.user_b.id),
+            f"SELECT set_config('app.user_id', '{self.user_b.id}', true)",
+        ):
+            with self.subTest(query=raw_sql), self.assertRaises(SqlPermissionDeniedError):
+                self.gateway.execute(SqlQuery(raw=raw_sql, wrapped=raw_sql, rls_user_id=self.user_a.id))
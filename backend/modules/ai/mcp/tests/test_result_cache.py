@@ -0,0 +1,105 @@
+import pickle
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+
+from modules.ai.mcp.domains.query_result import QueryResult
+from modules.ai.mcp.services.result_cache import QueryResultCacheService
+from modules.base.services import VersionedCacheService
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def make_result(row_count: int = 3) -> QueryResult:
+    return QueryResult(
+        columns=["id"], rows=[[i] for i in range(row_count)], row_count=row_count,
+        truncated=False, execution_ms=5,
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MCP_SQL_CACHE_TIMEOUT=600, MCP_SQL_CACHE_MAX_BYTES_PER_USER=100_000)
+class TestQueryResultCacheService(TestCase):
+    def setUp(self):
+        self.versions = VersionedCacheService()
+        self.service = QueryResultCacheService(self.versions)
+        self.service.cache.clear()
+
+    def _run(self, sql, user_id=1, result=None):
+        execute = Mock(return_value=result or make_result())
+        return self.service.get_or_execute(sql, user_id=user_id, execute=execute), execute
+
+    def test_second_identical_query_is_a_hit(self):
+        first, first_execute = self._run("SELECT id FROM x")
+        second, second_execute = self._run("SELECT id FROM x")
+
+        first_execute.assert_called_once()
+        second_execute.assert_not_called()
+        self.assertEqual(second.rows, first.rows)
+        self.assertEqual(first.cache, {"hit": False, "hits": 0, "misses": 1, "hit_ratio": 0.0})
+        self.assertEqual(second.cache, {"hit": True, "hits": 1, "misses": 1, "hit_ratio": 0.5})
+
+    def test_whitespace_and_keyword_case_are_normalized(self):
+        self._run("SELECT id FROM x WHERE id > 1")
+        _, execute = self._run("select id\n  from x   where id > 1")
+        execute.assert_not_called()
+
+    def test_data_version_bump_misses(self):
+        self._run("SELECT id FROM x")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.versions.bump(1)
+
+        _, execute = self._run("SELECT id FROM x")
+        execute.assert_called_once()
+
+    def test_results_are_per_user(self):
+        self._run("SELECT id FROM x", user_id=1)
+        _, execute = self._run("SELECT id FROM x", user_id=2)
+        execute.assert_called_once()
+
+    def test_volatile_queries_are_not_cached(self):
+        for sql in ("SELECT now()", "SELECT * FROM x WHERE d >= CURRENT_DATE - 30", "SELECT random()"):
+            with self.subTest(sql=sql):
+                self._run(sql)
+                result, execute = self._run(sql)
+                execute.assert_called_once()
+                self.assertIsNone(result.cache)
+
+    @override_settings(MCP_SQL_CACHE_TIMEOUT=0)
+    def test_zero_timeout_disables_the_cache(self):
+        self._run("SELECT id FROM x")
+        _, execute = self._run("SELECT id FROM x")
+        execute.assert_called_once()
+
+    def test_oldest_results_are_evicted_past_the_user_cap(self):
+        size = len(pickle.dumps(make_result(50), pickle.HIGHEST_PROTOCOL))
+        with override_settings(MCP_SQL_CACHE_MAX_BYTES_PER_USER=size * 2):
+            for sql in ("SELECT 1 FROM x", "SELECT 2 FROM x", "SELECT 3 FROM x"):
+                self._run(sql, result=make_result(50))
+
+            _, evicted = self._run("SELECT 1 FROM x", result=make_result(50))
+            _, kept = self._run("SELECT 3 FROM x", result=make_result(50))
+
+        evicted.assert_called_once()
+        kept.assert_not_called()
+
+    def test_result_larger_than_the_cap_is_not_stored(self):
+        with override_settings(MCP_SQL_CACHE_MAX_BYTES_PER_USER=100):
+            self._run("SELECT id FROM x", result=make_result(100))
+            _, execute = self._run("SELECT id FROM x")
+        execute.assert_called_once()
+
+    def test_older_versions_are_dropped_from_the_index(self):
+        self._run("SELECT id FROM x")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.versions.bump(1)
+        self._run("SELECT id FROM y")
+
+        index = self.service.cache.get("mcp_sql_cache_index:1")
+        self.assertEqual(len(index), 1)
+        self.assertIn(":v1:", index[0][0])
+
+    def test_unreachable_cache_runs_the_query(self):
+        with patch.object(type(self.service.cache), "get", side_effect=ConnectionError):
+            result, execute = self._run("SELECT id FROM x")
+        execute.assert_called_once()
+        self.assertIsNone(result.cache)
@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from modules.ai.mcp.domains.query_result import QueryResult
+from modules.ai.mcp.exceptions import SqlCursorExpiredError
+from modules.ai.mcp.services.result_pages import CHUNK_ROWS, ResultPageCacheService
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def make_result(row_count: int) -> QueryResult:
+    return QueryResult(
+        columns=["id"], rows=[[i] for i in range(row_count)], row_count=row_count,
+        truncated=False, execution_ms=5,
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MCP_SQL_RESULT_TIMEOUT=300)
+class TestResultPageCacheService(SimpleTestCase):
+    def setUp(self):
+        self.service = ResultPageCacheService()
+        self.service.cache.clear()
+
+    def test_small_result_is_returned_as_is(self):
+        result = make_result(5)
+        self.assertIs(self.service.first_page(result, user_id=1, page_size=10), result)
+
+    def test_page_spanning_two_chunks(self):
+        first = self.service.first_page(make_result(CHUNK_ROWS * 2), user_id=1, page_size=CHUNK_ROWS - 10)
+
+        page = self.service.page(first.next_cursor, user_id=1, page_size=20)
+
+        self.assertEqual(page.rows, [[i] for i in range(CHUNK_ROWS - 10, CHUNK_ROWS + 10)])
+        self.assertEqual(page.next_cursor.rpartition(".")[2], str(CHUNK_ROWS + 10))
+
+    def test_expired_result_raises(self):
+        first = self.service.first_page(make_result(30), user_id=1, page_size=10)
+        self.service.cache.clear()
+
+        with self.assertRaises(SqlCursorExpiredError):
+            self.service.page(first.next_cursor, user_id=1, page_size=10)
+
+    def test_malformed_cursor_raises(self):
+        for cursor in ("", "abc", "abc.x", ".10"):
+            with self.subTest(cursor=cursor), self.assertRaises(SqlCursorExpiredError):
+                self.service.page(cursor, user_id=1, page_size=10)
+
+    def test_unreachable_cache_returns_a_truncated_page_without_cursor(self):
+        with patch.object(type(self.service.cache), "set_many", side_effect=ConnectionError):
+            first = self.service.first_page(make_result(30), user_id=1, page_size=10)
+
+        self.assertEqual(first.row_count, 10)
+        self.assertTrue(first.truncated)
+        self.assertIsNone(first.next_cursor)
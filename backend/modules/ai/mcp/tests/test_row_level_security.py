@@ -0,0 +1,38 @@
+from django.test import SimpleTestCase
+
+from modules.ai.mcp import row_level_security
+from modules.ai.mcp.schema_docs import SCOPED_TABLES
+from modules.ai.mcp.services.query_scoper import SCOPED_TABLE_CTES
+
+
+class TestRowLevelSecurityPolicies(SimpleTestCase):
+    def test_every_scoped_table_has_a_policy(self):
+        self.assertEqual(set(row_level_security.POLICIES), set(SCOPED_TABLES))
+        self.assertEqual(set(row_level_security.POLICIES), set(SCOPED_TABLE_CTES))
+
+    def test_enable_recreates_policies_for_the_role(self):
+        statements = row_level_security.enable_statements('mcp"ro', "app")
+
+        self.assertEqual(statements[:13], row_level_security.disable_statements())
+        self.assertIn(
+            'CREATE POLICY mcp_user_scope ON public.loans_loan FOR SELECT TO "mcp""ro" USING '
+            "(user_id = NULLIF(current_setting('app.user_id', true), '')::bigint AND deleted_at IS NULL)",
+            statements,
+        )
+        self.assertIn("ALTER TABLE public.loans_loan ENABLE ROW LEVEL SECURITY", statements)
+
+    def test_child_tables_are_scoped_through_their_parent(self):
+        self.assertIn("public.transactions_transaction", row_level_security.POLICIES["transactions_subtransaction"])
+        self.assertIn("public.loans_loan", row_level_security.POLICIES["loans_loanpayment"])
+
+    def test_query_running_functions_are_revoked_from_public(self):
+        revoke = row_level_security.enable_statements("mcp_ro", "o'app")[13]
+
+        self.assertIn("EXECUTE 'REVOKE EXECUTE ON FUNCTION ' || f || ' FROM PUBLIC';", revoke)
+        self.assertIn("EXECUTE 'GRANT EXECUTE ON FUNCTION ' || f || ' TO ' || quote_ident('o''app');", revoke)
+        self.assertIn("_to_xml", revoke)
+        self.assertIn("'set_config', 'ts_stat'", revoke)
+        self.assertIn(
+            "EXECUTE 'GRANT EXECUTE ON FUNCTION ' || f || ' TO PUBLIC';",
+            row_level_security.disable_statements()[-1],
+        )
@@ -26,3 +26,28 @@ class TestSqlQueryFactory(SimpleTestCase):
     def test_propagates_validator_errors(self):
         with self.assertRaises(SqlNotAllowedError):
             self.factory.from_raw("DROP TABLE x", user_id=1)
+
+    def test_rls_mode_leaves_the_query_unwrapped(self):
+        factory = SqlQueryFactory(
+            sql_validator=SqlValidatorService(),
+            query_scoper=QueryScoperService(),
+            scoping_mode="rls",
+        )
+
+        result = factory.from_raw("SELECT id FROM transactions_transaction;", user_id=42)
+
+        self.assertEqual(result.wrapped, "SELECT id FROM transactions_transaction")
+        self.assertEqual(result.params, {})
+        self.assertEqual(result.rls_user_id, 42)
+
+    def test_cte_mode_sets_no_rls_user(self):
+        result = self.factory.from_raw("SELECT 1", user_id=42)
+        self.assertIsNone(result.rls_user_id)
+
+    def test_unknown_scoping_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            SqlQueryFactory(
+                sql_validator=SqlValidatorService(),
+                query_scoper=QueryScoperService(),
+                scoping_mode="none",
+            )
@@ -78,3 +78,29 @@ class TestSqlValidatorService(SimpleTestCase):
     def test_strips_block_comments(self):
         result = self.service.validate("SELECT /* evil */ 1")
         self.assertNotIn("/*", result)
+
+    def test_rejects_set_config(self):
+        for query in (
+            "SELECT set_config('app.user_id', '2', true)",
+            "SELECT * FROM transactions_transaction WHERE pg_catalog.SET_CONFIG('app.user_id', '2', true) IS NOT NULL",
+            'SELECT "set_config"(\'app.user_id\', \'2\', false)',
+        ):
+            with self.subTest(query=query), self.assertRaises(SqlNotAllowedError):
+                self.service.validate(query)
+
+    def test_rejects_unicode_escapes(self):
+        with self.assertRaises(SqlNotAllowedError):
+            self.service.validate('SELECT U&"set\\005fconfig"(\'app.user_id\', \'2\', true)')
+
+    def test_rejects_functions_that_run_a_query_from_text(self):
+        for query in (
+            "WITH s AS MATERIALIZED (SELECT query_to_xml('select set_' || 'config(''app.user_id'', ''2'', true)', "
+            "false, false, '') x) SELECT t.* FROM s CROSS JOIN LATERAL "
+            "(SELECT * FROM transactions_transaction WHERE s.x IS NOT NULL) t",
+            "SELECT query_to_xml('select * from transactions_transaction', true, false, '')",
+            "SELECT table_to_xml('transactions_transaction', true, false, '')",
+            "SELECT database_to_xmlschema(true, false, '')",
+            "SELECT * FROM ts_stat('select to_tsvector(description) from transactions_subtransaction')",
+        ):
+            with self.subTest(query=query), self.assertRaises(SqlNotAllowedError):
+                self.service.validate(query)
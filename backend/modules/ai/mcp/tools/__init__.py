@@ -14,8 +14,9 @@ from modules.ai.mcp.tools.describe_schema import (
     call_describe_schema,
 )
 from modules.ai.mcp.tools.execute_sql import (
-    EXECUTE_SQL_DESCRIPTION,
     call_execute_sql,
+    execute_sql_description,
+    execute_sql_input_schema,
 )
 from modules.ai.mcp.tools.list_enums import (
     LIST_ENUMS_DESCRIPTION,
@@ -29,17 +30,8 @@ def register_tools(server: Server, container: MCPContainer, user_id: int) -> Non
         return [
             Tool(
                 name="execute_sql",
-                description=EXECUTE_SQL_DESCRIPTION,
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "SELECT or WITH ... SELECT statement.",
-                        }
-                    },
-                    "required": ["query"],
-                },
+                description=execute_sql_description(),
+                inputSchema=execute_sql_input_schema(),
             ),
             Tool(
                 name="describe_schema",
@@ -68,9 +60,13 @@ def register_tools(server: Server, container: MCPContainer, user_id: int) -> Non
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         if name == "execute_sql":
             payload = call_execute_sql(
-                query=arguments["query"],
+                query=arguments.get("query"),
                 use_case=container.execute_sql_use_case(),
+                query_result_factory=container.query_result_factory(),
                 user_id=user_id,
+                row_limit=arguments.get("row_limit"),
+                cursor=arguments.get("cursor"),
+                output_format=arguments.get("format"),
             )
         elif name == "describe_schema":
             payload = call_describe_schema(
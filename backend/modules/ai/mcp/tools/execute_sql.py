@@ -1,29 +1,80 @@
 import logging
-from typing import Any
+from typing import Any, Optional
+
+from django.conf import settings
 
 from modules.ai.mcp.exceptions import MCPError
+from modules.ai.mcp.factories.query_result import OUTPUT_FORMATS, QueryResultFactory
 from modules.ai.mcp.use_cases.execute_sql import ExecuteSqlUseCase
 
 
 logger = logging.getLogger("modules.ai.mcp")
 
 
-EXECUTE_SQL_DESCRIPTION = (
-    "Executa uma query SELECT read-only no banco do Poupix. Escopada "
-    "automaticamente ao seu usuário; exclui registros soft-deleted. "
-    "Limite de 1000 linhas e 5s de execução. Use os nomes de tabela do "
-    "Django: transactions_transaction, transactions_subtransaction, "
-    "transactions_actor, file_reader_file."
-)
+def execute_sql_description() -> str:
+    return (
+        "Executa uma query SELECT read-only no banco do Poupix. Escopada "
+        "automaticamente ao seu usuário; exclui registros soft-deleted. "
+        f"Devolve row_limit linhas por página (padrão {settings.MCP_SQL_PAGE_SIZE}, "
+        f"máximo {settings.MCP_SQL_MAX_PAGE_SIZE}) e até {settings.MCP_SQL_MAX_ROWS} "
+        "linhas por query, com 5s de execução. Quando houver mais linhas, "
+        "a resposta traz next_cursor: passe-o em cursor (sem query) para a "
+        "próxima página, sem rodar a query de novo; vale por "
+        f"{settings.MCP_SQL_RESULT_TIMEOUT} segundos. "
+        "format=csv, markdown_table ou columnar (colunas com valores repetidos "
+        "viram dictionary + codes) gasta menos tokens que o json padrão; size "
+        "informa bytes e tokens estimados da resposta. Use os nomes de tabela do "
+        "Django: transactions_transaction, transactions_subtransaction, "
+        "transactions_actor, file_reader_file."
+    )
+
+
+def execute_sql_input_schema() -> dict:
+    return {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "SELECT or WITH ... SELECT statement.",
+            },
+            "row_limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": settings.MCP_SQL_MAX_PAGE_SIZE,
+                "description": f"Rows per page (default {settings.MCP_SQL_PAGE_SIZE}).",
+            },
+            "cursor": {
+                "type": "string",
+                "description": "next_cursor of a previous page, to fetch the page after it.",
+            },
+            "format": {
+                "type": "string",
+                "enum": list(OUTPUT_FORMATS),
+                "description": "Output format (default json).",
+            },
+        },
+    }
 
 
 def call_execute_sql(
-    *, query: str, use_case: ExecuteSqlUseCase, user_id: int
+    *,
+    query: Optional[str],
+    use_case: ExecuteSqlUseCase,
+    user_id: int,
+    query_result_factory: QueryResultFactory,
+    row_limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    output_format: Optional[str] = None,
 ) -> dict[str, Any]:
-    logger.info("mcp.execute_sql user_id=%s sql=%r", user_id, query[:500])
     try:
-        result = use_case.execute(query, user_id=user_id)
-        return result.to_dict()
+        output_format = query_result_factory.check_format(output_format)
+        if cursor:
+            logger.info("mcp.execute_sql user_id=%s cursor=%r", user_id, cursor)
+            result = use_case.next_page(cursor, user_id=user_id, row_limit=row_limit)
+        else:
+            logger.info("mcp.execute_sql user_id=%s sql=%r", user_id, (query or "")[:500])
+            result = use_case.execute(query or "", user_id=user_id, row_limit=row_limit)
+        return query_result_factory.to_payload(result, output_format)
     except MCPError as exc:
         logger.info("mcp.execute_sql error code=%s", exc.code)
         return {"error": {"code": exc.code, "message": exc.message}}
@@ -1,21 +1,58 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
 
 from modules.ai.mcp.domains.query_result import QueryResult
+from modules.ai.mcp.exceptions import SqlInvalidError
 from modules.ai.mcp.factories.sql_query import SqlQueryFactory
+from modules.ai.mcp.services.result_cache import QueryResultCacheService
+from modules.ai.mcp.services.result_pages import ResultPageCacheService
 
 if TYPE_CHECKING:
     from modules.ai.mcp.gateways.readonly_postgres import ReadOnlyPostgresGateway
 
 
 class ExecuteSqlUseCase:
+    """Runs a query once, reading up to ``MCP_SQL_MAX_ROWS`` rows, and returns
+    them a page at a time: later pages come from ``ResultPageCacheService``
+    through the cursor of the previous one. Repeating a query while the user's
+    data is unchanged is served by ``QueryResultCacheService``.
+    """
+
     def __init__(
         self,
         sql_query_factory: SqlQueryFactory,
         readonly_postgres_gateway: "ReadOnlyPostgresGateway",
+        result_page_cache: ResultPageCacheService,
+        query_result_cache: QueryResultCacheService,
     ):
         self.sql_query_factory = sql_query_factory
         self.readonly_postgres_gateway = readonly_postgres_gateway
+        self.result_page_cache = result_page_cache
+        self.query_result_cache = query_result_cache
+
+    def execute(self, raw_query: str, *, user_id: int, row_limit: Optional[int] = None) -> QueryResult:
+        max_rows = settings.MCP_SQL_MAX_ROWS
+        sql_query = self.sql_query_factory.from_raw(raw_query, user_id=user_id, row_limit=max_rows)
+        result = self.query_result_cache.get_or_execute(
+            sql_query.raw,
+            user_id=user_id,
+            execute=lambda: self.readonly_postgres_gateway.execute(sql_query, row_limit=max_rows),
+        )
+        return self.result_page_cache.first_page(
+            result, user_id=user_id, page_size=self._page_size(row_limit)
+        )
+
+    def next_page(self, cursor: str, *, user_id: int, row_limit: Optional[int] = None) -> QueryResult:
+        return self.result_page_cache.page(
+            cursor, user_id=user_id, page_size=self._page_size(row_limit)
+        )
 
-    def execute(self, raw_query: str, *, user_id: int) -> QueryResult:
-        sql_query = self.sql_query_factory.from_raw(raw_query, user_id=user_id)
-        return self.readonly_postgres_gateway.execute(sql_query)
+    def _page_size(self, row_limit: Optional[int]) -> int:
+        if row_limit is None:
+            return settings.MCP_SQL_PAGE_SIZE
+        try:
+            row_limit = int(row_limit)
+        except (TypeError, ValueError) as exc:
+            raise SqlInvalidError(f"row_limit must be an integer, got {row_limit!r}") from exc
+        return max(1, min(row_limit, settings.MCP_SQL_MAX_PAGE_SIZE))
@@ -22,12 +22,14 @@ class TestAskUseCase(SimpleTestCase):
         self.mock_ai_response_factory = Mock()
         self.mock_ai_call_repository = Mock()
         self.mock_llm_service = Mock()
+        self.mock_versioned_cache_service = Mock()
 
         self.use_case = AskUseCase(
             ai_request_factory=self.mock_ai_request_factory,
             ai_response_factory=self.mock_ai_response_factory,
             ai_call_repository=self.mock_ai_call_repository,
             llm_service=self.mock_llm_service,
+            versioned_cache_service=self.mock_versioned_cache_service,
         )
 
     def test_execute_creates_ai_request_and_calls_llm(self):
@@ -68,6 +70,7 @@ class TestAskUseCase(SimpleTestCase):
             mock_llm_response, mock_ai_request
         )
         self.mock_ai_call_repository.create.assert_called_once_with(mock_ai_response, user_id)
+        self.mock_versioned_cache_service.bump.assert_called_once_with(user_id, namespace="ai_calls")
         self.assertEqual(result, "response_123")
 
     def test_execute_with_all_parameters(self):
@@ -0,0 +1,128 @@
+"""
+Unit tests for OpenAIClientRegistry.
+
+These tests verify that gateways of the same provider account share one
+keep-alive client and that the pool metrics follow the requests it serves.
+No request leaves the process: the transport is patched.
+"""
+from unittest.mock import patch
+
+import httpx
+from django.test import SimpleTestCase
+
+from modules.ai.gateways import LLMGateway, OpenAIEmbeddingGateway
+from modules.ai.gateways.http_clients import MeteredTransport, OpenAIClientRegistry, PoolMetrics
+
+
+class TestOpenAIClientRegistry(SimpleTestCase):
+    """Test OpenAIClientRegistry client sharing and metrics."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = OpenAIClientRegistry()
+
+    def tearDown(self):
+        """Close the pools opened by the test."""
+        self.registry.close()
+
+    def test_same_account_shares_one_client(self):
+        """Test the same provider, base URL and key always return the same client."""
+        # Act
+        first = self.registry.get("deepseek", "key", "https://api.deepseek.com")
+        second = self.registry.get("deepseek", "key", "https://api.deepseek.com")
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertEqual(len(self.registry.stats()), 1)
+
+    def test_different_accounts_get_different_clients(self):
+        """Test a different provider, base URL or key gets its own pool."""
+        # Act
+        clients = [
+            self.registry.get("deepseek", "key", "https://api.deepseek.com"),
+            self.registry.get("deepseek", "other-key", "https://api.deepseek.com"),
+            self.registry.get("openai", "key"),
+        ]
+
+        # Assert
+        self.assertEqual(len({id(client) for client in clients}), 3)
+
+    def test_forked_process_starts_new_pools(self):
+        """Test clients created before a fork are not reused by the child."""
+        # Arrange
+        parent_client = self.registry.get("openai", "key")
+
+        # Act
+        with patch("modules.ai.gateways.http_clients.os.getpid", return_value=-1):
+            child_client = self.registry.get("openai", "key")
+
+        # Assert
+        self.assertIsNot(parent_client, child_client)
+        self.assertEqual(len(self.registry.stats()), 1)
+
+    def test_client_uses_configured_timeouts(self):
+        """Test the client timeout comes from the LLM_HTTP_* settings."""
+        # Act
+        with self.settings(LLM_HTTP_TIMEOUT=30, LLM_HTTP_CONNECT_TIMEOUT=2):
+            client = self.registry.get("openai", "key")
+
+        # Assert
+        self.assertEqual(client.timeout.read, 30)
+        self.assertEqual(client.timeout.connect, 2)
+
+    def test_metrics_count_requests_and_errors(self):
+        """Test requests and failures served by a pool are reported in stats."""
+        # Arrange
+        client = self.registry.get("openai", "key")
+        http_client = client._client
+
+        # Act
+        with patch.object(httpx.HTTPTransport, "handle_request", return_value=httpx.Response(200)):
+            http_client.get("https://api.openai.com/v1/models")
+            http_client.get("https://api.openai.com/v1/models")
+        with patch.object(httpx.HTTPTransport, "handle_request", side_effect=httpx.ConnectError("down")):
+            with self.assertRaises(httpx.ConnectError):
+                http_client.get("https://api.openai.com/v1/models")
+
+        # Assert
+        stats = self.registry.stats()[0]
+        self.assertEqual(stats["provider"], "openai")
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_transport_without_the_private_pool_still_meters_requests(self):
+        """Test a renamed httpx pool only disables the connection metrics."""
+        # Arrange
+        metrics = PoolMetrics()
+        with patch.object(httpx.HTTPTransport, "__init__", lambda transport, **kwargs: None):
+            with self.assertLogs("modules.ai.gateways.http_clients", level="WARNING"):
+                transport = MeteredTransport(metrics)
+
+        # Act
+        with patch.object(httpx.HTTPTransport, "handle_request", return_value=httpx.Response(200)):
+            transport.handle_request(httpx.Request("GET", "https://api.openai.com/v1/models"))
+
+        # Assert
+        self.assertEqual(metrics.requests, 1)
+        self.assertEqual(transport.connection_counts(), {"open": None, "idle": None})
+
+
+class TestGatewaysShareClients(SimpleTestCase):
+    """Test gateways resolve their client through the shared registry."""
+
+    def test_gateways_of_the_same_account_share_a_client(self):
+        """Test two gateway instances for one account get the same client."""
+        # Arrange
+        registry = OpenAIClientRegistry()
+        first = LLMGateway("openai", "key", "https://api.openai.com/v1", ai_request_factory=None)
+        second = OpenAIEmbeddingGateway("key", "https://api.openai.com/v1")
+
+        # Act
+        with patch("modules.ai.gateways.llm.client_registry", registry), \
+                patch("modules.ai.gateways.openai_embedding.client_registry", registry):
+            clients = (first.get_client(), second.get_client())
+
+        # Assert
+        self.assertIs(clients[0], clients[1])
+        registry.close()
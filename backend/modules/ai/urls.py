@@ -1,6 +1,6 @@
 from django.urls import include, path
 
-from modules.ai.views import ListAICallsView, StatsAICallsView, ListEmbeddingsView, StatsEmbeddingsView
+from modules.ai.views import AIClientPoolStatsView, MCPTokenCacheStatsView, ListAICallsView, StatsAICallsView, ListEmbeddingsView, StatsEmbeddingsView
 
 urlpatterns = [
     path("chat/", include("modules.ai.chat.urls")),
@@ -8,4 +8,6 @@ urlpatterns = [
     path("ai-calls/stats/", StatsAICallsView.as_view(), name="stats_ai_calls"),
     path("embeddings/", ListEmbeddingsView.as_view(), name="list_embeddings"),
     path("embeddings/stats/", StatsEmbeddingsView.as_view(), name="stats_embeddings"),
+    path("client-pools/stats/", AIClientPoolStatsView.as_view(), name="ai_client_pool_stats"),
+    path("mcp/token-cache/stats/", MCPTokenCacheStatsView.as_view(), name="mcp_token_cache_stats"),
 ]
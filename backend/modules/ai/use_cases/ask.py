@@ -8,9 +8,14 @@ from modules.ai.services.llm import LLMService
 from modules.ai.repositories.ai_call import AICallRepository
 from modules.ai.types import LlmModels
 from modules.ai.exceptions import LLMGatewayException
+from modules.base.services import VersionedCacheService
 
 logger = logging.getLogger(__name__)
 
+# AI calls are not ledger data: their own version keeps LLM calls from evicting
+# the dashboards and the MCP result cache.
+AI_CALLS_CACHE_NAMESPACE = "ai_calls"
+
 
 class AskUseCase:
     def __init__(
@@ -19,11 +24,13 @@ class AskUseCase:
         ai_response_factory: AIResponseFactory,
         ai_call_repository: AICallRepository,
         llm_service: LLMService,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.ai_request_factory = ai_request_factory
         self.ai_response_factory = ai_response_factory
         self.ai_call_repository = ai_call_repository
         self.llm_service = llm_service
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(
         self,
@@ -55,6 +62,7 @@ class AskUseCase:
         response = self.ask_ai(ai_request)
         logger.info(f"[AskUseCase] LLM response received, saving to repository...")
         ai_response = self.ai_call_repository.create(response, user_id)
+        self.versioned_cache_service.bump(user_id, namespace=AI_CALLS_CACHE_NAMESPACE)
         logger.info(f"[AskUseCase] Response saved with id: {ai_response.id}")
         return ai_response.id
 
@@ -1,20 +1,36 @@
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from modules.ai.chat.models import Conversation, Message
 from modules.ai.container import AIContainer
+from modules.ai.gateways import client_registry
+from modules.ai.mcp.oauth.services.token_cache import token_cache
+from modules.ai.models import AICall
+from modules.ai.use_cases.ask import AI_CALLS_CACHE_NAMESPACE
+from modules.base.conditional import conditional_get
+from modules.file_reader.models import File
 from modules.userdata.authentication import JWTAuthentication
 
+# AI calls are linked to the user directly or through conversations, messages and files
+AI_CALL_SOURCES = [
+    (AICall, "user_id"),
+    (Conversation, "user_id"),
+    (Message, "conversation__user_id"),
+    (File, "user_id"),
+]
+
+container = AIContainer()
+
 class ListAICallsView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = AIContainer()
+    container = container
 
+    @conditional_get(*AI_CALL_SOURCES)
     def get(self, request: Request):
         user_id = request.user.id
         filter_by_model = request.query_params.get("model")
@@ -29,17 +45,22 @@ class StatsAICallsView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = AIContainer()
+    container = container
 
+    @conditional_get(*AI_CALL_SOURCES)
     def get(self, request: Request):
         user_id = request.user.id
         filter_by_model = request.query_params.get("model")
         due_date_start = request.query_params.get("due_date_start")
         due_date_end = request.query_params.get("due_date_end")
 
-        stats = self.container.stats_ai_call_use_case().execute(user_id, filter_by_model, due_date_start, due_date_end)
+        stats = self.container.versioned_cache_service().get_or_compute(
+            "ai_calls.stats",
+            user_id,
+            {"model": filter_by_model, "due_date_start": due_date_start, "due_date_end": due_date_end},
+            lambda: self.container.stats_ai_call_use_case().execute(user_id, filter_by_model, due_date_start, due_date_end),
+            namespace=AI_CALLS_CACHE_NAMESPACE,
+        )
         return Response(stats, status=status.HTTP_200_OK)
     
 
@@ -47,9 +68,7 @@ class ListEmbeddingsView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = AIContainer()
+    container = container
 
     def get(self, request: Request):
         user_id = request.user.id
@@ -64,9 +83,7 @@ class StatsEmbeddingsView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = AIContainer()
+    container = container
 
     def get(self, request: Request):
         user_id = request.user.id
@@ -75,3 +92,19 @@ class StatsEmbeddingsView(APIView):
 
         stats = self.container.stats_embeddings_use_case().execute(user_id, due_date_start, due_date_end)
         return Response(stats, status=status.HTTP_200_OK)
+
+
+class AIClientPoolStatsView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request):
+        return Response(client_registry.stats(), status=status.HTTP_200_OK)
+
+
+class MCPTokenCacheStatsView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request):
+        return Response(token_cache.stats(), status=status.HTTP_200_OK)
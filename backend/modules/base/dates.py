@@ -0,0 +1,66 @@
+from datetime import date, datetime
+
+from dateutil.relativedelta import relativedelta
+
+
+def month_range(year: int, month: int) -> tuple[date, date]:
+    """Return the half-open ``[first_day, first_day_of_next_month)`` range of a month."""
+    first_day = date(int(year), int(month), 1)
+    return first_day, first_day + relativedelta(months=1)
+
+
+def month_filters(field: str, year: int, month: int = None) -> dict:
+    """Build range lookups for a month (or a whole year) that can use an index on ``field``.
+
+    ``field__month``/``field__year`` compile to ``EXTRACT()`` and force a scan, so
+    callers should filter with these lookups instead.
+    """
+    if month is None:
+        start = date(int(year), 1, 1)
+        end = start + relativedelta(years=1)
+    else:
+        start, end = month_range(year, month)
+    return {f"{field}__gte": start, f"{field}__lt": end}
+
+
+def month_filters_from_date(field: str, value: str) -> dict:
+    """Same as ``month_filters`` for the month of a ``YYYY-MM-DD`` string."""
+    parsed = datetime.strptime(value, "%Y-%m-%d")
+    return month_filters(field, parsed.year, parsed.month)
+
+
+def first_day_of_month(value) -> date:
+    """First day of the month of a ``date``/``datetime`` or ``YYYY-MM-DD`` string."""
+    if isinstance(value, str):
+        value = datetime.strptime(value[:10], "%Y-%m-%d")
+    return date(value.year, value.month, 1)
+
+
+def whole_months_range(start: str, end: str):
+    """Half-open month range covering ``[start, end]`` when both ends fall on month boundaries.
+
+    Returns ``None`` when ``start`` is not the first day of a month or ``end`` is not the
+    last one, since such a period cannot be answered from monthly totals.
+    """
+    start_date = datetime.strptime(start, "%Y-%m-%d").date()
+    end_date = datetime.strptime(end, "%Y-%m-%d").date()
+    next_day = end_date + relativedelta(days=1)
+    if start_date.day != 1 or next_day.day != 1 or next_day <= start_date:
+        return None
+    return start_date, next_day
+
+
+def months_for_period(due_date: str = None, due_date_start: str = None, due_date_end: str = None):
+    """Month range ``(start, end)`` matching the period filters used by the stats endpoints.
+
+    ``None`` bounds mean unbounded. Returns ``None`` when the period cannot be expressed in
+    whole months (or combines both filters) and must be computed from raw rows instead.
+    """
+    if due_date and due_date_start and due_date_end:
+        return None
+    if due_date:
+        start = first_day_of_month(due_date)
+        return start, start + relativedelta(months=1)
+    if due_date_start and due_date_end:
+        return whole_months_range(due_date_start, due_date_end)
+    return None, None
@@ -0,0 +1,138 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+# Below this planner estimate an exact COUNT(*) is cheap, and the estimate is too
+# rough to show anyway (statistics of small tables are often stale).
+EXACT_COUNT_THRESHOLD = 1000
+TRUE_VALUES = ("1", "true", "True")
+
+
+class PageRequest:
+    """Cursor and page size asked by the client, capped at ``PAGINATION_MAX_PAGE_SIZE``."""
+
+    def __init__(self, cursor: str = None, page_size: int = None, with_count: bool = False):
+        self.cursor = cursor
+        self.page_size = min(page_size or settings.PAGINATION_DEFAULT_PAGE_SIZE, settings.PAGINATION_MAX_PAGE_SIZE)
+        self.with_count = with_count
+
+    @classmethod
+    def from_query_params(cls, query_params) -> "PageRequest | None":
+        """Build a request from ``cursor``, ``page_size`` and ``with_count``.
+
+        Returns None when neither ``cursor`` nor ``page_size`` is given, so clients
+        that do not paginate keep receiving the full list.
+        """
+        cursor = query_params.get("cursor")
+        page_size = query_params.get("page_size")
+        if not cursor and not page_size:
+            return None
+
+        if page_size:
+            try:
+                page_size = int(page_size)
+            except ValueError as exc:
+                raise ValueError("page_size must be a positive integer") from exc
+            if page_size < 1:
+                raise ValueError("page_size must be a positive integer")
+
+        return cls(cursor or None, page_size or None, query_params.get("with_count") in TRUE_VALUES)
+
+    def as_params(self) -> dict:
+        return {"cursor": self.cursor, "page_size": self.page_size, "with_count": self.with_count}
+
+
+class Page:
+    def __init__(self, items: list, next_cursor: str = None, count: int = None, count_is_estimate: bool = False):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.count = count
+        self.count_is_estimate = count_is_estimate
+
+    def with_items(self, items: list) -> "Page":
+        return Page(items, self.next_cursor, self.count, self.count_is_estimate)
+
+    def as_dict(self) -> dict:
+        response = {"results": self.items, "next_cursor": self.next_cursor}
+        if self.count is not None:
+            response["count"] = self.count
+            response["count_is_estimate"] = self.count_is_estimate
+        return response
+
+
+class KeysetPaginator:
+    """Paginates a queryset by the values of its ordering columns instead of an OFFSET.
+
+    ``ordering`` must end with a unique column (usually ``id``) so every row has a
+    distinct position. Each page is one indexed range scan whatever its depth.
+    """
+
+    def __init__(self, ordering: list[str]):
+        self.ordering = ordering
+        self.fields = [field.lstrip("-") for field in ordering]
+
+    def paginate(self, queryset, page_request: PageRequest) -> Page:
+        count, count_is_estimate = None, False
+        if page_request.with_count:
+            count, count_is_estimate = estimate_count(queryset)
+
+        queryset = queryset.order_by(*self.ordering)
+        if page_request.cursor:
+            try:
+                queryset = queryset.filter(self._after(self.decode_cursor(page_request.cursor)))
+            except (ValidationError, TypeError, ValueError) as exc:
+                raise ValueError("Invalid cursor") from exc
+
+        items = list(queryset[:page_request.page_size + 1])
+        next_cursor = None
+        if len(items) > page_request.page_size:
+            items = items[:page_request.page_size]
+            next_cursor = self.encode_cursor([getattr(items[-1], field) for field in self.fields])
+
+        return Page(items, next_cursor, count, count_is_estimate)
+
+    def encode_cursor(self, values: list) -> str:
+        payload = json.dumps(values, default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> list:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise ValueError("Invalid cursor")
+        return values
+
+    def _after(self, values: list) -> Q:
+        """Rows strictly after ``values``: ``a > x OR (a = x AND b > y) ...`` per ordering direction."""
+        conditions = []
+        for index, ordering in enumerate(self.ordering):
+            lookup = "lt" if ordering.startswith("-") else "gt"
+            conditions.append(Q(
+                **dict(zip(self.fields[:index], values[:index], strict=True)),
+                **{f"{self.fields[index]}__{lookup}": values[index]},
+            ))
+        return reduce(or_, conditions)
+
+
+def estimate_count(queryset) -> tuple[int, bool]:
+    """Row count from the planner estimate, or an exact count when the result is small.
+
+    Returns the count and whether it is an estimate.
+    """
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    # Postgres answers ``[{"Plan": ...}]``; some drivers unwrap the list.
+    if isinstance(plan, list):
+        plan = plan[0]
+    estimate = plan["Plan"]["Plan Rows"]
+    if estimate < EXACT_COUNT_THRESHOLD:
+        return queryset.count(), False
+    return estimate, True
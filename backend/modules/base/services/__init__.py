@@ -0,0 +1,5 @@
+from modules.base.services.versioned_cache import VersionedCacheService
+
+__all__ = [
+    "VersionedCacheService",
+]
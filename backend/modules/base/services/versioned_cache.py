@@ -0,0 +1,120 @@
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.transaction import on_commit
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "{namespace}_version:{user_id}"
+DATA_NAMESPACE = "data"
+VALUE_KEY = "dashboard:{endpoint}:{user_id}:v{version}:{params}"
+COUNTER_KEY = "dashboard_stats:{endpoint}:{counter}"
+COUNTERS = ("hits", "misses", "errors")
+
+
+class VersionedCacheService:
+    """Read-through cache for per-user dashboard data.
+
+    Every key embeds the user's data version. Write use cases call ``bump`` and the
+    next read misses, so invalidating a user is a single ``INCR`` and entries cached
+    under an older version are never served again; they simply expire.
+
+    Data that changes independently of the ledger (AI calls) keeps its own version
+    ``namespace`` so its writes do not evict the ledger dashboards.
+
+    Cache failures never break a request: the value is computed from the database.
+    """
+
+    def __init__(self, cache_alias: str = "default"):
+        self.cache_alias = cache_alias
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def is_enabled(self, endpoint: str) -> bool:
+        disabled = settings.DASHBOARD_CACHE_DISABLED
+        return "*" not in disabled and endpoint not in disabled
+
+    def get_or_compute(
+        self, endpoint: str, user_id: int, params: dict, compute: Callable[[], Any], namespace: str = DATA_NAMESPACE,
+    ) -> Any:
+        if not self.is_enabled(endpoint):
+            return compute()
+
+        try:
+            key = VALUE_KEY.format(
+                endpoint=endpoint,
+                user_id=user_id,
+                version=self.version(user_id, namespace),
+                params=self._hash(params),
+            )
+            value = self.cache.get(key)
+        except Exception:
+            logger.warning("[VersionedCache] Read failed for %s", endpoint, exc_info=True)
+            self._count(endpoint, "errors")
+            return compute()
+
+        if value is not None:
+            self._count(endpoint, "hits")
+            return value
+
+        self._count(endpoint, "misses")
+        value = compute()
+        try:
+            self.cache.set(key, value, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+        except Exception:
+            logger.warning("[VersionedCache] Write failed for %s", endpoint, exc_info=True)
+        return value
+
+    def version(self, user_id: int, namespace: str = DATA_NAMESPACE) -> int:
+        return self.cache.get(VERSION_KEY.format(namespace=namespace, user_id=user_id), 0)
+
+    def bump(self, user_id: int, namespace: str = DATA_NAMESPACE):
+        """Invalidate everything cached for the user under ``namespace`` once the current transaction commits."""
+        if user_id:
+            on_commit(lambda: self._increment_version(user_id, namespace))
+
+    def counters(self) -> dict:
+        keys = {
+            COUNTER_KEY.format(endpoint=endpoint, counter=counter): (endpoint, counter)
+            for endpoint in settings.DASHBOARD_CACHE_ENDPOINTS
+            for counter in COUNTERS
+        }
+        values = self.cache.get_many(list(keys))
+
+        result = {endpoint: dict.fromkeys(COUNTERS, 0) for endpoint in settings.DASHBOARD_CACHE_ENDPOINTS}
+        for key, value in values.items():
+            endpoint, counter = keys[key]
+            result[endpoint][counter] = value
+        return result
+
+    def _increment_version(self, user_id: int, namespace: str):
+        key = VERSION_KEY.format(namespace=namespace, user_id=user_id)
+        try:
+            self._increment(key)
+        except Exception:
+            logger.warning("[VersionedCache] Could not bump data version for user %s", user_id, exc_info=True)
+
+    def _increment(self, key: str):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Missing key: create it, unless a concurrent writer just did.
+            if not self.cache.add(key, 1, timeout=None):
+                self.cache.incr(key)
+
+    def _count(self, endpoint: str, counter: str):
+        try:
+            self._increment(COUNTER_KEY.format(endpoint=endpoint, counter=counter))
+        except Exception:
+            pass
+
+    def _hash(self, params: dict) -> str:
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.md5(payload.encode()).hexdigest()
@@ -0,0 +1,98 @@
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+
+from modules.base.services import VersionedCacheService
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestVersionedCacheService(TestCase):
+    """Test VersionedCacheService against an in-memory cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = VersionedCacheService()
+        self.service.cache.clear()
+        self.compute = Mock(return_value={"total": 10})
+
+    def test_second_read_is_served_from_cache(self):
+        """Test the value is computed once and then read back from the cache."""
+        # Act
+        first = self.service.get_or_compute("transactions.stats", 1, {"due_date": "2026-03"}, self.compute)
+        second = self.service.get_or_compute("transactions.stats", 1, {"due_date": "2026-03"}, self.compute)
+
+        # Assert
+        self.assertEqual(first, {"total": 10})
+        self.assertEqual(second, {"total": 10})
+        self.compute.assert_called_once()
+        self.assertEqual(self.service.counters()["transactions.stats"], {"hits": 1, "misses": 1, "errors": 0})
+
+    def test_params_and_users_do_not_share_entries(self):
+        """Test different params or users never read each other's values."""
+        # Act
+        self.service.get_or_compute("transactions.stats", 1, {"due_date": "2026-03"}, self.compute)
+        self.service.get_or_compute("transactions.stats", 1, {"due_date": "2026-04"}, self.compute)
+        self.service.get_or_compute("transactions.stats", 2, {"due_date": "2026-03"}, self.compute)
+
+        # Assert
+        self.assertEqual(self.compute.call_count, 3)
+
+    def test_bump_invalidates_after_commit(self):
+        """Test a bump only takes effect once the surrounding transaction commits."""
+        # Arrange
+        self.service.get_or_compute("transactions.stats", 1, {}, self.compute)
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.bump(1)
+            self.service.get_or_compute("transactions.stats", 1, {}, self.compute)
+            self.assertEqual(self.compute.call_count, 1)
+
+        self.service.get_or_compute("transactions.stats", 1, {}, self.compute)
+        self.service.get_or_compute("transactions.stats", 2, {}, self.compute)
+
+        # Assert
+        self.assertEqual(self.service.version(1), 1)
+        self.assertEqual(self.service.version(2), 0)
+        self.assertEqual(self.compute.call_count, 3)
+
+    def test_namespaces_are_bumped_independently(self):
+        """Test a bump in one namespace keeps entries cached under another."""
+        # Arrange
+        self.service.get_or_compute("transactions.stats", 1, {}, self.compute)
+        self.service.get_or_compute("ai_calls.stats", 1, {}, self.compute, namespace="ai_calls")
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.bump(1, namespace="ai_calls")
+        self.service.get_or_compute("transactions.stats", 1, {}, self.compute)
+        self.service.get_or_compute("ai_calls.stats", 1, {}, self.compute, namespace="ai_calls")
+
+        # Assert
+        self.assertEqual(self.service.version(1), 0)
+        self.assertEqual(self.service.version(1, namespace="ai_calls"), 1)
+        self.assertEqual(self.compute.call_count, 3)
+
+    @override_settings(DASHBOARD_CACHE_DISABLED=["actors.list"])
+    def test_disabled_endpoint_always_computes(self):
+        """Test an endpoint listed in DASHBOARD_CACHE_DISABLED bypasses the cache."""
+        # Act
+        self.service.get_or_compute("actors.list", 1, {}, self.compute)
+        self.service.get_or_compute("actors.list", 1, {}, self.compute)
+
+        # Assert
+        self.assertEqual(self.compute.call_count, 2)
+        self.assertEqual(self.service.counters()["actors.list"], {"hits": 0, "misses": 0, "errors": 0})
+
+    def test_cache_failure_falls_back_to_compute(self):
+        """Test an unreachable cache degrades to computing the value."""
+        # Act
+        with patch.object(self.service.cache, "get", side_effect=ConnectionError):
+            result = self.service.get_or_compute("loans.stats", 1, {}, self.compute)
+
+        # Assert
+        self.assertEqual(result, {"total": 10})
+        self.compute.assert_called_once()
+        self.assertEqual(self.service.counters()["loans.stats"]["errors"], 1)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from modules.base.views import DashboardCacheStatsView
+
+urlpatterns = [
+    path("cache/stats/", DashboardCacheStatsView.as_view(), name="dashboard_cache_stats"),
+]
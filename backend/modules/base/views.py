@@ -1 +1,17 @@
-# Create your views here.
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from modules.base.services import VersionedCacheService
+from modules.userdata.authentication import JWTAuthentication
+
+
+class DashboardCacheStatsView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request):
+        counters = VersionedCacheService().counters()
+        return Response(counters, status=status.HTTP_200_OK)
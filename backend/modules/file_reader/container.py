@@ -7,7 +7,9 @@ from modules.file_reader.factories.bill_sub_transaction import BillSubTransactio
 from modules.file_reader.factories.file import FileFactory
 from modules.file_reader.models import File
 from modules.ai.models import AICall
-from modules.transactions.models import Transaction, SubTransaction
+from modules.base.services import VersionedCacheService
+from modules.transactions.models import LedgerRollup, Transaction, SubTransaction
+from modules.transactions.repositories.ledger_rollup import LedgerRollupRepository
 from modules.file_reader.repositories.ai_call import AICallRepository
 from modules.file_reader.repositories.file import FileRepository
 from modules.file_reader.repositories.bill import BillRepository
@@ -26,27 +28,42 @@ from modules.file_reader.use_cases.remover_pdf_password import RemovePDFPassword
 
 class FileReaderContainer(containers.DeclarativeContainer):
     # SERIALIZERS
-    ai_call_serializer = providers.Factory(AICallSerializer)
-    file_serializer = providers.Factory(FileSerializer, ai_call_serializer=ai_call_serializer)
-    bill_sub_transaction_serializer = providers.Factory(BillSubTransactionSerializer)
-    bill_serializer = providers.Factory(BillSerializer, bill_sub_transaction_serializer=bill_sub_transaction_serializer)
+    ai_call_serializer = providers.Singleton(AICallSerializer)
+    file_serializer = providers.Singleton(FileSerializer, ai_call_serializer=ai_call_serializer)
+    bill_sub_transaction_serializer = providers.Singleton(BillSubTransactionSerializer)
+    bill_serializer = providers.Singleton(BillSerializer, bill_sub_transaction_serializer=bill_sub_transaction_serializer)
 
     # FACTORIES
-    ai_call_factory = providers.Factory(AICallFactory)
-    file_factory = providers.Factory(FileFactory, ai_call_factory=ai_call_factory)
-    bill_factory = providers.Factory(BillFactory, file_factory=file_factory)
-    bill_sub_transaction_factory = providers.Factory(BillSubTransactionFactory)
+    ai_call_factory = providers.Singleton(AICallFactory)
+    file_factory = providers.Singleton(FileFactory, ai_call_factory=ai_call_factory)
+    bill_factory = providers.Singleton(BillFactory, file_factory=file_factory)
+    bill_sub_transaction_factory = providers.Singleton(BillSubTransactionFactory)
 
     # REPOSITORIES
-    ai_call_repository = providers.Factory(AICallRepository, model=AICall, ai_call_factory=ai_call_factory)
-    file_repository = providers.Factory(FileRepository, model=File, file_factory=file_factory)
-    bill_repository = providers.Factory(BillRepository, model=Transaction, bill_factory=bill_factory)
-    bill_sub_transaction_repository = providers.Factory(
+    ai_call_repository = providers.Singleton(AICallRepository, model=AICall, ai_call_factory=ai_call_factory)
+    file_repository = providers.Singleton(FileRepository, model=File, file_factory=file_factory)
+    ledger_rollup_repository = providers.Singleton(
+        LedgerRollupRepository,
+        model=LedgerRollup,
+        transaction_model=Transaction,
+        sub_transaction_model=SubTransaction,
+    )
+    bill_repository = providers.Singleton(
+        BillRepository,
+        model=Transaction,
+        bill_factory=bill_factory,
+        ledger_rollup_repository=ledger_rollup_repository,
+    )
+    bill_sub_transaction_repository = providers.Singleton(
         BillSubTransactionRepository,
         model=SubTransaction,
         bill_sub_transaction_factory=bill_sub_transaction_factory,
+        ledger_rollup_repository=ledger_rollup_repository,
     )
 
+    # SERVICES
+    versioned_cache_service = providers.Singleton(VersionedCacheService)
+
     # USE CASES
     recalculate_amount_use_case = providers.Dependency(default=None)
     transpose_file_bill_to_models_use_case = providers.Factory(
@@ -58,6 +75,7 @@ class FileReaderContainer(containers.DeclarativeContainer):
         bill_sub_transaction_factory=bill_sub_transaction_factory,
         file_repository=file_repository,
         recalculate_amount_use_case=recalculate_amount_use_case,
+        versioned_cache_service=versioned_cache_service,
     )
 
     ask_use_case = providers.Dependency(default=None)
@@ -3,12 +3,14 @@ from typing import List
 from modules.file_reader.domains.bill import BillDomain
 from modules.file_reader.factories.bill import BillFactory
 from modules.transactions.models import Transaction
+from modules.transactions.repositories.ledger_rollup import LedgerRollupRepository
 
 
 class BillRepository:
-    def __init__(self, model: Transaction, bill_factory: BillFactory):
+    def __init__(self, model: Transaction, bill_factory: BillFactory, ledger_rollup_repository: LedgerRollupRepository = None):
         self.model = model
         self.bill_factory = bill_factory
+        self.ledger_rollup_repository = ledger_rollup_repository
 
     def get(self, bill_id: str) -> BillDomain:
         bill_instance = self.model.objects.get(id=bill_id)
@@ -29,4 +31,6 @@ class BillRepository:
             main_transaction_id=bill.main_transaction_id if bill.main_transaction_id else None,
             category=bill.category,
         )
+        if self.ledger_rollup_repository:
+            self.ledger_rollup_repository.mark_dirty([(bill_instance.user_id, bill_instance.due_date)])
         return self.bill_factory.build_from_model(bill_instance)
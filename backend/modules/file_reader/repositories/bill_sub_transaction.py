@@ -1,12 +1,27 @@
 from modules.file_reader.domains.bill_sub_transaction import BillSubTransactionDomain
 from modules.file_reader.factories.bill_sub_transaction import BillSubTransactionFactory
 from modules.transactions.models import SubTransaction
+from modules.transactions.repositories.ledger_rollup import LedgerRollupRepository
+
+BULK_CREATE_BATCH_SIZE = 500
 
 
 class BillSubTransactionRepository:
-    def __init__(self, model: SubTransaction, bill_sub_transaction_factory: BillSubTransactionFactory):
+    def __init__(
+        self,
+        model: SubTransaction,
+        bill_sub_transaction_factory: BillSubTransactionFactory,
+        ledger_rollup_repository: LedgerRollupRepository = None,
+    ):
         self.model = model
         self.bill_sub_transaction_factory = bill_sub_transaction_factory
+        self.ledger_rollup_repository = ledger_rollup_repository
+
+    def _mark_dirty(self, bill_sub_transactions: list[BillSubTransactionDomain]):
+        if self.ledger_rollup_repository:
+            self.ledger_rollup_repository.mark_dirty(self.ledger_rollup_repository.buckets_for_transaction_ids(
+                {bill_sub_transaction.bill.id for bill_sub_transaction in bill_sub_transactions}
+            ))
 
     def get_many_by_bill_id(self, bill_id: str) -> list[BillSubTransactionDomain]:
         bill_sub_transaction_instances = self.model.objects.filter(transaction_id=bill_id)
@@ -15,8 +30,8 @@ class BillSubTransactionRepository:
             for bill_sub_transaction_instance in bill_sub_transaction_instances
         ]
 
-    def create(self, bill_sub_transaction: BillSubTransactionDomain) -> BillSubTransactionDomain:
-        bill_sub_transaction_instance = self.model.objects.create(
+    def _to_model(self, bill_sub_transaction: BillSubTransactionDomain) -> SubTransaction:
+        return self.model(
             date=bill_sub_transaction.date,
             description=bill_sub_transaction.description,
             amount=bill_sub_transaction.amount,
@@ -24,9 +39,36 @@ class BillSubTransactionRepository:
             transaction_id=bill_sub_transaction.bill.id,
             category=bill_sub_transaction.category,
         )
+
+    def create(self, bill_sub_transaction: BillSubTransactionDomain) -> BillSubTransactionDomain:
+        bill_sub_transaction_instance = self._to_model(bill_sub_transaction)
+        bill_sub_transaction_instance.save()
+        self._mark_dirty([bill_sub_transaction])
         return self.bill_sub_transaction_factory.build_from_model(bill_sub_transaction_instance)
     
-    def create_many(self, bill_sub_transactions: list[BillSubTransactionDomain]) -> list[BillSubTransactionDomain]:
+    def create_many(
+        self,
+        bill_sub_transactions: list[BillSubTransactionDomain],
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+        hydrate: bool = True,
+    ) -> list[BillSubTransactionDomain]:
+        bill_sub_transaction_instances = self.model.objects.bulk_create(
+            [self._to_model(bill_sub_transaction) for bill_sub_transaction in bill_sub_transactions],
+            batch_size=batch_size,
+        )
+        self._mark_dirty(bill_sub_transactions)
+
+        if not hydrate:
+            for bill_sub_transaction, instance in zip(bill_sub_transactions, bill_sub_transaction_instances, strict=True):
+                bill_sub_transaction.id = instance.id
+                bill_sub_transaction.created_at = instance.created_at
+                bill_sub_transaction.updated_at = instance.updated_at
+            return bill_sub_transactions
+
+        created_instances = self.model.objects.select_related("transaction").filter(
+            id__in=[instance.id for instance in bill_sub_transaction_instances]
+        ).order_by("id")
         return [
-            self.create(bill_sub_transaction) for bill_sub_transaction in bill_sub_transactions
+            self.bill_sub_transaction_factory.build_from_model(bill_sub_transaction_instance)
+            for bill_sub_transaction_instance in created_instances
         ]
@@ -0,0 +1,137 @@
+"""
+Benchmark-style tests for importing large bills.
+
+These tests run against the database and pin the number of round-trips needed
+to persist a synthetic 500-item credit card bill.
+"""
+from decimal import Decimal
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from modules.ai.models import AICall
+from modules.file_reader.container import FileReaderContainer
+from modules.file_reader.domains.bill_sub_transaction import BillSubTransactionDomain
+from modules.file_reader.models import File
+from modules.transactions.container import TransactionsContainer
+from modules.transactions.models import SubTransaction, Transaction
+
+User = get_user_model()
+
+ITEMS = 500
+
+
+class TestBillSubTransactionRepositoryBulkCreate(TestCase):
+    """Test BillSubTransactionRepository.create_many against a 500-item bill."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="bulk@example.com", password="testpass123")
+        self.repository = FileReaderContainer().bill_sub_transaction_repository()
+        self.transaction = Transaction.objects.create(
+            user=self.user,
+            due_date="2026-03-10",
+            total_amount=Decimal("500.00"),
+            transaction_identifier="Card",
+        )
+
+    def _build_items(self) -> list[BillSubTransactionDomain]:
+        bill = Transaction.objects.get(id=self.transaction.id)
+        return [
+            BillSubTransactionDomain(
+                date="2026-02-15",
+                description=f"Purchase {index}",
+                amount=Decimal("1.00"),
+                installment_info="1/1",
+                bill=bill,
+                category="other",
+            )
+            for index in range(ITEMS)
+        ]
+
+    def _measure(self, callback):
+        with CaptureQueriesContext(connection) as context:
+            started_at = perf_counter()
+            callback()
+            elapsed = perf_counter() - started_at
+        return len(context.captured_queries), elapsed
+
+    def test_create_many_uses_one_insert_per_batch(self):
+        """Test bulk import issues one INSERT per batch instead of one per item.
+
+        The extra query looks up the rollup month of the bill.
+        """
+        per_item = self._build_items()
+        bulk = self._build_items()
+
+        before_queries, before_time = self._measure(lambda: [self.repository.create(item) for item in per_item])
+        after_queries, after_time = self._measure(lambda: self.repository.create_many(bulk, hydrate=False))
+
+        self.assertGreaterEqual(before_queries, ITEMS, f"per-item create: {before_queries} queries in {before_time:.3f}s")
+        self.assertEqual(after_queries, 2, f"bulk create: {after_queries} queries in {after_time:.3f}s")
+        self.assertEqual(SubTransaction.objects.filter(transaction=self.transaction).count(), ITEMS * 2)
+
+    def test_create_many_respects_batch_size(self):
+        """Test the batch size controls the number of INSERT statements."""
+        items = self._build_items()
+
+        queries, _ = self._measure(lambda: self.repository.create_many(items, batch_size=100, hydrate=False))
+
+        self.assertEqual(queries, 6)
+
+    def test_create_many_without_hydration_returns_inputs_with_ids(self):
+        """Test the non-hydrating path hands back the same domains with ids filled in."""
+        items = self._build_items()
+
+        created = self.repository.create_many(items, hydrate=False)
+
+        self.assertIs(created, items)
+        self.assertTrue(all(item.id for item in created))
+        self.assertEqual(len({item.id for item in created}), ITEMS)
+
+    def test_create_many_with_hydration_rebuilds_in_one_query(self):
+        """Test hydration reloads the created rows with a single extra query."""
+        items = self._build_items()
+
+        queries, _ = self._measure(lambda: self.repository.create_many(items))
+
+        self.assertEqual(queries, 3)
+
+
+class TestTransposeLargeBill(TestCase):
+    """Test importing a synthetic 500-item bill end to end."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="import@example.com", password="testpass123")
+        ai_call = AICall.objects.create(
+            prompt=[],
+            response={
+                "bill_identifier": "Credit Card",
+                "total_amount": ITEMS,
+                "due_date": "2026-03-10",
+                "transactions": [
+                    {"date": "2026-02-15", "description": f"Purchase {index}", "amount": 1}
+                    for index in range(ITEMS)
+                ],
+            },
+            model="test",
+            total_tokens=0,
+            input_used_tokens=0,
+            output_used_tokens=0,
+        )
+        self.file = File.objects.create(user=self.user, raw_file="files/bill.pdf", ai_call=ai_call)
+        recalculate_amount_use_case = TransactionsContainer().recalculate_amount_use_case()
+        container = FileReaderContainer(recalculate_amount_use_case=recalculate_amount_use_case)
+        self.use_case = container.transpose_file_bill_to_models_use_case()
+
+    def test_import_query_count_does_not_depend_on_item_count(self):
+        """Test the import cost stays flat instead of one round-trip per item."""
+        with CaptureQueriesContext(connection) as context:
+            self.use_case.execute(self.file.id, self.user.id)
+
+        self.assertLess(len(context.captured_queries), 15)
+        self.assertEqual(SubTransaction.objects.filter(transaction__file=self.file).count(), ITEMS)
@@ -34,6 +34,7 @@ class TestTransposeFileBillToModelsUseCase(SimpleTestCase):
             bill_sub_transaction_factory=self.mock_sub_transaction_factory,
             file_repository=self.mock_file_repository,
             recalculate_amount_use_case=self.mock_recalculate_use_case,
+            versioned_cache_service=Mock(),
         )
 
     def test_execute_for_single_bill(self):
@@ -65,7 +66,7 @@ class TestTransposeFileBillToModelsUseCase(SimpleTestCase):
         self.mock_file_repository.get.assert_called_once_with(file_id)
         self.mock_bill_factory.build_from_file.assert_called_once()
         self.mock_bill_repository.create.assert_called_once_with(mock_bill, user_id)
-        self.mock_sub_transaction_repository.create_many.assert_called_once_with([])
+        self.mock_sub_transaction_repository.create_many.assert_called_once_with([], hydrate=False)
 
     def test_execute_for_bill_with_sub_transactions(self):
         """Test that execute processes bill with sub-transactions."""
@@ -101,7 +102,7 @@ class TestTransposeFileBillToModelsUseCase(SimpleTestCase):
         self.mock_sub_transaction_factory.build_many_from_file.assert_called_once_with(
             mock_file, mock_bill, response
         )
-        self.mock_sub_transaction_repository.create_many.assert_called_once_with(mock_sub_trans)
+        self.mock_sub_transaction_repository.create_many.assert_called_once_with(mock_sub_trans, hydrate=False)
 
     def test_execute_for_multiple_bills(self):
         """Test that execute processes multiple bills from a list response."""
@@ -2,6 +2,7 @@ import logging
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
+from modules.base.services import VersionedCacheService
 from modules.file_reader.domains.bill import BillDomain
 from modules.file_reader.domains.file import FileDomain
 from modules.file_reader.factories.bill import BillFactory
@@ -25,6 +26,7 @@ class TransposeFileBillToModelsUseCase:
         bill_sub_transaction_factory: BillSubTransactionFactory,
         file_repository: FileRepository,
         recalculate_amount_use_case: RecalculateAmountUseCase,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.bill_repository = bill_repository
         self.bill_factory = bill_factory
@@ -33,27 +35,30 @@ class TransposeFileBillToModelsUseCase:
         self.bill_sub_transaction_factory = bill_sub_transaction_factory
         self.file_repository = file_repository
         self.recalculate_amount_use_case = recalculate_amount_use_case
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, file_id: str, user_id: int, create_in_future_months: bool = False):
         file = self.file_repository.get(file_id)
         response = file.get_response()
 
         if isinstance(response, list):
-            return self._execute_for_many(file, response, user_id, create_in_future_months)
-        return self._execute_for_one(file, response, user_id, create_in_future_months)
+            self._execute_for_many(file, response, user_id, create_in_future_months)
+        else:
+            self._execute_for_one(file, response, user_id, create_in_future_months)
+        self.versioned_cache_service.bump(user_id)
 
     def _execute_for_one(self, file: FileDomain, response: dict, user_id: int, create_in_future_months: bool = False):
         bill = self.bill_factory.build_from_file(file, response)
         saved_bill = self.bill_repository.create(bill, user_id)
         bill_sub_transactions = self.bill_sub_transaction_factory.build_many_from_file(file, saved_bill, response)
-        self.bill_sub_transaction_repository.create_many(bill_sub_transactions)
+        self.bill_sub_transaction_repository.create_many(bill_sub_transactions, hydrate=False)
 
         future_transactions = self._get_future_transactions(response, saved_bill) if create_in_future_months else []
         for future_transaction in future_transactions:
             bill = self.bill_factory.build_from_file(file, future_transaction)
             saved_bill = self.bill_repository.create(bill, user_id)
             bill_sub_transactions = self.bill_sub_transaction_factory.build_many_from_file(file, saved_bill, ai_response=future_transaction)
-            self.bill_sub_transaction_repository.create_many(bill_sub_transactions)
+            self.bill_sub_transaction_repository.create_many(bill_sub_transactions, hydrate=False)
             self.recalculate_amount_use_case.execute(saved_bill.id, user_id)
 
     def _get_future_transactions(self, response: dict, bill: BillDomain) -> list:
@@ -112,7 +117,7 @@ class TransposeFileBillToModelsUseCase:
                 bill = self.bill_factory.build_from_file(file, r)
                 saved_bill = self.bill_repository.create(bill, user_id)
                 bill_sub_transactions = self.bill_sub_transaction_factory.build_many_from_file(file, saved_bill, r)
-                self.bill_sub_transaction_repository.create_many(bill_sub_transactions)
+                self.bill_sub_transaction_repository.create_many(bill_sub_transactions, hydrate=False)
             except Exception as e:
                 logger.warning(f"[Transpose] Skipping item due to error: {e}")
                 continue
@@ -16,16 +16,19 @@ from modules.file_reader.exceptions import InvalidPasswordException
 
 logger = logging.getLogger(__name__)
 
+ai_container = AIContainer()
+transactions_container = TransactionsContainer()
+container = FileReaderContainer(
+    ask_use_case=ai_container.ask_use_case,
+    recalculate_amount_use_case=transactions_container.recalculate_amount_use_case,
+)
+
 
 class UploadFileView(APIView):
     parser_classes = [MultiPartParser]
     authentication_classes = [JWTAuthentication]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        ask_use_case = AIContainer().ask_use_case()
-        recalculate_amount_use_case = TransactionsContainer().recalculate_amount_use_case()
-        self.container = FileReaderContainer(ask_use_case=ask_use_case, recalculate_amount_use_case=recalculate_amount_use_case)
+    container = container
 
     def post(self, request: Request) -> Response:
         file = request.FILES.get("file")
@@ -71,9 +74,7 @@ class UploadSheetView(APIView):
     parser_classes = [MultiPartParser]
     authentication_classes = [JWTAuthentication]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = FileReaderContainer()
+    container = container
 
     def post(self, request: Request) -> Response:
         file = request.FILES.get("file")
@@ -109,9 +110,7 @@ class UploadSheetView(APIView):
 class BillViewSet(ViewSetMixin, APIView):
     authentication_classes = [JWTAuthentication]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = FileReaderContainer()
+    container = container
 
     def list(self, request: Request) -> Response:
         bills = self.container.list_bills_use_case().execute()
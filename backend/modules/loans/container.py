@@ -1,5 +1,6 @@
 from dependency_injector import containers, providers
 
+from modules.base.services import VersionedCacheService
 from modules.loans.factories.loan import LoanFactory
 from modules.loans.factories.loan_payment import LoanPaymentFactory
 from modules.loans.models import Loan, LoanPayment
@@ -31,27 +32,31 @@ class LoansContainer(containers.DeclarativeContainer):
     ai_call_repository = providers.Dependency()
 
     # FACTORIES
-    loan_payment_factory = providers.Factory(LoanPaymentFactory)
-    loan_factory = providers.Factory(LoanFactory, loan_payment_factory=loan_payment_factory)
+    loan_payment_factory = providers.Singleton(LoanPaymentFactory)
+    loan_factory = providers.Singleton(LoanFactory, loan_payment_factory=loan_payment_factory)
 
     # REPOSITORIES
-    loan_repository = providers.Factory(LoanRepository, model=Loan, loan_factory=loan_factory)
-    loan_payment_repository = providers.Factory(
+    loan_repository = providers.Singleton(LoanRepository, model=Loan, loan_factory=loan_factory)
+    loan_payment_repository = providers.Singleton(
         LoanPaymentRepository, model=LoanPayment, loan_payment_factory=loan_payment_factory
     )
 
     # SERIALIZERS
-    loan_payment_serializer = providers.Factory(LoanPaymentSerializer)
-    loan_serializer = providers.Factory(
+    loan_payment_serializer = providers.Singleton(LoanPaymentSerializer)
+    loan_serializer = providers.Singleton(
         LoanSerializer, loan_payment_serializer=loan_payment_serializer
     )
 
+    # SERVICES
+    versioned_cache_service = providers.Singleton(VersionedCacheService)
+
     # USE CASES — loan
     create_loan_use_case = providers.Factory(
         CreateLoanUseCase,
         loan_repository=loan_repository,
         loan_factory=loan_factory,
         loan_serializer=loan_serializer,
+        versioned_cache_service=versioned_cache_service,
     )
     get_loan_use_case = providers.Factory(
         GetLoanUseCase, loan_repository=loan_repository, loan_serializer=loan_serializer
@@ -60,9 +65,16 @@ class LoansContainer(containers.DeclarativeContainer):
         ListLoansUseCase, loan_repository=loan_repository, loan_serializer=loan_serializer
     )
     update_loan_use_case = providers.Factory(
-        UpdateLoanUseCase, loan_repository=loan_repository, loan_serializer=loan_serializer
+        UpdateLoanUseCase,
+        loan_repository=loan_repository,
+        loan_serializer=loan_serializer,
+        versioned_cache_service=versioned_cache_service,
+    )
+    delete_loan_use_case = providers.Factory(
+        DeleteLoanUseCase,
+        loan_repository=loan_repository,
+        versioned_cache_service=versioned_cache_service,
     )
-    delete_loan_use_case = providers.Factory(DeleteLoanUseCase, loan_repository=loan_repository)
     loan_stats_use_case = providers.Factory(LoanStatsUseCase, loan_repository=loan_repository)
 
     # USE CASES — loan_payment
@@ -72,6 +84,7 @@ class LoansContainer(containers.DeclarativeContainer):
         loan_repository=loan_repository,
         loan_payment_factory=loan_payment_factory,
         loan_payment_serializer=loan_payment_serializer,
+        versioned_cache_service=versioned_cache_service,
     )
     get_loan_payment_use_case = providers.Factory(
         GetLoanPaymentUseCase,
@@ -88,11 +101,13 @@ class LoansContainer(containers.DeclarativeContainer):
         loan_payment_repository=loan_payment_repository,
         loan_repository=loan_repository,
         loan_payment_serializer=loan_payment_serializer,
+        versioned_cache_service=versioned_cache_service,
     )
     delete_loan_payment_use_case = providers.Factory(
         DeleteLoanPaymentUseCase,
         loan_payment_repository=loan_payment_repository,
         loan_repository=loan_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     # PIX parser (depends on AI bits injected from outside)
@@ -17,6 +17,7 @@ class TestCreateLoanUseCase(SimpleTestCase):
             loan_repository=self.repo,
             loan_factory=self.factory,
             loan_serializer=self.serializer,
+            versioned_cache_service=Mock(),
         )
 
     def test_executes_factory_repo_serializer_in_order(self):
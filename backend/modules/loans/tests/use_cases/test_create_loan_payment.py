@@ -22,6 +22,7 @@ class TestCreateLoanPaymentUseCase(SimpleTestCase):
             loan_repository=self.loan_repo,
             loan_payment_factory=self.payment_factory,
             loan_payment_serializer=self.payment_serializer,
+            versioned_cache_service=Mock(),
         )
 
     def _loan(self, principal="5000", payments=None, status="active"):
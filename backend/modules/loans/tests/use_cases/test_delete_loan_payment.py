@@ -18,6 +18,7 @@ class TestDeleteLoanPaymentUseCase(SimpleTestCase):
         self.use_case = DeleteLoanPaymentUseCase(
             loan_payment_repository=self.payment_repo,
             loan_repository=self.loan_repo,
+            versioned_cache_service=Mock(),
         )
 
     def test_reverts_settled_loan_to_active_when_remaining_after_delete(self, _exit, _enter):
@@ -1,3 +1,4 @@
+from modules.base.services import VersionedCacheService
 from modules.loans.factories.loan import LoanFactory
 from modules.loans.repositories.loan import LoanRepository
 from modules.loans.serializers.loan import LoanSerializer
@@ -9,12 +10,15 @@ class CreateLoanUseCase:
         loan_repository: LoanRepository,
         loan_factory: LoanFactory,
         loan_serializer: LoanSerializer,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.loan_repository = loan_repository
         self.loan_factory = loan_factory
         self.loan_serializer = loan_serializer
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, data: dict, user_id: int) -> dict:
         loan = self.loan_factory.build(data, user_id)
         saved = self.loan_repository.create(loan)
+        self.versioned_cache_service.bump(user_id)
         return self.loan_serializer.serialize(saved, include_payments=False)
@@ -1,9 +1,16 @@
+from modules.base.services import VersionedCacheService
 from modules.loans.repositories.loan import LoanRepository
 
 
 class DeleteLoanUseCase:
-    def __init__(self, loan_repository: LoanRepository):
+    def __init__(
+        self,
+        loan_repository: LoanRepository,
+        versioned_cache_service: VersionedCacheService,
+    ):
         self.loan_repository = loan_repository
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, loan_id: str, user_id: int) -> None:
         self.loan_repository.delete(loan_id, user_id)
+        self.versioned_cache_service.bump(user_id)
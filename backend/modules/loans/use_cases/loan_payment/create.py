@@ -1,5 +1,6 @@
 from django.db import transaction
 
+from modules.base.services import VersionedCacheService
 from modules.loans.factories.loan_payment import LoanPaymentFactory
 from modules.loans.repositories.loan import LoanRepository
 from modules.loans.repositories.loan_payment import LoanPaymentRepository
@@ -13,11 +14,13 @@ class CreateLoanPaymentUseCase:
         loan_repository: LoanRepository,
         loan_payment_factory: LoanPaymentFactory,
         loan_payment_serializer: LoanPaymentSerializer,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.loan_payment_repository = loan_payment_repository
         self.loan_repository = loan_repository
         self.loan_payment_factory = loan_payment_factory
         self.loan_payment_serializer = loan_payment_serializer
+        self.versioned_cache_service = versioned_cache_service
 
     @transaction.atomic
     def execute(self, data: dict, user_id: int) -> dict:
@@ -34,4 +37,5 @@ class CreateLoanPaymentUseCase:
         if loan.status != previous_status:
             self.loan_repository.update(loan)
 
+        self.versioned_cache_service.bump(user_id)
         return self.loan_payment_serializer.serialize(saved_payment)
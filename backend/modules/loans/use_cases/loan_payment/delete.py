@@ -1,5 +1,6 @@
 from django.db import transaction
 
+from modules.base.services import VersionedCacheService
 from modules.loans.repositories.loan import LoanRepository
 from modules.loans.repositories.loan_payment import LoanPaymentRepository
 
@@ -9,9 +10,11 @@ class DeleteLoanPaymentUseCase:
         self,
         loan_payment_repository: LoanPaymentRepository,
         loan_repository: LoanRepository,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.loan_payment_repository = loan_payment_repository
         self.loan_repository = loan_repository
+        self.versioned_cache_service = versioned_cache_service
 
     @transaction.atomic
     def execute(self, payment_id: str, user_id: int) -> None:
@@ -23,3 +26,5 @@ class DeleteLoanPaymentUseCase:
         loan.recompute_status()
         if loan.status != previous_status:
             self.loan_repository.update(loan)
+
+        self.versioned_cache_service.bump(user_id)
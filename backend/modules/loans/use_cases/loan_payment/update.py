@@ -1,5 +1,6 @@
 from django.db import transaction
 
+from modules.base.services import VersionedCacheService
 from modules.loans.repositories.loan import LoanRepository
 from modules.loans.repositories.loan_payment import LoanPaymentRepository
 from modules.loans.serializers.loan_payment import LoanPaymentSerializer
@@ -11,10 +12,12 @@ class UpdateLoanPaymentUseCase:
         loan_payment_repository: LoanPaymentRepository,
         loan_repository: LoanRepository,
         loan_payment_serializer: LoanPaymentSerializer,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.loan_payment_repository = loan_payment_repository
         self.loan_repository = loan_repository
         self.loan_payment_serializer = loan_payment_serializer
+        self.versioned_cache_service = versioned_cache_service
 
     @transaction.atomic
     def execute(self, payment_id: str, data: dict, user_id: int) -> dict:
@@ -28,4 +31,5 @@ class UpdateLoanPaymentUseCase:
         if loan.status != previous_status:
             self.loan_repository.update(loan)
 
+        self.versioned_cache_service.bump(user_id)
         return self.loan_payment_serializer.serialize(updated)
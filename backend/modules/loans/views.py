@@ -7,10 +7,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from modules.ai.container import AIContainer
+from modules.base.conditional import conditional_get
 from modules.ai.types import LlmModels
 from modules.file_reader.container import FileReaderContainer
 from modules.file_reader.exceptions import InvalidPasswordException
 from modules.loans.container import LoansContainer
+from modules.loans.models import Loan, LoanPayment
 from modules.loans.use_cases.loan_payment.upload_pix_receipt import (
     PixReceiptParseError,
     UploadPixReceiptUseCase,
@@ -19,19 +21,24 @@ from modules.userdata.authentication import JWTAuthentication
 
 logger = logging.getLogger(__name__)
 
+# Tables behind the loan listings, for conditional GET validators
+LOAN_SOURCES = [(Loan, "user_id"), (LoanPayment, "loan__user_id")]
+
+ai_container = AIContainer()
+container = LoansContainer(
+    ask_use_case=ai_container.ask_use_case,
+    ai_call_repository=ai_container.ai_call_repository,
+)
+file_reader_container = FileReaderContainer()
+
 
 class LoanViewSet(viewsets.ViewSet):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        ai = AIContainer()
-        self.container = LoansContainer(
-            ask_use_case=ai.ask_use_case(),
-            ai_call_repository=ai.ai_call_repository(),
-        )
+    container = container
 
+    @conditional_get(*LOAN_SOURCES)
     def list(self, request):
         filters = {}
         if request.query_params.get("actor_id"):
@@ -58,8 +65,14 @@ class LoanViewSet(viewsets.ViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @decorators.action(detail=False, methods=["GET"])
+    @conditional_get(*LOAN_SOURCES)
     def stats(self, request):
-        data = self.container.loan_stats_use_case().execute(request.user.id)
+        data = self.container.versioned_cache_service().get_or_compute(
+            "loans.stats",
+            request.user.id,
+            {},
+            lambda: self.container.loan_stats_use_case().execute(request.user.id),
+        )
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -68,15 +81,10 @@ class LoanPaymentViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        ai = AIContainer()
-        self.container = LoansContainer(
-            ask_use_case=ai.ask_use_case(),
-            ai_call_repository=ai.ai_call_repository(),
-        )
-        self.file_reader = FileReaderContainer()
+    container = container
+    file_reader = file_reader_container
 
+    @conditional_get(*LOAN_SOURCES)
     def list(self, request):
         payments = self.container.list_loan_payments_use_case().execute(
             user_id=request.user.id,
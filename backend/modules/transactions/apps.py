@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class TransactionsConfig(AppConfig):
     name = "modules.transactions"
+
+    def ready(self):
+        from modules.transactions import signals  # noqa: F401
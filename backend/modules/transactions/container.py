@@ -1,12 +1,13 @@
 from dependency_injector import containers, providers
 
+from modules.base.services import VersionedCacheService
 from modules.loans.repositories import LoanRepository
 from modules.loans.factories import LoanFactory, LoanPaymentFactory
 from modules.loans.models import Loan as LoanModel
 from modules.transactions.factories import ActorFactory, TransactionFactory, SubTransactionFactory
 from modules.transactions.factories.actor import ActorFactory
-from modules.transactions.models import Actor, Transaction, SubTransaction
-from modules.transactions.repositories import ActorRepository, TransactionRepository, SubTransactionRepository
+from modules.transactions.models import Actor, LedgerRollup, Transaction, SubTransaction
+from modules.transactions.repositories import ActorRepository, LedgerRollupRepository, TransactionRepository, SubTransactionRepository
 from modules.transactions.serializers import ActorSerializer, TransactionSerializer, SubTransactionSerializer
 from modules.transactions.factories import ActorFactory, TransactionFactory, SubTransactionFactory
 from modules.transactions.services.share_token import ShareTokenService
@@ -35,6 +36,7 @@ from modules.transactions.use_cases import (
     ListSubTransactionsUseCase,
     UpdateSubTransactionUseCase,
     PaySubTransactionUseCase,
+    PayManySubTransactionsUseCase,
     GetActorsToolUseCase,
     GetActorDetailToolUseCase,
     GetActorStatsToolUseCase,
@@ -46,35 +48,51 @@ from modules.transactions.use_cases import (
 
 class TransactionsContainer(containers.DeclarativeContainer):
     # DEPENDENCIES
-    user_id = providers.Dependency()
     ask_use_case = providers.Dependency()
     ai_call_repository = providers.Dependency()
 
     # SERIALIZERS
-    actor_serializer = providers.Factory(ActorSerializer)
-    sub_transaction_serializer = providers.Factory(
+    actor_serializer = providers.Singleton(ActorSerializer)
+    sub_transaction_serializer = providers.Singleton(
         SubTransactionSerializer, actor_serializer=actor_serializer,
     )
-    transaction_serializer = providers.Factory(
+    transaction_serializer = providers.Singleton(
         TransactionSerializer, sub_transaction_serializer=sub_transaction_serializer,
     )
 
     # FACTORIES
-    actor_factory = providers.Factory(ActorFactory)
-    transaction_factory = providers.Factory(TransactionFactory)
-    sub_transaction_factory = providers.Factory(
+    actor_factory = providers.Singleton(ActorFactory)
+    transaction_factory = providers.Singleton(TransactionFactory)
+    sub_transaction_factory = providers.Singleton(
         SubTransactionFactory,
         actor_factory=actor_factory,
         transaction_factory=transaction_factory,
     )
 
     # REPOSITORIES
-    actor_repository = providers.Factory(ActorRepository, model=Actor, actor_factory=actor_factory)
-    transaction_repository = providers.Factory(TransactionRepository, model=Transaction, transaction_factory=transaction_factory)
-    sub_transaction_repository = providers.Factory(SubTransactionRepository, model=SubTransaction, sub_transaction_factory=sub_transaction_factory)
+    actor_repository = providers.Singleton(ActorRepository, model=Actor, actor_factory=actor_factory)
+    ledger_rollup_repository = providers.Singleton(
+        LedgerRollupRepository,
+        model=LedgerRollup,
+        transaction_model=Transaction,
+        sub_transaction_model=SubTransaction,
+    )
+    transaction_repository = providers.Singleton(
+        TransactionRepository,
+        model=Transaction,
+        transaction_factory=transaction_factory,
+        ledger_rollup_repository=ledger_rollup_repository,
+    )
+    sub_transaction_repository = providers.Singleton(
+        SubTransactionRepository,
+        model=SubTransaction,
+        sub_transaction_factory=sub_transaction_factory,
+        ledger_rollup_repository=ledger_rollup_repository,
+    )
 
     # SERVICES
-    share_token_service = providers.Factory(ShareTokenService)
+    share_token_service = providers.Singleton(ShareTokenService)
+    versioned_cache_service = providers.Singleton(VersionedCacheService)
 
     # USE CASES
     list_actors_use_case = providers.Factory(
@@ -98,25 +116,28 @@ class TransactionsContainer(containers.DeclarativeContainer):
         actor_repository=actor_repository,
         actor_serializer=actor_serializer,
         actor_factory=actor_factory,
+        versioned_cache_service=versioned_cache_service,
     )
 
     update_actor_use_case = providers.Factory(
         UpdateActorUseCase,
         actor_repository=actor_repository,
         actor_serializer=actor_serializer,
+        versioned_cache_service=versioned_cache_service,
     )
 
-    loan_payment_factory_for_actor_delete = providers.Factory(LoanPaymentFactory)
-    loan_factory_for_actor_delete = providers.Factory(
+    loan_payment_factory_for_actor_delete = providers.Singleton(LoanPaymentFactory)
+    loan_factory_for_actor_delete = providers.Singleton(
         LoanFactory, loan_payment_factory=loan_payment_factory_for_actor_delete
     )
-    loan_repository_for_actor_delete = providers.Factory(
+    loan_repository_for_actor_delete = providers.Singleton(
         LoanRepository, model=LoanModel, loan_factory=loan_factory_for_actor_delete
     )
     delete_actor_use_case = providers.Factory(
         DeleteActorUseCase,
         actor_repository=actor_repository,
         loan_repository=loan_repository_for_actor_delete,
+        versioned_cache_service=versioned_cache_service,
     )
 
     actor_stats_use_case = providers.Factory(
@@ -160,6 +181,7 @@ class TransactionsContainer(containers.DeclarativeContainer):
         transaction_factory=transaction_factory,
         sub_transaction_factory=sub_transaction_factory,
         sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     update_transaction_use_case = providers.Factory(
@@ -167,30 +189,35 @@ class TransactionsContainer(containers.DeclarativeContainer):
         transaction_repository=transaction_repository,
         transaction_serializer=transaction_serializer,
         sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     delete_transaction_use_case = providers.Factory(
         DeleteTransactionUseCase,
         transaction_repository=transaction_repository,
         sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     transaction_stats_use_case = providers.Factory(
         TransactionStatsUseCase,
         transaction_repository=transaction_repository,
         sub_transaction_repository=sub_transaction_repository,
+        ledger_rollup_repository=ledger_rollup_repository,
     )
 
     pay_transaction_use_case = providers.Factory(
         PayTransactionUseCase,
         transaction_repository=transaction_repository,
         sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     recalculate_amount_use_case = providers.Factory(
         RecalculateAmountUseCase,
         transaction_repository=transaction_repository,
         sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     guess_sub_transactions_category_use_case = providers.Factory(
@@ -199,6 +226,7 @@ class TransactionsContainer(containers.DeclarativeContainer):
         sub_transaction_serializer=sub_transaction_serializer,
         ai_call_repository=ai_call_repository,
         ask_use_case=ask_use_case,
+        versioned_cache_service=versioned_cache_service,
     )
 
     create_sub_transaction_use_case = providers.Factory(
@@ -208,6 +236,7 @@ class TransactionsContainer(containers.DeclarativeContainer):
         sub_transaction_repository=sub_transaction_repository,
         sub_transaction_serializer=sub_transaction_serializer,
         sub_transaction_factory=sub_transaction_factory,
+        versioned_cache_service=versioned_cache_service,
     )
 
     get_sub_transaction_use_case = providers.Factory(
@@ -227,16 +256,25 @@ class TransactionsContainer(containers.DeclarativeContainer):
         sub_transaction_repository=sub_transaction_repository,
         sub_transaction_serializer=sub_transaction_serializer,
         actor_repository=actor_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     delete_sub_transaction_use_case = providers.Factory(
         DeleteSubTransactionUseCase,
         sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     pay_sub_transaction_use_case = providers.Factory(
         PaySubTransactionUseCase,
         sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
+    )
+
+    pay_many_sub_transactions_use_case = providers.Factory(
+        PayManySubTransactionsUseCase,
+        sub_transaction_repository=sub_transaction_repository,
+        versioned_cache_service=versioned_cache_service,
     )
 
     get_actors_tool_use_case = providers.Factory(
@@ -244,7 +282,6 @@ class TransactionsContainer(containers.DeclarativeContainer):
         actor_repository=actor_repository,
         actor_serializer=actor_serializer,
         sub_transaction_repository=sub_transaction_repository,
-        user_id=user_id,
     )
 
     get_actor_detail_tool_use_case = providers.Factory(
@@ -253,13 +290,11 @@ class TransactionsContainer(containers.DeclarativeContainer):
         actor_serializer=actor_serializer,
         sub_transaction_repository=sub_transaction_repository,
         sub_transaction_serializer=sub_transaction_serializer,
-        user_id=user_id,
     )
 
     get_actor_stats_tool_use_case = providers.Factory(
         GetActorStatsToolUseCase,
         actor_stats_use_case=actor_stats_use_case,
-        user_id=user_id,
     )
 
     get_sub_transactions_from_transaction_tool_use_case = providers.Factory(
@@ -268,13 +303,11 @@ class TransactionsContainer(containers.DeclarativeContainer):
         sub_transaction_factory=sub_transaction_factory,
         sub_transaction_repository=sub_transaction_repository,
         transaction_repository=transaction_repository,
-        user_id=user_id,
     )
 
     get_user_general_stats_tool_use_case = providers.Factory(
         GetUserGeneralStatsToolUseCase,
         transaction_stats_use_case=transaction_stats_use_case,
-        user_id=user_id,
     )
 
     get_transactions_tool_use_case = providers.Factory(
@@ -282,15 +315,16 @@ class TransactionsContainer(containers.DeclarativeContainer):
         transaction_repository=transaction_repository,
         transaction_serializer=transaction_serializer,
         transaction_factory=transaction_factory,
-        user_id=user_id,
     )
 
+    # Tools are bound to the requesting user when GetToolsForAIUseCase runs, so it
+    # receives the providers rather than instances.
     get_tools_for_ai_use_case = providers.Factory(
         GetToolsForAIUseCase,
-        get_actors_tool_use_case=get_actors_tool_use_case,
-        get_actor_detail_tool_use_case=get_actor_detail_tool_use_case,
-        get_actor_stats_tool_use_case=get_actor_stats_tool_use_case,
-        get_sub_transactions_from_transaction_tool_use_case=get_sub_transactions_from_transaction_tool_use_case,
-        get_user_general_stats_tool_use_case=get_user_general_stats_tool_use_case,
-        get_transactions_tool_use_case=get_transactions_tool_use_case,
+        get_actors_tool_use_case=get_actors_tool_use_case.provider,
+        get_actor_detail_tool_use_case=get_actor_detail_tool_use_case.provider,
+        get_actor_stats_tool_use_case=get_actor_stats_tool_use_case.provider,
+        get_sub_transactions_from_transaction_tool_use_case=get_sub_transactions_from_transaction_tool_use_case.provider,
+        get_user_general_stats_tool_use_case=get_user_general_stats_tool_use_case.provider,
+        get_transactions_tool_use_case=get_transactions_tool_use_case.provider,
     )
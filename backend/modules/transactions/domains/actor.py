@@ -13,6 +13,9 @@ class ActorDomain:
         updated_at: str = None,
         user_id: int = None,
         sub_transactions: list["SubTransactionDomain"] = [],
+        total_spent_amount: float = None,
+        total_spent_paid_amount: float = None,
+        sub_transactions_count: int = None,
     ):
         self.name = name
         self.id = id
@@ -20,6 +23,9 @@ class ActorDomain:
         self.updated_at = updated_at
         self.user_id = user_id
         self.sub_transactions = sub_transactions
+        self.total_spent_amount = total_spent_amount
+        self.total_spent_paid_amount = total_spent_paid_amount
+        self.sub_transactions_count = sub_transactions_count
 
     def update(self, name: str):
         self.name = name
@@ -27,10 +33,22 @@ class ActorDomain:
     def set_sub_transactions(self, sub_transactions: list["SubTransactionDomain"]):
         self.sub_transactions = sub_transactions
 
+    def has_totals(self) -> bool:
+        return self.sub_transactions_count is not None
+
+    def has_sub_transactions(self) -> bool:
+        if self.has_totals():
+            return self.sub_transactions_count > 0
+        return bool(self.sub_transactions)
+
     def get_total_spent(self) -> float:
+        if self.has_totals():
+            return self.total_spent_amount if self.total_spent_amount is not None else 0
         return sum(sub_transaction.amount for sub_transaction in self.sub_transactions) if self.sub_transactions else 0
 
     def get_total_spent_paid(self) -> float:
+        if self.has_totals():
+            return self.total_spent_paid_amount if self.total_spent_paid_amount is not None else 0
         return sum(sub_transaction.amount for sub_transaction in self.sub_transactions if sub_transaction.paid_at) if self.sub_transactions else 0
 
     @property
@@ -22,6 +22,7 @@ class TransactionDomain:
         is_recurrent: bool = False,
         installment_number: int = None,
         main_transaction: "TransactionDomain" = None,
+        main_transaction_id: int = None,
         recurrence_count: int = None,
         amount_from_actor: float = None,
         file_id: int = None,
@@ -42,6 +43,7 @@ class TransactionDomain:
         self.is_recurrent = is_recurrent
         self.installment_number = installment_number
         self.main_transaction = main_transaction
+        self.main_transaction_id = main_transaction_id or getattr(main_transaction, "id", main_transaction)
         self.recurrence_count = recurrence_count
         self.amount_from_actor = amount_from_actor
         self.file_id = file_id
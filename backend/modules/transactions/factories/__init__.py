@@ -1,8 +1,10 @@
+from modules.transactions.factories.identity_map import IdentityMap
 from modules.transactions.factories.actor import ActorFactory
 from modules.transactions.factories.transaction import TransactionFactory
 from modules.transactions.factories.sub_transaction import SubTransactionFactory
 
 __all__ = [
+    "IdentityMap",
     "ActorFactory",
     "TransactionFactory",
     "SubTransactionFactory",
@@ -10,6 +10,9 @@ class ActorFactory:
             created_at=model.created_at,
             updated_at=model.updated_at,
             user_id=model.user_id,
+            total_spent_amount=getattr(model, "total_spent_amount", None),
+            total_spent_paid_amount=getattr(model, "total_spent_paid_amount", None),
+            sub_transactions_count=getattr(model, "sub_transactions_count", None),
         )
 
     def build(self, name: str, user_id: int) -> ActorDomain:
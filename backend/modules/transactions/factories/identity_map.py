@@ -0,0 +1,17 @@
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """Keeps one domain object per (type, id) while a result set is being hydrated."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get_or_build(self, domain_type: type[T], id: Hashable, build: Callable[[], T]) -> T:
+        key = (domain_type, id)
+        if key not in self.entries:
+            self.entries[key] = build()
+        return self.entries[key]
@@ -1,5 +1,5 @@
 from modules.transactions.domains import SubTransactionDomain, ActorDomain, TransactionDomain
-from modules.transactions.factories import ActorFactory, TransactionFactory
+from modules.transactions.factories import ActorFactory, IdentityMap, TransactionFactory
 from modules.transactions.models import SubTransaction
 from modules.transactions.types import TransactionCategory
 
@@ -13,8 +13,14 @@ class SubTransactionFactory:
         self.transaction_factory = transaction_factory
         self.actor_factory = actor_factory
 
-    def build_from_model(self, model: SubTransaction) -> SubTransactionDomain:
-        actor = self.actor_factory.build_from_model(model.actor) if model.actor else None
+    def build_from_model(self, model: SubTransaction, identity_map: IdentityMap = None) -> SubTransactionDomain:
+        identity_map = identity_map or IdentityMap()
+        actor = identity_map.get_or_build(
+            ActorDomain, model.actor_id, lambda: self.actor_factory.build_from_model(model.actor),
+        ) if model.actor_id else None
+        transaction = identity_map.get_or_build(
+            TransactionDomain, model.transaction_id, lambda: self.transaction_factory.build_from_model(model.transaction),
+        )
         return SubTransactionDomain(
             date=model.date,
             description=model.description,
@@ -23,7 +29,7 @@ class SubTransactionFactory:
             id=model.id,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            transaction=self.transaction_factory.build_from_model(model.transaction),
+            transaction=transaction,
             actor=actor,
             user_provided_description=model.user_provided_description,
             paid_at=model.paid_at,
@@ -14,13 +14,13 @@ class TransactionFactory:
             updated_at=model.updated_at,
             transaction_type=model.transaction_type,
             is_salary=model.is_salary,
-            user_id=model.user.id,
+            user_id=model.user_id,
             is_recurrent=model.is_recurrent,
             installment_number=model.installment_number,
-            main_transaction=model.main_transaction,
+            main_transaction_id=model.main_transaction_id,
             recurrence_count=model.recurrence_count,
-            amount_from_actor=model.get_total_from_actors(),
-            file_id=model.file.id if model.file else None,
+            amount_from_actor=getattr(model, "amount_from_actor", None),
+            file_id=model.file_id,
             paid_at=model.paid_at,
             subtransactions_paid=getattr(model, "subtransactions_paid", None),
             category=model.category,
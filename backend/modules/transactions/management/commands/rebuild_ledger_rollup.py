@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from modules.transactions.container import TransactionsContainer
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly ledger rollup from raw transactions and verify it matches them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids", help="Only rebuild this user id (repeatable)")
+        parser.add_argument("--verify-only", action="store_true", help="Compare the rollup with raw rows without rewriting it")
+
+    def handle(self, *args, **options):
+        ledger_rollup_repository = TransactionsContainer().ledger_rollup_repository()
+        user_ids = options["user_ids"]
+
+        if not options["verify_only"]:
+            created = ledger_rollup_repository.rebuild(user_ids)
+            self.stdout.write(f"Rebuilt {created} ledger rollup rows")
+
+        mismatches = ledger_rollup_repository.verify(user_ids)
+        for mismatch in mismatches:
+            self.stderr.write(str(mismatch))
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} ledger rollup buckets do not match raw transactions")
+
+        self.stdout.write(self.style.SUCCESS("Ledger rollup matches raw transactions"))
@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-17 10:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("file_reader", "0005_alter_file_ai_call"),
+        ("transactions", "0014_subtransaction_category_transaction_category"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="subtransaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["actor", "transaction"],
+                name="subtx_actor_transaction_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["user", "due_date"],
+                name="transaction_user_due_date_idx",
+            ),
+        ),
+    ]
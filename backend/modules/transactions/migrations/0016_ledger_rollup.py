@@ -0,0 +1,147 @@
+# Generated by Django 6.0 on 2026-10-17 11:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncMonth
+
+
+def backfill_ledger_rollup(apps, schema_editor):
+    # Mirrors LedgerRollupRepository._aggregate against the historical models, so
+    # later changes to the repository cannot alter what this migration writes.
+    LedgerRollup = apps.get_model("transactions", "LedgerRollup")
+    Transaction = apps.get_model("transactions", "Transaction")
+    SubTransaction = apps.get_model("transactions", "SubTransaction")
+    is_paid = models.ExpressionWrapper(models.Q(paid_at__isnull=False), output_field=models.BooleanField())
+
+    transaction_rows = (
+        Transaction.objects
+            .filter(deleted_at__isnull=True)
+            .order_by()
+            .annotate(rollup_month=TruncMonth("due_date"), rollup_is_paid=is_paid)
+            .values("user_id", "rollup_month", "transaction_type", "category", "rollup_is_paid")
+            .annotate(rollup_total=models.Sum("total_amount"), rollup_count=models.Count("id"))
+    )
+    sub_transaction_rows = (
+        SubTransaction.objects
+            .filter(deleted_at__isnull=True, transaction__deleted_at__isnull=True)
+            .order_by()
+            .annotate(
+                rollup_user_id=models.F("transaction__user_id"),
+                rollup_month=TruncMonth("transaction__due_date"),
+                rollup_transaction_type=models.F("transaction__transaction_type"),
+                rollup_is_paid=is_paid,
+            )
+            .values("rollup_user_id", "rollup_month", "rollup_transaction_type", "category", "actor_id", "rollup_is_paid")
+            .annotate(rollup_total=models.Sum("amount"), rollup_count=models.Count("id"))
+    )
+
+    LedgerRollup.objects.bulk_create(
+        [
+            LedgerRollup(
+                user_id=row["user_id"],
+                month=row["rollup_month"],
+                source="transaction",
+                transaction_type=row["transaction_type"],
+                category=row["category"],
+                actor_id=None,
+                is_paid=row["rollup_is_paid"],
+                total_amount=row["rollup_total"],
+                count=row["rollup_count"],
+            )
+            for row in transaction_rows
+        ] + [
+            LedgerRollup(
+                user_id=row["rollup_user_id"],
+                month=row["rollup_month"],
+                source="sub_transaction",
+                transaction_type=row["rollup_transaction_type"],
+                category=row["category"],
+                actor_id=row["actor_id"],
+                is_paid=row["rollup_is_paid"],
+                total_amount=row["rollup_total"],
+                count=row["rollup_count"],
+            )
+            for row in sub_transaction_rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0015_partial_month_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LedgerRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("month", models.DateField()),
+                (
+                    "source",
+                    models.CharField(
+                        choices=[
+                            ("transaction", "Transaction"),
+                            ("sub_transaction", "Sub-transaction"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[("incoming", "Incoming"), ("outgoing", "Outgoing")], max_length=255
+                    ),
+                ),
+                ("category", models.CharField(max_length=255)),
+                ("is_paid", models.BooleanField(default=False)),
+                ("total_amount", models.DecimalField(decimal_places=2, max_digits=14)),
+                ("count", models.IntegerField()),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ledger_rollups",
+                        to="transactions.actor",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "user",
+                            "month",
+                            "source",
+                            "transaction_type",
+                            "category",
+                            "actor",
+                            "is_paid",
+                        ),
+                        name="ledger_rollup_bucket_unique",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_ledger_rollup, migrations.RunPython.noop),
+    ]
@@ -31,6 +31,11 @@ class Transaction(TimedModel, UserOwnedModel, SoftDeleteModel):
         indexes = [
             models.Index(fields=["due_date"]),
             models.Index(fields=["transaction_identifier"]),
+            models.Index(
+                fields=["user", "due_date"],
+                name="transaction_user_due_date_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
@@ -54,9 +59,46 @@ class SubTransaction(TimedModel, SoftDeleteModel):
     paid_at = models.DateField(null=True, blank=True)
     category = models.CharField(choices=TransactionCategory.get_all_as_options(), default=TransactionCategory.OTHER.name)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["actor", "transaction"],
+                name="subtx_actor_transaction_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.date} - {self.description} - {self.amount}"
     
     def __repr__(self):
         return f"<SubTransaction {self.id} - {self.date} - {self.description} - {self.amount}>"
-    
\ No newline at end of file
+
+
+class LedgerRollup(TimedModel, UserOwnedModel):
+    """Monthly sums of transactions and sub-transactions, maintained by LedgerRollupRepository."""
+
+    class Source(models.TextChoices):
+        TRANSACTION = "transaction", "Transaction"
+        SUB_TRANSACTION = "sub_transaction", "Sub-transaction"
+
+    month = models.DateField()
+    source = models.CharField(max_length=32, choices=Source.choices)
+    transaction_type = models.CharField(max_length=255, choices=Transaction.TransactionType.choices)
+    category = models.CharField(max_length=255)
+    actor = models.ForeignKey(Actor, on_delete=models.CASCADE, null=True, blank=True, related_name="ledger_rollups")
+    is_paid = models.BooleanField(default=False)
+    total_amount = models.DecimalField(max_digits=14, decimal_places=2)
+    count = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "month", "source", "transaction_type", "category", "actor", "is_paid"],
+                name="ledger_rollup_bucket_unique",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __repr__(self):
+        return f"<LedgerRollup {self.user_id} - {self.month} - {self.source} - {self.total_amount}>"
@@ -1,9 +1,11 @@
 from modules.transactions.repositories.actor import ActorRepository
+from modules.transactions.repositories.ledger_rollup import LedgerRollupRepository
 from modules.transactions.repositories.transaction import TransactionRepository
 from modules.transactions.repositories.sub_transaction import SubTransactionRepository
 
 __all__ = [
     "ActorRepository",
+    "LedgerRollupRepository",
     "TransactionRepository",
     "SubTransactionRepository",
 ]
@@ -1,8 +1,16 @@
+from datetime import date
+
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from modules.base.pagination import KeysetPaginator, Page, PageRequest
 from modules.transactions.domains.actor import ActorDomain
 from modules.transactions.factories.actor import ActorFactory
-from modules.transactions.models import Actor
+from modules.transactions.models import Actor, LedgerRollup
+
+# Same order as the full listing; ``id`` breaks ties between actors with the same name.
+PAGINATOR = KeysetPaginator(["name", "id"])
 
 
 class ActorRepository:
@@ -31,6 +39,53 @@ class ActorRepository:
         actor_instances = self.queryset.filter(user_id=user_id, **filters)
         return [self.actor_factory.build_from_model(actor) for actor in actor_instances]
 
+    def get_page(self, user_id: int, page_request: PageRequest) -> Page:
+        page = PAGINATOR.paginate(self.queryset.filter(user_id=user_id), page_request)
+        return page.with_items([self.actor_factory.build_from_model(actor) for actor in page.items])
+
+    def _with_totals(self, user_id: int, sub_transaction_filters: dict | None):
+        sub_transactions = Q(subtransaction__deleted_at__isnull=True, **{
+            f"subtransaction__{lookup}": value for lookup, value in (sub_transaction_filters or {}).items()
+        })
+        return self.queryset.filter(user_id=user_id).annotate(
+            total_spent_amount=Sum("subtransaction__amount", filter=sub_transactions),
+            total_spent_paid_amount=Sum(
+                "subtransaction__amount",
+                filter=sub_transactions & Q(subtransaction__paid_at__isnull=False),
+            ),
+            sub_transactions_count=Count("subtransaction", filter=sub_transactions),
+        )
+
+    def get_all_with_totals(self, user_id: int, sub_transaction_filters: dict | None = None) -> list[ActorDomain]:
+        """Actors of the user with their sub-transaction totals aggregated in one GROUP BY.
+
+        ``sub_transaction_filters`` are SubTransaction lookups (e.g. ``transaction__due_date__gte``).
+        """
+        actor_instances = self._with_totals(user_id, sub_transaction_filters)
+        return [self.actor_factory.build_from_model(actor) for actor in actor_instances]
+
+    def get_page_with_totals(self, user_id: int, page_request: PageRequest, sub_transaction_filters: dict | None = None) -> Page:
+        page = PAGINATOR.paginate(self._with_totals(user_id, sub_transaction_filters), page_request)
+        return page.with_items([self.actor_factory.build_from_model(actor) for actor in page.items])
+
+    def get_all_with_rollup_totals(self, user_id: int, month_start: date = None, month_end: date = None) -> list[ActorDomain]:
+        """Same as ``get_all_with_totals`` for whole months, read from the monthly ledger rollup."""
+        rollups = Q(ledger_rollups__source=LedgerRollup.Source.SUB_TRANSACTION)
+        if month_start:
+            rollups &= Q(ledger_rollups__month__gte=month_start)
+        if month_end:
+            rollups &= Q(ledger_rollups__month__lt=month_end)
+
+        actor_instances = self.queryset.filter(user_id=user_id).annotate(
+            total_spent_amount=Sum("ledger_rollups__total_amount", filter=rollups),
+            total_spent_paid_amount=Sum(
+                "ledger_rollups__total_amount",
+                filter=rollups & Q(ledger_rollups__is_paid=True),
+            ),
+            sub_transactions_count=Coalesce(Sum("ledger_rollups__count", filter=rollups), 0),
+        )
+        return [self.actor_factory.build_from_model(actor) for actor in actor_instances]
+
     def create(self, actor: ActorDomain) -> ActorDomain:
         actor_instance = self.model.objects.create(
             name=actor.name,
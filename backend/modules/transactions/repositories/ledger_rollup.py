@@ -0,0 +1,241 @@
+import threading
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+
+from dateutil.relativedelta import relativedelta
+from django.db import connection
+from django.db.models import BooleanField, Count, DecimalField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import Coalesce, TruncMonth
+from django.db.transaction import atomic, on_commit
+
+from modules.base.dates import first_day_of_month
+from modules.transactions.models import LedgerRollup, SubTransaction, Transaction
+
+BULK_CREATE_BATCH_SIZE = 500
+# First key of pg_advisory_xact_lock(int, int); the second one is the user id.
+ROLLUP_LOCK_NAMESPACE = 7301
+BUCKET_FIELDS = ["user_id", "month", "source", "transaction_type", "category", "actor_id", "is_paid"]
+
+# Buckets written by the current thread that still have to be refreshed once the
+# surrounding database transaction commits.
+_pending = threading.local()
+
+
+class LedgerRollupRepository:
+    """Keeps LedgerRollup in sync with transactions and sub-transactions.
+
+    A bucket is a ``(user_id, month)`` pair. Writers mark the buckets they touch and
+    every marked bucket is recomputed from raw rows after commit, so the rollup never
+    drifts from the data it summarizes.
+    """
+
+    def __init__(self, model: LedgerRollup, transaction_model: Transaction, sub_transaction_model: SubTransaction):
+        self.model = model
+        self.transaction_model = transaction_model
+        self.sub_transaction_model = sub_transaction_model
+
+    def buckets_for_transactions(self, transaction_queryset) -> set[tuple[int, date]]:
+        return set(
+            transaction_queryset
+                .order_by()
+                .annotate(rollup_month=TruncMonth("due_date"))
+                .values_list("user_id", "rollup_month")
+                .distinct()
+        )
+
+    def buckets_for_transaction_ids(self, transaction_ids) -> set[tuple[int, date]]:
+        return self.buckets_for_transactions(self.transaction_model.objects.filter(id__in=transaction_ids))
+
+    def buckets_for_sub_transactions(self, sub_transaction_queryset) -> set[tuple[int, date]]:
+        return set(
+            sub_transaction_queryset
+                .order_by()
+                .annotate(rollup_month=TruncMonth("transaction__due_date"))
+                .values_list("transaction__user_id", "rollup_month")
+                .distinct()
+        )
+
+    def mark_dirty(self, buckets):
+        buckets = {
+            (user_id, first_day_of_month(month))
+            for user_id, month in buckets
+            if user_id and month
+        }
+        if not buckets:
+            return
+
+        if getattr(_pending, "buckets", None) is None:
+            _pending.buckets = set()
+        _pending.buckets.update(buckets)
+        on_commit(self.flush)
+
+    def flush(self):
+        buckets = getattr(_pending, "buckets", None)
+        _pending.buckets = None
+        if buckets:
+            self.refresh(buckets)
+
+    @atomic
+    def refresh(self, buckets):
+        months_by_user = defaultdict(set)
+        for user_id, month in buckets:
+            months_by_user[user_id].add(first_day_of_month(month))
+
+        self._lock(months_by_user)
+        self.model.objects.filter(
+            reduce(or_, [Q(user_id=user_id, month__in=months) for user_id, months in months_by_user.items()])
+        ).delete()
+        self.model.objects.bulk_create(
+            self._aggregate(
+                self._months_scope(months_by_user, "user_id", "due_date"),
+                self._months_scope(months_by_user, "transaction__user_id", "transaction__due_date"),
+            ),
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+    @atomic
+    def rebuild(self, user_ids: list[int] = None) -> int:
+        rollups = self.model.objects.all()
+        transaction_scope = Q()
+        sub_transaction_scope = Q()
+        if user_ids is not None:
+            self._lock({user_id: None for user_id in user_ids})
+            rollups = rollups.filter(user_id__in=user_ids)
+            transaction_scope = Q(user_id__in=user_ids)
+            sub_transaction_scope = Q(transaction__user_id__in=user_ids)
+
+        rollups.delete()
+        created = self.model.objects.bulk_create(
+            self._aggregate(transaction_scope, sub_transaction_scope),
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+        return len(created)
+
+    def verify(self, user_ids: list[int] = None) -> list[dict]:
+        """Compare stored buckets with freshly aggregated ones and return the differences."""
+        rollups = self.model.objects.all()
+        transaction_scope = Q()
+        sub_transaction_scope = Q()
+        if user_ids is not None:
+            rollups = rollups.filter(user_id__in=user_ids)
+            transaction_scope = Q(user_id__in=user_ids)
+            sub_transaction_scope = Q(transaction__user_id__in=user_ids)
+
+        stored = {
+            tuple(getattr(rollup, field) for field in BUCKET_FIELDS): (rollup.total_amount, rollup.count)
+            for rollup in rollups
+        }
+        expected = {
+            tuple(getattr(rollup, field) for field in BUCKET_FIELDS): (rollup.total_amount, rollup.count)
+            for rollup in self._aggregate(transaction_scope, sub_transaction_scope)
+        }
+
+        return [
+            {
+                **dict(zip(BUCKET_FIELDS, bucket, strict=True)),
+                "stored": stored.get(bucket),
+                "expected": expected.get(bucket),
+            }
+            for bucket in sorted(stored.keys() | expected.keys(), key=str)
+            if stored.get(bucket) != expected.get(bucket)
+        ]
+
+    def stats(self, user_id: int, month_start: date = None, month_end: date = None) -> dict:
+        queryset = self._filter_months(self.model.objects.filter(user_id=user_id), month_start, month_end)
+        is_transaction = Q(source=LedgerRollup.Source.TRANSACTION)
+        is_from_actor = Q(source=LedgerRollup.Source.SUB_TRANSACTION, actor__isnull=False)
+        is_incoming = Q(transaction_type=Transaction.TransactionType.INCOMING)
+        is_outgoing = Q(transaction_type=Transaction.TransactionType.OUTGOING)
+        is_paid = Q(is_paid=True)
+
+        return queryset.aggregate(
+            incoming_total=self._sum(is_transaction & is_incoming),
+            outgoing_total=self._sum(is_transaction & is_outgoing),
+            incoming_total_paid=self._sum(is_transaction & is_incoming & is_paid),
+            outgoing_total_paid=self._sum(is_transaction & is_outgoing & is_paid),
+            outgoing_from_actors=self._sum(is_from_actor),
+            outgoing_from_actors_paid=self._sum(is_from_actor & is_paid),
+        )
+
+    def _sum(self, condition: Q):
+        return Coalesce(Sum("total_amount", filter=condition), Decimal("0"), output_field=DecimalField())
+
+    def _filter_months(self, queryset, month_start: date = None, month_end: date = None, prefix: str = ""):
+        if month_start:
+            queryset = queryset.filter(**{f"{prefix}month__gte": month_start})
+        if month_end:
+            queryset = queryset.filter(**{f"{prefix}month__lt": month_end})
+        return queryset
+
+    def _lock(self, months_by_user: dict):
+        with connection.cursor() as cursor:
+            for user_id in sorted(months_by_user):
+                cursor.execute("SELECT pg_advisory_xact_lock(%s, %s)", [ROLLUP_LOCK_NAMESPACE, user_id % 2147483647])
+
+    def _months_scope(self, months_by_user: dict, user_field: str, date_field: str) -> Q:
+        return reduce(or_, [
+            Q(**{
+                user_field: user_id,
+                f"{date_field}__gte": month,
+                f"{date_field}__lt": month + relativedelta(months=1),
+            })
+            for user_id, months in months_by_user.items()
+            for month in months
+        ])
+
+    def _aggregate(self, transaction_scope: Q, sub_transaction_scope: Q) -> list[LedgerRollup]:
+        transaction_rows = (
+            self.transaction_model.objects
+                .filter(transaction_scope, deleted_at__isnull=True)
+                .order_by()
+                .annotate(
+                    rollup_month=TruncMonth("due_date"),
+                    rollup_is_paid=ExpressionWrapper(Q(paid_at__isnull=False), output_field=BooleanField()),
+                )
+                .values("user_id", "rollup_month", "transaction_type", "category", "rollup_is_paid")
+                .annotate(rollup_total=Sum("total_amount"), rollup_count=Count("id"))
+        )
+        sub_transaction_rows = (
+            self.sub_transaction_model.objects
+                .filter(sub_transaction_scope, deleted_at__isnull=True, transaction__deleted_at__isnull=True)
+                .order_by()
+                .annotate(
+                    rollup_user_id=F("transaction__user_id"),
+                    rollup_month=TruncMonth("transaction__due_date"),
+                    rollup_transaction_type=F("transaction__transaction_type"),
+                    rollup_is_paid=ExpressionWrapper(Q(paid_at__isnull=False), output_field=BooleanField()),
+                )
+                .values("rollup_user_id", "rollup_month", "rollup_transaction_type", "category", "actor_id", "rollup_is_paid")
+                .annotate(rollup_total=Sum("amount"), rollup_count=Count("id"))
+        )
+
+        return [
+            self.model(
+                user_id=row["user_id"],
+                month=row["rollup_month"],
+                source=LedgerRollup.Source.TRANSACTION,
+                transaction_type=row["transaction_type"],
+                category=row["category"],
+                actor_id=None,
+                is_paid=row["rollup_is_paid"],
+                total_amount=row["rollup_total"],
+                count=row["rollup_count"],
+            )
+            for row in transaction_rows
+        ] + [
+            self.model(
+                user_id=row["rollup_user_id"],
+                month=row["rollup_month"],
+                source=LedgerRollup.Source.SUB_TRANSACTION,
+                transaction_type=row["rollup_transaction_type"],
+                category=row["category"],
+                actor_id=row["actor_id"],
+                is_paid=row["rollup_is_paid"],
+                total_amount=row["rollup_total"],
+                count=row["rollup_count"],
+            )
+            for row in sub_transaction_rows
+        ]
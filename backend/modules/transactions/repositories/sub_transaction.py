@@ -1,18 +1,68 @@
 from typing import TYPE_CHECKING
-from datetime import datetime
+from decimal import Decimal
+
+from django.db.models import DecimalField, Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from modules.base.dates import month_filters_from_date
+from modules.base.pagination import KeysetPaginator, Page, PageRequest
 from modules.transactions.domains import SubTransactionDomain
+from modules.transactions.factories.identity_map import IdentityMap
 from modules.transactions.models import SubTransaction
+from modules.transactions.repositories.ledger_rollup import LedgerRollupRepository
 
 if TYPE_CHECKING:
     from modules.transactions.factories import SubTransactionFactory
 
+BULK_CREATE_BATCH_SIZE = 500
+BULK_UPDATE_BATCH_SIZE = 500
+UPDATABLE_FIELDS = [
+    "date",
+    "description",
+    "amount",
+    "installment_info",
+    "transaction_id",
+    "actor_id",
+    "user_provided_description",
+    "category",
+    "updated_at",
+]
+PAGINATOR = KeysetPaginator(["id"])
+
 
 class SubTransactionRepository:
-    def __init__(self, model: SubTransaction, sub_transaction_factory: "SubTransactionFactory"):
+    def __init__(
+        self,
+        model: SubTransaction,
+        sub_transaction_factory: "SubTransactionFactory",
+        ledger_rollup_repository: LedgerRollupRepository = None,
+    ):
         self.model = model
         self.sub_transaction_factory = sub_transaction_factory
+        self.ledger_rollup_repository = ledger_rollup_repository
+
+    def _mark_dirty(self, sub_transactions: list["SubTransactionDomain"]):
+        """Mark the months of the parents carried by the domains, querying only parents missing them."""
+        if not self.ledger_rollup_repository:
+            return
+
+        buckets = set()
+        unresolved_transaction_ids = set()
+        for sub_transaction in sub_transactions:
+            transaction = sub_transaction.transaction
+            if transaction.user_id and transaction.due_date:
+                buckets.add((transaction.user_id, transaction.due_date))
+            else:
+                unresolved_transaction_ids.add(transaction.id)
+
+        if unresolved_transaction_ids:
+            buckets |= self.ledger_rollup_repository.buckets_for_transaction_ids(unresolved_transaction_ids)
+        self.ledger_rollup_repository.mark_dirty(buckets)
+
+    def _mark_dirty_queryset(self, queryset):
+        if self.ledger_rollup_repository:
+            self.ledger_rollup_repository.mark_dirty(self.ledger_rollup_repository.buckets_for_sub_transactions(queryset))
 
     @property
     def queryset(self):
@@ -24,6 +74,13 @@ class SubTransactionRepository:
                 .exclude(deleted_at__isnull=False)
         )
 
+    def _build_many(self, sub_transaction_instances) -> list["SubTransactionDomain"]:
+        identity_map = IdentityMap()
+        return [
+            self.sub_transaction_factory.build_from_model(sub_transaction_instance, identity_map)
+            for sub_transaction_instance in sub_transaction_instances
+        ]
+
     def get(self, sub_transaction_id: str, user_id: int) -> "SubTransactionDomain":
         sub_transaction_instance = self.queryset.get(id=sub_transaction_id, transaction__user_id=user_id)
         return self.sub_transaction_factory.build_from_model(sub_transaction_instance)
@@ -32,85 +89,81 @@ class SubTransactionRepository:
         sub_transaction_instances = self.queryset.filter(actor_id=actor_id, transaction__user_id=user_id)
 
         if due_date:
-            date = datetime.strptime(due_date, "%Y-%m-%d")
             sub_transaction_instances = sub_transaction_instances.filter(
-                transaction__due_date__month=date.month, 
-                transaction__due_date__year=date.year
+                **month_filters_from_date("transaction__due_date", due_date)
             )
 
-        return [
-            self.sub_transaction_factory.build_from_model(sub_transaction_instance)
-            for sub_transaction_instance in sub_transaction_instances
-        ]
+        return self._build_many(sub_transaction_instances)
 
-    def get_all(self, user_id: int, due_date: str = None, actor_id: str = None) -> list["SubTransactionDomain"]:
+    def _filter_all(self, user_id: int, due_date: str = None, actor_id: str = None):
         sub_transaction_instances = self.queryset.filter(transaction__user_id=user_id)
 
         if due_date:
-            date = datetime.strptime(due_date, "%Y-%m-%d")
             sub_transaction_instances = sub_transaction_instances.filter(
-                transaction__due_date__month=date.month, 
-                transaction__due_date__year=date.year
+                **month_filters_from_date("transaction__due_date", due_date)
             )
 
         if actor_id:
             sub_transaction_instances = sub_transaction_instances.filter(actor_id=actor_id)
 
-        return [
-            self.sub_transaction_factory.build_from_model(sub_transaction_instance)
-            for sub_transaction_instance in sub_transaction_instances
-        ]
+        return sub_transaction_instances
+
+    def get_all(self, user_id: int, due_date: str = None, actor_id: str = None) -> list["SubTransactionDomain"]:
+        return self._build_many(self._filter_all(user_id, due_date, actor_id))
+
+    def get_page(self, user_id: int, page_request: PageRequest, due_date: str = None, actor_id: str = None) -> Page:
+        page = PAGINATOR.paginate(self._filter_all(user_id, due_date, actor_id), page_request)
+        return page.with_items(self._build_many(page.items))
 
     def get_all_by_transaction_id(self, transaction_id: str, user_id: int, filters: dict = {}) -> list["SubTransactionDomain"]:
         sub_transaction_instances = self.queryset.filter(transaction_id=transaction_id, transaction__user_id=user_id, **filters)
-        return [
-            self.sub_transaction_factory.build_from_model(sub_transaction_instance)
-            for sub_transaction_instance in sub_transaction_instances
-        ]
+        return self._build_many(sub_transaction_instances)
     
     def get_all_by_transaction_ids(self, transaction_ids: list[str]) -> list["SubTransactionDomain"]:
         sub_transaction_instances = self.queryset.filter(transaction_id__in=transaction_ids)
-        return [
-            self.sub_transaction_factory.build_from_model(sub_transaction_instance)
-            for sub_transaction_instance in sub_transaction_instances
-        ]
+        return self._build_many(sub_transaction_instances)
     
     def get_all_by_actor_ids(self, actor_ids: list[str], due_date: str = None) -> list["SubTransactionDomain"]:
         sub_transaction_instances = self.queryset.filter(actor_id__in=actor_ids)
 
         if due_date:
-            date = datetime.strptime(due_date, "%Y-%m-%d")
             sub_transaction_instances = sub_transaction_instances.filter(
-                transaction__due_date__month=date.month, 
-                transaction__due_date__year=date.year
+                **month_filters_from_date("transaction__due_date", due_date)
             )
 
-        return [
-            self.sub_transaction_factory.build_from_model(sub_transaction_instance)
-            for sub_transaction_instance in sub_transaction_instances
-        ]
+        return self._build_many(sub_transaction_instances)
     
     def filter_by_actor_ids(self, actor_ids: list[str], filters: dict = {}) -> list["SubTransactionDomain"]:
         sub_transaction_instances = self.queryset.filter(actor_id__in=actor_ids, **filters)
-        return [
-            self.sub_transaction_factory.build_from_model(sub_transaction_instance)
-            for sub_transaction_instance in sub_transaction_instances
-        ]
+        return self._build_many(sub_transaction_instances)
     
     def filter_by_actor_id(self, actor_id: str, filters: dict = {}) -> list["SubTransactionDomain"]:
         sub_transaction_instances = self.queryset.filter(actor_id=actor_id, **filters)
-        return [
-            self.sub_transaction_factory.build_from_model(sub_transaction_instance)
-            for sub_transaction_instance in sub_transaction_instances
-        ]
+        return self._build_many(sub_transaction_instances)
     
-    def create(self, sub_transaction: "SubTransactionDomain") -> "SubTransactionDomain":
+    def stats_from_actors(self, transaction_filters: dict) -> dict:
+        filters = {f"transaction__{key}": value for key, value in transaction_filters.items()}
+        queryset = (
+            self.model.objects
+                .filter(actor__isnull=False, transaction__deleted_at__isnull=True, **filters)
+                .exclude(deleted_at__isnull=False)
+        )
+
+        return queryset.aggregate(
+            outgoing_from_actors=Coalesce(Sum("amount"), Decimal("0"), output_field=DecimalField()),
+            outgoing_from_actors_paid=Coalesce(
+                Sum("amount", filter=Q(paid_at__isnull=False)),
+                Decimal("0"), output_field=DecimalField(),
+            ),
+        )
+
+    def _to_model(self, sub_transaction: "SubTransactionDomain") -> SubTransaction:
         if sub_transaction.actor:
             actor_id = sub_transaction.actor.id
         else:
             actor_id = None
 
-        sub_transaction_instance = self.model.objects.create(
+        return self.model(
             date=sub_transaction.date,
             description=sub_transaction.description,
             amount=sub_transaction.amount,
@@ -120,15 +173,41 @@ class SubTransactionRepository:
             user_provided_description=sub_transaction.user_provided_description,
             category=sub_transaction.category,
         )
+
+    def create(self, sub_transaction: "SubTransactionDomain") -> "SubTransactionDomain":
+        sub_transaction_instance = self._to_model(sub_transaction)
+        sub_transaction_instance.save()
+        self._mark_dirty([sub_transaction])
         return self.sub_transaction_factory.build_from_model(sub_transaction_instance)
     
-    def create_many(self, sub_transactions: list["SubTransactionDomain"]) -> list["SubTransactionDomain"]:
-        return [
-            self.create(sub_transaction) for sub_transaction in sub_transactions
-        ]
+    def create_many(
+        self,
+        sub_transactions: list["SubTransactionDomain"],
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+        hydrate: bool = True,
+    ) -> list["SubTransactionDomain"]:
+        sub_transaction_instances = self.model.objects.bulk_create(
+            [self._to_model(sub_transaction) for sub_transaction in sub_transactions],
+            batch_size=batch_size,
+        )
+        self._mark_dirty(sub_transactions)
+
+        if not hydrate:
+            for sub_transaction, instance in zip(sub_transactions, sub_transaction_instances, strict=True):
+                sub_transaction.id = instance.id
+                sub_transaction.created_at = instance.created_at
+                sub_transaction.updated_at = instance.updated_at
+            return sub_transactions
+
+        return self._build_many(
+            self.queryset.filter(id__in=[instance.id for instance in sub_transaction_instances])
+        )
     
     def update(self, sub_transaction: "SubTransactionDomain") -> "SubTransactionDomain":
         sub_transaction_instance = self.queryset.get(id=sub_transaction.id)
+        if self.ledger_rollup_repository:
+            previous_transaction = sub_transaction_instance.transaction
+            self.ledger_rollup_repository.mark_dirty([(previous_transaction.user_id, previous_transaction.due_date)])
         sub_transaction_instance.date = sub_transaction.date
         sub_transaction_instance.description = sub_transaction.description
         sub_transaction_instance.amount = sub_transaction.amount
@@ -138,17 +217,94 @@ class SubTransactionRepository:
         sub_transaction_instance.user_provided_description = sub_transaction.user_provided_description
         sub_transaction_instance.category = sub_transaction.category
         sub_transaction_instance.save()
+        self._mark_dirty([sub_transaction])
         return self.sub_transaction_factory.build_from_model(sub_transaction_instance)
     
+    def update_many(
+        self,
+        sub_transactions: list["SubTransactionDomain"],
+        batch_size: int = BULK_UPDATE_BATCH_SIZE,
+    ) -> list["SubTransactionDomain"]:
+        self._mark_dirty_queryset(self.model.objects.filter(id__in=[sub_transaction.id for sub_transaction in sub_transactions]))
+        updated_at = timezone.now()
+        sub_transaction_instances = []
+        for sub_transaction in sub_transactions:
+            sub_transaction_instance = self._to_model(sub_transaction)
+            sub_transaction_instance.id = sub_transaction.id
+            sub_transaction_instance.actor_id = sub_transaction.actor_id
+            sub_transaction_instance.updated_at = updated_at
+            sub_transaction_instances.append(sub_transaction_instance)
+        self.model.objects.bulk_update(sub_transaction_instances, UPDATABLE_FIELDS, batch_size=batch_size)
+        self._mark_dirty(sub_transactions)
+
+        for sub_transaction in sub_transactions:
+            sub_transaction.updated_at = updated_at
+        return sub_transactions
+
+    def update_categories(self, categories: dict[int, str], user_id: int) -> int:
+        updated_at = timezone.now()
+        sub_transaction_instances = [
+            self.model(id=sub_transaction_id, category=category, updated_at=updated_at)
+            for sub_transaction_id, category in categories.items()
+        ]
+        queryset = self.model.objects.filter(transaction__user_id=user_id, deleted_at__isnull=True)
+        self._mark_dirty_queryset(queryset.filter(id__in=categories.keys()))
+        return queryset.bulk_update(sub_transaction_instances, ["category", "updated_at"], batch_size=BULK_UPDATE_BATCH_SIZE)
+
     def update_paid_at(self, sub_transaction: "SubTransactionDomain"):
-        self.queryset.filter(id=sub_transaction.id).update(paid_at=sub_transaction.paid_at)
+        self.queryset.filter(id=sub_transaction.id).update(paid_at=sub_transaction.paid_at, updated_at=timezone.now())
+        self._mark_dirty([sub_transaction])
+
+    def update_paid_at_by_transaction_id(self, transaction_id: str, user_id: int, paid_at) -> int:
+        queryset = self.model.objects.filter(
+            transaction_id=transaction_id,
+            transaction__user_id=user_id,
+            deleted_at__isnull=True,
+        )
+        self._mark_dirty_queryset(queryset)
+        return queryset.update(paid_at=paid_at, updated_at=timezone.now())
+
+    def update_paid_at_many(
+        self,
+        user_id: int,
+        paid_at,
+        actor_id: str = None,
+        due_date: str = None,
+        sub_transaction_ids: list[int] = None,
+    ) -> int:
+        sub_transaction_instances = self.model.objects.filter(transaction__user_id=user_id, deleted_at__isnull=True)
+
+        if actor_id:
+            sub_transaction_instances = sub_transaction_instances.filter(actor_id=actor_id)
+
+        if due_date:
+            sub_transaction_instances = sub_transaction_instances.filter(
+                **month_filters_from_date("transaction__due_date", due_date)
+            )
+
+        if sub_transaction_ids is not None:
+            sub_transaction_instances = sub_transaction_instances.filter(id__in=sub_transaction_ids)
+
+        self._mark_dirty_queryset(sub_transaction_instances)
+        return sub_transaction_instances.update(paid_at=paid_at, updated_at=timezone.now())
     
     def delete(self, sub_transaction_id: str):
-        self.queryset.filter(id=sub_transaction_id).update(deleted_at=timezone.now())
+        queryset = self.queryset.filter(id=sub_transaction_id)
+        self._mark_dirty_queryset(queryset)
+        queryset.update(deleted_at=timezone.now())
 
     def delete_many(self, sub_transactions: list["SubTransactionDomain"]):
         sub_transaction_ids = [sub_transaction.id for sub_transaction in sub_transactions]
         self.queryset.filter(id__in=sub_transaction_ids).update(deleted_at=timezone.now())
+        self._mark_dirty(sub_transactions)
+
+    def delete_by_transaction_tree(self, transaction_id: str, user_id: int, include_children: bool = True) -> int:
+        tree = Q(transaction_id=transaction_id)
+        if include_children:
+            tree |= Q(transaction__main_transaction_id=transaction_id, transaction__deleted_at__isnull=True)
+        queryset = self.model.objects.filter(tree, transaction__user_id=user_id, deleted_at__isnull=True)
+        self._mark_dirty_queryset(queryset)
+        return queryset.update(deleted_at=timezone.now())
 
     def duplicate(self, sub_transaction_id: str, extra_data: dict = {}) -> "SubTransactionDomain":
         sub_transaction_instance = self.queryset.get(id=sub_transaction_id)
@@ -158,4 +314,5 @@ class SubTransactionRepository:
             setattr(sub_transaction_instance, key, value)
         
         sub_transaction_instance.save()
+        self._mark_dirty_queryset(self.model.objects.filter(id=sub_transaction_instance.id))
         return self.sub_transaction_factory.build_from_model(sub_transaction_instance)
@@ -1,15 +1,47 @@
+from decimal import Decimal
+
 from django.utils import timezone
-from django.db.models import Case, When, Value, BooleanField, Exists, OuterRef
+from django.db.models import Case, When, Value, BooleanField, DecimalField, Exists, OuterRef, Q, Sum
+from django.db.models.functions import Coalesce
 
+from modules.base.pagination import KeysetPaginator, Page, PageRequest
 from modules.transactions.domains import TransactionDomain
 from modules.transactions.factories.transaction import TransactionFactory
 from modules.transactions.models import Transaction, SubTransaction
+from modules.transactions.repositories.ledger_rollup import LedgerRollupRepository
 
+BULK_CREATE_BATCH_SIZE = 500
+BULK_UPDATE_BATCH_SIZE = 500
+UPDATABLE_FIELDS = [
+    "due_date",
+    "total_amount",
+    "transaction_identifier",
+    "transaction_type",
+    "is_salary",
+    "is_recurrent",
+    "category",
+    "updated_at",
+]
+PAGINATOR = KeysetPaginator(["-due_date", "-id"])
 
 class TransactionRepository:
-    def __init__(self, model: Transaction, transaction_factory: TransactionFactory):
+    def __init__(
+        self,
+        model: Transaction,
+        transaction_factory: TransactionFactory,
+        ledger_rollup_repository: LedgerRollupRepository = None,
+    ):
         self.model = model
         self.transaction_factory = transaction_factory
+        self.ledger_rollup_repository = ledger_rollup_repository
+
+    def _mark_dirty(self, buckets):
+        if self.ledger_rollup_repository:
+            self.ledger_rollup_repository.mark_dirty(buckets)
+
+    def _mark_dirty_queryset(self, queryset):
+        if self.ledger_rollup_repository:
+            self.ledger_rollup_repository.mark_dirty(self.ledger_rollup_repository.buckets_for_transactions(queryset))
 
     @property
     def queryset(self):
@@ -17,7 +49,16 @@ class TransactionRepository:
             self.model.objects
                 .order_by("id")
                 .exclude(deleted_at__isnull=False)
-                .prefetch_related("sub_transactions")
+        )
+
+    @property
+    def projected_queryset(self):
+        """Queryset exposing everything TransactionFactory reads as plain columns."""
+        return self.queryset.annotate(
+            amount_from_actor=Sum(
+                "sub_transactions__amount",
+                filter=Q(sub_transactions__actor__isnull=False, sub_transactions__deleted_at__isnull=True),
+            )
         )
 
     def _annotate_subtransactions_paid(self, queryset):
@@ -39,23 +80,29 @@ class TransactionRepository:
         )
 
     def filter(self, filters: dict) -> list["TransactionDomain"]:
-        queryset = self._annotate_subtransactions_paid(self.queryset.filter(**filters))
+        queryset = self._annotate_subtransactions_paid(self.projected_queryset.filter(**filters))
         return [self.transaction_factory.build_from_model(transaction) for transaction in queryset]
 
+    def filter_page(self, filters: dict, page_request: PageRequest) -> Page:
+        """One page of ``filter``, newest due date first."""
+        queryset = self._annotate_subtransactions_paid(self.projected_queryset.filter(**filters))
+        page = PAGINATOR.paginate(queryset, page_request)
+        return page.with_items([self.transaction_factory.build_from_model(transaction) for transaction in page.items])
+
     def get(self, transaction_id: str, user_id: int) -> "TransactionDomain":
-        transaction_instance = self.queryset.get(id=transaction_id, user_id=user_id)
+        transaction_instance = self.projected_queryset.get(id=transaction_id, user_id=user_id)
         return self.transaction_factory.build_from_model(transaction_instance)
     
     def get_children_transactions(self, transaction_id: str, user_id: int) -> list["TransactionDomain"]:
-        transaction_instances = self.queryset.filter(main_transaction_id=transaction_id, user_id=user_id)
+        transaction_instances = self.projected_queryset.filter(main_transaction_id=transaction_id, user_id=user_id)
         return [self.transaction_factory.build_from_model(transaction) for transaction in transaction_instances]
     
     def get_all(self, user_id: int) -> list["TransactionDomain"]:
-        transaction_instances = self.queryset.filter(user_id=user_id)
+        transaction_instances = self.projected_queryset.filter(user_id=user_id)
         return [self.transaction_factory.build_from_model(transaction) for transaction in transaction_instances]
     
-    def create(self, transaction: "TransactionDomain") -> "TransactionDomain":
-        transaction_instance = self.model.objects.create(
+    def _to_model(self, transaction: "TransactionDomain") -> Transaction:
+        return self.model(
             due_date=transaction.due_date,
             total_amount=transaction.total_amount,
             transaction_identifier=transaction.transaction_identifier,
@@ -64,14 +111,42 @@ class TransactionRepository:
             user_id=transaction.user_id,
             is_recurrent=transaction.is_recurrent,
             installment_number=transaction.installment_number,
-            main_transaction_id=transaction.main_transaction,
+            main_transaction_id=transaction.main_transaction_id,
             recurrence_count=transaction.recurrence_count,
             category=transaction.category,
         )
+
+    def create(self, transaction: "TransactionDomain") -> "TransactionDomain":
+        transaction_instance = self._to_model(transaction)
+        transaction_instance.save()
+        self._mark_dirty([(transaction_instance.user_id, transaction_instance.due_date)])
         return self.transaction_factory.build_from_model(transaction_instance)
+
+    def create_many(
+        self,
+        transactions: list["TransactionDomain"],
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+        hydrate: bool = True,
+    ) -> list["TransactionDomain"]:
+        transaction_instances = self.model.objects.bulk_create(
+            [self._to_model(transaction) for transaction in transactions],
+            batch_size=batch_size,
+        )
+        self._mark_dirty([(instance.user_id, instance.due_date) for instance in transaction_instances])
+
+        if not hydrate:
+            for transaction, instance in zip(transactions, transaction_instances, strict=True):
+                transaction.id = instance.id
+                transaction.created_at = instance.created_at
+                transaction.updated_at = instance.updated_at
+            return transactions
+
+        transaction_instances = self.projected_queryset.filter(id__in=[instance.id for instance in transaction_instances])
+        return [self.transaction_factory.build_from_model(transaction) for transaction in transaction_instances]
     
     def update(self, transaction: "TransactionDomain") -> "TransactionDomain":
-        transaction_instance = self.queryset.get(id=transaction.id, user_id=transaction.user_id)
+        transaction_instance = self.projected_queryset.get(id=transaction.id, user_id=transaction.user_id)
+        previous_bucket = (transaction_instance.user_id, transaction_instance.due_date)
         transaction_instance.due_date = transaction.due_date
         transaction_instance.total_amount = transaction.total_amount
         transaction_instance.transaction_identifier = transaction.transaction_identifier
@@ -80,19 +155,80 @@ class TransactionRepository:
         transaction_instance.is_recurrent = transaction.is_recurrent
         transaction_instance.category = transaction.category
         transaction_instance.save()
+        self._mark_dirty([previous_bucket, (transaction_instance.user_id, transaction_instance.due_date)])
         return self.transaction_factory.build_from_model(transaction_instance)
     
     def update_paid_at(self, transaction: "TransactionDomain"):
-        self.queryset.filter(id=transaction.id).update(paid_at=transaction.paid_at)
+        self.queryset.filter(id=transaction.id).update(paid_at=transaction.paid_at, updated_at=timezone.now())
+        self._mark_dirty([(transaction.user_id, transaction.due_date)])
     
-    def update_many(self, transactions: list["TransactionDomain"]) -> list["TransactionDomain"]:
-        return [self.update(transaction) for transaction in transactions]
+    def update_many(
+        self,
+        transactions: list["TransactionDomain"],
+        batch_size: int = BULK_UPDATE_BATCH_SIZE,
+    ) -> list["TransactionDomain"]:
+        self._mark_dirty_queryset(self.model.objects.filter(id__in=[transaction.id for transaction in transactions]))
+        updated_at = timezone.now()
+        transaction_instances = [
+            self.model(
+                id=transaction.id,
+                due_date=transaction.due_date,
+                total_amount=transaction.total_amount,
+                transaction_identifier=transaction.transaction_identifier,
+                transaction_type=transaction.transaction_type,
+                is_salary=transaction.is_salary,
+                is_recurrent=transaction.is_recurrent,
+                category=transaction.category,
+                updated_at=updated_at,
+            )
+            for transaction in transactions
+        ]
+        self.model.objects.bulk_update(transaction_instances, UPDATABLE_FIELDS, batch_size=batch_size)
+        self._mark_dirty([(transaction.user_id, transaction.due_date) for transaction in transactions])
+
+        for transaction in transactions:
+            transaction.updated_at = updated_at
+        return transactions
     
     def delete(self, transaction_id: str, user_id: int):
-        self.queryset.filter(id=transaction_id, user_id=user_id).update(deleted_at=timezone.now())
+        queryset = self.queryset.filter(id=transaction_id, user_id=user_id)
+        self._mark_dirty_queryset(queryset)
+        queryset.update(deleted_at=timezone.now())
+
+    def delete_tree(self, transaction_id: str, user_id: int, include_children: bool = True) -> int:
+        tree = Q(id=transaction_id)
+        if include_children:
+            tree |= Q(main_transaction_id=transaction_id)
+        queryset = self.queryset.filter(tree, user_id=user_id)
+        self._mark_dirty_queryset(queryset)
+        return queryset.update(deleted_at=timezone.now())
 
     def delete_many(self, transactions: list["TransactionDomain"]):
         transaction_ids = [transaction.id for transaction in transactions]
         self.queryset.filter(id__in=transaction_ids).update(deleted_at=timezone.now())
+        self._mark_dirty([(transaction.user_id, transaction.due_date) for transaction in transactions])
 
+    def stats(self, filters: dict) -> dict:
+        queryset = self.model.objects.filter(**filters).exclude(deleted_at__isnull=False)
+        is_incoming = Q(transaction_type=Transaction.TransactionType.INCOMING)
+        is_outgoing = Q(transaction_type=Transaction.TransactionType.OUTGOING)
+        is_paid = Q(paid_at__isnull=False)
 
+        return queryset.aggregate(
+            incoming_total=Coalesce(
+                Sum("total_amount", filter=is_incoming),
+                Decimal("0"), output_field=DecimalField(),
+            ),
+            outgoing_total=Coalesce(
+                Sum("total_amount", filter=is_outgoing),
+                Decimal("0"), output_field=DecimalField(),
+            ),
+            incoming_total_paid=Coalesce(
+                Sum("total_amount", filter=is_incoming & is_paid),
+                Decimal("0"), output_field=DecimalField(),
+            ),
+            outgoing_total_paid=Coalesce(
+                Sum("total_amount", filter=is_outgoing & is_paid),
+                Decimal("0"), output_field=DecimalField(),
+            ),
+        )
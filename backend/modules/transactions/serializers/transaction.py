@@ -35,7 +35,7 @@ class TransactionSerializer:
             "is_recurrent": transaction.is_recurrent,
             "recurrence_count": transaction.recurrence_count,
             "installment_number": transaction.installment_number,
-            "main_transaction": transaction.main_transaction.id if transaction.main_transaction else None,
+            "main_transaction": transaction.main_transaction_id,
             "amount_from_actor": transaction.amount_from_actor if transaction.amount_from_actor else None,
             "paid_at": transaction.paid_at.strftime("%Y-%m-%d %H:%M:%S") if transaction.paid_at else None,
             "subtransactions_paid": transaction.subtransactions_paid,
@@ -52,7 +52,7 @@ class TransactionSerializer:
             transaction_type=transaction.transaction_type,
             recurrence_count=transaction.recurrence_count,
             installment_number=transaction.installment_number,
-            main_transaction=transaction.main_transaction.id if transaction.main_transaction else None,
+            main_transaction=transaction.main_transaction_id,
             is_credit_card=transaction.file_id is not None,
             category=transaction.category,
         )
@@ -0,0 +1,18 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from modules.transactions.models import Actor, LedgerRollup, SubTransaction, Transaction
+from modules.transactions.repositories import LedgerRollupRepository
+
+ledger_rollup_repository = LedgerRollupRepository(
+    model=LedgerRollup, transaction_model=Transaction, sub_transaction_model=SubTransaction,
+)
+
+
+@receiver(pre_delete, sender=Actor, dispatch_uid="refresh_rollup_on_actor_delete")
+def refresh_rollup_on_actor_delete(sender, instance: Actor, **kwargs):
+    # A hard delete cascades to the actor's rollup rows while its sub-transactions
+    # survive with actor=NULL (SET_NULL), so their months have to be re-bucketed.
+    ledger_rollup_repository.mark_dirty(
+        ledger_rollup_repository.buckets_for_sub_transactions(SubTransaction.objects.filter(actor=instance))
+    )
@@ -0,0 +1,129 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.utils.http import http_date
+from rest_framework.test import APITestCase
+
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+User = get_user_model()
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TestConditionalGetViews(APITestCase):
+    """Test list and stats endpoints answer 304 while the user's data is unchanged."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="etag@example.com", password="testpass123")
+        self.other_user = User.objects.create_user(email="other-etag@example.com", password="testpass123")
+        self.client.force_authenticate(self.user)
+        self.actor = Actor.objects.create(user=self.user, name="John Doe")
+        self.transaction = Transaction.objects.create(
+            user=self.user, due_date=date(2026, 3, 10), total_amount=Decimal("100.00"), transaction_identifier="Card",
+        )
+        self.sub_transaction = SubTransaction.objects.create(
+            transaction=self.transaction, actor=self.actor, date=self.transaction.due_date, description="Item", amount=Decimal("40.00"),
+        )
+
+    def _revalidate(self, url: str, params: dict | None = None):
+        first = self.client.get(url, params)
+        self.assertEqual(first.status_code, 200)
+        return first, self.client.get(url, params, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    def test_unchanged_data_answers_not_modified_with_one_query(self):
+        """Test a matching If-None-Match skips the use case entirely."""
+        for url in ("/transactions/transactions/", "/transactions/actors/", "/transactions/sub_transactions/"):
+            with self.subTest(url=url):
+                # Arrange
+                first = self.client.get(url)
+
+                # Act
+                with self.assertNumQueries(1):
+                    second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+                # Assert
+                self.assertEqual(second.status_code, 304)
+                self.assertEqual(second["ETag"], first["ETag"])
+                self.assertIn("private", first["Cache-Control"])
+                self.assertNotIn("Last-Modified", first)
+
+    def test_writes_change_the_validator(self):
+        """Test updates, queryset-level payments and soft deletes all change the ETag."""
+        writes = [
+            lambda: self.client.put(f"/transactions/actors/{self.actor.id}/", {"name": "Jane"}, format="json"),
+            lambda: self.client.post(f"/transactions/sub_transactions/{self.sub_transaction.id}/pay/"),
+            lambda: self.client.delete(f"/transactions/sub_transactions/{self.sub_transaction.id}/"),
+        ]
+        for write in writes:
+            # Arrange
+            first = self.client.get("/transactions/sub_transactions/")
+
+            # Act
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+            second = self.client.get("/transactions/sub_transactions/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+            # Assert
+            self.assertEqual(second.status_code, 200)
+            self.assertNotEqual(second["ETag"], first["ETag"])
+
+    def test_hard_delete_changes_the_validator(self):
+        """Test removing a row without touching timestamps is caught by the row count."""
+        # Arrange
+        Actor.objects.create(user=self.user, name="Second")
+        first = self.client.get("/transactions/actors/")
+
+        # Act
+        Actor.objects.filter(name="Second").delete()
+        second = self.client.get("/transactions/actors/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # Assert
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second["ETag"], first["ETag"])
+
+    def test_date_change_changes_the_validator(self):
+        """Test the same data revalidated on another day gets a fresh response."""
+        # Arrange
+        first = self.client.get("/transactions/transactions/stats/")
+        tomorrow = date.today() + timedelta(days=1)
+
+        # Act
+        with patch("modules.base.conditional.timezone.localdate", return_value=tomorrow):
+            second = self.client.get("/transactions/transactions/stats/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # Assert
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second["ETag"], first["ETag"])
+
+    def test_other_users_writes_and_other_params_do_not_match(self):
+        """Test another user's writes keep the validator while other query params get their own."""
+        # Arrange
+        first, _ = self._revalidate("/transactions/transactions/stats/", {"due_date": "2026-03-01"})
+
+        # Act
+        Transaction.objects.create(
+            user=self.other_user, due_date=date(2026, 3, 10), total_amount=Decimal("1.00"), transaction_identifier="Other",
+        )
+        same = self.client.get("/transactions/transactions/stats/", {"due_date": "2026-03-01"}, HTTP_IF_NONE_MATCH=first["ETag"])
+        other_month = self.client.get("/transactions/transactions/stats/", {"due_date": "2026-04-01"}, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # Assert
+        self.assertEqual(same.status_code, 304)
+        self.assertEqual(other_month.status_code, 200)
+
+    def test_if_modified_since_alone_does_not_revalidate(self):
+        """Test a date-only validator cannot get a 304, even after a same-second hard delete."""
+        # Arrange
+        Actor.objects.create(user=self.user, name="Second")
+        self.client.get("/transactions/actors/")
+
+        # Act
+        Actor.objects.filter(name="Second").delete()
+        second = self.client.get("/transactions/actors/", HTTP_IF_MODIFIED_SINCE=http_date())
+
+        # Assert
+        self.assertEqual(second.status_code, 200)
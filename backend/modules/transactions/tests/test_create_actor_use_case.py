@@ -18,6 +18,7 @@ class TestCreateActorUseCase(TestCase):
             actor_repository=self.mock_actor_repository,
             actor_serializer=self.mock_actor_serializer,
             actor_factory=self.mock_actor_factory,
+            versioned_cache_service=Mock(),
         )
 
     def test_create_actor(self):
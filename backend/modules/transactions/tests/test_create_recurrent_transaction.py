@@ -0,0 +1,65 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from modules.transactions.container import TransactionsContainer
+from modules.transactions.models import SubTransaction, Transaction
+
+User = get_user_model()
+
+
+class TestCreateRecurrentTransaction(TestCase):
+    """Test CreateTransactionUseCase expanding recurrences against the database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="create@example.com", password="testpass123")
+        self.use_case = TransactionsContainer().create_transaction_use_case()
+
+    def _data(self, recurrence_count: int) -> dict:
+        return {
+            "due_date": "2026-01-31",
+            "total_amount": "80.00",
+            "transaction_identifier": "Gym",
+            "transaction_type": "outgoing",
+            "user_id": self.user.id,
+            "is_recurrent": True,
+            "recurrence_count": recurrence_count,
+        }
+
+    def test_query_count_does_not_depend_on_recurrence_count(self):
+        """Test a 12 and a 60 month bill are created with the same number of queries."""
+        query_counts = []
+        for recurrence_count in (12, 60):
+            with self.subTest(recurrence_count=recurrence_count):
+                # Act
+                with CaptureQueriesContext(connection) as context:
+                    self.use_case.execute(self._data(recurrence_count))
+                query_counts.append(len(context.captured_queries))
+
+        # Assert
+        self.assertEqual(query_counts[0], query_counts[1])
+        self.assertEqual(Transaction.objects.count(), 72)
+        self.assertEqual(SubTransaction.objects.count(), 72)
+
+    def test_installments_point_at_first_transaction(self):
+        """Test children reference the first installment and keep its day of month."""
+        # Act
+        result = self.use_case.execute(self._data(4))
+
+        # Assert
+        main_transaction = Transaction.objects.get(id=result["id"])
+        self.assertEqual(result["installment_number"], 1)
+        self.assertIsNone(result["main_transaction"])
+        children = Transaction.objects.filter(main_transaction=main_transaction).order_by("installment_number")
+        self.assertEqual(
+            [(child.installment_number, child.due_date) for child in children],
+            [(2, date(2026, 2, 28)), (3, date(2026, 3, 31)), (4, date(2026, 4, 30))],
+        )
+        self.assertEqual(
+            list(SubTransaction.objects.order_by("transaction__installment_number").values_list("installment_info", flat=True)),
+            ["1/4", "2/4", "3/4", "4/4"],
+        )
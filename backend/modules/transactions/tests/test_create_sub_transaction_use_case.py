@@ -22,6 +22,7 @@ class TestCreateSubTransactionUseCase(TestCase):
             sub_transaction_repository=self.mock_sub_transaction_repository,
             sub_transaction_serializer=self.mock_sub_transaction_serializer,
             sub_transaction_factory=self.mock_sub_transaction_factory,
+            versioned_cache_service=Mock(),
         )
 
     def test_create_sub_transaction_with_actor(self):
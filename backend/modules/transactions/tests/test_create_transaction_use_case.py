@@ -22,6 +22,7 @@ class TestCreateTransactionUseCase(TestCase):
             transaction_factory=self.mock_transaction_factory,
             sub_transaction_factory=self.mock_sub_transaction_factory,
             sub_transaction_repository=self.mock_sub_transaction_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_create_non_recurrent_transaction(self):
@@ -145,8 +146,9 @@ class TestCreateTransactionUseCase(TestCase):
             mock_transactions.append(mock_transaction)
 
         self.mock_transaction_factory.build.side_effect = mock_transactions
-        self.mock_transaction_repository.create.side_effect = mock_transactions
-        self.mock_sub_transaction_repository.create.return_value = Mock()
+        self.mock_transaction_repository.create.return_value = mock_transactions[0]
+        self.mock_transaction_repository.create_many.return_value = mock_transactions[1:]
+        self.mock_sub_transaction_factory.build_from_transaction.side_effect = lambda transaction, installment: (transaction.id, installment)
         self.mock_transaction_serializer.serialize.return_value = {"id": 1, "transaction_identifier": "Gym Membership"}
 
         # Act
@@ -154,8 +156,17 @@ class TestCreateTransactionUseCase(TestCase):
 
         # Assert
         self.assertEqual(self.mock_transaction_factory.build.call_count, 3)
-        self.assertEqual(self.mock_transaction_repository.create.call_count, 3)
-        self.assertEqual(self.mock_sub_transaction_repository.create.call_count, 3)
+        self.mock_transaction_repository.create.assert_called_once_with(mock_transactions[0])
+        self.mock_transaction_repository.create_many.assert_called_once_with(mock_transactions[1:], hydrate=False)
+        self.mock_sub_transaction_repository.create.assert_not_called()
+        self.mock_sub_transaction_repository.create_many.assert_called_once_with(
+            [(1, "1/3"), (2, "2/3"), (3, "3/3")], hydrate=False,
+        )
+
+        built_data = [call.args[0] for call in self.mock_transaction_factory.build.call_args_list]
+        self.assertEqual([item["due_date"] for item in built_data], ["2026-03-15", "2026-04-15", "2026-05-15"])
+        self.assertEqual([item["installment_number"] for item in built_data], [1, 2, 3])
+        self.assertEqual([item.get("main_transaction") for item in built_data], [None, 1, 1])
         self.mock_transaction_serializer.serialize.assert_called_once_with(mock_transactions[0])
         self.assertEqual(result, {"id": 1, "transaction_identifier": "Gym Membership"})
 
@@ -169,3 +180,7 @@ class TestCreateTransactionUseCase(TestCase):
         next_date = self.use_case.calculate_next_due_date("2026-12-31")
         self.assertEqual(next_date, "2027-01-31")
 
+        # Test moving several months at once keeps the original day when possible
+        next_date = self.use_case.calculate_next_due_date("2026-01-31", months=2)
+        self.assertEqual(next_date, "2026-03-31")
+
@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from modules.base.services import VersionedCacheService
+from modules.transactions.models import Transaction
+
+User = get_user_model()
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TestTransactionStatsCache(APITestCase):
+    """Test transaction stats are cached until the user writes new data."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        VersionedCacheService().cache.clear()
+        self.user = User.objects.create_user(email="cache@example.com", password="testpass123")
+        self.client.force_authenticate(self.user)
+        Transaction.objects.create(
+            user=self.user, due_date=date(2026, 3, 10), total_amount=Decimal("100.00"), transaction_identifier="Card",
+        )
+
+    def test_repeated_stats_do_not_hit_the_database(self):
+        """Test the second stats call is answered from the cache after the validator query."""
+        # Arrange
+        first = self.client.get("/transactions/transactions/stats/", {"due_date": "2026-03-01"})
+
+        # Act
+        with self.assertNumQueries(1):
+            second = self.client.get("/transactions/transactions/stats/", {"due_date": "2026-03-01"})
+
+        # Assert
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+
+    def test_write_invalidates_stats(self):
+        """Test creating a transaction through the API refreshes the cached stats."""
+        # Arrange
+        self.client.get("/transactions/transactions/stats/", {"due_date": "2026-03-01"})
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/transactions/transactions/", {
+                "due_date": "2026-03-15",
+                "total_amount": "50.00",
+                "transaction_identifier": "Market",
+                "transaction_type": Transaction.TransactionType.OUTGOING,
+            }, format="json")
+        stats = self.client.get("/transactions/transactions/stats/", {"due_date": "2026-03-01"})
+
+        # Assert
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Decimal(str(stats.json()["outgoing_total"])), Decimal("150.00"))
@@ -13,6 +13,7 @@ class TestDeleteActorUseCase(TestCase):
 
         self.use_case = DeleteActorUseCase(
             actor_repository=self.mock_actor_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_delete_actor(self):
@@ -49,6 +50,7 @@ class TestDeleteActorBlocksWithActiveLoans(SimpleTestCase):
         use_case = DeleteActorUseCase(
             actor_repository=actor_repo,
             loan_repository=loan_repo,
+            versioned_cache_service=Mock(),
         )
 
         with self.assertRaises(ValueError) as cm:
@@ -61,7 +63,7 @@ class TestDeleteActorBlocksWithActiveLoans(SimpleTestCase):
         loan_repo = Mock()
         loan_repo.has_active_for_actor.return_value = False
 
-        use_case = DeleteActorUseCase(actor_repository=actor_repo, loan_repository=loan_repo)
+        use_case = DeleteActorUseCase(actor_repository=actor_repo, loan_repository=loan_repo, versioned_cache_service=Mock())
         use_case.execute(actor_id=10, user_id=7)
 
         actor_repo.delete.assert_called_once_with(10, 7)
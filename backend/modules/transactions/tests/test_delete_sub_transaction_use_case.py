@@ -14,6 +14,7 @@ class TestDeleteSubTransactionUseCase(TestCase):
 
         self.use_case = DeleteSubTransactionUseCase(
             sub_transaction_repository=self.mock_sub_transaction_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_delete_sub_transaction(self):
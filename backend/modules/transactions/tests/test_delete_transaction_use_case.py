@@ -1,8 +1,16 @@
+from datetime import date
+from decimal import Decimal
 from unittest.mock import Mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
+from modules.transactions.container import TransactionsContainer
 from modules.transactions.use_cases.transaction.delete import DeleteTransactionUseCase
-from modules.transactions.domains import TransactionDomain, SubTransactionDomain
+from modules.transactions.domains import TransactionDomain
+from modules.transactions.models import SubTransaction, Transaction
+
+User = get_user_model()
 
 
 class TestDeleteTransactionUseCase(TestCase):
@@ -16,6 +24,7 @@ class TestDeleteTransactionUseCase(TestCase):
         self.use_case = DeleteTransactionUseCase(
             transaction_repository=self.mock_transaction_repository,
             sub_transaction_repository=self.mock_sub_transaction_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_delete_simple_transaction(self):
@@ -34,28 +43,18 @@ class TestDeleteTransactionUseCase(TestCase):
             is_recurrent=False,
         )
 
-        mock_sub_transactions = [
-            SubTransactionDomain(
-                id=1,
-                date="2026-03-15",
-                description="Bill to Delete",
-                amount=150.00,
-                installment_info="1/1",
-            )
-        ]
-
         self.mock_transaction_repository.get.return_value = mock_transaction
-        self.mock_transaction_repository.get_children_transactions.return_value = []
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = mock_sub_transactions
 
         # Act
         self.use_case.execute(transaction_id, user_id)
 
         # Assert
         self.mock_transaction_repository.get.assert_called_once_with(transaction_id, user_id)
-        self.mock_transaction_repository.delete.assert_called_once_with(transaction_id, user_id)
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.assert_called_once_with(transaction_id, user_id)
-        self.mock_sub_transaction_repository.delete_many.assert_called_once_with(mock_sub_transactions)
+        self.mock_transaction_repository.get_children_transactions.assert_not_called()
+        self.mock_sub_transaction_repository.delete_by_transaction_tree.assert_called_once_with(
+            transaction_id, user_id, include_children=False
+        )
+        self.mock_transaction_repository.delete_tree.assert_called_once_with(transaction_id, user_id, include_children=False)
 
     def test_delete_recurrent_transaction_with_children(self):
         """Test deleting a recurrent transaction deletes all children."""
@@ -74,63 +73,93 @@ class TestDeleteTransactionUseCase(TestCase):
             recurrence_count=3,
         )
 
-        # Mock child transactions
-        mock_children = [
-            TransactionDomain(id=2, due_date="2026-04-15", user_id=user_id, is_recurrent=True),
-            TransactionDomain(id=3, due_date="2026-05-15", user_id=user_id, is_recurrent=True),
-        ]
-
-        # Mock sub-transactions for each transaction
-        mock_sub_transactions_main = [Mock(spec=SubTransactionDomain, id=1, description="Main", amount=100.00)]
-        mock_sub_transactions_child1 = [Mock(spec=SubTransactionDomain, id=2, description="Child 1", amount=100.00)]
-        mock_sub_transactions_child2 = [Mock(spec=SubTransactionDomain, id=3, description="Child 2", amount=100.00)]
-
         self.mock_transaction_repository.get.return_value = mock_transaction
-        self.mock_transaction_repository.get_children_transactions.return_value = mock_children
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.side_effect = [
-            mock_sub_transactions_child1,  # First child
-            mock_sub_transactions_child2,  # Second child
-            mock_sub_transactions_main,    # Main transaction
-        ]
 
         # Act
         self.use_case.execute(transaction_id, user_id)
 
         # Assert
         self.mock_transaction_repository.get.assert_called_once_with(transaction_id, user_id)
-        self.mock_transaction_repository.get_children_transactions.assert_called_once_with(transaction_id, user_id)
-        
-        # Should delete all children + main transaction (3 total)
-        self.assertEqual(self.mock_transaction_repository.delete.call_count, 3)
-        self.assertEqual(self.mock_sub_transaction_repository.delete_many.call_count, 3)
-
-    def test_delete_transaction_without_sub_transactions(self):
-        """Test deleting a transaction that has no sub-transactions."""
-        # Arrange
-        transaction_id = 1
-        user_id = 1
-
-        mock_transaction = TransactionDomain(
-            id=transaction_id,
-            due_date="2026-03-15",
-            total_amount=150.00,
-            transaction_identifier="Bill without subs",
-            transaction_type="outgoing",
-            user_id=user_id,
-            is_recurrent=False,
+        self.mock_transaction_repository.get_children_transactions.assert_not_called()
+        self.mock_sub_transaction_repository.delete_by_transaction_tree.assert_called_once_with(
+            transaction_id, user_id, include_children=True
         )
+        self.mock_transaction_repository.delete_tree.assert_called_once_with(transaction_id, user_id, include_children=True)
 
-        self.mock_transaction_repository.get.return_value = mock_transaction
-        self.mock_transaction_repository.get_children_transactions.return_value = []
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = []
+
+class TestDeleteTransactionCascade(TestCase):
+    """Test DeleteTransactionUseCase soft-deleting against the database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="delete@example.com", password="testpass123")
+        self.other_user = User.objects.create_user(email="other@example.com", password="testpass123")
+        self.use_case = TransactionsContainer().delete_transaction_use_case()
+
+    def _create_purchase(self, installments: int, user=None) -> Transaction:
+        user = user or self.user
+        main_transaction = Transaction.objects.create(
+            user=user,
+            due_date=date(2026, 1, 10),
+            total_amount=Decimal("50.00"),
+            transaction_identifier="Purchase",
+            is_recurrent=True,
+            recurrence_count=installments,
+        )
+        children = Transaction.objects.bulk_create([
+            Transaction(
+                user=user,
+                due_date=date(2026, 1, 10),
+                total_amount=Decimal("50.00"),
+                transaction_identifier="Purchase",
+                is_recurrent=True,
+                main_transaction=main_transaction,
+            )
+            for _ in range(installments - 1)
+        ])
+        SubTransaction.objects.bulk_create([
+            SubTransaction(transaction=transaction, date=transaction.due_date, description="Purchase", amount=Decimal("50.00"))
+            for transaction in [main_transaction, *children]
+        ])
+        return main_transaction
+
+    def test_cascade_uses_two_updates_whatever_the_installment_count(self):
+        """Test deleting 12 or 60 installments runs a read plus two UPDATE statements and their rollup bucket lookups."""
+        for installments in (12, 60):
+            with self.subTest(installments=installments):
+                # Arrange
+                main_transaction = self._create_purchase(installments)
+
+                # Act
+                with self.assertNumQueries(7):
+                    self.use_case.execute(main_transaction.id, self.user.id)
+
+                # Assert
+                tree = Transaction.objects.filter(id=main_transaction.id) | Transaction.objects.filter(main_transaction=main_transaction)
+                self.assertFalse(tree.filter(deleted_at__isnull=True).exists())
+                self.assertFalse(
+                    SubTransaction.objects.filter(transaction__in=tree, deleted_at__isnull=True).exists()
+                )
+
+    def test_non_recurrent_delete_leaves_other_transactions(self):
+        """Test deleting one transaction does not touch unrelated rows."""
+        # Arrange
+        transaction = Transaction.objects.create(
+            user=self.user,
+            due_date=date(2026, 1, 10),
+            total_amount=Decimal("50.00"),
+            transaction_identifier="Single",
+        )
+        SubTransaction.objects.create(transaction=transaction, date=transaction.due_date, description="Single", amount=Decimal("50.00"))
+        untouched = self._create_purchase(3)
+        other = self._create_purchase(3, user=self.other_user)
 
         # Act
-        self.use_case.execute(transaction_id, user_id)
+        self.use_case.execute(transaction.id, self.user.id)
 
         # Assert
-        self.mock_transaction_repository.get.assert_called_once_with(transaction_id, user_id)
-        self.mock_transaction_repository.delete.assert_called_once_with(transaction_id, user_id)
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.assert_called_once_with(transaction_id, user_id)
-        # delete_many should still be called, just with empty list
-        self.mock_sub_transaction_repository.delete_many.assert_called_once_with([])
-
+        transaction.refresh_from_db()
+        self.assertIsNotNone(transaction.deleted_at)
+        self.assertFalse(SubTransaction.objects.filter(transaction=transaction, deleted_at__isnull=True).exists())
+        self.assertEqual(SubTransaction.objects.filter(deleted_at__isnull=True).count(), 6)
+        self.assertFalse(Transaction.objects.filter(id__in=[untouched.id, other.id], deleted_at__isnull=False).exists())
@@ -0,0 +1,33 @@
+from django.test import TestCase
+
+from modules.transactions.container import TransactionsContainer
+
+
+class TestGetToolsForAIUseCase(TestCase):
+    """Test AI tools are bound per user on top of process-wide collaborators."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.container = TransactionsContainer()
+
+    def test_tools_are_bound_to_the_given_user(self):
+        """Test each call builds tools for its own user."""
+        # Act
+        first = self.container.get_tools_for_ai_use_case().execute(1)
+        second = self.container.get_tools_for_ai_use_case().execute(2)
+
+        # Assert
+        self.assertEqual({tool.user_id for tool in first}, {1})
+        self.assertEqual({tool.user_id for tool in second}, {2})
+        self.assertEqual(len(first), 6)
+
+    def test_stateless_collaborators_are_shared(self):
+        """Test repositories and serializers are built once per container."""
+        # Act
+        first = self.container.get_tools_for_ai_use_case().execute(1)[0]
+        second = self.container.get_tools_for_ai_use_case().execute(2)[0]
+
+        # Assert
+        self.assertIs(first.actor_repository, second.actor_repository)
+        self.assertIs(first.actor_serializer, self.container.actor_serializer())
+        self.assertIsNot(self.container.list_actors_use_case(), self.container.list_actors_use_case())
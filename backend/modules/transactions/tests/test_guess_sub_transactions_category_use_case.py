@@ -0,0 +1,187 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from modules.transactions.container import TransactionsContainer
+from modules.transactions.domains import SubTransactionDomain
+from modules.transactions.models import SubTransaction, Transaction
+from modules.transactions.use_cases.transaction.guess_sub_transactions_category import (
+    GuessSubTransactionsCategoryUseCase,
+)
+
+User = get_user_model()
+
+
+class TestGuessSubTransactionsCategoryUseCase(TestCase):
+    """Test GuessSubTransactionsCategoryUseCase with mocked dependencies."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_sub_transaction_repository = Mock()
+        self.mock_sub_transaction_serializer = Mock()
+        self.mock_sub_transaction_serializer.serialize_for_tool.return_value = "x" * 40
+        self.mock_sub_transaction_serializer.serialize_many_for_tool.side_effect = (
+            lambda sub_transactions: ",".join(str(sub_transaction.id) for sub_transaction in sub_transactions)
+        )
+        self.mock_ai_call_repository = Mock()
+        self.mock_ask_use_case = Mock()
+        self.mock_sub_transaction_repository.update_categories.side_effect = lambda categories, user_id: len(categories)
+
+        self.use_case = GuessSubTransactionsCategoryUseCase(
+            sub_transaction_repository=self.mock_sub_transaction_repository,
+            sub_transaction_serializer=self.mock_sub_transaction_serializer,
+            ai_call_repository=self.mock_ai_call_repository,
+            ask_use_case=self.mock_ask_use_case,
+            versioned_cache_service=Mock(),
+        )
+
+    def _sub_transactions(self, count: int) -> list[SubTransactionDomain]:
+        return [
+            SubTransactionDomain(id=index + 1, date="2026-03-10", description=f"Item {index}", amount=10)
+            for index in range(count)
+        ]
+
+    def _answer_every_chunk(self, category: str = "food"):
+        """Make the LLM answer each chunk with the ids found in its prompt."""
+        def ask(prompt, user_id, response_format=None):
+            return prompt[-1]
+
+        def get(prompt):
+            ids = prompt.split("### 📥 INPUT (Subtransactions):")[1].split("###")[0].strip().split(",")
+            return Mock(is_error=False, response=[{"sub_transaction_id": id, "category": category} for id in ids])
+
+        self.mock_ask_use_case.execute.side_effect = ask
+        self.mock_ai_call_repository.get.side_effect = get
+
+    def test_large_bill_is_split_in_chunks(self):
+        """Test a bill bigger than a chunk is sent in several prompts and applied once."""
+        # Arrange
+        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = self._sub_transactions(200)
+        self._answer_every_chunk()
+
+        # Act
+        with patch("modules.transactions.use_cases.transaction.guess_sub_transactions_category.CHUNK_MAX_ITEMS", 50):
+            result = self.use_case.execute(1, 1)
+
+        # Assert
+        self.assertEqual(self.mock_ask_use_case.execute.call_count, 4)
+        self.mock_sub_transaction_repository.update_categories.assert_called_once()
+        categories, user_id = self.mock_sub_transaction_repository.update_categories.call_args.args
+        self.assertEqual(user_id, 1)
+        self.assertEqual(categories, {index: "food" for index in range(1, 201)})
+        self.mock_sub_transaction_repository.get.assert_not_called()
+        self.mock_sub_transaction_repository.update.assert_not_called()
+        self.assertEqual(result["updated"], 200)
+        self.assertEqual(result["failed_chunks"], 0)
+        self.assertEqual(result["total_chunks"], 4)
+
+    def test_chunks_respect_token_budget(self):
+        """Test chunks are cut when the estimated prompt size would exceed the budget."""
+        # Arrange
+        self.mock_sub_transaction_serializer.serialize_for_tool.return_value = "x" * 4000
+
+        # Act
+        with patch("modules.transactions.use_cases.transaction.guess_sub_transactions_category.CHUNK_MAX_TOKENS", 2500):
+            chunks = self.use_case.split_in_chunks(self._sub_transactions(5))
+
+        # Assert
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+
+    def test_invalid_guesses_are_ignored(self):
+        """Test unknown categories and ids outside the bill are not applied."""
+        # Arrange
+        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = self._sub_transactions(3)
+        self.mock_ai_call_repository.get.return_value = Mock(is_error=False, response=[
+            {"sub_transaction_id": "1", "category": "food"},
+            {"sub_transaction_id": 2, "category": "Alimentação - Mercado"},
+            {"sub_transaction_id": 3, "category": "not a category"},
+            {"sub_transaction_id": 99, "category": "food"},
+            {"category": "food"},
+            "garbage",
+        ])
+
+        # Act
+        result = self.use_case.execute(1, 1)
+
+        # Assert
+        self.mock_sub_transaction_repository.update_categories.assert_called_once_with({1: "food", 2: "food_grocery"}, 1)
+        self.assertEqual(result["updated"], 2)
+
+    def test_partial_chunk_failures_are_reported(self):
+        """Test a failing chunk does not discard the others."""
+        # Arrange
+        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = self._sub_transactions(4)
+        self._answer_every_chunk()
+        get = self.mock_ai_call_repository.get.side_effect
+
+        def get_with_failure(prompt):
+            if prompt.split("### 📥 INPUT (Subtransactions):")[1].strip().startswith("3"):
+                return Mock(is_error=True, response={})
+            return get(prompt)
+
+        self.mock_ai_call_repository.get.side_effect = get_with_failure
+
+        # Act
+        with patch("modules.transactions.use_cases.transaction.guess_sub_transactions_category.CHUNK_MAX_ITEMS", 2):
+            result = self.use_case.execute(1, 1)
+
+        # Assert
+        self.mock_sub_transaction_repository.update_categories.assert_called_once_with({1: "food", 2: "food"}, 1)
+        self.assertEqual(result["updated"], 2)
+        self.assertEqual(result["failed_chunks"], 1)
+        self.assertEqual(result["total_chunks"], 2)
+
+    def test_empty_bill_does_not_call_llm(self):
+        """Test a bill without sub-transactions skips the LLM and the update."""
+        # Arrange
+        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = []
+
+        # Act
+        result = self.use_case.execute(1, 1)
+
+        # Assert
+        self.mock_ask_use_case.execute.assert_not_called()
+        self.mock_sub_transaction_repository.update_categories.assert_not_called()
+        self.assertEqual(result["updated"], 0)
+
+
+class TestSubTransactionRepositoryUpdateCategories(TestCase):
+    """Test SubTransactionRepository.update_categories against the database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="categories@example.com", password="testpass123")
+        self.other_user = User.objects.create_user(email="other@example.com", password="testpass123")
+        self.repository = TransactionsContainer().sub_transaction_repository()
+
+    def _create_bill(self, user, count: int) -> list[SubTransaction]:
+        transaction = Transaction.objects.create(
+            user=user, due_date=date(2026, 3, 10), total_amount=Decimal(count), transaction_identifier="Card",
+        )
+        return SubTransaction.objects.bulk_create([
+            SubTransaction(transaction=transaction, date=transaction.due_date, description=f"Item {index}", amount=Decimal("1.00"))
+            for index in range(count)
+        ])
+
+    def test_applies_categories_in_one_statement_for_the_user_only(self):
+        """Test categories are written with a single UPDATE that ignores other users' rows.
+
+        The extra query looks up the rollup months touched by the update.
+        """
+        # Arrange
+        own = self._create_bill(self.user, 200)
+        other = self._create_bill(self.other_user, 1)
+        categories = {sub_transaction.id: "food" for sub_transaction in own}
+        categories[other[0].id] = "food"
+
+        # Act
+        with self.assertNumQueries(2):
+            updated = self.repository.update_categories(categories, self.user.id)
+
+        # Assert
+        self.assertEqual(updated, 200)
+        self.assertEqual(SubTransaction.objects.filter(category="food").count(), 200)
+        self.assertEqual(SubTransaction.objects.get(id=other[0].id).category, "other")
@@ -0,0 +1,210 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from modules.transactions.container import TransactionsContainer
+from modules.transactions.domains import SubTransactionDomain, TransactionDomain
+from modules.transactions.models import Actor, LedgerRollup, SubTransaction, Transaction
+
+User = get_user_model()
+
+
+class TestLedgerRollupMaintenance(TestCase):
+    """Test repository writes keep the monthly ledger rollup in sync."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="rollup@example.com", password="testpass123")
+        self.actor = Actor.objects.create(user=self.user, name="John Doe")
+        self.container = TransactionsContainer()
+        self.transaction_repository = self.container.transaction_repository()
+        self.sub_transaction_repository = self.container.sub_transaction_repository()
+        self.ledger_rollup_repository = self.container.ledger_rollup_repository()
+
+    def _create_transaction(self, due_date="2026-03-10", total_amount="100.00") -> TransactionDomain:
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.transaction_repository.create(TransactionDomain(
+                due_date=due_date,
+                total_amount=Decimal(total_amount),
+                transaction_identifier="Card",
+                transaction_type=Transaction.TransactionType.OUTGOING,
+                user_id=self.user.id,
+            ))
+
+    def _stats(self, month: date) -> dict:
+        return self.ledger_rollup_repository.stats(self.user.id, month, month + relativedelta(months=1))
+
+    def test_writes_refresh_the_touched_months(self):
+        """Test create, pay, move and delete are reflected in the rollup after commit."""
+        # Act
+        transaction = self._create_transaction()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sub_transaction_repository.create(SubTransactionDomain(
+                description="Item", amount=Decimal("40.00"), transaction=transaction, actor=self.actor,
+            ))
+
+        # Assert
+        self.assertEqual(self._stats(date(2026, 3, 1))["outgoing_total"], Decimal("100.00"))
+        self.assertEqual(self._stats(date(2026, 3, 1))["outgoing_from_actors"], Decimal("40.00"))
+
+        # Act
+        transaction.paid_at = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.transaction_repository.update_paid_at(transaction)
+
+        # Assert
+        self.assertEqual(self._stats(date(2026, 3, 1))["outgoing_total_paid"], Decimal("100.00"))
+
+        # Act
+        transaction.due_date = "2026-04-10"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.transaction_repository.update(transaction)
+
+        # Assert
+        self.assertEqual(self._stats(date(2026, 3, 1))["outgoing_total"], Decimal("0"))
+        self.assertEqual(self._stats(date(2026, 4, 1))["outgoing_total"], Decimal("100.00"))
+        self.assertEqual(self._stats(date(2026, 4, 1))["outgoing_from_actors"], Decimal("40.00"))
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.transaction_repository.delete_tree(transaction.id, self.user.id)
+
+        # Assert
+        self.assertEqual(self._stats(date(2026, 4, 1))["outgoing_total"], Decimal("0"))
+        self.assertEqual(self.ledger_rollup_repository.verify([self.user.id]), [])
+
+    def test_hard_deleting_an_actor_rebuckets_its_sub_transactions(self):
+        """Test the actor's sub-transactions move to the no-actor bucket instead of vanishing."""
+        # Arrange
+        transaction = self._create_transaction()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sub_transaction_repository.create(SubTransactionDomain(
+                description="Item", amount=Decimal("40.00"), transaction=transaction, actor=self.actor,
+            ))
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.actor.delete()
+
+        # Assert
+        self.assertEqual(self.ledger_rollup_repository.verify([self.user.id]), [])
+        self.assertEqual(self._stats(date(2026, 3, 1))["outgoing_from_actors"], Decimal("0"))
+        self.assertEqual(
+            LedgerRollup.objects.get(user=self.user, source=LedgerRollup.Source.SUB_TRANSACTION, actor=None).total_amount,
+            Decimal("40.00"),
+        )
+
+    def test_rollup_is_refreshed_once_per_commit(self):
+        """Test several writes in one transaction schedule a single refresh."""
+        # Act
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.transaction_repository.create_many([
+                TransactionDomain(
+                    due_date=f"2026-{month:02d}-10",
+                    total_amount=Decimal("10.00"),
+                    transaction_identifier="Installment",
+                    transaction_type=Transaction.TransactionType.OUTGOING,
+                    user_id=self.user.id,
+                )
+                for month in range(1, 13)
+            ], hydrate=False)
+
+        self.assertFalse(LedgerRollup.objects.exists())
+        for callback in callbacks:
+            callback()
+
+        # Assert
+        self.assertEqual(LedgerRollup.objects.filter(user=self.user).count(), 12)
+        self.assertEqual(self.ledger_rollup_repository.verify(), [])
+
+
+class TestLedgerRollupStats(TestCase):
+    """Test stats over long periods read monthly buckets instead of raw rows."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="years@example.com", password="testpass123")
+        self.actor = Actor.objects.create(user=self.user, name="John Doe")
+        transactions = Transaction.objects.bulk_create([
+            Transaction(
+                user=self.user,
+                due_date=date(2021, 1, 1) + relativedelta(months=month, days=index),
+                total_amount=Decimal("10.00"),
+                transaction_identifier=f"Transaction {index}",
+            )
+            for month in range(60)
+            for index in range(20)
+        ])
+        SubTransaction.objects.bulk_create([
+            SubTransaction(
+                transaction=transaction, actor=self.actor, date=transaction.due_date, description="Item", amount=Decimal("5.00"),
+            )
+            for transaction in transactions
+        ])
+        self.container = TransactionsContainer()
+        self.container.ledger_rollup_repository().rebuild()
+
+    def test_five_year_stats_scan_one_row_per_month(self):
+        """Test 1200 transactions over five years collapse into 60 transaction buckets."""
+        # Act
+        with self.assertNumQueries(1):
+            result = self.container.transaction_stats_use_case().execute(
+                self.user.id, due_date_start="2021-01-01", due_date_end="2025-12-31",
+            )
+
+        # Assert
+        self.assertEqual(result["outgoing_total"], Decimal("12000.00"))
+        self.assertEqual(result["outgoing_from_actors"], Decimal("6000.00"))
+        self.assertEqual(
+            LedgerRollup.objects.filter(user=self.user, source=LedgerRollup.Source.TRANSACTION).count(), 60,
+        )
+
+    def test_actor_stats_match_raw_rows(self):
+        """Test actor stats from the rollup match the raw aggregation."""
+        # Act
+        with self.assertNumQueries(1):
+            result = self.container.actor_stats_use_case().execute(
+                self.user.id, due_date_start="2021-01-01", due_date_end="2025-12-31",
+            )
+        raw = self.container.actor_stats_use_case().execute(
+            self.user.id, due_date_start="2021-01-02", due_date_end="2025-12-31",
+        )
+
+        # Assert
+        self.assertEqual(result["total_spent"], Decimal("6000.00"))
+        self.assertEqual(raw["total_spent"], Decimal("5995.00"))
+
+
+class TestRebuildLedgerRollupCommand(TestCase):
+    """Test the rebuild_ledger_rollup management command."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="command@example.com", password="testpass123")
+        Transaction.objects.create(
+            user=self.user, due_date=date(2026, 3, 10), total_amount=Decimal("100.00"), transaction_identifier="Card",
+        )
+
+    def test_verify_only_reports_drift(self):
+        """Test verification fails while the rollup is missing rows written behind its back."""
+        # Act / Assert
+        with self.assertRaises(CommandError):
+            call_command("rebuild_ledger_rollup", "--verify-only", stdout=StringIO(), stderr=StringIO())
+
+    def test_rebuild_fixes_drift(self):
+        """Test rebuilding a user brings the rollup back in line with raw rows."""
+        # Act
+        call_command("rebuild_ledger_rollup", "--user", str(self.user.id), stdout=StringIO())
+
+        # Assert
+        rollup = LedgerRollup.objects.get(user=self.user)
+        self.assertEqual(rollup.month, date(2026, 3, 1))
+        self.assertEqual(rollup.total_amount, Decimal("100.00"))
+        self.assertEqual(rollup.count, 1)
+        call_command("rebuild_ledger_rollup", "--verify-only", stdout=StringIO())
@@ -1,8 +1,17 @@
+from datetime import date
+from decimal import Decimal
 from unittest.mock import Mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 
+from modules.transactions.container import TransactionsContainer
 from modules.transactions.use_cases.actor.list import ListActorsUseCase
-from modules.transactions.domains import ActorDomain, SubTransactionDomain
+from modules.transactions.domains import ActorDomain
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+User = get_user_model()
 
 
 class TestListActorsUseCase(TestCase):
@@ -22,120 +31,193 @@ class TestListActorsUseCase(TestCase):
             sub_transaction_serializer=self.mock_sub_transaction_serializer,
         )
 
-    def test_list_actors_with_sub_transactions(self):
-        """Test listing actors with their sub-transactions."""
+    def test_list_actors_with_due_date(self):
+        """Test listing actors aggregates the totals of the month in the repository."""
         # Arrange
         user_id = 1
-        due_date = "2026-03"
-
-        mock_actor1 = Mock(spec=ActorDomain)
-        mock_actor1.id = 1
-        mock_actor2 = Mock(spec=ActorDomain)
-        mock_actor2.id = 2
-
-        mock_sub_transaction1 = Mock(spec=SubTransactionDomain)
-        mock_sub_transaction1.actor = Mock()
-        mock_sub_transaction1.actor.id = 1
+        due_date = "2026-03-01"
 
-        mock_sub_transaction2 = Mock(spec=SubTransactionDomain)
-        mock_sub_transaction2.actor = Mock()
-        mock_sub_transaction2.actor.id = 2
-
-        self.mock_actor_repository.get_all.return_value = [mock_actor1, mock_actor2]
-        self.mock_sub_transaction_repository.get_all.return_value = [mock_sub_transaction1, mock_sub_transaction2]
-        self.mock_actor_serializer.serialize.side_effect = [
-            {"id": 1, "name": "Actor 1"},
-            {"id": 2, "name": "Actor 2"},
-        ]
+        actors = [ActorDomain(id=1, name="Actor 1"), ActorDomain(id=2, name="Actor 2")]
+        self.mock_actor_repository.get_all_with_totals.return_value = actors
+        self.mock_actor_serializer.serialize_many.return_value = [{"id": 1}, {"id": 2}]
 
         # Act
         result = self.use_case.execute(user_id, due_date)
 
         # Assert
-        self.mock_actor_repository.get_all.assert_called_once_with(user_id)
-        self.mock_sub_transaction_repository.get_all.assert_called_once_with(user_id, due_date)
-        self.assertEqual(len(result), 2)
-        mock_actor1.set_sub_transactions.assert_called_once()
-        mock_actor2.set_sub_transactions.assert_called_once()
+        self.mock_actor_repository.get_all_with_totals.assert_called_once_with(user_id, {
+            "transaction__user_id": user_id,
+            "transaction__due_date__gte": date(2026, 3, 1),
+            "transaction__due_date__lt": date(2026, 4, 1),
+        })
+        self.mock_actor_serializer.serialize_many.assert_called_once_with(actors)
+        self.mock_sub_transaction_repository.get_all.assert_not_called()
+        self.assertEqual(result, [{"id": 1}, {"id": 2}])
 
     def test_list_actors_without_due_date(self):
         """Test listing actors without due date filter."""
         # Arrange
         user_id = 1
+        self.mock_actor_repository.get_all_with_totals.return_value = []
 
-        mock_actor = Mock(spec=ActorDomain)
-        mock_actor.id = 1
+        # Act
+        self.use_case.execute(user_id)
 
-        self.mock_actor_repository.get_all.return_value = [mock_actor]
-        self.mock_sub_transaction_repository.get_all.return_value = []
-        self.mock_actor_serializer.serialize.return_value = {"id": 1, "name": "Actor 1"}
+        # Assert
+        self.mock_actor_repository.get_all_with_totals.assert_called_once_with(user_id, {"transaction__user_id": user_id})
+        self.mock_sub_transaction_repository.get_all.assert_not_called()
+
+    def test_list_actors_without_sub_transactions(self):
+        """Test the lightweight listing skips the totals."""
+        # Arrange
+        user_id = 1
+        actors = [ActorDomain(id=1, name="Actor 1")]
+        self.mock_actor_repository.get_all.return_value = actors
 
         # Act
-        result = self.use_case.execute(user_id)
+        self.use_case.execute(user_id, without_sub_transactions=True)
 
         # Assert
         self.mock_actor_repository.get_all.assert_called_once_with(user_id)
-        self.mock_sub_transaction_repository.get_all.assert_called_once_with(user_id, None)
-        self.assertEqual(len(result), 1)
+        self.mock_actor_repository.get_all_with_totals.assert_not_called()
+        self.mock_actor_serializer.serialize_many.assert_called_once_with(actors)
 
-    def test_separe_sub_transactions_by_actor(self):
-        """Test separating sub-transactions by actor."""
-        # Arrange
-        mock_sub_transaction1 = Mock(spec=SubTransactionDomain)
-        mock_sub_transaction1.actor = Mock()
-        mock_sub_transaction1.actor.id = 1
 
-        mock_sub_transaction2 = Mock(spec=SubTransactionDomain)
-        mock_sub_transaction2.actor = Mock()
-        mock_sub_transaction2.actor.id = 1
+class TestActorTotalsAgainstDatabase(TestCase):
+    """Test actor listing and stats aggregate in SQL without changing their output."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="actors@example.com", password="testpass123")
+        self.other_user = User.objects.create_user(email="other@example.com", password="testpass123")
+        self.container = TransactionsContainer()
+
+        self.alice = Actor.objects.create(user=self.user, name="Alice")
+        self.bob = Actor.objects.create(user=self.user, name="Bob")
+        self.carol = Actor.objects.create(user=self.user, name="Carol")
+        Actor.objects.create(user=self.user, name="Deleted", deleted_at=timezone.now())
+        other_actor = Actor.objects.create(user=self.other_user, name="Other")
+
+        march = self._create_transaction(self.user, date(2026, 3, 10))
+        april = self._create_transaction(self.user, date(2026, 4, 10))
+        other = self._create_transaction(self.other_user, date(2026, 3, 10))
+
+        self._create_sub_transaction(march, self.alice, "100.50", paid_at=date(2026, 3, 12))
+        self._create_sub_transaction(march, self.alice, "20.25")
+        self._create_sub_transaction(march, self.bob, "300.00")
+        self._create_sub_transaction(march, self.bob, "50.00", deleted_at=timezone.now())
+        self._create_sub_transaction(march, None, "999.00")
+        self._create_sub_transaction(april, self.alice, "10.00", paid_at=date(2026, 4, 12))
+        self._create_sub_transaction(april, self.carol, "5.00")
+        self._create_sub_transaction(other, other_actor, "777.00")
+        self.container.ledger_rollup_repository().rebuild()
+
+    def _create_transaction(self, user, due_date):
+        return Transaction.objects.create(
+            user=user, due_date=due_date, total_amount=Decimal("1000.00"), transaction_identifier="Card",
+        )
 
-        mock_sub_transaction3 = Mock(spec=SubTransactionDomain)
-        mock_sub_transaction3.actor = Mock()
-        mock_sub_transaction3.actor.id = 2
+    def _create_sub_transaction(self, transaction, actor, amount, **kwargs):
+        return SubTransaction.objects.create(
+            transaction=transaction,
+            actor=actor,
+            date=transaction.due_date,
+            description="Item",
+            amount=Decimal(amount),
+            **kwargs,
+        )
 
-        # Sub-transaction without actor
-        mock_sub_transaction4 = Mock(spec=SubTransactionDomain)
-        mock_sub_transaction4.actor = None
+    def _legacy_list(self, due_date=None):
+        """Per-actor totals computed the way the use case used to, in Python."""
+        actors = self.container.actor_repository().get_all(self.user.id)
+        sub_transactions = self.container.sub_transaction_repository().get_all(self.user.id, due_date)
+        for actor in actors:
+            actor.set_sub_transactions([
+                sub_transaction for sub_transaction in sub_transactions
+                if sub_transaction.actor and sub_transaction.actor.id == actor.id
+            ])
+        return self.container.actor_serializer().serialize_many(actors)
+
+    def test_list_matches_previous_output(self):
+        """Test the aggregated listing returns exactly what the in-memory version did."""
+        for due_date in (None, "2026-03-01", "2026-04-01", "2026-05-01"):
+            with self.subTest(due_date=due_date):
+                # Act
+                with self.assertNumQueries(1):
+                    result = self.container.list_actors_use_case().execute(self.user.id, due_date)
+
+                # Assert
+                self.assertEqual(result, self._legacy_list(due_date))
+
+    def test_list_totals(self):
+        """Test totals, paid totals and remaining values for a month."""
+        # Act
+        result = self.container.list_actors_use_case().execute(self.user.id, "2026-03-01")
 
-        sub_transactions = [mock_sub_transaction1, mock_sub_transaction2, mock_sub_transaction3, mock_sub_transaction4]
+        # Assert
+        by_name = {actor["name"]: actor for actor in result}
+        self.assertEqual(list(by_name), ["Alice", "Bob", "Carol"])
+        self.assertEqual(by_name["Alice"]["total_spent"], Decimal("120.75"))
+        self.assertEqual(by_name["Alice"]["total_spent_paid"], Decimal("100.50"))
+        self.assertEqual(by_name["Alice"]["total_remaining"], Decimal("20.25"))
+        self.assertEqual(by_name["Bob"]["total_spent"], Decimal("300.00"))
+        self.assertEqual(by_name["Bob"]["total_spent_paid"], 0)
+        self.assertEqual(by_name["Carol"]["total_spent"], 0)
+
+    def test_stats_from_one_query(self):
+        """Test actor stats come from the monthly rollup in one query."""
+        # Act
+        with self.assertNumQueries(1):
+            result = self.container.actor_stats_use_case().execute(self.user.id, "2026-03-01")
 
+        # Assert
+        self.assertEqual(result, {
+            "total_spent": Decimal("420.75"),
+            "total_spent_paid": Decimal("100.50"),
+            "biggest_spender": "Bob",
+            "biggest_spender_amount": Decimal("300.00"),
+            "smallest_spender": "Alice",
+            "smallest_spender_amount": Decimal("120.75"),
+            "average_spent": Decimal("210.375"),
+            "active_actors": 2,
+        })
+
+    def test_stats_with_date_range(self):
+        """Test stats over an explicit range only count actors with sub-transactions in it."""
         # Act
-        result = self.use_case.separe_sub_transactions_by_actor(sub_transactions)
+        result = self.container.actor_stats_use_case().execute(
+            self.user.id, due_date_start="2026-04-01", due_date_end="2026-04-30",
+        )
 
         # Assert
-        self.assertEqual(len(result), 2)  # Only 2 actors
-        self.assertEqual(len(result[1]), 2)  # Actor 1 has 2 sub-transactions
-        self.assertEqual(len(result[2]), 1)  # Actor 2 has 1 sub-transaction
+        self.assertEqual(result["total_spent"], Decimal("15.00"))
+        self.assertEqual(result["biggest_spender"], "Alice")
+        self.assertEqual(result["smallest_spender"], "Carol")
 
-    def test_list_actors_filters_actors_without_sub_transactions(self):
-        """Test that actors without sub-transactions in the period are not included."""
+    def test_stats_from_rollup_and_raw_rows_agree(self):
+        """Test a whole-month period and an equivalent day range skip sub-transactions of deleted transactions alike."""
         # Arrange
-        user_id = 1
-        due_date = "2026-03"
-
-        mock_actor1 = Mock(spec=ActorDomain)
-        mock_actor1.id = 1
-        mock_actor2 = Mock(spec=ActorDomain)
-        mock_actor2.id = 2
+        deleted = Transaction.objects.create(
+            user=self.user, due_date=date(2026, 3, 20), total_amount=Decimal("80.00"),
+            transaction_identifier="Deleted", deleted_at=timezone.now(),
+        )
+        self._create_sub_transaction(deleted, self.alice, "80.00")
+        self.container.ledger_rollup_repository().rebuild()
 
-        # Only actor 1 has sub-transactions
-        mock_sub_transaction = Mock(spec=SubTransactionDomain)
-        mock_sub_transaction.actor = Mock()
-        mock_sub_transaction.actor.id = 1
+        # Act
+        from_rollup = self.container.actor_stats_use_case().execute(self.user.id, "2026-03-01")
+        from_raw_rows = self.container.actor_stats_use_case().execute(
+            self.user.id, due_date_start="2026-03-02", due_date_end="2026-03-31",
+        )
 
-        self.mock_actor_repository.get_all.return_value = [mock_actor1, mock_actor2]
-        self.mock_sub_transaction_repository.get_all.return_value = [mock_sub_transaction]
-        self.mock_actor_serializer.serialize.side_effect = [
-            {"id": 1, "name": "Actor 1"},
-            {"id": 2, "name": "Actor 2"}
-        ]
+        # Assert
+        self.assertEqual(from_raw_rows, from_rollup)
+        self.assertEqual(from_rollup["total_spent"], Decimal("420.75"))
 
+    def test_stats_without_sub_transactions(self):
+        """Test stats for a period without sub-transactions."""
         # Act
-        result = self.use_case.execute(user_id, due_date)
+        result = self.container.actor_stats_use_case().execute(self.user.id, "2027-01-01")
 
         # Assert
-        # Both actors should be in the result, but only actor 1 has sub-transactions
-        self.assertEqual(len(result), 2)
-        mock_actor1.set_sub_transactions.assert_called_once_with([mock_sub_transaction])
-        mock_actor2.set_sub_transactions.assert_called_once_with([])
-
+        self.assertTrue(all(value is None for value in result.values()))
@@ -0,0 +1,83 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+User = get_user_model()
+
+
+class TestListTransactionsView(APITestCase):
+    """Test the transaction list endpoint does not issue queries per row."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="list@example.com", password="testpass123")
+        self.client.force_authenticate(self.user)
+        self.actor = Actor.objects.create(user=self.user, name="John Doe")
+
+    def _create_transactions(self, count: int):
+        main_transaction = Transaction.objects.create(
+            user=self.user,
+            due_date=date(2026, 3, 1),
+            total_amount=Decimal("30.00"),
+            transaction_identifier="Main",
+            is_recurrent=True,
+        )
+        transactions = Transaction.objects.bulk_create([
+            Transaction(
+                user=self.user,
+                due_date=date(2026, 3, 1 + index % 28),
+                total_amount=Decimal("30.00"),
+                transaction_identifier=f"Transaction {index}",
+                main_transaction=main_transaction,
+            )
+            for index in range(count - 1)
+        ])
+        SubTransaction.objects.bulk_create([
+            SubTransaction(
+                transaction=transaction,
+                actor=actor,
+                date=transaction.due_date,
+                description="Item",
+                amount=Decimal("10.00"),
+            )
+            for transaction in [main_transaction, *transactions]
+            for actor in (self.actor, self.actor, None)
+        ])
+
+    def test_list_query_count_is_constant(self):
+        """Test listing 1, 100 and 1000 transactions costs the same number of queries.
+
+        The first query is the conditional GET validator.
+        """
+        for count in (1, 100, 1000):
+            with self.subTest(count=count):
+                # Arrange
+                Transaction.objects.all().delete()
+                self._create_transactions(count)
+
+                # Act
+                with self.assertNumQueries(2):
+                    response = self.client.get("/transactions/transactions/", {"due_date__month": 3, "due_date__year": 2026})
+
+                # Assert
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.json()), count)
+                self.assertEqual(response.json()[0]["amount_from_actor"], 20.0)
+
+    def test_list_exposes_main_transaction_id(self):
+        """Test installments keep pointing at their main transaction."""
+        # Arrange
+        self._create_transactions(2)
+        main_transaction = Transaction.objects.get(transaction_identifier="Main")
+
+        # Act
+        response = self.client.get("/transactions/transactions/")
+
+        # Assert
+        by_identifier = {item["transaction_identifier"]: item for item in response.json()}
+        self.assertIsNone(by_identifier["Main"]["main_transaction"])
+        self.assertEqual(by_identifier["Transaction 0"]["main_transaction"], main_transaction.id)
@@ -0,0 +1,122 @@
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from random import Random
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from modules.base.dates import month_filters
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+User = get_user_model()
+
+FIXTURE = Path(__file__).parent / "fixtures" / "month_filter_explain.txt"
+USERS = 50
+MONTHS = 24
+TRANSACTIONS_PER_MONTH = 10
+
+
+def explain(queryset) -> str:
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN {sql}", params)
+        return "\n".join(row[0] for row in cursor.fetchall())
+
+
+class TestMonthFilterPlans(TestCase):
+    """Test month filters compile to range scans on the partial composite indexes.
+
+    The plans captured on the same synthetic data set are kept in
+    fixtures/month_filter_explain.txt for reference.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures."""
+        users = [User.objects.create_user(email=f"plan{index}@example.com", password="testpass123") for index in range(USERS)]
+        cls.user = users[0]
+        cls.actor = Actor.objects.create(user=cls.user, name="John Doe")
+        rows = [
+            Transaction(
+                user=user,
+                due_date=date(2025, 1, 10) + relativedelta(months=month),
+                total_amount=Decimal("10.00"),
+                transaction_identifier="Transaction",
+            )
+            for user in users
+            for month in range(MONTHS)
+            for _ in range(TRANSACTIONS_PER_MONTH)
+        ]
+        # Rows of many users and months end up interleaved on disk, like real imports do.
+        Random(0).shuffle(rows)
+        transactions = Transaction.objects.bulk_create(rows)
+        SubTransaction.objects.bulk_create([
+            SubTransaction(
+                transaction=transaction,
+                actor=cls.actor if transaction.user_id == cls.user.id else None,
+                date=transaction.due_date,
+                description="Item",
+                amount=Decimal("10.00"),
+            )
+            for transaction in transactions
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE transactions_transaction")
+            cursor.execute("ANALYZE transactions_subtransaction")
+
+    def _transactions(self):
+        return Transaction.objects.filter(user_id=self.user.id, deleted_at__isnull=True)
+
+    def test_month_range_uses_user_due_date_index(self):
+        """Test the range filter is an index condition instead of an EXTRACT filter."""
+        # Act
+        before = explain(self._transactions().filter(due_date__month=3, due_date__year=2026))
+        after = explain(self._transactions().filter(**month_filters("due_date", 2026, 3)))
+
+        # Assert
+        self.assertIn("EXTRACT", before)
+        self.assertNotIn("EXTRACT", after)
+        self.assertIn("transaction_user_due_date_idx", after)
+        index_condition = next(line for line in after.splitlines() if "Index Cond" in line)
+        self.assertIn("due_date >=", index_condition)
+        self.assertIn("due_date <", index_condition)
+
+    def test_actor_month_filters_on_due_date_range(self):
+        """Test actor lookups scoped to a month probe a due date range instead of EXTRACT."""
+        # Arrange
+        queryset = SubTransaction.objects.filter(
+            actor_id=self.actor.id,
+            deleted_at__isnull=True,
+            **month_filters("transaction__due_date", 2026, 3),
+        )
+
+        # Act
+        plan = explain(queryset)
+
+        # Assert
+        self.assertNotIn("EXTRACT", plan)
+        self.assertIn("due_date >= '2026-03-01'::date", plan)
+        self.assertIn("due_date < '2026-04-01'::date", plan)
+
+    def test_month_filters(self):
+        """Test month and year ranges are half-open."""
+        self.assertEqual(
+            month_filters("due_date", 2026, 12),
+            {"due_date__gte": date(2026, 12, 1), "due_date__lt": date(2027, 1, 1)},
+        )
+        self.assertEqual(
+            month_filters("due_date", 2026),
+            {"due_date__gte": date(2026, 1, 1), "due_date__lt": date(2027, 1, 1)},
+        )
+
+    def test_fixture_records_before_and_after_plans(self):
+        """Test the captured plans still document the change."""
+        captured = FIXTURE.read_text()
+
+        before, after = captured.split("-- after", 1)
+        self.assertIn("EXTRACT", before)
+        self.assertNotIn("EXTRACT", after)
+        self.assertIn("transaction_user_due_date_idx", after)
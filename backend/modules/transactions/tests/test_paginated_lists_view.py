@@ -0,0 +1,147 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+User = get_user_model()
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    PAGINATION_MAX_PAGE_SIZE=25,
+)
+class TestPaginatedListsView(APITestCase):
+    """Test keyset pagination on the transaction, sub-transaction and actor listings."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="pages@example.com", password="testpass123")
+        self.client.force_authenticate(self.user)
+        self.actors = Actor.objects.bulk_create([
+            Actor(user=self.user, name="Same name" if index % 2 else f"Actor {index:02d}") for index in range(30)
+        ])
+        self.transactions = Transaction.objects.bulk_create([
+            Transaction(
+                user=self.user,
+                due_date=date(2026, 3 + index % 2, 1 + index % 3),
+                total_amount=Decimal("10.00"),
+                transaction_identifier=f"Transaction {index}",
+                transaction_type=Transaction.TransactionType.INCOMING if index % 5 == 0 else Transaction.TransactionType.OUTGOING,
+            )
+            for index in range(60)
+        ])
+        SubTransaction.objects.bulk_create([
+            SubTransaction(
+                transaction=transaction,
+                actor=self.actors[index % 2],
+                date=transaction.due_date,
+                description="Item",
+                amount=Decimal("5.00"),
+            )
+            for index, transaction in enumerate(self.transactions)
+        ])
+
+    def _walk(self, url: str, params: dict) -> list[dict]:
+        results = []
+        cursor = None
+        while True:
+            response = self.client.get(url, {**params, **({"cursor": cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertLessEqual(len(body["results"]), params["page_size"])
+            results.extend(body["results"])
+            cursor = body["next_cursor"]
+            if not cursor:
+                return results
+
+    def test_transaction_pages_cover_filtered_rows_once(self):
+        """Test walking the pages of a filtered month returns every row once, newest first."""
+        # Act
+        results = self._walk("/transactions/transactions/", {
+            "page_size": 7, "due_date__year": 2026, "due_date__month": 3, "transaction_type": "outgoing",
+        })
+
+        # Assert
+        expected = Transaction.objects.filter(
+            due_date__month=3, transaction_type=Transaction.TransactionType.OUTGOING,
+        ).order_by("-due_date", "-id")
+        self.assertEqual([transaction["id"] for transaction in results], [transaction.id for transaction in expected])
+
+    def test_sub_transaction_pages_filter_by_actor(self):
+        """Test sub-transaction pages keep the actor filter across cursors."""
+        # Act
+        results = self._walk("/transactions/sub_transactions/", {"page_size": 4, "actor_id": self.actors[1].id})
+
+        # Assert
+        self.assertEqual(len(results), 30)
+        self.assertEqual(len({sub_transaction["id"] for sub_transaction in results}), 30)
+
+    def test_actor_pages_break_name_ties_by_id(self):
+        """Test actors sharing a name are neither repeated nor skipped between pages."""
+        # Act
+        results = self._walk("/transactions/actors/", {"page_size": 4, "due_date": "2026-03-01"})
+
+        # Assert
+        self.assertEqual(
+            [actor["id"] for actor in results],
+            list(Actor.objects.filter(user=self.user).order_by("name", "id").values_list("id", flat=True)),
+        )
+
+    def test_page_size_is_capped_and_count_is_exact_for_small_results(self):
+        """Test the page size cannot exceed the configured maximum and small counts are exact."""
+        # Act
+        response = self.client.get("/transactions/transactions/", {"page_size": 1000, "with_count": "true"})
+
+        # Assert
+        body = response.json()
+        self.assertEqual(len(body["results"]), 25)
+        self.assertEqual(body["count"], 60)
+        self.assertFalse(body["count_is_estimate"])
+
+    def test_large_counts_come_from_the_planner_estimate(self):
+        """Test counts above the exact threshold are the planner estimate, without a COUNT query."""
+        # Act
+        with patch("modules.base.pagination.EXACT_COUNT_THRESHOLD", 0), self.assertNumQueries(3):
+            response = self.client.get("/transactions/sub_transactions/", {"page_size": 5, "with_count": "1"})
+
+        # Assert
+        self.assertTrue(response.json()["count_is_estimate"])
+        self.assertGreater(response.json()["count"], 0)
+
+    def test_deep_pages_cost_the_same_as_the_first(self):
+        """Test a page deep in the listing runs a single page query like the first one."""
+        # Arrange
+        first = self.client.get("/transactions/transactions/", {"page_size": 25}).json()
+        second = self.client.get("/transactions/transactions/", {"page_size": 25, "cursor": first["next_cursor"]}).json()
+
+        # Act
+        with self.assertNumQueries(2):
+            response = self.client.get("/transactions/transactions/", {"page_size": 25, "cursor": second["next_cursor"]})
+
+        # Assert
+        self.assertEqual(len(response.json()["results"]), 10)
+        self.assertIsNone(response.json()["next_cursor"])
+
+    def test_invalid_cursor_is_rejected(self):
+        """Test malformed cursors and page sizes answer 400."""
+        for params in ({"cursor": "not-a-cursor"}, {"cursor": "WyJ4Il0"}, {"page_size": "zero"}, {"page_size": "0"}):
+            with self.subTest(params=params):
+                # Act
+                response = self.client.get("/transactions/transactions/", params)
+
+                # Assert
+                self.assertEqual(response.status_code, 400)
+
+    def test_listing_without_pagination_params_is_unchanged(self):
+        """Test clients that do not ask for a page still receive the full list."""
+        # Act
+        response = self.client.get("/transactions/transactions/")
+
+        # Assert
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual(len(response.json()), 60)
@@ -0,0 +1,135 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from modules.transactions.models import Actor, SubTransaction, Transaction
+from modules.transactions.use_cases.sub_transaction.pay_many import PayManySubTransactionsUseCase
+
+User = get_user_model()
+
+
+class TestPayManySubTransactionsUseCase(TestCase):
+    """Test PayManySubTransactionsUseCase with mocked dependencies."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_sub_transaction_repository = Mock()
+        self.mock_sub_transaction_repository.update_paid_at_many.return_value = 3
+
+        self.use_case = PayManySubTransactionsUseCase(
+            sub_transaction_repository=self.mock_sub_transaction_repository,
+            versioned_cache_service=Mock(),
+        )
+
+    def test_pay_actor_month(self):
+        """Test paying every sub-transaction of an actor in a month."""
+        # Act
+        result = self.use_case.execute(1, paid=True, actor_id=5, due_date="2026-03-01")
+
+        # Assert
+        args, kwargs = self.mock_sub_transaction_repository.update_paid_at_many.call_args
+        self.assertEqual(args[0], 1)
+        self.assertIsNotNone(args[1])
+        self.assertEqual(kwargs, {"actor_id": 5, "due_date": "2026-03-01", "sub_transaction_ids": None})
+        self.assertEqual(result, {"message": "success", "updated": 3})
+
+    def test_unpay_explicit_ids(self):
+        """Test unpaying an explicit list of sub-transactions."""
+        # Act
+        self.use_case.execute(1, paid=False, sub_transaction_ids=[1, 2, 3])
+
+        # Assert
+        self.mock_sub_transaction_repository.update_paid_at_many.assert_called_once_with(
+            1, None, actor_id=None, due_date=None, sub_transaction_ids=[1, 2, 3],
+        )
+
+    def test_requires_actor_or_ids(self):
+        """Test a bulk toggle without a target is rejected."""
+        with self.assertRaises(ValueError):
+            self.use_case.execute(1, paid=True)
+
+        with self.assertRaises(ValueError):
+            self.use_case.execute(1, paid=True, due_date="2026-03-01", sub_transaction_ids=[1])
+
+        self.mock_sub_transaction_repository.update_paid_at_many.assert_not_called()
+
+
+class TestPayManySubTransactionsView(APITestCase):
+    """Test the bulk payment endpoint against the database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="paymany@example.com", password="testpass123")
+        self.other_user = User.objects.create_user(email="other@example.com", password="testpass123")
+        self.client.force_authenticate(self.user)
+        self.actor = Actor.objects.create(user=self.user, name="Friend")
+
+    def _create_purchases(self, count: int, due_date: date, user=None, actor=None):
+        transaction = Transaction.objects.create(
+            user=user or self.user,
+            due_date=due_date,
+            total_amount=Decimal(count),
+            transaction_identifier="Card",
+        )
+        SubTransaction.objects.bulk_create([
+            SubTransaction(
+                transaction=transaction,
+                actor=actor or self.actor,
+                date=due_date,
+                description=f"Purchase {index}",
+                amount=Decimal("1.00"),
+            )
+            for index in range(count)
+        ])
+        return transaction
+
+    def test_settles_an_actor_month_in_one_statement(self):
+        """Test settling 200 purchases runs a single UPDATE plus the rollup bucket lookup."""
+        # Arrange
+        march = self._create_purchases(200, date(2026, 3, 10))
+        april = self._create_purchases(5, date(2026, 4, 10))
+
+        # Act
+        with self.assertNumQueries(2):
+            response = self.client.post(
+                "/transactions/sub_transactions/pay_many/",
+                {"actor_id": self.actor.id, "due_date": "2026-03-01", "paid": True},
+                format="json",
+            )
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["updated"], 200)
+        self.assertFalse(SubTransaction.objects.filter(transaction=march, paid_at__isnull=True).exists())
+        self.assertFalse(SubTransaction.objects.filter(transaction=april, paid_at__isnull=False).exists())
+
+    def test_unpay_only_touches_own_ids(self):
+        """Test explicit ids from another user are ignored."""
+        # Arrange
+        own = self._create_purchases(2, date(2026, 3, 10))
+        other_actor = Actor.objects.create(user=self.other_user, name="Other")
+        other = self._create_purchases(2, date(2026, 3, 10), user=self.other_user, actor=other_actor)
+        SubTransaction.objects.update(paid_at=date(2026, 3, 15))
+        ids = list(SubTransaction.objects.values_list("id", flat=True))
+
+        # Act
+        response = self.client.post(
+            "/transactions/sub_transactions/pay_many/",
+            {"sub_transaction_ids": ids, "paid": False},
+            format="json",
+        )
+
+        # Assert
+        self.assertEqual(response.json()["updated"], 2)
+        self.assertFalse(SubTransaction.objects.filter(transaction=own, paid_at__isnull=False).exists())
+        self.assertFalse(SubTransaction.objects.filter(transaction=other, paid_at__isnull=True).exists())
+
+    def test_missing_target_returns_400(self):
+        """Test the endpoint rejects a request without actor or ids."""
+        response = self.client.post("/transactions/sub_transactions/pay_many/", {"paid": True}, format="json")
+
+        self.assertEqual(response.status_code, 400)
@@ -14,6 +14,7 @@ class TestPaySubTransactionUseCase(TestCase):
 
         self.use_case = PaySubTransactionUseCase(
             sub_transaction_repository=self.mock_sub_transaction_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_pay_sub_transaction(self):
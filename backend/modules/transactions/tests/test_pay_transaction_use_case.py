@@ -2,7 +2,7 @@ from unittest.mock import Mock
 from django.test import TestCase
 
 from modules.transactions.use_cases.transaction.pay import PayTransactionUseCase
-from modules.transactions.domains import TransactionDomain, SubTransactionDomain
+from modules.transactions.domains import TransactionDomain
 
 
 class TestPayTransactionUseCase(TestCase):
@@ -16,6 +16,7 @@ class TestPayTransactionUseCase(TestCase):
         self.use_case = PayTransactionUseCase(
             transaction_repository=self.mock_transaction_repository,
             sub_transaction_repository=self.mock_sub_transaction_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_pay_transaction_marks_as_paid(self):
@@ -63,21 +64,16 @@ class TestPayTransactionUseCase(TestCase):
         self.assertEqual(result, {"message": "success"})
 
     def test_pay_transaction_with_sub_transactions(self):
-        """Test paying a transaction also pays all sub-transactions."""
+        """Test paying a transaction also pays all sub-transactions in one statement."""
         # Arrange
         transaction_id = 1
         user_id = 1
 
         mock_transaction = Mock(spec=TransactionDomain)
         mock_transaction.is_paying.return_value = True
-
-        mock_sub_transactions = [
-            Mock(spec=SubTransactionDomain),
-            Mock(spec=SubTransactionDomain),
-        ]
+        mock_transaction.paid_at = "2026-03-15"
 
         self.mock_transaction_repository.get.return_value = mock_transaction
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = mock_sub_transactions
 
         # Act
         result = self.use_case.execute(transaction_id, user_id, update_sub_transactions=True)
@@ -86,31 +82,26 @@ class TestPayTransactionUseCase(TestCase):
         self.mock_transaction_repository.get.assert_called_once_with(transaction_id, user_id)
         mock_transaction.pay.assert_called_once()
         self.mock_transaction_repository.update_paid_at.assert_called_once_with(mock_transaction)
-        
-        # Verify sub-transactions were paid
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.assert_called_once_with(transaction_id, user_id)
-        for sub_transaction in mock_sub_transactions:
-            sub_transaction.pay.assert_called_once()
-            sub_transaction.unpay.assert_not_called()
-        self.assertEqual(self.mock_sub_transaction_repository.update_paid_at.call_count, 2)
+
+        # Verify sub-transactions were paid with a single set-based update
+        self.mock_sub_transaction_repository.update_paid_at_by_transaction_id.assert_called_once_with(
+            transaction_id, user_id, "2026-03-15"
+        )
+        self.mock_sub_transaction_repository.get_all_by_transaction_id.assert_not_called()
+        self.mock_sub_transaction_repository.update_paid_at.assert_not_called()
         self.assertEqual(result, {"message": "success"})
 
     def test_unpay_transaction_with_sub_transactions(self):
-        """Test unpaying a transaction also unpays all sub-transactions."""
+        """Test unpaying a transaction also unpays all sub-transactions in one statement."""
         # Arrange
         transaction_id = 1
         user_id = 1
 
         mock_transaction = Mock(spec=TransactionDomain)
         mock_transaction.is_paying.return_value = False
-
-        mock_sub_transactions = [
-            Mock(spec=SubTransactionDomain),
-            Mock(spec=SubTransactionDomain),
-        ]
+        mock_transaction.paid_at = None
 
         self.mock_transaction_repository.get.return_value = mock_transaction
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = mock_sub_transactions
 
         # Act
         result = self.use_case.execute(transaction_id, user_id, update_sub_transactions=True)
@@ -119,13 +110,12 @@ class TestPayTransactionUseCase(TestCase):
         self.mock_transaction_repository.get.assert_called_once_with(transaction_id, user_id)
         mock_transaction.unpay.assert_called_once()
         self.mock_transaction_repository.update_paid_at.assert_called_once_with(mock_transaction)
-        
-        # Verify sub-transactions were unpaid
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.assert_called_once_with(transaction_id, user_id)
-        for sub_transaction in mock_sub_transactions:
-            sub_transaction.unpay.assert_called_once()
-            sub_transaction.pay.assert_not_called()
-        self.assertEqual(self.mock_sub_transaction_repository.update_paid_at.call_count, 2)
+
+        # Verify sub-transactions were unpaid with a single set-based update
+        self.mock_sub_transaction_repository.update_paid_at_by_transaction_id.assert_called_once_with(
+            transaction_id, user_id, None
+        )
+        self.mock_sub_transaction_repository.get_all_by_transaction_id.assert_not_called()
         self.assertEqual(result, {"message": "success"})
 
     def test_pay_transaction_without_updating_sub_transactions(self):
@@ -148,7 +138,7 @@ class TestPayTransactionUseCase(TestCase):
         self.mock_transaction_repository.update_paid_at.assert_called_once_with(mock_transaction)
         
         # Verify sub-transactions were NOT queried or updated
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.assert_not_called()
+        self.mock_sub_transaction_repository.update_paid_at_by_transaction_id.assert_not_called()
         self.mock_sub_transaction_repository.update_paid_at.assert_not_called()
         self.assertEqual(result, {"message": "success"})
 
@@ -0,0 +1,59 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from modules.transactions.container import TransactionsContainer
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+User = get_user_model()
+
+
+class TestSubTransactionRepositoryHydration(TestCase):
+    """Test SubTransactionRepository shares parents across a result set."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="hydration@example.com", password="testpass123")
+        self.actor = Actor.objects.create(user=self.user, name="John Doe")
+        self.transaction = Transaction.objects.create(
+            user=self.user,
+            due_date=date(2026, 3, 10),
+            total_amount=Decimal("300.00"),
+            transaction_identifier="Credit card",
+        )
+        SubTransaction.objects.bulk_create([
+            SubTransaction(
+                transaction=self.transaction,
+                actor=self.actor,
+                date=self.transaction.due_date,
+                description=f"Item {index}",
+                amount=Decimal("1.00"),
+            )
+            for index in range(300)
+        ])
+        self.repository = TransactionsContainer().sub_transaction_repository()
+
+    def test_parents_are_materialized_once_per_result_set(self):
+        """Test every sub-transaction of a bill points at the same domain objects."""
+        # Act
+        with self.assertNumQueries(1):
+            sub_transactions = self.repository.get_all_by_transaction_id(self.transaction.id, self.user.id)
+
+        # Assert
+        self.assertEqual(len(sub_transactions), 300)
+        self.assertEqual(len({id(sub_transaction.transaction) for sub_transaction in sub_transactions}), 1)
+        self.assertEqual(len({id(sub_transaction.actor) for sub_transaction in sub_transactions}), 1)
+        self.assertEqual(sub_transactions[0].transaction.id, self.transaction.id)
+        self.assertEqual(sub_transactions[0].actor.id, self.actor.id)
+
+    def test_result_sets_do_not_share_parents(self):
+        """Test separate calls hydrate their own domain objects."""
+        # Act
+        first = self.repository.get_by_actor_id(self.actor.id, self.user.id)
+        second = self.repository.get_by_actor_id(self.actor.id, self.user.id)
+
+        # Assert
+        self.assertIsNot(first[0].transaction, second[0].transaction)
+        self.assertIsNot(first[0].actor, second[0].actor)
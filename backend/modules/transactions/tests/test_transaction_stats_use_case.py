@@ -0,0 +1,189 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from modules.transactions.container import TransactionsContainer
+from modules.transactions.models import Actor, SubTransaction, Transaction
+
+User = get_user_model()
+
+
+class TestTransactionStatsUseCase(TestCase):
+    """Test TransactionStatsUseCase aggregating in the database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="stats@example.com", password="testpass123")
+        self.other_user = User.objects.create_user(email="other@example.com", password="testpass123")
+        self.actor = Actor.objects.create(user=self.user, name="John Doe")
+        container = TransactionsContainer()
+        self.use_case = container.transaction_stats_use_case()
+        self.ledger_rollup_repository = container.ledger_rollup_repository()
+
+    def _create_transaction(self, user, total_amount, transaction_type="outgoing", due_date="2026-03-10", **kwargs):
+        return Transaction.objects.create(
+            user=user,
+            due_date=due_date,
+            total_amount=Decimal(total_amount),
+            transaction_identifier="Transaction",
+            transaction_type=transaction_type,
+            **kwargs,
+        )
+
+    def _create_sub_transaction(self, transaction, amount, actor=None, **kwargs):
+        return SubTransaction.objects.create(
+            transaction=transaction,
+            actor=actor,
+            date=transaction.due_date,
+            description="Item",
+            amount=Decimal(amount),
+            **kwargs,
+        )
+
+    def test_stats_for_month(self):
+        """Test totals, paid totals and actor totals for a month."""
+        # Arrange
+        self._create_transaction(self.user, "5000.00", "incoming", paid_at=date(2026, 3, 5))
+        self._create_transaction(self.user, "300.00", "incoming")
+        rent = self._create_transaction(self.user, "1000.00", paid_at=date(2026, 3, 10))
+        groceries = self._create_transaction(self.user, "500.00")
+        self._create_sub_transaction(rent, "1000.00")
+        self._create_sub_transaction(groceries, "200.00", actor=self.actor, paid_at=date(2026, 3, 12))
+        self._create_sub_transaction(groceries, "100.00", actor=self.actor)
+        self._create_sub_transaction(groceries, "200.00")
+        self.ledger_rollup_repository.rebuild()
+
+        # Act
+        result = self.use_case.execute(self.user.id, due_date="2026-03-01")
+
+        # Assert
+        self.assertEqual(result, {
+            "incoming_total": Decimal("5300.00"),
+            "outgoing_total": Decimal("1500.00"),
+            "outgoing_total_paid": Decimal("1000.00"),
+            "incoming_total_paid": Decimal("5000.00"),
+            "balance": Decimal("3800.00"),
+            "outgoing_from_actors": Decimal("300.00"),
+            "outgoing_from_actors_paid": Decimal("200.00"),
+        })
+
+    def test_stats_ignores_deleted_rows_other_users_and_other_months(self):
+        """Test soft-deleted rows, other users and other periods are not counted."""
+        # Arrange
+        groceries = self._create_transaction(self.user, "500.00")
+        self._create_sub_transaction(groceries, "200.00", actor=self.actor)
+        self._create_sub_transaction(groceries, "50.00", actor=self.actor, deleted_at=timezone.now())
+
+        deleted = self._create_transaction(self.user, "700.00", deleted_at=timezone.now())
+        self._create_sub_transaction(deleted, "700.00", actor=self.actor)
+
+        next_month = self._create_transaction(self.user, "900.00", due_date="2026-04-10")
+        self._create_sub_transaction(next_month, "900.00", actor=self.actor)
+
+        other_actor = Actor.objects.create(user=self.other_user, name="Other")
+        other = self._create_transaction(self.other_user, "800.00")
+        self._create_sub_transaction(other, "800.00", actor=other_actor)
+        self.ledger_rollup_repository.rebuild()
+
+        # Act
+        result = self.use_case.execute(self.user.id, due_date="2026-03-01")
+
+        # Assert
+        self.assertEqual(result["outgoing_total"], Decimal("500.00"))
+        self.assertEqual(result["outgoing_from_actors"], Decimal("200.00"))
+
+    def test_stats_with_date_range(self):
+        """Test stats filtered by an explicit due date range."""
+        # Arrange
+        self._create_transaction(self.user, "100.00", due_date="2026-01-10")
+        self._create_transaction(self.user, "200.00", due_date="2026-02-10")
+        self._create_transaction(self.user, "400.00", due_date="2026-05-10")
+        self.ledger_rollup_repository.rebuild()
+
+        # Act
+        result = self.use_case.execute(self.user.id, due_date_start="2026-01-01", due_date_end="2026-02-28")
+
+        # Assert
+        self.assertEqual(result["outgoing_total"], Decimal("300.00"))
+        self.assertEqual(result["balance"], Decimal("-300.00"))
+
+    def test_stats_with_partial_month_range_reads_raw_rows(self):
+        """Test a range that does not cover whole months is computed from transactions."""
+        # Arrange
+        self._create_transaction(self.user, "100.00", due_date="2026-01-10")
+        self._create_transaction(self.user, "200.00", due_date="2026-01-20")
+
+        # Act
+        with self.assertNumQueries(2):
+            result = self.use_case.execute(self.user.id, due_date_start="2026-01-15", due_date_end="2026-01-31")
+
+        # Assert
+        self.assertEqual(result["outgoing_total"], Decimal("200.00"))
+
+    def test_stats_with_month_and_date_range_uses_their_intersection(self):
+        """Test a month combined with a range only counts transactions inside both."""
+        # Arrange
+        self._create_transaction(self.user, "100.00", due_date="2026-02-20")
+        self._create_transaction(self.user, "200.00", due_date="2026-03-05")
+        self._create_transaction(self.user, "400.00", due_date="2026-03-20")
+        self._create_transaction(self.user, "800.00", due_date="2026-04-05")
+
+        # Act
+        late_start = self.use_case.execute(
+            self.user.id, due_date="2026-03-01", due_date_start="2026-03-10", due_date_end="2026-04-30",
+        )
+        early_start = self.use_case.execute(
+            self.user.id, due_date="2026-03-01", due_date_start="2026-02-01", due_date_end="2026-03-10",
+        )
+
+        # Assert
+        self.assertEqual(late_start["outgoing_total"], Decimal("400.00"))
+        self.assertEqual(early_start["outgoing_total"], Decimal("200.00"))
+
+    def test_stats_without_transactions_returns_zeros(self):
+        """Test stats for a period without transactions."""
+        # Act
+        result = self.use_case.execute(self.user.id, due_date="2026-03-01")
+
+        # Assert
+        for value in result.values():
+            self.assertEqual(value, Decimal("0"))
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """Test stats run a fixed number of queries whatever the volume is."""
+        for rows in (10, 100, 1000):
+            with self.subTest(rows=rows):
+                # Arrange
+                Transaction.objects.all().delete()
+                transactions = Transaction.objects.bulk_create([
+                    Transaction(
+                        user=self.user,
+                        due_date=date(2026, 3, 1 + index % 28),
+                        total_amount=Decimal("10.00"),
+                        transaction_identifier=f"Transaction {index}",
+                        transaction_type="outgoing",
+                    )
+                    for index in range(rows)
+                ])
+                SubTransaction.objects.bulk_create([
+                    SubTransaction(
+                        transaction=transaction,
+                        actor=self.actor,
+                        date=transaction.due_date,
+                        description="Item",
+                        amount=Decimal("10.00"),
+                    )
+                    for transaction in transactions
+                ])
+                self.ledger_rollup_repository.rebuild()
+
+                # Act
+                with self.assertNumQueries(1):
+                    result = self.use_case.execute(self.user.id, due_date="2026-03-01")
+
+                # Assert
+                self.assertEqual(result["outgoing_total"], Decimal("10.00") * rows)
+                self.assertEqual(result["outgoing_from_actors"], Decimal("10.00") * rows)
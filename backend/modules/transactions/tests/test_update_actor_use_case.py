@@ -16,6 +16,7 @@ class TestUpdateActorUseCase(TestCase):
         self.use_case = UpdateActorUseCase(
             actor_repository=self.mock_actor_repository,
             actor_serializer=self.mock_actor_serializer,
+            versioned_cache_service=Mock(),
         )
 
     def test_update_actor(self):
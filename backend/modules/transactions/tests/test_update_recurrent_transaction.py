@@ -0,0 +1,94 @@
+from datetime import date
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from modules.transactions.container import TransactionsContainer
+from modules.transactions.models import SubTransaction, Transaction
+
+User = get_user_model()
+
+
+class TestUpdateRecurrentTransaction(TestCase):
+    """Test UpdateTransactionUseCase writing recurrent edits against the database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(email="recurrent@example.com", password="testpass123")
+        self.use_case = TransactionsContainer().update_transaction_use_case()
+
+    def _create_financing(self, installments: int) -> Transaction:
+        main_transaction = Transaction.objects.create(
+            user=self.user,
+            due_date=date(2026, 1, 10),
+            total_amount=Decimal("100.00"),
+            transaction_identifier="Financing",
+            is_recurrent=True,
+            recurrence_count=installments,
+        )
+        children = Transaction.objects.bulk_create([
+            Transaction(
+                user=self.user,
+                due_date=date(2026, 1, 10) + relativedelta(months=index),
+                total_amount=Decimal("100.00"),
+                transaction_identifier="Financing",
+                is_recurrent=True,
+                main_transaction=main_transaction,
+                installment_number=index + 1,
+            )
+            for index in range(installments)
+        ])
+        SubTransaction.objects.bulk_create([
+            SubTransaction(transaction=transaction, date=transaction.due_date, description="Financing", amount=Decimal("100.00"))
+            for transaction in [main_transaction, *children]
+        ])
+        return main_transaction
+
+    def _update(self, main_transaction: Transaction):
+        return self.use_case.execute(main_transaction.id, {
+            "user_id": self.user.id,
+            "due_date": "2026-02-05",
+            "total_amount": "120.00",
+            "transaction_identifier": "Car financing",
+        })
+
+    def test_query_count_does_not_depend_on_installments(self):
+        """Test editing 12 or 48 installments costs the same number of queries."""
+        query_counts = []
+        for installments in (12, 48):
+            with self.subTest(installments=installments):
+                # Arrange
+                main_transaction = self._create_financing(installments)
+
+                # Act
+                with CaptureQueriesContext(connection) as context:
+                    self._update(main_transaction)
+                query_counts.append(len(context.captured_queries))
+
+        # Assert
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_children_and_single_sub_transactions_are_updated(self):
+        """Test every installment gets its new due date, amount and synced sub-transaction."""
+        # Arrange
+        main_transaction = self._create_financing(3)
+
+        # Act
+        self._update(main_transaction)
+
+        # Assert
+        children = Transaction.objects.filter(main_transaction=main_transaction).order_by("id")
+        self.assertEqual(
+            [child.due_date for child in children],
+            [date(2026, 2, 5), date(2026, 3, 5), date(2026, 4, 5)],
+        )
+        self.assertTrue(all(child.total_amount == Decimal("120.00") for child in children))
+        sub_transactions = SubTransaction.objects.filter(transaction__in=[main_transaction, *children])
+        self.assertEqual(sub_transactions.count(), 4)
+        for sub_transaction in sub_transactions:
+            self.assertEqual(sub_transaction.description, "Car financing")
+            self.assertEqual(sub_transaction.amount, Decimal("120.00"))
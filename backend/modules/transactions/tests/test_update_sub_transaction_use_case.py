@@ -18,6 +18,7 @@ class TestUpdateSubTransactionUseCase(TestCase):
             sub_transaction_repository=self.mock_sub_transaction_repository,
             sub_transaction_serializer=self.mock_sub_transaction_serializer,
             actor_repository=self.mock_actor_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_update_sub_transaction_simple(self):
@@ -18,6 +18,7 @@ class TestUpdateTransactionUseCase(TestCase):
             transaction_repository=self.mock_transaction_repository,
             transaction_serializer=self.mock_transaction_serializer,
             sub_transaction_repository=self.mock_sub_transaction_repository,
+            versioned_cache_service=Mock(),
         )
 
     def test_update_simple_transaction(self):
@@ -54,7 +55,7 @@ class TestUpdateTransactionUseCase(TestCase):
 
         self.mock_transaction_repository.get.return_value = mock_transaction
         self.mock_transaction_repository.get_children_transactions.return_value = []
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = []
+        self.mock_sub_transaction_repository.get_all_by_transaction_ids.return_value = []
         self.mock_transaction_repository.update.return_value = updated_mock_transaction
         self.mock_transaction_serializer.serialize.return_value = {"id": 1, "transaction_identifier": "Updated Bill"}
 
@@ -95,6 +96,7 @@ class TestUpdateTransactionUseCase(TestCase):
             description="Original Bill",
             amount=150.00,
             installment_info="1/1",
+            transaction=mock_transaction,
         )
 
         updated_mock_transaction = TransactionDomain(
@@ -109,7 +111,7 @@ class TestUpdateTransactionUseCase(TestCase):
 
         self.mock_transaction_repository.get.return_value = mock_transaction
         self.mock_transaction_repository.get_children_transactions.return_value = []
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = [mock_sub_transaction]
+        self.mock_sub_transaction_repository.get_all_by_transaction_ids.return_value = [mock_sub_transaction]
         self.mock_transaction_repository.update.return_value = updated_mock_transaction
         self.mock_transaction_serializer.serialize.return_value = {"id": 1, "transaction_identifier": "Updated Bill"}
 
@@ -118,8 +120,11 @@ class TestUpdateTransactionUseCase(TestCase):
 
         # Assert
         self.mock_transaction_repository.get.assert_called_once_with(transaction_id, data["user_id"])
-        # Sub-transaction should be updated
-        self.assertEqual(self.mock_sub_transaction_repository.get_all_by_transaction_id.call_count, 2)
+        # Sub-transaction should be synced with the transaction in one batch
+        self.mock_sub_transaction_repository.get_all_by_transaction_ids.assert_called_once_with([transaction_id])
+        self.mock_sub_transaction_repository.update_many.assert_called_once_with([mock_sub_transaction])
+        self.assertEqual(mock_sub_transaction.description, "Updated Bill")
+        self.assertEqual(mock_sub_transaction.amount, 200)
         self.mock_transaction_repository.update.assert_called_once()
         self.assertEqual(result, {"id": 1, "transaction_identifier": "Updated Bill"})
 
@@ -154,7 +159,7 @@ class TestUpdateTransactionUseCase(TestCase):
 
         self.mock_transaction_repository.get.return_value = mock_transaction
         self.mock_transaction_repository.get_children_transactions.return_value = mock_children
-        self.mock_sub_transaction_repository.get_all_by_transaction_id.return_value = []
+        self.mock_sub_transaction_repository.get_all_by_transaction_ids.return_value = []
         self.mock_transaction_repository.update_many.return_value = mock_children
         self.mock_transaction_repository.update.return_value = mock_transaction
         self.mock_transaction_serializer.serialize.return_value = {"id": 1, "transaction_identifier": "Updated Subscription"}
@@ -166,6 +171,10 @@ class TestUpdateTransactionUseCase(TestCase):
         self.mock_transaction_repository.get.assert_called_once_with(transaction_id, data["user_id"])
         self.mock_transaction_repository.get_children_transactions.assert_called()
         self.mock_transaction_repository.update_many.assert_called_once_with(mock_children)
+        self.mock_transaction_repository.get_children_transactions.assert_called_once_with(transaction_id, data["user_id"])
+        self.assertEqual([child.due_date for child in mock_children], ["2026-03-20", "2026-04-20"])
+        self.mock_sub_transaction_repository.get_all_by_transaction_ids.assert_called_once_with([1, 2, 3])
+        self.mock_sub_transaction_repository.update_many.assert_not_called()
         self.assertEqual(result, {"id": 1, "transaction_identifier": "Updated Subscription"})
 
     def test_calculate_next_due_date(self):
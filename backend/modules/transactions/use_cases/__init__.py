@@ -27,6 +27,7 @@ from modules.transactions.use_cases.sub_transaction import (
     ListSubTransactionsUseCase,
     UpdateSubTransactionUseCase,
     PaySubTransactionUseCase,
+    PayManySubTransactionsUseCase,
 )
 from modules.transactions.use_cases.tools import (
     GetActorsToolUseCase,
@@ -62,6 +63,7 @@ __all__ = [
     "ListSubTransactionsUseCase",
     "UpdateSubTransactionUseCase",
     "PaySubTransactionUseCase",
+    "PayManySubTransactionsUseCase",
     "GetActorsToolUseCase",
     "GetActorDetailToolUseCase",
     "GetActorStatsToolUseCase",
@@ -1,8 +1,9 @@
+from modules.base.dates import month_filters_from_date
+from modules.base.pagination import PageRequest
 from modules.transactions.repositories.actor import ActorRepository
 from modules.transactions.serializers.actor import ActorSerializer
 from modules.transactions.repositories.sub_transaction import SubTransactionRepository
 from modules.transactions.serializers.sub_transaction import SubTransactionSerializer
-from modules.transactions.domains.actor import ActorDomain
 
 
 class ListActorsUseCase:
@@ -18,32 +19,28 @@ class ListActorsUseCase:
         self.sub_transaction_repository = sub_transaction_repository
         self.sub_transaction_serializer = sub_transaction_serializer
 
-    def execute(self, user_id: int, due_date: str = None, without_sub_transactions: bool = False) -> list[dict]:
-        actors = self.actor_repository.get_all(user_id)
+    def execute(
+        self,
+        user_id: int,
+        due_date: str = None,
+        without_sub_transactions: bool = False,
+        page_request: PageRequest = None,
+    ) -> list[dict] | dict:
         if without_sub_transactions:
+            if page_request:
+                page = self.actor_repository.get_page(user_id, page_request)
+                return page.with_items(self.actor_serializer.serialize_many(page.items)).as_dict()
+
+            actors = self.actor_repository.get_all(user_id)
             return self.actor_serializer.serialize_many(actors)
 
-        sub_transactions = self.sub_transaction_repository.get_all(user_id, due_date)
-        separed_sub_transactions = self.separe_sub_transactions_by_actor(sub_transactions)
+        filters = {"transaction__user_id": user_id}
+        if due_date:
+            filters.update(month_filters_from_date("transaction__due_date", due_date))
+
+        if page_request:
+            page = self.actor_repository.get_page_with_totals(user_id, page_request, filters)
+            return page.with_items(self.actor_serializer.serialize_many(page.items)).as_dict()
 
-        return [
-            self.get_actor_data(actor, separed_sub_transactions.get(actor.id, []))
-            for actor in actors
-        ]
-    
-    def separe_sub_transactions_by_actor(self, sub_transactions: list["SubTransactionDomain"]) -> dict[int, list["SubTransactionDomain"]]:
-        separed_sub_transactions = {}
-        for sub_transaction in sub_transactions:
-            if not sub_transaction.actor:
-                continue
-            
-            if sub_transaction.actor.id in separed_sub_transactions:
-                separed_sub_transactions[sub_transaction.actor.id].append(sub_transaction)
-            else:
-                separed_sub_transactions[sub_transaction.actor.id] = [sub_transaction]
-        return separed_sub_transactions
-    
-    def get_actor_data(self, actor: ActorDomain, sub_transactions: list["SubTransactionDomain"]) -> dict:
-        actor.set_sub_transactions(sub_transactions)
-        actor_data = self.actor_serializer.serialize(actor)
-        return actor_data
+        actors = self.actor_repository.get_all_with_totals(user_id, filters)
+        return self.actor_serializer.serialize_many(actors)
@@ -1,3 +1,4 @@
+from modules.base.dates import month_filters_from_date, months_for_period
 from modules.transactions.repositories import ActorRepository, SubTransactionRepository
 from modules.transactions.domains import ActorDomain
 
@@ -8,27 +9,26 @@ class ActorStatsUseCase:
         self.sub_transaction_repository = sub_transaction_repository
 
     def execute(self, user_id: int, due_date: str = None, due_date_start: str = None, due_date_end: str = None) -> dict:
+        months = months_for_period(due_date) if due_date else months_for_period(None, due_date_start, due_date_end)
+        if months is not None:
+            actors = self.actor_repository.get_all_with_rollup_totals(user_id, *months)
+            return self.calculate_stats([actor for actor in actors if actor.has_sub_transactions()])
+
+        # Same rows as the rollup: sub-transactions of soft-deleted transactions are left out.
         filters = {
-            "transaction__user_id": user_id
+            "transaction__user_id": user_id,
+            "transaction__deleted_at__isnull": True,
         }
 
         if due_date:
-            filters["transaction__due_date__month"] = due_date.split("-")[1]
-            filters["transaction__due_date__year"] = due_date.split("-")[0]
+            filters.update(month_filters_from_date("transaction__due_date", due_date))
 
         elif due_date_start and due_date_end:
             filters["transaction__due_date__gte"] = due_date_start
             filters["transaction__due_date__lte"] = due_date_end
 
-        actors = self.actor_repository.get_all(user_id)
-        sub_transactions = self.sub_transaction_repository.filter_by_actor_ids([actor.id for actor in actors], filters)
-
-        actors_with_sub_transactions = []
-        for actor in actors:
-            actor_sub_transactions = [sub_transaction for sub_transaction in sub_transactions if sub_transaction.actor.id == actor.id]
-            if actor_sub_transactions:
-                actor.set_sub_transactions([sub_transaction for sub_transaction in sub_transactions if sub_transaction.actor.id == actor.id])
-                actors_with_sub_transactions.append(actor)
+        actors = self.actor_repository.get_all_with_totals(user_id, filters)
+        actors_with_sub_transactions = [actor for actor in actors if actor.has_sub_transactions()]
 
         return self.calculate_stats(actors_with_sub_transactions)
     
@@ -1,14 +1,17 @@
+from modules.base.services import VersionedCacheService
 from modules.transactions.repositories.actor import ActorRepository
 from modules.transactions.serializers.actor import ActorSerializer
 
 
 class UpdateActorUseCase:
-    def __init__(self, actor_repository: ActorRepository, actor_serializer: ActorSerializer):
+    def __init__(self, actor_repository: ActorRepository, actor_serializer: ActorSerializer, versioned_cache_service: VersionedCacheService):
         self.actor_repository = actor_repository
         self.actor_serializer = actor_serializer
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, actor_id: str, name: str, user_id: int) -> dict:
         actor = self.actor_repository.get(actor_id, user_id)
         actor.update(name)
         updated_actor = self.actor_repository.update(actor)
+        self.versioned_cache_service.bump(user_id)
         return self.actor_serializer.serialize(updated_actor)
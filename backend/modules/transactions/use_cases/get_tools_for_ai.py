@@ -1,4 +1,4 @@
-import functools
+from collections.abc import Callable
 
 from google.genai.types import ToolListUnion
 
@@ -20,14 +20,20 @@ class ToolInterface:
 
     
 class GetToolsForAIUseCase:
+    """Builds the AI tools for one user.
+
+    Each argument is a provider of a tool use case; tools keep the user id because
+    the model calls them with its own arguments only.
+    """
+
     def __init__(
         self,
-        get_actors_tool_use_case: GetActorsToolUseCase,
-        get_actor_detail_tool_use_case: GetActorDetailToolUseCase,
-        get_actor_stats_tool_use_case: GetActorStatsToolUseCase,
-        get_sub_transactions_from_transaction_tool_use_case: GetSubTransactionsFromTransactionToolUseCase,
-        get_user_general_stats_tool_use_case: GetUserGeneralStatsToolUseCase,
-        get_transactions_tool_use_case: GetTransactionsToolUseCase,
+        get_actors_tool_use_case: Callable[..., GetActorsToolUseCase],
+        get_actor_detail_tool_use_case: Callable[..., GetActorDetailToolUseCase],
+        get_actor_stats_tool_use_case: Callable[..., GetActorStatsToolUseCase],
+        get_sub_transactions_from_transaction_tool_use_case: Callable[..., GetSubTransactionsFromTransactionToolUseCase],
+        get_user_general_stats_tool_use_case: Callable[..., GetUserGeneralStatsToolUseCase],
+        get_transactions_tool_use_case: Callable[..., GetTransactionsToolUseCase],
     ):
         self.get_actors_tool_use_case = get_actors_tool_use_case
         self.get_actor_detail_tool_use_case = get_actor_detail_tool_use_case
@@ -36,12 +42,12 @@ class GetToolsForAIUseCase:
         self.get_user_general_stats_tool_use_case = get_user_general_stats_tool_use_case
         self.get_transactions_tool_use_case = get_transactions_tool_use_case
 
-    def execute(self) -> list[dict]:
+    def execute(self, user_id: int) -> list[ToolInterface]:
         return [
-            self.get_actors_tool_use_case,
-            self.get_actor_detail_tool_use_case,
-            self.get_actor_stats_tool_use_case,
-            self.get_sub_transactions_from_transaction_tool_use_case,
-            self.get_user_general_stats_tool_use_case,
-            self.get_transactions_tool_use_case,
+            self.get_actors_tool_use_case(user_id=user_id),
+            self.get_actor_detail_tool_use_case(user_id=user_id),
+            self.get_actor_stats_tool_use_case(user_id=user_id),
+            self.get_sub_transactions_from_transaction_tool_use_case(user_id=user_id),
+            self.get_user_general_stats_tool_use_case(user_id=user_id),
+            self.get_transactions_tool_use_case(user_id=user_id),
         ]
@@ -3,6 +3,7 @@ from modules.transactions.use_cases.sub_transaction.delete import DeleteSubTrans
 from modules.transactions.use_cases.sub_transaction.get import GetSubTransactionUseCase
 from modules.transactions.use_cases.sub_transaction.list import ListSubTransactionsUseCase
 from modules.transactions.use_cases.sub_transaction.pay import PaySubTransactionUseCase
+from modules.transactions.use_cases.sub_transaction.pay_many import PayManySubTransactionsUseCase
 from modules.transactions.use_cases.sub_transaction.update import UpdateSubTransactionUseCase
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "ListSubTransactionsUseCase",
     "UpdateSubTransactionUseCase",
     "PaySubTransactionUseCase",
+    "PayManySubTransactionsUseCase",
 ]
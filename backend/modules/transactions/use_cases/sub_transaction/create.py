@@ -1,3 +1,4 @@
+from modules.base.services import VersionedCacheService
 from modules.transactions.factories import SubTransactionFactory
 from modules.transactions.repositories import SubTransactionRepository, TransactionRepository, ActorRepository
 from modules.transactions.serializers import SubTransactionSerializer
@@ -11,12 +12,14 @@ class CreateSubTransactionUseCase:
         sub_transaction_repository: SubTransactionRepository,
         sub_transaction_serializer: SubTransactionSerializer,
         sub_transaction_factory: SubTransactionFactory,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.transaction_repository = transaction_repository
         self.actor_repository = actor_repository
         self.sub_transaction_repository = sub_transaction_repository
         self.sub_transaction_serializer = sub_transaction_serializer
         self.sub_transaction_factory = sub_transaction_factory
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, data: dict, user_id: int) -> dict:
         transaction = self.transaction_repository.get(data["transaction_id"], user_id)
@@ -24,4 +27,5 @@ class CreateSubTransactionUseCase:
         sub_transaction = self.sub_transaction_factory.build(data, transaction, actor)
 
         created_sub_transaction = self.sub_transaction_repository.create(sub_transaction)
+        self.versioned_cache_service.bump(user_id)
         return self.sub_transaction_serializer.serialize(created_sub_transaction)
@@ -1,10 +1,13 @@
+from modules.base.services import VersionedCacheService
 from modules.transactions.repositories import SubTransactionRepository
 
 
 class DeleteSubTransactionUseCase:
-    def __init__(self, sub_transaction_repository: SubTransactionRepository):
+    def __init__(self, sub_transaction_repository: SubTransactionRepository, versioned_cache_service: VersionedCacheService):
         self.sub_transaction_repository = sub_transaction_repository
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, sub_transaction_id: str, user_id: int):
         sub_transaction = self.sub_transaction_repository.get(sub_transaction_id, user_id)
         self.sub_transaction_repository.delete(sub_transaction.id)
+        self.versioned_cache_service.bump(user_id)
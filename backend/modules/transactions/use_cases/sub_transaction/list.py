@@ -1,3 +1,4 @@
+from modules.base.pagination import PageRequest
 from modules.transactions.repositories import SubTransactionRepository
 from modules.transactions.serializers import SubTransactionSerializer
 
@@ -7,6 +8,10 @@ class ListSubTransactionsUseCase:
         self.sub_transaction_repository = sub_transaction_repository
         self.sub_transaction_serializer = sub_transaction_serializer
 
-    def execute(self, user_id: int, due_date: str = None, actor_id: str = None) -> list[dict]:
+    def execute(self, user_id: int, due_date: str = None, actor_id: str = None, page_request: PageRequest = None) -> list[dict] | dict:
+        if page_request:
+            page = self.sub_transaction_repository.get_page(user_id, page_request, due_date, actor_id)
+            return page.with_items([self.sub_transaction_serializer.serialize(sub_transaction) for sub_transaction in page.items]).as_dict()
+
         sub_transactions = self.sub_transaction_repository.get_all(user_id, due_date, actor_id)
         return [self.sub_transaction_serializer.serialize(sub_transaction) for sub_transaction in sub_transactions]
@@ -1,11 +1,13 @@
 from django.utils import timezone
 
+from modules.base.services import VersionedCacheService
 from modules.transactions.repositories import SubTransactionRepository
 
 
 class PaySubTransactionUseCase:
-    def __init__(self, sub_transaction_repository: SubTransactionRepository):
+    def __init__(self, sub_transaction_repository: SubTransactionRepository, versioned_cache_service: VersionedCacheService):
         self.sub_transaction_repository = sub_transaction_repository
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, sub_transaction_id: int, user_id: int):
         sub_transaction = self.sub_transaction_repository.get(sub_transaction_id, user_id)
@@ -17,5 +19,6 @@ class PaySubTransactionUseCase:
             sub_transaction.unpay()
         
         self.sub_transaction_repository.update_paid_at(sub_transaction)
+        self.versioned_cache_service.bump(user_id)
 
         return {"message": "success"}
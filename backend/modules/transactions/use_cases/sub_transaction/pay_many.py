@@ -0,0 +1,36 @@
+from django.utils import timezone
+
+from modules.base.services import VersionedCacheService
+from modules.transactions.repositories import SubTransactionRepository
+
+
+class PayManySubTransactionsUseCase:
+    def __init__(self, sub_transaction_repository: SubTransactionRepository, versioned_cache_service: VersionedCacheService):
+        self.sub_transaction_repository = sub_transaction_repository
+        self.versioned_cache_service = versioned_cache_service
+
+    def execute(
+        self,
+        user_id: int,
+        paid: bool = True,
+        actor_id: str = None,
+        due_date: str = None,
+        sub_transaction_ids: list[int] = None,
+    ) -> dict:
+        if not actor_id and sub_transaction_ids is None:
+            raise ValueError("actor_id or sub_transaction_ids is required")
+
+        if due_date and not actor_id:
+            raise ValueError("due_date requires actor_id")
+
+        paid_at = timezone.now().date() if paid else None
+        updated = self.sub_transaction_repository.update_paid_at_many(
+            user_id,
+            paid_at,
+            actor_id=actor_id,
+            due_date=due_date,
+            sub_transaction_ids=sub_transaction_ids,
+        )
+        self.versioned_cache_service.bump(user_id)
+
+        return {"message": "success", "updated": updated}
@@ -1,3 +1,4 @@
+from modules.base.services import VersionedCacheService
 from modules.transactions.repositories import SubTransactionRepository, ActorRepository
 from modules.transactions.serializers import SubTransactionSerializer
 from modules.transactions.domains import SubTransactionDomain, ActorDomain
@@ -8,11 +9,13 @@ class UpdateSubTransactionUseCase:
         self, 
         sub_transaction_repository: SubTransactionRepository, 
         sub_transaction_serializer: SubTransactionSerializer, 
-        actor_repository: ActorRepository
+        actor_repository: ActorRepository,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.sub_transaction_repository = sub_transaction_repository
         self.sub_transaction_serializer = sub_transaction_serializer
         self.actor_repository = actor_repository
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, id: int, data: dict, user_id: int) -> dict:
         # Handle actor field: convert to actor_id, including null (remove actor)
@@ -36,6 +39,7 @@ class UpdateSubTransactionUseCase:
         sub_transaction.update(data)
         
         updated_sub_transaction = self.sub_transaction_repository.update(sub_transaction)
+        self.versioned_cache_service.bump(user_id)
         return self.sub_transaction_serializer.serialize(updated_sub_transaction)
     
     def give_part_to_actor(self, sub_transaction: SubTransactionDomain, data: dict, actor: ActorDomain) -> dict:
@@ -407,6 +407,7 @@ class TestGetUserGeneralStatsToolIntegration(TestCase):
 
         # Initialize the use case from container
         container = TransactionsContainer()
+        container.ledger_rollup_repository().rebuild()
         self.use_case = container.get_user_general_stats_tool_use_case(user_id=self.user.id)
 
     def test_get_user_general_stats(self):
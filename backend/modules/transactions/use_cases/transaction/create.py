@@ -1,6 +1,8 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from django.db.transaction import atomic
 
+from modules.base.services import VersionedCacheService
 from modules.transactions.factories import TransactionFactory, SubTransactionFactory
 from modules.transactions.repositories import TransactionRepository, SubTransactionRepository
 from modules.transactions.serializers import TransactionSerializer
@@ -15,14 +17,18 @@ class CreateTransactionUseCase:
         transaction_factory: TransactionFactory,
         sub_transaction_factory: SubTransactionFactory,
         sub_transaction_repository: SubTransactionRepository,
+        versioned_cache_service: VersionedCacheService,
     ):
         self.transaction_repository = transaction_repository
         self.transaction_serializer = transaction_serializer
         self.transaction_factory = transaction_factory
         self.sub_transaction_factory = sub_transaction_factory
         self.sub_transaction_repository = sub_transaction_repository
+        self.versioned_cache_service = versioned_cache_service
 
+    @atomic
     def execute(self, data: dict) -> dict:
+        self.versioned_cache_service.bump(data["user_id"])
         if data.get("is_recurrent", False):
             return self.execute_if_recurrent(data)
         return self.execute_if_not_recurrent(data)
@@ -36,25 +42,35 @@ class CreateTransactionUseCase:
     
     def execute_if_recurrent(self, data: dict) -> dict:
         recurrence_count = data.get("recurrence_count")
-        first_created_transaction = None
-        for i in range(recurrence_count):
-            data["installment_number"] = i + 1
-            if i > 0:
-                data["main_transaction"] = first_created_transaction.id
-                
-            transaction = self.transaction_factory.build(data)
-            created_transaction = self.transaction_repository.create(transaction)
-            self.create_sub_transaction(created_transaction, installment=f"{i+1}/{recurrence_count}")
-            data["due_date"] = self.calculate_next_due_date(data["due_date"])
-            if i == 0:
-                first_created_transaction = created_transaction
+        first_due_date = data["due_date"]
+
+        first_transaction = self.transaction_factory.build({**data, "installment_number": 1})
+        first_created_transaction = self.transaction_repository.create(first_transaction)
+
+        children_transactions = [
+            self.transaction_factory.build({
+                **data,
+                "installment_number": i + 1,
+                "main_transaction": first_created_transaction.id,
+                "due_date": self.calculate_next_due_date(first_due_date, months=i),
+            })
+            for i in range(1, recurrence_count)
+        ]
+        if children_transactions:
+            children_transactions = self.transaction_repository.create_many(children_transactions, hydrate=False)
+
+        sub_transactions = [
+            self.sub_transaction_factory.build_from_transaction(transaction, f"{i+1}/{recurrence_count}")
+            for i, transaction in enumerate([first_created_transaction, *children_transactions])
+        ]
+        self.sub_transaction_repository.create_many(sub_transactions, hydrate=False)
         return self.transaction_serializer.serialize(first_created_transaction)
     
     def create_sub_transaction(self, transaction: "TransactionDomain", installment: str = "1/1") -> "SubTransactionDomain":
         sub_transaction = self.sub_transaction_factory.build_from_transaction(transaction, installment)
         return self.sub_transaction_repository.create(sub_transaction)
 
-    def calculate_next_due_date(self, due_date: str) -> str:
+    def calculate_next_due_date(self, due_date: str, months: int = 1) -> str:
         date_obj = datetime.strptime(due_date, "%Y-%m-%d")
-        next_date = date_obj + relativedelta(months=1)
+        next_date = date_obj + relativedelta(months=months)
         return next_date.strftime("%Y-%m-%d")
@@ -1,6 +1,10 @@
+import logging
 from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from modules.transactions.models import SubTransaction
+from django.db import connection
+
+from modules.base.services import VersionedCacheService
 from modules.transactions.types import TransactionCategory
 from modules.transactions.repositories import SubTransactionRepository
 from modules.transactions.serializers import SubTransactionSerializer
@@ -9,6 +13,15 @@ from modules.ai.prompts import BOT_DESCRIPTION, MODELS_EXPLANATION_PROMPT
 if TYPE_CHECKING:
     from modules.ai.repositories.ai_call import AICallRepository
     from modules.ai.use_cases.ask import AskUseCase
+    from modules.transactions.domains import SubTransactionDomain
+
+logger = logging.getLogger(__name__)
+
+# Rough prompt budget per chunk, estimated at ~4 characters per token.
+CHUNK_MAX_TOKENS = 6000
+# Keeps each JSON answer well below the model output limit.
+CHUNK_MAX_ITEMS = 80
+MAX_CONCURRENT_CHUNKS = 4
 
 PROMPT = """
 Você é um Especialista em Classificação de Dados Financeiros.
@@ -44,32 +57,96 @@ class GuessSubTransactionsCategoryUseCase:
         sub_transaction_serializer: SubTransactionSerializer,
         ai_call_repository: "AICallRepository",
         ask_use_case: "AskUseCase",
+        versioned_cache_service: VersionedCacheService,
     ):
         self.sub_transaction_repository = sub_transaction_repository
         self.sub_transaction_serializer = sub_transaction_serializer
         self.ai_call_repository = ai_call_repository
         self.ask_use_case = ask_use_case
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, transaction_id: int, user_id: int):
         sub_transactions = self.sub_transaction_repository.get_all_by_transaction_id(transaction_id, user_id)
-        sub_transactions_for_tool = self.sub_transaction_serializer.serialize_many_for_tool(sub_transactions)
-        categories = [category.name for category in TransactionCategory.get_all()]
-        prompt = PROMPT.format(sub_transactions=sub_transactions_for_tool, categories=categories)
-        ai_call_id = self.ask_use_case.execute([BOT_DESCRIPTION, MODELS_EXPLANATION_PROMPT, prompt], user_id, response_format="json_object")
-        ai_call = self.ai_call_repository.get(ai_call_id)
-
-        updated_sub_transactions = []
-        for sub_transaction in ai_call.response:
-            try:
-                sub_transaction_instance = self.sub_transaction_repository.get(sub_transaction["sub_transaction_id"], user_id)
-                sub_transaction_instance.category = sub_transaction["category"]
-                self.sub_transaction_repository.update(sub_transaction_instance)
-                updated_sub_transactions.append(sub_transaction_instance)
-            except SubTransaction.DoesNotExist:
-                continue
+        chunks = self.split_in_chunks(sub_transactions)
+
+        guesses = []
+        failed_chunks = 0
+        if chunks:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_CHUNKS, len(chunks))) as executor:
+                futures = [executor.submit(self.guess_chunk, chunk, user_id) for chunk in chunks]
+                for future in as_completed(futures):
+                    try:
+                        guesses.extend(future.result())
+                    except Exception as e:
+                        logger.warning(f"GuessSubTransactionsCategoryUseCase chunk failed: {e}")
+                        failed_chunks += 1
+
+        categories = self.validate_guesses(guesses, {sub_transaction.id for sub_transaction in sub_transactions})
+        updated = self.sub_transaction_repository.update_categories(categories, user_id) if categories else 0
+        if updated:
+            self.versioned_cache_service.bump(user_id)
 
         return {
-            "message": f"{len(updated_sub_transactions)} sub transações atualizadas com sucesso",
+            "message": f"{updated} sub transações atualizadas com sucesso",
+            "updated": updated,
+            "failed_chunks": failed_chunks,
+            "total_chunks": len(chunks),
         }
 
-        
+    def split_in_chunks(self, sub_transactions: list["SubTransactionDomain"]) -> list[list["SubTransactionDomain"]]:
+        chunks = []
+        chunk = []
+        chunk_tokens = 0
+        for sub_transaction in sub_transactions:
+            tokens = self.estimate_tokens(self.sub_transaction_serializer.serialize_for_tool(sub_transaction))
+            if chunk and (chunk_tokens + tokens > CHUNK_MAX_TOKENS or len(chunk) >= CHUNK_MAX_ITEMS):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(sub_transaction)
+            chunk_tokens += tokens
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def estimate_tokens(self, text: str) -> int:
+        return len(text) // 4 + 1
+
+    def guess_chunk(self, sub_transactions: list["SubTransactionDomain"], user_id: int) -> list[dict]:
+        try:
+            sub_transactions_for_tool = self.sub_transaction_serializer.serialize_many_for_tool(sub_transactions)
+            categories = [category.name for category in TransactionCategory.get_all()]
+            prompt = PROMPT.format(sub_transactions=sub_transactions_for_tool, categories=categories)
+            ai_call_id = self.ask_use_case.execute([BOT_DESCRIPTION, MODELS_EXPLANATION_PROMPT, prompt], user_id, response_format="json_object")
+            ai_call = self.ai_call_repository.get(ai_call_id)
+        finally:
+            # Worker threads open their own database connection.
+            connection.close()
+
+        if getattr(ai_call, "is_error", False) or not isinstance(ai_call.response, list):
+            raise ValueError(f"Invalid response for AI call {ai_call_id}")
+        return ai_call.response
+
+    def validate_guesses(self, guesses: list[dict], sub_transaction_ids: set[int]) -> dict[int, str]:
+        categories = {}
+        for guess in guesses:
+            if not isinstance(guess, dict):
+                continue
+
+            try:
+                sub_transaction_id = int(guess.get("sub_transaction_id"))
+            except (TypeError, ValueError):
+                continue
+
+            category = self.resolve_category(guess.get("category"))
+            if sub_transaction_id in sub_transaction_ids and category:
+                categories[sub_transaction_id] = category
+        return categories
+
+    def resolve_category(self, category: str) -> str:
+        category_type = (
+            TransactionCategory.get_by_name(category)
+            or TransactionCategory.get_by_attribute_value(category, "value")
+        )
+        return category_type.name if category_type else None
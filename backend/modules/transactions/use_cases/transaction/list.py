@@ -1,5 +1,6 @@
 from typing import TypedDict
 
+from modules.base.pagination import PageRequest
 from modules.transactions.repositories import TransactionRepository
 from modules.transactions.serializers import TransactionSerializer
 
@@ -14,6 +15,10 @@ class ListTransactionsUseCase:
         self.transaction_repository = transaction_repository
         self.transaction_serializer = transaction_serializer
 
-    def execute(self, filters: ListTransactionsFilters = {}) -> list[dict]:
+    def execute(self, filters: ListTransactionsFilters = {}, page_request: PageRequest = None) -> list[dict] | dict:
+        if page_request:
+            page = self.transaction_repository.filter_page(filters, page_request)
+            return page.with_items([self.transaction_serializer.serialize(transaction) for transaction in page.items]).as_dict()
+
         transactions = self.transaction_repository.filter(filters=filters)
         return [self.transaction_serializer.serialize(transaction) for transaction in transactions]
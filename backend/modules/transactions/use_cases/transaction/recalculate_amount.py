@@ -1,10 +1,17 @@
+from modules.base.services import VersionedCacheService
 from modules.transactions.repositories import TransactionRepository, SubTransactionRepository
 
 
 class RecalculateAmountUseCase:
-    def __init__(self, transaction_repository: TransactionRepository, sub_transaction_repository: SubTransactionRepository):
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        sub_transaction_repository: SubTransactionRepository,
+        versioned_cache_service: VersionedCacheService,
+    ):
         self.transaction_repository = transaction_repository
         self.sub_transaction_repository = sub_transaction_repository
+        self.versioned_cache_service = versioned_cache_service
 
     def execute(self, transaction_id: int, user_id: int):
         transaction = self.transaction_repository.get(transaction_id, user_id)
@@ -12,4 +19,5 @@ class RecalculateAmountUseCase:
         total_amount = sum([sub_transaction.amount for sub_transaction in sub_transactions])
         transaction.update_amount(total_amount)
         self.transaction_repository.update(transaction)
+        self.versioned_cache_service.bump(user_id)
         return {"message": "success"}
@@ -1,50 +1,50 @@
-from modules.transactions.repositories import TransactionRepository, SubTransactionRepository
-from modules.transactions.domains import SubTransactionDomain, TransactionDomain
+from datetime import datetime
+
+from modules.base.dates import month_filters_from_date, months_for_period
+from modules.transactions.repositories import LedgerRollupRepository, TransactionRepository, SubTransactionRepository
 
 
 class TransactionStatsUseCase:
-    def __init__(self, transaction_repository: TransactionRepository, sub_transaction_repository: SubTransactionRepository):
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        sub_transaction_repository: SubTransactionRepository,
+        ledger_rollup_repository: LedgerRollupRepository,
+    ):
         self.transaction_repository = transaction_repository
         self.sub_transaction_repository = sub_transaction_repository
+        self.ledger_rollup_repository = ledger_rollup_repository
 
     def execute(self, user_id: int, due_date: str = "", due_date_start: str = "", due_date_end: str = "") -> dict:
+        months = months_for_period(due_date, due_date_start, due_date_end)
+        if months is not None:
+            rollup_stats = self.ledger_rollup_repository.stats(user_id, *months)
+            return self.calculate_stats(rollup_stats, rollup_stats)
+
         filters = {"user_id": user_id}
         if due_date:
-            filters["due_date__month"] = due_date.split("-")[1]
-            filters["due_date__year"] = due_date.split("-")[0]
+            filters.update(month_filters_from_date("due_date", due_date))
 
         if due_date_start and due_date_end:
-            filters["due_date__gte"] = due_date_start
+            # With a month as well, keep the intersection of both periods.
+            start = datetime.strptime(due_date_start, "%Y-%m-%d").date()
+            filters["due_date__gte"] = max(filters.get("due_date__gte", start), start)
             filters["due_date__lte"] = due_date_end
 
-        transactions = self.transaction_repository.filter(filters)
-        sub_transactions = self.sub_transaction_repository.get_all_by_transaction_ids([transaction.id for transaction in transactions])
-        return self.calculate_stats(transactions, sub_transactions)
+        transaction_stats = self.transaction_repository.stats(filters)
+        actor_stats = self.sub_transaction_repository.stats_from_actors(filters)
+        return self.calculate_stats(transaction_stats, actor_stats)
 
-    def calculate_stats(self, transactions: list[TransactionDomain], sub_transactions: list[SubTransactionDomain]) -> dict:
-        incoming_total = sum([transaction.total_amount for transaction in transactions if transaction.transaction_type == "incoming"])
-        outgoing_total = sum([transaction.total_amount for transaction in transactions if transaction.transaction_type == "outgoing"])
-        balance = incoming_total - outgoing_total
-        outgoing_from_actors = self.get_outgoing_from_actors(sub_transactions)
+    def calculate_stats(self, transaction_stats: dict, actor_stats: dict) -> dict:
+        incoming_total = transaction_stats["incoming_total"]
+        outgoing_total = transaction_stats["outgoing_total"]
 
         return {
             "incoming_total": incoming_total,
             "outgoing_total": outgoing_total,
-            "outgoing_total_paid": self.get_outgoing_total_paid(transactions),
-            "incoming_total_paid": self.get_incoming_total_paid(transactions),
-            "balance": balance,
-            "outgoing_from_actors": outgoing_from_actors,
-            "outgoing_from_actors_paid": self.get_outgoing_from_actors_paid(sub_transactions),
+            "outgoing_total_paid": transaction_stats["outgoing_total_paid"],
+            "incoming_total_paid": transaction_stats["incoming_total_paid"],
+            "balance": incoming_total - outgoing_total,
+            "outgoing_from_actors": actor_stats["outgoing_from_actors"],
+            "outgoing_from_actors_paid": actor_stats["outgoing_from_actors_paid"],
         }
-    
-    def get_incoming_total_paid(self, transactions: list) -> dict:
-        return sum([transaction.total_amount for transaction in transactions if transaction.transaction_type == "incoming" and transaction.is_paid])
-
-    def get_outgoing_total_paid(self, transactions: list) -> dict:
-        return sum([transaction.total_amount for transaction in transactions if transaction.transaction_type == "outgoing" and transaction.is_paid])
-
-    def get_outgoing_from_actors(self, sub_transactions: list) -> dict:
-        return sum([sub_transaction.amount for sub_transaction in sub_transactions if sub_transaction.actor])
-
-    def get_outgoing_from_actors_paid(self, sub_transactions: list) -> dict:
-        return sum([sub_transaction.amount for sub_transaction in sub_transactions if sub_transaction.actor and sub_transaction.paid_at])
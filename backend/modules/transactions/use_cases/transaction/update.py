@@ -1,8 +1,11 @@
 from typing import TYPE_CHECKING
+from collections import defaultdict
 
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from django.db.transaction import atomic
 
+from modules.base.services import VersionedCacheService
 from modules.transactions.repositories import TransactionRepository
 from modules.transactions.serializers import TransactionSerializer
 from modules.transactions.repositories import SubTransactionRepository
@@ -12,35 +15,56 @@ if TYPE_CHECKING:
 
 
 class UpdateTransactionUseCase:
-    def __init__(self, transaction_repository: TransactionRepository, transaction_serializer: TransactionSerializer, sub_transaction_repository: SubTransactionRepository):
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        transaction_serializer: TransactionSerializer,
+        sub_transaction_repository: SubTransactionRepository,
+        versioned_cache_service: VersionedCacheService,
+    ):
         self.transaction_repository = transaction_repository
         self.transaction_serializer = transaction_serializer
         self.sub_transaction_repository = sub_transaction_repository
+        self.versioned_cache_service = versioned_cache_service
 
+    @atomic
     def execute(self, id: int, data: dict) -> dict:
         transaction = self.transaction_repository.get(id, data["user_id"])
         transaction.update(data)
 
+        children_transactions = []
         if transaction.is_recurrent:
-            children_transactions = self.transaction_repository.get_children_transactions(transaction.id, data["user_id"])
-            if len(children_transactions):
-                self.update_children_transactions(transaction, data)
+            children_transactions = self.update_children_transactions(transaction, data)
 
-        self.update_single_sub_transaction(transaction)
+        self.update_single_sub_transactions([transaction, *children_transactions])
 
         updated_transaction = self.transaction_repository.update(transaction)
+        self.versioned_cache_service.bump(transaction.user_id)
         return self.transaction_serializer.serialize(updated_transaction)
-    
-    def update_single_sub_transaction(self, transaction: "TransactionDomain") -> "SubTransactionDomain":
-        sub_transactions = self.sub_transaction_repository.get_all_by_transaction_id(transaction.id, transaction.user_id)
-        if len(sub_transactions) == 1:
+
+    def update_single_sub_transactions(self, transactions: list["TransactionDomain"]) -> list["SubTransactionDomain"]:
+        transactions_by_id = {transaction.id: transaction for transaction in transactions}
+        sub_transactions_by_transaction_id = defaultdict(list)
+        for sub_transaction in self.sub_transaction_repository.get_all_by_transaction_ids(list(transactions_by_id)):
+            sub_transactions_by_transaction_id[sub_transaction.transaction.id].append(sub_transaction)
+
+        single_sub_transactions = []
+        for transaction_id, sub_transactions in sub_transactions_by_transaction_id.items():
+            if len(sub_transactions) != 1:
+                continue
+
+            transaction = transactions_by_id[transaction_id]
             sub_transaction = sub_transactions[0]
             sub_transaction.update({
                 "description": transaction.transaction_identifier,
                 "amount": transaction.total_amount,
             })
-            self.sub_transaction_repository.update(sub_transaction)
-    
+            single_sub_transactions.append(sub_transaction)
+
+        if not single_sub_transactions:
+            return []
+        return self.sub_transaction_repository.update_many(single_sub_transactions)
+
     def update_children_transactions(self, transaction: "TransactionDomain", data: dict) -> list["TransactionDomain"]:
         children_transactions = self.transaction_repository.get_children_transactions(transaction.id, transaction.user_id)
         if len(children_transactions) == 0:
@@ -48,11 +72,9 @@ class UpdateTransactionUseCase:
 
         last_due_date = transaction.due_date
         for i, child_transaction in enumerate(children_transactions):
-            data["due_date"] = self.calculate_next_due_date(last_due_date, i)
-            child_transaction.update(data)
-            self.update_single_sub_transaction(child_transaction)
+            child_transaction.update({**data, "due_date": self.calculate_next_due_date(last_due_date, i)})
         return self.transaction_repository.update_many(children_transactions)
-    
+
     def calculate_next_due_date(self, due_date: str, recurrence_count: int) -> str:
         date_obj = datetime.strptime(due_date, "%Y-%m-%d")
         next_date = date_obj + relativedelta(months=recurrence_count)
@@ -2,23 +2,52 @@ from rest_framework import status, viewsets, decorators
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from modules.base.conditional import conditional_get
+from modules.base.dates import month_filters
+from modules.base.pagination import PageRequest
 from modules.userdata.authentication import JWTAuthentication
 from modules.transactions.container import TransactionsContainer
+from modules.transactions.models import Actor, SubTransaction, Transaction
 from modules.ai.container import AIContainer
 
+# Tables behind each listing, for conditional GET validators
+ACTOR_SOURCES = [(Actor, "user_id"), (Transaction, "user_id"), (SubTransaction, "transaction__user_id")]
+TRANSACTION_SOURCES = [(Transaction, "user_id"), (SubTransaction, "transaction__user_id")]
+SUB_TRANSACTION_SOURCES = [(SubTransaction, "transaction__user_id"), (Transaction, "user_id"), (Actor, "user_id")]
+
+ai_container = AIContainer()
+container = TransactionsContainer(
+    ask_use_case=ai_container.ask_use_case,
+    ai_call_repository=ai_container.ai_call_repository,
+)
+
 
 class ActorViewSet(viewsets.ViewSet):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = TransactionsContainer()
+    container = container
 
+    @conditional_get(*ACTOR_SOURCES)
     def list(self, request):
         due_date = request.query_params.get("due_date")
         without_sub_transactions = request.query_params.get("without_sub_transactions", False)
-        actors = self.container.list_actors_use_case().execute(request.user.id, due_date, without_sub_transactions)
+        try:
+            page_request = PageRequest.from_query_params(request.query_params)
+            actors = self.container.versioned_cache_service().get_or_compute(
+                "actors.list",
+                request.user.id,
+                {
+                    "due_date": due_date,
+                    "without_sub_transactions": without_sub_transactions,
+                    "page": page_request.as_params() if page_request else None,
+                },
+                lambda: self.container.list_actors_use_case().execute(
+                    request.user.id, due_date, without_sub_transactions, page_request,
+                ),
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(actors, status=status.HTTP_200_OK)
 
     def retrieve(self, request, pk: str):
@@ -41,10 +70,16 @@ class ActorViewSet(viewsets.ViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
     
     @decorators.action(detail=False, methods=["GET"])
+    @conditional_get(*ACTOR_SOURCES)
     def stats(self, request):
         due_date_start = request.query_params.get("due_date_start")
         due_date_end = request.query_params.get("due_date_end")
-        stats = self.container.actor_stats_use_case().execute(request.user.id, due_date_start, due_date_end)
+        stats = self.container.versioned_cache_service().get_or_compute(
+            "actors.stats",
+            request.user.id,
+            {"due_date_start": due_date_start, "due_date_end": due_date_end},
+            lambda: self.container.actor_stats_use_case().execute(request.user.id, due_date_start, due_date_end),
+        )
         return Response(stats, status=status.HTTP_200_OK)
 
     @decorators.action(detail=True, methods=["GET"], url_path="share_token")
@@ -58,9 +93,7 @@ class PublicActorViewSet(viewsets.ViewSet):
     authentication_classes = []
     permission_classes = []
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = TransactionsContainer()
+    container = container
 
     def list(self, request):
         """Get actor data by share token from Authorization header"""
@@ -84,21 +117,18 @@ class TransactionViewSet(viewsets.ViewSet):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        ai_container = AIContainer()
-        ask_use_case = ai_container.ask_use_case()
-        ai_call_repository = ai_container.ai_call_repository()
-        self.container = TransactionsContainer(ask_use_case=ask_use_case, ai_call_repository=ai_call_repository)
+    container = container
 
+    @conditional_get(*TRANSACTION_SOURCES)
     def list(self, request):
         filters = {"user_id": request.user.id}
 
-        if request.query_params.get("due_date__month"):
-            filters["due_date__month"] = int(request.query_params.get("due_date__month"))
-
-        if request.query_params.get("due_date__year"):
-            filters["due_date__year"] = int(request.query_params.get("due_date__year"))
+        due_date_month = request.query_params.get("due_date__month")
+        due_date_year = request.query_params.get("due_date__year")
+        if due_date_year:
+            filters.update(month_filters("due_date", int(due_date_year), int(due_date_month) if due_date_month else None))
+        elif due_date_month:
+            filters["due_date__month"] = int(due_date_month)
 
         if request.query_params.get("transaction_type"):
             filters["transaction_type"] = request.query_params.get("transaction_type")
@@ -110,7 +140,11 @@ class TransactionViewSet(viewsets.ViewSet):
         elif payment_status == "unpaid":
             filters["paid_at__isnull"] = True
 
-        transactions = self.container.list_transactions_use_case().execute(filters)
+        try:
+            page_request = PageRequest.from_query_params(request.query_params)
+            transactions = self.container.list_transactions_use_case().execute(filters, page_request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(transactions, status=status.HTTP_200_OK)
     
     def retrieve(self, request, pk: str):
@@ -134,9 +168,15 @@ class TransactionViewSet(viewsets.ViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
     
     @decorators.action(detail=False, methods=["GET"])
+    @conditional_get(*TRANSACTION_SOURCES)
     def stats(self, request):
         due_date = request.query_params.get("due_date")
-        stats = self.container.transaction_stats_use_case().execute(request.user.id, due_date)
+        stats = self.container.versioned_cache_service().get_or_compute(
+            "transactions.stats",
+            request.user.id,
+            {"due_date": due_date},
+            lambda: self.container.transaction_stats_use_case().execute(request.user.id, due_date),
+        )
         return Response(stats, status=status.HTTP_200_OK)
     
     @decorators.action(detail=True, methods=["POST"])
@@ -160,15 +200,20 @@ class SubTransactionViewSet(viewsets.ViewSet):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = TransactionsContainer()
+    container = container
 
+    @conditional_get(*SUB_TRANSACTION_SOURCES)
     def list(self, request):
         due_date = request.query_params.get("due_date")
         actor_id = request.query_params.get("actor_id")
 
-        sub_transactions = self.container.list_sub_transactions_use_case().execute(request.user.id, due_date, actor_id)
+        try:
+            page_request = PageRequest.from_query_params(request.query_params)
+            sub_transactions = self.container.list_sub_transactions_use_case().execute(
+                request.user.id, due_date, actor_id, page_request,
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(sub_transactions, status=status.HTTP_200_OK)
     
     def retrieve(self, request, pk: str):
@@ -193,3 +238,17 @@ class SubTransactionViewSet(viewsets.ViewSet):
     def pay(self, request, pk: str):
         response = self.container.pay_sub_transaction_use_case().execute(pk, request.user.id)
         return Response(response, status=status.HTTP_200_OK)
+
+    @decorators.action(detail=False, methods=["POST"])
+    def pay_many(self, request):
+        try:
+            response = self.container.pay_many_sub_transactions_use_case().execute(
+                request.user.id,
+                paid=request.data.get("paid", True),
+                actor_id=request.data.get("actor_id"),
+                due_date=request.data.get("due_date"),
+                sub_transaction_ids=request.data.get("sub_transaction_ids"),
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(response, status=status.HTTP_200_OK)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class UserDataConfig(AppConfig):
     name = "modules.userdata"
+
+    def ready(self):
+        from modules.userdata import signals  # noqa: F401
@@ -3,7 +3,7 @@ from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
 from modules.userdata.gateways.jwt import JWTGateway
-from modules.userdata.models import User
+from modules.userdata.services import principal_cache
 
 
 class JWTAuthentication(BaseAuthentication):
@@ -26,9 +26,8 @@ class JWTAuthentication(BaseAuthentication):
         if not payload:
             raise AuthenticationFailed("Invalid or expired token")
 
-        try:
-            user = User.objects.get(id=payload["user_id"], is_active=True)
-        except User.DoesNotExist:
+        principal = principal_cache.get(payload["user_id"])
+        if principal is None:
             raise AuthenticationFailed("User not found")
 
-        return (user, token)
+        return (principal, token)
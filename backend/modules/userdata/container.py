@@ -18,19 +18,19 @@ from modules.userdata.use_cases.update_profile import UpdateProfileUseCase
 
 class UserDataContainer(containers.DeclarativeContainer):
     # GATEWAYS
-    jwt_gateway = providers.Factory(JWTGateway, secret_key=settings.SECRET_KEY)
+    jwt_gateway = providers.Singleton(JWTGateway, secret_key=settings.SECRET_KEY)
 
     # SERIALIZERS
-    profile_serializer = providers.Factory(ProfileSerializer)
-    user_serializer = providers.Factory(UserSerializer, profile_serializer=profile_serializer)
+    profile_serializer = providers.Singleton(ProfileSerializer)
+    user_serializer = providers.Singleton(UserSerializer, profile_serializer=profile_serializer)
 
     # FACTORIES
-    profile_factory = providers.Factory(ProfileFactory)
-    user_factory = providers.Factory(UserFactory, profile_factory=profile_factory)
+    profile_factory = providers.Singleton(ProfileFactory)
+    user_factory = providers.Singleton(UserFactory, profile_factory=profile_factory)
 
     # REPOSITORIES
-    profile_repository = providers.Factory(ProfileRepository, model=Profile, profile_factory=profile_factory)
-    user_repository = providers.Factory(UserRepository, model=User, user_factory=user_factory, profile_repository=profile_repository)
+    profile_repository = providers.Singleton(ProfileRepository, model=Profile, profile_factory=profile_factory)
+    user_repository = providers.Singleton(UserRepository, model=User, user_factory=user_factory, profile_repository=profile_repository)
 
     # USE CASES
     login_use_case = providers.Factory(
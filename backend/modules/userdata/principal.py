@@ -0,0 +1,65 @@
+from modules.userdata.models import User
+
+
+class AuthenticatedPrincipal:
+    """The ``request.user`` set by JWTAuthentication.
+
+    Carries only what permission checks and views read on every request, so it can
+    be served from cache without touching the database. Any other ``User``
+    attribute is resolved by loading the full row once, on first access.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(
+        self,
+        id: int,
+        email: str,
+        is_active: bool = True,
+        is_staff: bool = False,
+        is_superuser: bool = False,
+        profile_id: int | None = None,
+    ):
+        self.id = id
+        self.email = email
+        self.is_active = is_active
+        self.is_staff = is_staff
+        self.is_superuser = is_superuser
+        self.profile_id = profile_id
+        self._user = None
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    def get_user(self) -> User:
+        if self._user is None:
+            self._user = User.objects.get(id=self.id)
+        return self._user
+
+    def as_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "email": self.email,
+            "is_active": self.is_active,
+            "is_staff": self.is_staff,
+            "is_superuser": self.is_superuser,
+            "profile_id": self.profile_id,
+        }
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get_user(), name)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AuthenticatedPrincipal | User):
+            return self.id == other.pk
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __str__(self) -> str:
+        return self.email
@@ -0,0 +1,6 @@
+from modules.userdata.services.principal_cache import PrincipalCacheService, principal_cache
+
+__all__ = [
+    "PrincipalCacheService",
+    "principal_cache",
+]
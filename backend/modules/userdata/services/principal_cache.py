@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from modules.userdata.models import User
+from modules.userdata.principal import AuthenticatedPrincipal
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_KEY = "principal:{user_id}"
+
+
+class PrincipalCacheService:
+    """Two-level cache of active users' principals, keyed by user id.
+
+    A small in-process LRU answers most requests with no I/O at all; the shared
+    cache (Redis) spares the database when a worker sees a user for the first
+    time. Saving or deleting a ``User`` or its ``Profile`` evicts the entry from
+    the shared cache and from this process (see ``modules.userdata.signals``).
+    Other workers drop their local copy within ``PRINCIPAL_CACHE_LOCAL_TIMEOUT``
+    seconds, which bounds how long a deactivated user can keep authenticating.
+
+    Shared cache failures never break authentication: the row is read from the
+    database.
+    """
+
+    def __init__(self, cache_alias: str = "default"):
+        self.cache_alias = cache_alias
+        self._lock = threading.Lock()
+        self._local: OrderedDict[int, tuple[float, AuthenticatedPrincipal]] = OrderedDict()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get(self, user_id: int) -> AuthenticatedPrincipal | None:
+        """Return the principal of an active user, or None if there is none."""
+        principal = self._get_local(user_id)
+        if principal is not None:
+            return principal
+
+        principal = self._get_shared(user_id)
+        if principal is None:
+            principal = self._load(user_id)
+            if principal is None:
+                return None
+            self._set_shared(principal)
+
+        self._set_local(principal)
+        return principal
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._local.pop(user_id, None)
+        try:
+            self.cache.delete(PRINCIPAL_KEY.format(user_id=user_id))
+        except Exception:
+            logger.warning("[PrincipalCache] Could not invalidate user %s", user_id, exc_info=True)
+
+    def clear(self):
+        """Forget every principal cached by this process."""
+        with self._lock:
+            self._local.clear()
+
+    def _get_local(self, user_id: int) -> AuthenticatedPrincipal | None:
+        with self._lock:
+            entry = self._local.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._local[user_id]
+                return None
+            self._local.move_to_end(user_id)
+        # A fresh object per request: the full user loaded on demand must not leak.
+        return AuthenticatedPrincipal(**principal.as_dict())
+
+    def _set_local(self, principal: AuthenticatedPrincipal):
+        expires_at = time.monotonic() + settings.PRINCIPAL_CACHE_LOCAL_TIMEOUT
+        with self._lock:
+            self._local[principal.id] = (expires_at, AuthenticatedPrincipal(**principal.as_dict()))
+            self._local.move_to_end(principal.id)
+            while len(self._local) > settings.PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES:
+                self._local.popitem(last=False)
+
+    def _get_shared(self, user_id: int) -> AuthenticatedPrincipal | None:
+        try:
+            values = self.cache.get(PRINCIPAL_KEY.format(user_id=user_id))
+        except Exception:
+            logger.warning("[PrincipalCache] Read failed for user %s", user_id, exc_info=True)
+            return None
+        return AuthenticatedPrincipal(**values) if values else None
+
+    def _set_shared(self, principal: AuthenticatedPrincipal):
+        try:
+            self.cache.set(
+                PRINCIPAL_KEY.format(user_id=principal.id),
+                principal.as_dict(),
+                timeout=settings.PRINCIPAL_CACHE_TIMEOUT,
+            )
+        except Exception:
+            logger.warning("[PrincipalCache] Write failed for user %s", principal.id, exc_info=True)
+
+    def _load(self, user_id: int) -> AuthenticatedPrincipal | None:
+        values = (
+            User.objects.filter(id=user_id, is_active=True)
+            .values("id", "email", "is_active", "is_staff", "is_superuser", "profile__id")
+            .first()
+        )
+        if values is None:
+            return None
+        values["profile_id"] = values.pop("profile__id")
+        return AuthenticatedPrincipal(**values)
+
+
+principal_cache = PrincipalCacheService()
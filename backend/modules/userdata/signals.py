@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.db.transaction import on_commit
+from django.dispatch import receiver
+
+from modules.userdata.models import Profile, User
+from modules.userdata.services import principal_cache
+
+
+def invalidate_principal(user_id: int):
+    # Evict now so this process sees the change, and again after commit so no
+    # concurrent request re-caches the row as it was before the transaction.
+    principal_cache.invalidate(user_id)
+    on_commit(lambda: principal_cache.invalidate(user_id))
+
+
+@receiver([post_save, post_delete], sender=User, dispatch_uid="invalidate_principal_on_user_change")
+def invalidate_principal_on_user_change(sender, instance: User, **kwargs):
+    invalidate_principal(instance.id)
+
+
+@receiver([post_save, post_delete], sender=Profile, dispatch_uid="invalidate_principal_on_profile_change")
+def invalidate_principal_on_profile_change(sender, instance: Profile, **kwargs):
+    invalidate_principal(instance.user_id)
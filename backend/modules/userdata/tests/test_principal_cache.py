@@ -0,0 +1,128 @@
+from django.conf import settings
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+
+from modules.userdata.authentication import JWTAuthentication
+from modules.userdata.gateways.jwt import JWTGateway
+from modules.userdata.models import Profile, User
+from modules.userdata.principal import AuthenticatedPrincipal
+from modules.userdata.services import PrincipalCacheService, principal_cache
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestJWTAuthenticationPrincipalCache(TestCase):
+    """Test JWTAuthentication serves principals from PrincipalCacheService."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        principal_cache.clear()
+        principal_cache.cache.clear()
+        self.user = User.objects.create_user(email="principal@example.com", password="testpass123", is_active=True)
+        self.profile = Profile.objects.create(user=self.user, first_name="Ana")
+        token = JWTGateway(secret_key=settings.SECRET_KEY).generate_access_token(self.user.id, self.user.email)
+        self.request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.authentication = JWTAuthentication()
+
+    def test_cached_principal_authenticates_without_queries(self):
+        """Test only the first request of a user reads the database."""
+        # Act
+        with self.assertNumQueries(1):
+            first, _ = self.authentication.authenticate(self.request)
+        with self.assertNumQueries(0):
+            second, _ = self.authentication.authenticate(self.request)
+
+        # Assert
+        self.assertIsInstance(second, AuthenticatedPrincipal)
+        self.assertEqual(second.id, self.user.id)
+        self.assertEqual(second.profile_id, self.profile.id)
+        self.assertTrue(second.is_authenticated)
+        self.assertEqual(first, second)
+
+    def test_shared_cache_serves_other_workers(self):
+        """Test a process with an empty local cache reads the principal from the shared cache."""
+        # Arrange
+        self.authentication.authenticate(self.request)
+        principal_cache.clear()
+
+        # Act
+        with self.assertNumQueries(0):
+            principal, _ = self.authentication.authenticate(self.request)
+
+        # Assert
+        self.assertEqual(principal.email, "principal@example.com")
+
+    def test_deactivated_user_is_rejected(self):
+        """Test saving is_active=False invalidates the cached principal."""
+        # Arrange
+        self.authentication.authenticate(self.request)
+
+        # Act
+        self.user.is_active = False
+        self.user.save()
+
+        # Assert
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.authenticate(self.request)
+
+    def test_profile_change_invalidates_principal(self):
+        """Test saving or deleting the profile refreshes the cached principal."""
+        # Arrange
+        self.authentication.authenticate(self.request)
+
+        # Act
+        self.profile.delete()
+        principal, _ = self.authentication.authenticate(self.request)
+
+        # Assert
+        self.assertIsNone(principal.profile_id)
+
+    def test_other_attributes_load_the_user_once(self):
+        """Test attributes outside the principal are read from the full user row, once."""
+        # Arrange
+        principal, _ = self.authentication.authenticate(self.request)
+
+        # Act
+        with self.assertNumQueries(1):
+            created_at = principal.created_at
+            password = principal.password
+
+        # Assert
+        self.assertEqual(created_at, self.user.created_at)
+        self.assertEqual(password, self.user.password)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES=2)
+class TestPrincipalCacheService(TestCase):
+    """Test PrincipalCacheService local LRU."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = PrincipalCacheService()
+        self.service.cache.clear()
+        self.users = [
+            User.objects.create_user(email=f"lru{index}@example.com", password="testpass123", is_active=True)
+            for index in range(3)
+        ]
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the local cache keeps at most PRINCIPAL_CACHE_LOCAL_MAX_ENTRIES users."""
+        # Act
+        for user in self.users:
+            self.service.get(user.id)
+
+        # Assert
+        self.assertEqual(list(self.service._local), [self.users[1].id, self.users[2].id])
+
+    def test_inactive_user_is_not_cached(self):
+        """Test unknown or inactive users get no principal and no cache entry."""
+        # Arrange
+        inactive = User.objects.create_user(email="inactive@example.com", password="testpass123")
+
+        # Act
+        principal = self.service.get(inactive.id)
+
+        # Assert
+        self.assertIsNone(principal)
+        self.assertNotIn(inactive.id, self.service._local)
@@ -7,11 +7,11 @@ from rest_framework.views import APIView
 from modules.userdata.authentication import JWTAuthentication
 from modules.userdata.container import UserDataContainer
 
+container = UserDataContainer()
+
 
 class LoginView(APIView):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = UserDataContainer()
+    container = container
 
     def post(self, request: Request) -> Response:
         email = request.data.get("email")
@@ -34,9 +34,7 @@ class LoginView(APIView):
 
 
 class RegisterView(APIView):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = UserDataContainer()
+    container = container
 
     def post(self, request: Request) -> Response:
         email = request.data.get("email")
@@ -66,9 +64,7 @@ class RegisterView(APIView):
 
 
 class RefreshTokenView(APIView):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = UserDataContainer()
+    container = container
 
     def post(self, request: Request) -> Response:
         refresh_token = request.data.get("refresh_token")
@@ -93,9 +89,7 @@ class MeView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = UserDataContainer()
+    container = container
 
     def get(self, request: Request) -> Response:
         result = self.container.get_current_user_use_case().execute(request.user.id)
@@ -112,13 +106,11 @@ class UpdateProfileView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.container = UserDataContainer()
+    container = container
 
     def patch(self, request: Request) -> Response:
         updated_profile = self.container.update_profile_use_case().execute(
-            request.user.profile.id,
+            request.user.profile_id,
             request.data,
         )
         return Response(updated_profile, status=status.HTTP_200_OK)